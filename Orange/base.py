@@ -100,6 +100,85 @@ class Learner(_ReprableWithPreprocessors):
         X, Y, W = data.X, data.Y, data.W if data.has_weights() else None
         return self.fit(X, Y, W)
 
+    def update_storage(self, model, data):
+        """
+        Update the model with a batch of (preprocessed) data and return
+        the updated model, which may be the same object. If `model` is
+        `None`, fit a new model that can be updated later.
+
+        Learners that support incremental learning must define this method.
+        """
+        raise NotImplementedError(
+            "{} does not support incremental learning".format(
+                type(self).__name__))
+
+    @property
+    def supports_partial_fit(self):
+        """`True` if the learner can update models with new data"""
+        return type(self).update_storage is not Learner.update_storage
+
+    def partial_fit(self, data, model=None):
+        """
+        Fit a model on the first batch of data or, if the `model` is given,
+        update it with a new batch, and return the model.
+
+        Preprocessors are fit on the first batch. Later batches are
+        transformed into the model's domain, so the model's variables
+        (e.g. discretization intervals) do not change.
+
+        Args:
+            data (Orange.data.Table): a batch of data
+            model (Model): the model fitted on previous batches
+
+        Returns:
+            Model: the updated model
+        """
+        if not self.supports_partial_fit:
+            raise NotImplementedError(
+                "{} does not support incremental learning".format(
+                    type(self).__name__))
+        if model is not None:
+            return self.update(model, data)
+        self.__tls.partial = True
+        try:
+            return self(data)
+        finally:
+            self.__tls.partial = False
+
+    def update(self, model, data):
+        """
+        Update the model, which was fitted by :obj:`partial_fit`, with
+        a new batch of data, and return the updated model.
+        """
+        if data.domain != model.domain:
+            data = data.transform(model.domain)
+        if data.domain.class_vars:
+            data = HasClass()(data)
+        model = self.update_storage(model, data)
+        model.used_vals = [np.union1d(used, np.unique(y))
+                           for used, y in zip(model.used_vals,
+                                              data.Y[:, None].T)]
+        return model
+
+    def fit_chunks(self, chunks):
+        """
+        Fit a model on data given in batches, for instance by
+        :obj:`Orange.data.io.FileFormat.iter_chunks`, which can be used to
+        learn from data that does not fit into memory.
+
+        Args:
+            chunks (iterable of Orange.data.Table): batches of data
+
+        Returns:
+            Model: the model fitted on all batches
+        """
+        model = None
+        for chunk in chunks:
+            model = self.partial_fit(chunk, model)
+        if model is None:
+            raise ValueError("no data")
+        return model
+
     def __call__(self, data):
         if not self.check_learner_adequacy(data.domain):
             raise ValueError(self.learner_adequacy_err_msg)
@@ -126,6 +205,8 @@ class Learner(_ReprableWithPreprocessors):
         return model
 
     def _fit_model(self, data):
+        if getattr(self.__tls, "partial", False):
+            return self.update_storage(None, data)
         if type(self).fit is Learner.fit:
             return self.fit_storage(data)
         else:
@@ -390,6 +471,29 @@ class SklLearner(Learner, metaclass=WrapperMeta):
             return self.__returns__(clf.fit(X, Y))
         return self.__returns__(clf.fit(X, Y, sample_weight=W.reshape(-1)))
 
+    def update_storage(self, model, data):
+        """
+        Update the model using `partial_fit` of the wrapped estimator,
+        for estimators that have it.
+        """
+        if not hasattr(self.__wraps__, "partial_fit"):
+            return super().update_storage(model, data)
+        if model is None:
+            clf = self.__wraps__(**self.params)
+        else:
+            clf = model.skl_model
+        kwargs = {}
+        if data.domain.has_discrete_class:
+            kwargs["classes"] = np.arange(len(data.domain.class_var.values))
+        if data.has_weights() and self.supports_weights:
+            kwargs["sample_weight"] = data.W.reshape(-1)
+        clf.partial_fit(data.X, data.Y.reshape(-1), **kwargs)
+        return self.__returns__(clf) if model is None else model
+
+    @property
+    def supports_partial_fit(self):
+        return hasattr(self.__wraps__, "partial_fit")
+
     @property
     def supports_weights(self):
         """Indicates whether this learner supports weighted instances.
@@ -431,7 +535,7 @@ class KNNBase:
     """Base class for KNN (classification and regression) learners
     """
     def __init__(self, n_neighbors=5, metric="euclidean", weights="uniform",
-                 algorithm='auto', metric_params=None,
+                 algorithm='auto', metric_params=None, leaf_size=30,
                  preprocessors=None):
         super().__init__(preprocessors=preprocessors)
         self.params = vars()
@@ -440,7 +544,39 @@ class KNNBase:
         if self.params["metric_params"] is None and \
                         self.params.get("metric") == "mahalanobis":
             self.params["metric_params"] = {"V": np.cov(X.T)}
-        return super().fit(X, Y, W)
+        index = self._neighbor_index(X)
+        if index is None:
+            return super().fit(X, Y, W)
+        clf = self.__wraps__(**self.params).fit(index.tree, Y.reshape(-1))
+        # scikit-learn keeps a memory view of tree's data, which cannot be
+        # pickled
+        clf._fit_X = np.asarray(clf._fit_X)  # pylint: disable=protected-access
+        return self.__returns__(clf)
+
+    def _neighbor_index(self, X):
+        """
+        Return a tree for Euclidean or Manhattan distance from the cache of
+        neighbour indexes, so it is built once for the same data and
+        parameters, or `None` if scikit-learn would not use a tree
+        """
+        from Orange.distance import Euclidean, Manhattan, NeighborIndex
+
+        params = self.params
+        distance = {"euclidean": Euclidean, "manhattan": Manhattan}.get(
+            params["metric"])
+        algorithm = params["algorithm"]
+        # With many neighbours, scikit-learn's "auto" uses brute force
+        if distance is None or params["metric_params"] is not None \
+                or algorithm not in ("auto", "kd_tree", "ball_tree") \
+                or algorithm == "auto" and params["n_neighbors"] >= len(X) // 2:
+            return None
+        try:
+            index = NeighborIndex.cached(
+                X, distance, algorithm=algorithm,
+                leaf_size=params["leaf_size"])
+        except ValueError:  # e.g. for sparse data or missing values
+            return None
+        return index if index.tree is not None else None
 
 
 class NNBase:
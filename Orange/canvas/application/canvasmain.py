@@ -183,6 +183,7 @@ class CanvasMainWindow(QMainWindow):
         self.num_recent_schemes = 15
 
         self.open_in_external_browser = False
+        self.asynchronous_signals = False
         self.help = HelpManager(self)
 
         self.setup_actions()
@@ -1061,6 +1062,8 @@ class CanvasMainWindow(QMainWindow):
         manager = new_scheme.signal_manager
         if self.freeze_action.isChecked():
             manager.pause()
+        if self.asynchronous_signals:
+            manager.set_asynchronous(True)
 
         scheme_doc.setScheme(new_scheme)
 
@@ -2009,6 +2012,14 @@ class CanvasMainWindow(QMainWindow):
                                          defaultValue=False,
                                          type=bool)
         self.scheme_widget.setNodeAnimationEnabled(node_animations)
+
+        asynchronous = settings.value("asynchronous-signals",
+                                      defaultValue=False,
+                                      type=bool)
+        if asynchronous != self.asynchronous_signals:
+            self.asynchronous_signals = asynchronous
+            scheme = self.current_document().scheme()
+            scheme.signal_manager.set_asynchronous(asynchronous)
         settings.endGroup()
 
         self.open_in_external_browser = \
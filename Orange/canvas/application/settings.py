@@ -268,6 +268,24 @@ class UserSettingsDialog(QMainWindow):
 
         form.addRow(self.tr("Links"), links)
 
+        signals = QWidget(self, objectName="signals")
+        signals.setLayout(QVBoxLayout())
+        signals.layout().setContentsMargins(0, 0, 0, 0)
+
+        cb_async = QCheckBox(
+            self.tr("Update independent branches concurrently"),
+            objectName="asynchronous-signals",
+            toolTip=self.tr("Pass inputs to widgets that support it in "
+                            "background threads, so that independent "
+                            "parts of the workflow are updated in parallel.")
+        )
+
+        self.bind(cb_async, "checked", "schemeedit/asynchronous-signals")
+
+        signals.layout().addWidget(cb_async)
+
+        form.addRow(self.tr("Signals"), signals)
+
         quickmenu = QWidget(self, objectName="quickmenu-options")
         quickmenu.setLayout(QVBoxLayout())
         quickmenu.layout().setContentsMargins(0, 0, 0, 0)
@@ -98,6 +98,9 @@ spec = \
      ("schemeedit/freeze-on-load", bool, False,
       "Freeze signal propagation when loading a workflow."),
 
+     ("schemeedit/asynchronous-signals", bool, False,
+      "Update independent branches of a workflow concurrently."),
+
      ("quickmenu/trigger-on-double-click", bool, True,
       "Show quick menu on double click."),
 
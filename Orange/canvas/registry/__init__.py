@@ -73,12 +73,10 @@ def global_registry(entry_point_group="_default"):
         log.debug("'global_registry()' - running widget discovery.")
         if entry_point_group == "_default":
             from ..config import widgets_entry_points
-            entry_points_iter = widgets_entry_points()
+            reg = discovery.run_discovery(widgets_entry_points(),
+                                          cached=True)
         else:
-            entry_points_iter = entry_point_group
-        reg = WidgetRegistry()
-        disc = discovery.WidgetDiscovery(reg)
-        disc.run(entry_points_iter)
+            reg = discovery.run_discovery(entry_point_group)
         log.info("'global_registry()' discovery finished.")
         __GLOBAL_REGISTRY[entry_point_group] = reg
 
@@ -51,8 +51,12 @@ def save_registry_cache(cache):
     log.debug("Saving widget registry cache with %i entries (%r).",
               len(cache), filename)
     try:
-        with open(filename, "wb") as f:
+        # Write to a temporary file first, so that concurrently started
+        # processes never read a partially written cache
+        tmp_filename = "{}.{}.tmp".format(filename, os.getpid())
+        with open(tmp_filename, "wb") as f:
             pickle.dump(cache, f)
+        os.replace(tmp_filename, filename)
         return True
     except Exception:
         log.error("Could not save registry cache", exc_info=True)
@@ -13,8 +13,10 @@ import sys
 import stat
 import glob
 import logging
+import time
 import types
 import pkgutil
+import importlib.util
 from collections import namedtuple
 import pkg_resources
 
@@ -84,7 +86,11 @@ class WidgetDiscovery(object):
             entry_points_iter = \
                 pkg_resources.iter_entry_points(entry_points_iter)
 
+        start_time = time.perf_counter()
+        n_modules = len(sys.modules)
         for entry_point in entry_points_iter:
+            if self.process_cached_widget_module(entry_point):
+                continue
             try:
                 point = entry_point.resolve()
             except pkg_resources.DistributionNotFound:
@@ -127,6 +133,10 @@ class WidgetDiscovery(object):
             except Exception:
                 log.error("An exception occurred while processing %r.",
                           entry_point, exc_info=True)
+        # Compare cold (empty cache) and warm runs to see what the cache saves
+        log.info("Widget discovery finished in %.3f s and imported %i "
+                 "modules.", time.perf_counter() - start_time,
+                 len(sys.modules) - n_modules)
 
     def process_widget_module(self, module, name=None, category_name=None,
                               distribution=None):
@@ -134,6 +144,7 @@ class WidgetDiscovery(object):
         Process a widget module.
         """
         try:
+            module = asmodule(module)
             desc = self.widget_description(module, widget_name=name,
                                            distribution=distribution)
         except (WidgetSpecificationError, Exception) as ex:
@@ -141,6 +152,41 @@ class WidgetDiscovery(object):
             return
 
         self.handle_widget(desc)
+        mod_path = fix_pyext(module.__file__)
+        if os.path.exists(mod_path):
+            self.cache_insert(module, os.stat(mod_path).st_mtime, desc,
+                              distribution)
+
+    def process_cached_widget_module(self, entry_point):
+        """
+        Process an entry point that refers to a widget module with a valid
+        cache entry, without importing the module. Return `True` if the
+        entry point was processed and `False` if it needs to be resolved.
+        """
+        if entry_point.attrs:
+            return False
+        try:
+            # Imports the parent packages, but not the module itself
+            spec = importlib.util.find_spec(entry_point.module_name)
+        except Exception:
+            return False
+        if spec is None or not spec.has_location or \
+                spec.submodule_search_locations is not None:
+            # Not a module in a file system, or a package (a category)
+            return False
+
+        distribution = entry_point.dist
+        if not self.cache_has_valid_entry(spec.origin, distribution):
+            return False
+        desc = self.cache_get(spec.origin).description
+        if desc is None:
+            return False
+
+        desc.name = entry_point.name
+        if distribution is not None:
+            desc.project_name = distribution.project_name
+        self.handle_widget(desc)
+        return True
 
     def process_category_package(self, category, name=None, distribution=None):
         """
@@ -418,7 +464,7 @@ def fix_pyext(mod_path):
     extension and replace it with .py).
 
     """
-    if mod_path[-4:] in [".pyo", "pyc"]:
+    if mod_path[-4:] in [".pyo", ".pyc"]:
         mod_path = mod_path[:-1]
     return mod_path
 
@@ -493,11 +539,15 @@ def asmodule(module):
         raise TypeError(type(module))
 
 
-def run_discovery(entry_point, cached=False):
+def run_discovery(entry_points_iter, cached=False):
     """
     Run the default widget discovery and return a :class:`WidgetRegistry`
     instance.
 
+    If `cached` is `True`, descriptions of widget modules that have not
+    changed since the last run are taken from the on-disk registry cache,
+    without importing the modules.
+
     """
     reg_cache = {}
     if cached:
@@ -505,7 +555,7 @@ def run_discovery(entry_point, cached=False):
 
     registry = WidgetRegistry()
     discovery = WidgetDiscovery(registry, cached_descriptions=reg_cache)
-    discovery.run()
+    discovery.run(entry_points_iter)
     if cached:
-        cache.save_registry_cache(reg_cache)
+        cache.save_registry_cache(discovery.cached_descriptions)
     return registry
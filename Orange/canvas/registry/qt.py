@@ -359,7 +359,7 @@ def run_discovery(entry_points_iter, cached=False):
     registry = QtWidgetRegistry()
     discovery.found_category.connect(registry.register_category)
     discovery.found_widget.connect(registry.register_widget)
-    discovery.run()
+    discovery.run(entry_points_iter)
     if cached:
-        cache.save_registry_cache(reg_cache)
+        cache.save_registry_cache(discovery.cached_descriptions)
     return registry
@@ -7,6 +7,9 @@ import os
 import logging
 
 import unittest
+from unittest.mock import Mock, patch
+
+import pkg_resources
 
 from ..discovery import WidgetDiscovery, widget_descriptions_from_package
 
@@ -70,3 +73,32 @@ class TestDiscovery(unittest.TestCase):
     def test_run(self):
         disc = self.discovery_class()
         disc.run("example.does.not.exist.but.it.does.not.matter.")
+
+    def test_cached_widget_module(self):
+        entry_point = pkg_resources.EntryPoint.parse(
+            "File = Orange.widgets.data.owfile")
+        disc = self.discovery_class()
+        disc.handle_widget = Mock()
+        disc.run([entry_point])
+        desc = disc.handle_widget.call_args[0][0]
+        self.assertEqual(desc.name, "File")
+
+        warm = WidgetDiscovery(
+            cached_descriptions=disc.cached_descriptions)
+        warm.handle_widget = Mock()
+        entry_point.resolve = Mock()
+        warm.run([entry_point])
+        entry_point.resolve.assert_not_called()
+        warm.handle_widget.assert_called_once_with(desc)
+
+    def test_cached_category_package(self):
+        disc = self.discovery_class()
+        disc.process_category_package("Orange.widgets.data")
+
+        warm = WidgetDiscovery(
+            cached_descriptions=disc.cached_descriptions)
+        warm.handle_widget = Mock()
+        with patch.object(WidgetDiscovery, "widget_description") as describe:
+            warm.process_category_package("Orange.widgets.data")
+            describe.assert_not_called()
+        self.assertTrue(warm.handle_widget.called)
@@ -0,0 +1,409 @@
+"""
+Headless workflow execution
+===========================
+
+Runs a workflow saved in an .ows file without the GUI: instead of creating
+widgets, every node is replaced by the computation behind it -- a function
+that receives the node's saved settings and its inputs and returns its
+outputs. Nodes in independent branches of the workflow run concurrently on
+a process pool, outputs are written to files as soon as each node finishes
+and the time spent in each node is reported.
+
+Computations are registered with :func:`node_computation` under the
+qualified names of widgets; nodes for which no computation is registered
+are skipped (and so receive nothing, like in the canvas when a widget does
+not send anything).
+
+Usage::
+
+    python -m Orange.canvas.scheme.headless workflow.ows -o results -j 4
+
+"""
+import argparse
+import importlib
+import logging
+import os
+import pickle
+import re
+import sys
+import time
+
+from collections import namedtuple, defaultdict
+from concurrent.futures import (
+    Future, ProcessPoolExecutor, wait, FIRST_COMPLETED
+)
+
+from . import readwrite
+
+log = logging.getLogger(__name__)
+
+
+_COMPUTATIONS = {}
+
+
+def node_computation(*qualified_names):
+    """
+    Register the decorated function as the computation behind widgets with
+    the given qualified names.
+
+    The function is called with three arguments: a dictionary with the
+    node's settings (as saved in the workflow), a dictionary that maps names
+    of input channels to lists of received values (in the order of links)
+    and a dictionary with the environment (the workflow's `basedir`, the
+    `output_dir`, the node's `title` and the widget's `qualified_name`). It
+    returns a dictionary that maps names of output channels to values, or
+    raises :obj:`NodeError` to report an error and still send some outputs.
+
+    The function runs in a worker process, so it must be defined at a
+    module's top level; with the default start method on Linux (fork) it is
+    sufficient to register it before calling :obj:`HeadlessWorkflow.run`.
+    """
+    def decorator(func):
+        for name in qualified_names:
+            _COMPUTATIONS[name] = func
+        return func
+    return decorator
+
+
+def computation_for(qualified_name):
+    """Return the computation registered for a widget or `None`"""
+    return _COMPUTATIONS.get(qualified_name)
+
+
+class NodeError(Exception):
+    """
+    An error in a node's computation after which the node still sends
+    `outputs`, like a widget that shows an error but outputs, for instance,
+    a learner without a model.
+    """
+    def __init__(self, error, outputs):
+        if isinstance(error, Exception):
+            error = "{}: {}".format(type(error).__name__, error)
+        super().__init__(error, outputs)
+
+    @property
+    def outputs(self):
+        return self.args[1]
+
+    def __str__(self):
+        return self.args[0]
+
+
+Node = namedtuple("Node", ["id", "title", "qualified_name", "settings"])
+Link = namedtuple("Link", ["source_id", "source_channel",
+                           "sink_id", "sink_channel"])
+
+#: The outcome of running a node; `time` is the time spent in the node's
+#: computation (without the transfer of inputs and outputs) and `error` is
+#: a string with the exception if the computation failed.
+NodeResult = namedtuple("NodeResult",
+                        ["node", "outputs", "time", "error", "filenames"])
+
+
+def _first(inputs, channel):
+    values = inputs.get(channel)
+    return values[0] if values else None
+
+
+def _submit_now(func, *args):
+    # Run the function immediately; returns a finished future so that
+    # the sequential and the parallel runs share the same code
+    future = Future()
+    try:
+        future.set_result(func(*args))
+    except BaseException as ex:  # pylint: disable=broad-except
+        future.set_exception(ex)
+    return future
+
+
+def _run_node(qualified_name, settings, inputs, env):
+    start = time.perf_counter()
+    outputs = _COMPUTATIONS[qualified_name](settings, inputs, env)
+    return outputs, time.perf_counter() - start
+
+
+def _output_filename(node, channel):
+    name = "{}-{}-{}.pkl".format(node.id, node.title, channel)
+    return re.sub(r"[^\w\-. ]", "_", name)
+
+
+class HeadlessWorkflow:
+    """
+    A workflow whose nodes are run without widgets.
+
+    Parameters
+    ----------
+    nodes : list of Node
+        Nodes; settings are dictionaries of saved widget properties.
+    links : list of Link
+        Enabled links between nodes.
+    basedir : str, optional
+        The directory of the workflow file, used to find files referred to
+        by relative paths.
+    """
+    def __init__(self, nodes, links, basedir=None):
+        self.nodes = list(nodes)
+        self.links = list(links)
+        self.basedir = basedir
+
+    @classmethod
+    def from_stream(cls, stream, basedir=None):
+        """Read the workflow from a stream with the .ows file's contents"""
+        desc = readwrite.parse_ows_stream(stream)
+        nodes = []
+        for node in desc.nodes:
+            settings = {}
+            if node.data is not None:
+                try:
+                    settings = readwrite.loads(node.data.data,
+                                               node.data.format)
+                except Exception:  # pylint: disable=broad-except
+                    log.error("Could not load properties for %r.",
+                              node.title, exc_info=True)
+            nodes.append(
+                Node(node.id, node.title, node.qualified_name, settings))
+        links = [Link(link.source_node_id, link.source_channel,
+                      link.sink_node_id, link.sink_channel)
+                 for link in desc.links if link.enabled]
+        return cls(nodes, links, basedir)
+
+    @classmethod
+    def from_file(cls, filename):
+        """Read the workflow from an .ows file"""
+        with open(filename, "rb") as f:
+            return cls.from_stream(
+                f, basedir=os.path.dirname(os.path.abspath(filename)))
+
+    def run(self, output_dir=None, max_workers=1, callback=None):
+        """
+        Run the computations behind all nodes.
+
+        A node is started when all nodes it depends upon are finished;
+        nodes in independent branches run in parallel when `max_workers`
+        is larger than 1. A node that fails or has no computation does not
+        send anything, but the nodes that depend on it still run, as in
+        the canvas.
+
+        Parameters
+        ----------
+        output_dir : str, optional
+            If given, outputs of each node are pickled into this directory
+            as soon as the node finishes, and nodes that save data (e.g.
+            Save Data) write into it.
+        max_workers : int
+            The number of worker processes; if 1, nodes are run in this
+            process, one after another.
+        callback : callable, optional
+            Called with the :obj:`NodeResult` of each node when it
+            finishes.
+
+        Returns
+        -------
+        results : list of NodeResult
+            Results in the order in which nodes finished.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive")
+        if output_dir is not None:
+            os.makedirs(output_dir, exist_ok=True)
+
+        nodes = {node.id: node for node in self.nodes}
+        incoming = defaultdict(list)
+        upstream = defaultdict(set)
+        downstream = defaultdict(set)
+        for link in self.links:
+            incoming[link.sink_id].append(link)
+            upstream[link.sink_id].add(link.source_id)
+            downstream[link.source_id].add(link.sink_id)
+
+        outputs = {}
+        results = []
+        ready = [node.id for node in self.nodes if not upstream[node.id]]
+        running = {}
+
+        def finish(node, node_outputs, elapsed, error):
+            outputs[node.id] = node_outputs
+            filenames = []
+            if output_dir is not None:
+                for channel, value in sorted(node_outputs.items()):
+                    if value is None:
+                        continue
+                    filename = os.path.join(
+                        output_dir, _output_filename(node, channel))
+                    with open(filename, "wb") as f:
+                        pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+                    filenames.append(filename)
+            result = NodeResult(node, node_outputs, elapsed, error, filenames)
+            results.append(result)
+            if callback is not None:
+                callback(result)
+            for sink_id in sorted(downstream[node.id]):
+                upstream[sink_id].discard(node.id)
+                if not upstream[sink_id]:
+                    ready.append(sink_id)
+
+        executor = None
+        if max_workers > 1:
+            executor = ProcessPoolExecutor(max_workers)
+        try:
+            while ready or running:
+                while ready:
+                    node = nodes[ready.pop(0)]
+                    if computation_for(node.qualified_name) is None:
+                        log.warning("Skipping %r: %s can not be run without "
+                                    "GUI.", node.title, node.qualified_name)
+                        finish(node, {}, 0., None)
+                        continue
+                    inputs = defaultdict(list)
+                    for link in incoming[node.id]:
+                        value = outputs[link.source_id].get(
+                            link.source_channel)
+                        if value is not None:
+                            inputs[link.sink_channel].append(value)
+                    env = {"basedir": self.basedir, "output_dir": output_dir,
+                           "title": node.title,
+                           "qualified_name": node.qualified_name}
+                    args = (node.qualified_name, node.settings,
+                            dict(inputs), env)
+                    if executor is None:
+                        future = _submit_now(_run_node, *args)
+                    else:
+                        future = executor.submit(_run_node, *args)
+                    running[future] = node
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: running[f].id):
+                    node = running.pop(future)
+                    try:
+                        node_outputs, elapsed = future.result()
+                    except NodeError as ex:
+                        log.error("Error in %r: %s", node.title, ex)
+                        finish(node, ex.outputs, 0., str(ex))
+                    except Exception as ex:  # pylint: disable=broad-except
+                        log.error("Error in %r.", node.title, exc_info=True)
+                        finish(node, {}, 0., "{}: {}".format(
+                            type(ex).__name__, ex))
+                    else:
+                        finish(node, node_outputs, elapsed, None)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return results
+
+
+def format_timings(results):
+    """Return a report of per-node times and errors, one line per node"""
+    lines = []
+    for result in sorted(results, key=lambda r: -r.time):
+        status = "skipped" if computation_for(
+            result.node.qualified_name) is None else result.error or "ok"
+        lines.append("{:10.3f} s  {}  ({})".format(
+            result.time, result.node.title, status))
+    lines.append("{:10.3f} s  total".format(sum(r.time for r in results)))
+    return "\n".join(lines)
+
+
+# Computations behind core widgets; they call the widgets' class methods that
+# compute outputs from settings, so that they match what widgets would send
+
+def _widget_class(qualified_name):
+    module, name = qualified_name.rsplit(".", 1)
+    return getattr(importlib.import_module(module), name)
+
+
+@node_computation("Orange.widgets.data.owfile.OWFile")
+def file_computation(settings, inputs, env):
+    """File: read the last used file or URL; edits of the domain are ignored"""
+    # pylint: disable=unused-argument
+    from Orange.widgets.data.owfile import OWFile
+    return {"Data": OWFile.data_from_settings(settings, env.get("basedir"))}
+
+
+@node_computation("Orange.widgets.data.owsave.OWSave")
+def save_computation(settings, inputs, env):
+    """Save Data: write the data into the output directory as a .tab file"""
+    # pylint: disable=unused-argument
+    data = _first(inputs, "Data")
+    if data is not None and env.get("output_dir"):
+        name = re.sub(r"[^\w\-. ]", "_", env["title"]) + ".tab"
+        data.save(os.path.join(env["output_dir"], name))
+    return {}
+
+
+@node_computation("Orange.widgets.model.owsavemodel.OWSaveModel")
+def save_model_computation(settings, inputs, env):
+    """Save Model: pickle the model into the output directory"""
+    # pylint: disable=unused-argument
+    model = _first(inputs, "Model")
+    if model is not None and env.get("output_dir"):
+        name = os.path.basename(settings.get("filename") or "") or \
+            re.sub(r"[^\w\-. ]", "_", env["title"]) + ".pkcls"
+        with open(os.path.join(env["output_dir"], name), "wb") as f:
+            pickle.dump(model, f)
+    return {}
+
+
+@node_computation("Orange.widgets.model.owloadmodel.OWLoadModel")
+def load_model_computation(settings, inputs, env):
+    """Load Model: unpickle the current model file"""
+    # pylint: disable=unused-argument
+    from Orange.widgets.model.owloadmodel import OWLoadModel
+    return {"Model": OWLoadModel.model_from_settings(settings)}
+
+
+@node_computation(
+    "Orange.widgets.model.ownaivebayes.OWNaiveBayes",
+    "Orange.widgets.model.owlogisticregression.OWLogisticRegression",
+    "Orange.widgets.model.owtree.OWTreeLearner",
+    "Orange.widgets.model.owrandomforest.OWRandomForest",
+    "Orange.widgets.model.owknn.OWKNNLearner")
+def learner_computation(settings, inputs, env):
+    """Learners: output the learner and the model fitted to the data"""
+    widget = _widget_class(env["qualified_name"])
+    learner = widget.learner_from_settings(
+        settings, _first(inputs, "Preprocessor"))
+    try:
+        model = widget.model_from_settings(
+            settings, learner, _first(inputs, "Data"))
+    except Exception as ex:  # pylint: disable=broad-except
+        # Like the widget, send the learner even if fitting fails
+        raise NodeError(ex, {"Learner": learner, "Model": None}) from ex
+    return {"Learner": learner, "Model": model}
+
+
+@node_computation("Orange.widgets.evaluate.owpredictions.OWPredictions")
+def predictions_computation(settings, inputs, env):
+    """Predictions: append predictions and probabilities to the data"""
+    # pylint: disable=unused-argument
+    from Orange.widgets.evaluate.owpredictions import OWPredictions
+    return {"Predictions": OWPredictions.predictions_from_settings(
+        settings, _first(inputs, "Data"), inputs.get("Predictors", []))}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run a workflow without the GUI.")
+    parser.add_argument("workflow", help="an .ows file")
+    parser.add_argument("-o", "--output-dir", default=None,
+                        help="directory for the outputs of nodes")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="number of worker processes")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    workflow = HeadlessWorkflow.from_file(args.workflow)
+
+    def report(result):
+        print("{:10.3f} s  {}{}".format(
+            result.time, result.node.title,
+            ": " + result.error if result.error else ""), flush=True)
+
+    start = time.perf_counter()
+    results = workflow.run(args.output_dir, max(args.jobs, 1), report)
+    print("Finished in {:.3f} s; time spent in nodes:".format(
+        time.perf_counter() - start))
+    print(format_timings(results))
+    return int(any(result.error for result in results))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
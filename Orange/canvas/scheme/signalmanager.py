@@ -5,17 +5,30 @@ Signal Manager
 A SignalManager instance handles the runtime signal propagation between
 widgets in a scheme.
 
+By default, inputs are delivered to one node at a time, on the GUI thread.
+In asynchronous mode (:func:`SignalManager.set_asynchronous`), they are
+delivered on a worker thread pool, and nodes in independent branches of the
+workflow are updated concurrently.
+
+Signals with the same fingerprint as the one last delivered on the same
+link (see :func:`SignalManager.fingerprint`) are not delivered again, so a
+node that re-sends unchanged outputs does not trigger recomputation
+downstream. The base implementation delivers all signals.
+
 
 """
 
 import logging
+import sys
 import warnings
 
 from collections import namedtuple, defaultdict, deque
 from operator import attrgetter
 from functools import partial
 
-from AnyQt.QtCore import QObject, QCoreApplication, QEvent, QTimer
+from AnyQt.QtCore import (
+    QObject, QCoreApplication, QEvent, QTimer, QThread, QThreadPool, Qt
+)
 from AnyQt.QtCore import pyqtSignal as Signal, pyqtSlot as Slot
 
 
@@ -70,6 +83,11 @@ class SignalManager(QObject):
     runtimeStateChanged = Signal(int)
     """Emitted when `SignalManager`'s runtime state changes."""
 
+    # Arguments of `send` called from a worker thread, queued to our thread
+    _queuedSend = Signal(tuple)
+    # A node and the future of delivery of its inputs on a worker thread
+    _nodeFinished = Signal(object, object)
+
     def __init__(self, scheme):
         assert(scheme)
         QObject.__init__(self, scheme)
@@ -87,6 +105,23 @@ class SignalManager(QObject):
         self.__update_timer = QTimer(self, interval=100, singleShot=True)
         self.__update_timer.timeout.connect(self.__process_next)
 
+        # A flag indicating that we are in `process_queued`
+        self.__in_process_queued = False
+
+        # Asynchronous mode: executor, maximal number of concurrently
+        # updated nodes and nodes whose inputs are being delivered
+        self.__executor = None
+        self.__max_concurrent = MAX_CONCURRENT
+        self.__running = {}
+
+        # Fingerprints of values last delivered on links
+        # {(link, id): fingerprint}
+        self.__delivered = {}
+
+        self._queuedSend.connect(self.__on_queued_send, Qt.QueuedConnection)
+        self._nodeFinished.connect(self.__on_node_finished,
+                                   Qt.QueuedConnection)
+
     def _can_process(self):
         """
         Return a bool indicating if the manger can enter the main
@@ -154,6 +189,49 @@ class SignalManager(QObject):
         """
         return self.__state
 
+    def set_asynchronous(self, asynchronous, max_workers=None):
+        """
+        Enable or disable the asynchronous mode.
+
+        In asynchronous mode, inputs of nodes for which `is_asynchronous`
+        returns `True` are delivered (`send_to_node` is called) on a
+        :obj:`~Orange.widgets.utils.concurrent.ThreadExecutor` with
+        `max_workers` threads (by default, the number of cores). Up to
+        `max_workers` nodes are updated or blocking at the same time;
+        a node's descendants are still updated only after the node.
+
+        Parameters
+        ----------
+        asynchronous : bool
+            Enable the asynchronous mode.
+        max_workers : Optional[int]
+            The number of worker threads.
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False)
+            self.__executor = None
+            self.__max_concurrent = MAX_CONCURRENT
+
+        if asynchronous:
+            from Orange.widgets.utils.concurrent import ThreadExecutor
+            if max_workers is None:
+                max_workers = max(1, QThread.idealThreadCount())
+            pool = QThreadPool(self)
+            pool.setMaxThreadCount(max_workers)
+            self.__executor = ThreadExecutor(self, threadPool=pool)
+            self.__max_concurrent = max_workers
+            self._update()
+
+    def is_asynchronous(self, node):
+        """
+        Are inputs of `node` delivered on a worker thread.
+
+        The base implementation returns `True` in asynchronous mode.
+        Reimplement to keep nodes whose inputs must be delivered on the
+        GUI thread synchronous.
+        """
+        return self.__executor is not None
+
     def _set_runtime_state(self, state):
         """
         Set the runtime state.
@@ -202,11 +280,13 @@ class SignalManager(QObject):
         # purge all values in sink's queue
         log.info("Link removed (%s). Scheduling signal data purge.", link)
         self.purge_link(link)
+        self.__forget_delivered(link)
         link.enabled_changed.disconnect(self.link_enabled_changed)
 
     def link_enabled_changed(self, enabled):
         if enabled:
             link = self.sender()
+            self.__forget_delivered(link)
             log.info("Link %s enabled. Scheduling signal data update.", link)
             self._schedule(self.signals_on_link(link))
 
@@ -242,7 +322,14 @@ class SignalManager(QObject):
 
     def send(self, node, channel, value, id):
         """
+        Send the `value` with `id` on an output `channel` of `node`.
+
+        Values sent from worker threads are queued to the manager's thread.
         """
+        if QThread.currentThread() is not self.thread():
+            self._queuedSend.emit((node, channel, value, id))
+            return
+
         log.debug("%r sending %r (id: %r) on channel %r",
                   node.title, type(value), id, channel.name)
 
@@ -308,7 +395,7 @@ class SignalManager(QObject):
                 "`max_nodes` is deprecated and unused (will always equal 1)",
                 DeprecationWarning, stacklevel=2)
 
-        if self.__runtime_state == SignalManager.Processing:
+        if self.__in_process_queued:
             raise RuntimeError("Cannot re-enter 'process_queued'")
 
         if not self._can_process():
@@ -323,10 +410,13 @@ class SignalManager(QObject):
         if node_update_front:
             node = node_update_front[0]
             self._set_runtime_state(SignalManager.Processing)
+            self.__in_process_queued = True
             try:
                 self.process_node(node)
             finally:
-                self._set_runtime_state(SignalManager.Waiting)
+                self.__in_process_queued = False
+                if not self.__running:
+                    self._set_runtime_state(SignalManager.Waiting)
 
     def process_node(self, node):
         """
@@ -337,22 +427,91 @@ class SignalManager(QObject):
 
         signals_in = self.compress_signals(signals_in)
 
-        log.debug("Processing %r, sending %i signals.",
-                  node.title, len(signals_in))
         # Clear the link's pending flag.
         for link in {sig.link for sig in signals_in}:
             link.set_runtime_state(link.runtime_state() & ~SchemeLink.Pending)
 
+        signals_in = self.__drop_delivered(signals_in)
+        log.debug("Processing %r, sending %i signals.",
+                  node.title, len(signals_in))
+        if not signals_in:
+            return
+
         assert ({sig.link for sig in self._input_queue}
                 .intersection({sig.link for sig in signals_in}) == set([]))
         self.processingStarted.emit()
         self.processingStarted[SchemeNode].emit(node)
+        if self.is_asynchronous(node):
+            # Processing finishes in `__on_node_finished`; until then,
+            # the node is blocking
+            future = self.__executor.submit(self.send_to_node, node,
+                                            signals_in)
+            self.__running[node] = future
+            future.add_done_callback(
+                lambda f: self._nodeFinished.emit(node, f))
+            return
+
         try:
             self.send_to_node(node, signals_in)
         finally:
             self.processingFinished.emit()
             self.processingFinished[SchemeNode].emit(node)
 
+    def fingerprint(self, signal):
+        """
+        Return a fingerprint of the signal's value, which is equal for
+        values that need not be delivered on the signal's link again, or
+        `None` if the value must always be delivered.
+
+        This is called on the GUI thread for every delivered signal, so
+        it must be cheaper than the work it saves in the receiving widgets.
+        The base implementation returns `None`.
+        """
+        return None
+
+    def __drop_delivered(self, signals):
+        """
+        Remove signals whose values have the same fingerprint as those last
+        delivered on their links and record fingerprints of the others.
+        """
+        kept = []
+        for sig in signals:
+            key = (sig.link, sig.id)
+            fingerprint = self.fingerprint(sig)
+            if fingerprint is not None and \
+                    self.__delivered.get(key) == fingerprint:
+                log.debug("Not delivering an unchanged value on %s", sig.link)
+                continue
+            kept.append(sig)
+            if fingerprint is None:
+                self.__delivered.pop(key, None)
+            else:
+                self.__delivered[key] = fingerprint
+        return kept
+
+    def __forget_delivered(self, link):
+        for key in [key for key in self.__delivered if key[0] is link]:
+            del self.__delivered[key]
+
+    @Slot(tuple)
+    def __on_queued_send(self, args):
+        SignalManager.send(self, *args)
+
+    @Slot(object, object)
+    def __on_node_finished(self, node, future):
+        del self.__running[node]
+        try:
+            exc = future.exception()
+            if exc is not None:
+                log.error("Error delivering inputs to '%s'", node.title)
+                sys.excepthook(type(exc), exc, exc.__traceback__)
+        finally:
+            if not self.__running and not self.__in_process_queued:
+                self._set_runtime_state(SignalManager.Waiting)
+            self.processingFinished.emit()
+            self.processingFinished[SchemeNode].emit(node)
+            self._update()
+
     def compress_signals(self, signals):
         """
         Compress a list of :class:`_Signal` instances to be delivered.
@@ -413,10 +572,12 @@ class SignalManager(QObject):
 
     def blocking_nodes(self):
         """
-        Return a list of nodes in a blocking state.
+        Return a list of nodes in a blocking state, including the nodes
+        whose inputs are being delivered on worker threads.
         """
         scheme = self.scheme()
-        return [node for node in scheme.nodes if self.is_blocking(node)]
+        return [node for node in scheme.nodes
+                if node in self.__running or self.is_blocking(node)]
 
     def is_blocking(self, node):
         return False
@@ -458,7 +619,7 @@ class SignalManager(QObject):
             log.debug("Received 'UpdateRequest' while not in 'Running' state")
             return
 
-        if self.__runtime_state == SignalManager.Processing:
+        if self.__in_process_queued:
             # This happens if someone calls QCoreApplication.processEvents
             # from the signal handlers.
             # A `__process_next` must be rescheduled when exiting
@@ -471,10 +632,10 @@ class SignalManager(QObject):
 
         nbusy = len(self.blocking_nodes())
         log.info("'UpdateRequest' event, queued signals: %i, nbusy: %i "
-                 "(MAX_CONCURRENT: %i)",
-                 len(self._input_queue), nbusy, MAX_CONCURRENT)
+                 "(max concurrent: %i)",
+                 len(self._input_queue), nbusy, self.__max_concurrent)
 
-        if self._input_queue and nbusy < MAX_CONCURRENT:
+        if self._input_queue and nbusy < self.__max_concurrent:
             self.process_queued()
 
         if self.__reschedule and self.__state == SignalManager.Running:
@@ -483,7 +644,7 @@ class SignalManager(QObject):
             self.__update_timer.start()
 
         nbusy = len(self.blocking_nodes())
-        if self.node_update_front() and nbusy < MAX_CONCURRENT:
+        if self.node_update_front() and nbusy < self.__max_concurrent:
             log.debug("More nodes are eligible for an update. "
                       "Scheduling another update.")
             self._update()
@@ -0,0 +1,153 @@
+"""Tests for headless execution of workflows
+"""
+import os
+import pickle
+import tempfile
+import unittest
+from io import BytesIO
+
+from Orange.data import Table
+
+from ..headless import HeadlessWorkflow, Node, Link, node_computation, \
+    format_timings
+
+
+@node_computation("test.headless.Iris")
+def iris_computation(settings, inputs, env):
+    # pylint: disable=unused-argument
+    return {"Data": Table("iris")[::settings.get("step", 1)]}
+
+
+@node_computation("test.headless.Fail")
+def fail_computation(settings, inputs, env):
+    raise ValueError("no luck")
+
+
+OWS = b"""<?xml version='1.0' encoding='utf-8'?>
+<scheme version="2.0" title="" description="">
+<nodes>
+<node id="0" name="Iris" qualified_name="test.headless.Iris"
+      project_name="" version="" title="Iris" position="(0, 0)" />
+<node id="1" name="Naive Bayes"
+      qualified_name="Orange.widgets.model.ownaivebayes.OWNaiveBayes"
+      project_name="Orange3" version="" title="Bayes" position="(1, 0)" />
+<node id="2" name="Tree"
+      qualified_name="Orange.widgets.model.owtree.OWTreeLearner"
+      project_name="Orange3" version="" title="Tree" position="(1, 1)" />
+<node id="3" name="Predictions"
+      qualified_name="Orange.widgets.evaluate.owpredictions.OWPredictions"
+      project_name="Orange3" version="" title="Predictions" position="(2, 0)" />
+<node id="4" name="Scatter Plot"
+      qualified_name="Orange.widgets.visualize.owscatterplot.OWScatterPlot"
+      project_name="Orange3" version="" title="Scatter" position="(3, 0)" />
+</nodes>
+<links>
+<link id="0" source_node_id="0" sink_node_id="1" source_channel="Data"
+      sink_channel="Data" enabled="true" />
+<link id="1" source_node_id="0" sink_node_id="2" source_channel="Data"
+      sink_channel="Data" enabled="true" />
+<link id="2" source_node_id="1" sink_node_id="3" source_channel="Model"
+      sink_channel="Predictors" enabled="true" />
+<link id="3" source_node_id="2" sink_node_id="3" source_channel="Model"
+      sink_channel="Predictors" enabled="true" />
+<link id="4" source_node_id="0" sink_node_id="3" source_channel="Data"
+      sink_channel="Data" enabled="true" />
+<link id="5" source_node_id="3" sink_node_id="4" source_channel="Predictions"
+      sink_channel="Data" enabled="true" />
+<link id="6" source_node_id="0" sink_node_id="4" source_channel="Data"
+      sink_channel="Data Subset" enabled="false" />
+</links>
+<node_properties>
+<properties node_id="0" format="literal">{'step': 2}</properties>
+<properties node_id="2" format="literal">{'learner_name': 'My Tree',
+    'max_depth': 2}</properties>
+</node_properties>
+</scheme>
+"""
+
+
+class TestHeadlessWorkflow(unittest.TestCase):
+    def setUp(self):
+        self.workflow = HeadlessWorkflow.from_stream(BytesIO(OWS))
+
+    def test_from_stream(self):
+        workflow = self.workflow
+        self.assertEqual([node.title for node in workflow.nodes],
+                         ["Iris", "Bayes", "Tree", "Predictions", "Scatter"])
+        self.assertEqual(workflow.nodes[0].settings, {"step": 2})
+        self.assertEqual(workflow.nodes[1].settings, {})
+        self.assertEqual(workflow.nodes[2].settings["learner_name"], "My Tree")
+        # disabled link is omitted
+        self.assertEqual(len(workflow.links), 6)
+        self.assertEqual(workflow.links[0], Link("0", "Data", "1", "Data"))
+
+    def check_results(self, results, output_dir):
+        by_title = {result.node.title: result for result in results}
+        order = [result.node.title for result in results]
+        self.assertEqual(len(results), 5)
+        self.assertEqual(order[0], "Iris")
+        self.assertEqual(order[-2:], ["Predictions", "Scatter"])
+        self.assertTrue(all(result.error is None for result in results))
+
+        predictions = by_title["Predictions"].outputs["Predictions"]
+        self.assertEqual(len(predictions), 75)
+        self.assertEqual(
+            [var.name for var in predictions.domain.metas[:2]],
+            ["Naive Bayes", "My Tree"])
+        self.assertEqual(len(predictions.domain.metas), 2 + 2 * 3)
+        self.assertEqual(by_title["Scatter"].outputs, {})
+
+        filename = os.path.join(output_dir, "3-Predictions-Predictions.pkl")
+        self.assertEqual(by_title["Predictions"].filenames, [filename])
+        with open(filename, "rb") as f:
+            saved = pickle.load(f)
+        self.assertEqual(saved.domain, predictions.domain)
+        self.assertEqual(len(os.listdir(output_dir)), 6)
+
+        report = format_timings(results)
+        self.assertIn("Scatter  (skipped)", report)
+        self.assertIn("total", report)
+
+    def test_run(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            self.check_results(self.workflow.run(output_dir), output_dir)
+
+    def test_run_parallel(self):
+        reported = []
+        with tempfile.TemporaryDirectory() as output_dir:
+            results = self.workflow.run(output_dir, max_workers=2,
+                                        callback=reported.append)
+            self.check_results(results, output_dir)
+        self.assertEqual(reported, results)
+
+    def test_failure(self):
+        workflow = HeadlessWorkflow(
+            [Node(0, "Fail", "test.headless.Fail", {}),
+             Node(1, "Bayes",
+                  "Orange.widgets.model.ownaivebayes.OWNaiveBayes", {})],
+            [Link(0, "Data", 1, "Data")])
+        fail, bayes = workflow.run()
+        self.assertEqual(fail.error, "ValueError: no luck")
+        self.assertIsNone(bayes.error)
+        self.assertIsNone(bayes.outputs["Model"])
+        self.assertEqual(bayes.outputs["Learner"].name, "Naive Bayes")
+
+        self.assertRaises(ValueError, workflow.run, max_workers=0)
+
+    def test_learner_error(self):
+        workflow = HeadlessWorkflow(
+            [Node(0, "Iris", "test.headless.Iris", {}),
+             Node(1, "Forest",
+                  "Orange.widgets.model.owrandomforest.OWRandomForest",
+                  {"use_max_features": True, "max_features": 10})],
+            [Link(0, "Data", 1, "Data")])
+        _, forest = workflow.run()
+        # the widget's check of data; the learner is still sent
+        self.assertEqual(forest.error,
+                         "ValueError: Insufficient number of attributes (4)")
+        self.assertIsNone(forest.outputs["Model"])
+        self.assertEqual(forest.outputs["Learner"].kwargs["max_features"], 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+Tests for SignalManager
+"""
+import threading
+import time
+
+from AnyQt.QtCore import QThread
+
+from ...gui import test
+from ...registry import WidgetDescription
+
+from .. import Scheme, SchemeLink
+from ..signalmanager import SignalManager
+
+
+class RecordingSignalManager(SignalManager):
+    def __init__(self, scheme):
+        super().__init__(scheme)
+        scheme.node_added.connect(self.on_node_added)
+        scheme.node_removed.connect(self.on_node_removed)
+        scheme.link_added.connect(self.link_added)
+        scheme.link_removed.connect(self.link_removed)
+        self.events = []
+        self.lock = threading.Lock()
+        self.barrier = None
+
+    def send_to_node(self, node, signals):
+        on_worker = QThread.currentThread() is not self.thread()
+        with self.lock:
+            self.events.append(("start", node, on_worker))
+        if self.barrier is not None and node.title.startswith("Discretize"):
+            # Passes only if both branches are updated concurrently
+            self.barrier.wait()
+        for channel in node.output_channels():
+            self.send(node, channel, signals[0].value, None)
+        with self.lock:
+            self.events.append(("end", node, on_worker))
+
+
+class DeduplicatingSignalManager(RecordingSignalManager):
+    def fingerprint(self, signal):
+        return signal.value
+
+
+class TestSignalManager(test.QCoreAppTestCase):
+    manager_class = RecordingSignalManager
+
+    def setUp(self):
+        super().setUp()
+        file_desc, discretize_desc, bayes_desc = [
+            WidgetDescription.from_module("Orange.widgets." + module)
+            for module in ("data.owfile", "data.owdiscretize",
+                           "model.ownaivebayes")]
+
+        self.scheme = Scheme()
+        self.manager = self.manager_class(self.scheme)
+        # Two independent branches: file -> discretize -> bayes
+        self.branches = []
+        for i in range(2):
+            nodes = [self.scheme.new_node(desc, title="{} {}".format(
+                desc.name, i)) for desc in (file_desc, discretize_desc,
+                                            bayes_desc)]
+            self.scheme.add_link(SchemeLink(nodes[0], "Data",
+                                            nodes[1], "Data"))
+            self.scheme.add_link(SchemeLink(nodes[1], "Data",
+                                            nodes[2], "Data"))
+            self.branches.append(nodes)
+
+    def tearDown(self):
+        self.manager.set_asynchronous(False)
+        del self.scheme
+        super().tearDown()
+
+    def send_data(self):
+        for source, _, _ in self.branches:
+            self.manager.send(source, source.output_channel("Data"), 42, None)
+
+    def process_events(self, timeout=0.5):
+        end = time.perf_counter() + timeout
+        while time.perf_counter() < end:
+            self.app.processEvents()
+            time.sleep(0.01)
+
+    def wait_for_events(self, n_events, timeout=10):
+        end = time.perf_counter() + timeout
+        while len(self.manager.events) < n_events and \
+                time.perf_counter() < end:
+            self.app.processEvents()
+            time.sleep(0.01)
+        self.app.processEvents()
+        self.assertEqual(len(self.manager.events), n_events)
+
+    def assert_dependencies(self):
+        events = [event[:2] for event in self.manager.events]
+        for _, discretize, bayes in self.branches:
+            self.assertLess(events.index(("end", discretize)),
+                            events.index(("start", bayes)))
+
+    def test_synchronous(self):
+        self.send_data()
+        self.wait_for_events(8)
+        self.assertFalse(any(on_worker for *_, on_worker
+                             in self.manager.events))
+        self.assert_dependencies()
+        self.assertEqual(self.manager.runtime_state(), SignalManager.Waiting)
+
+    def test_asynchronous(self):
+        self.manager.set_asynchronous(True, max_workers=2)
+        self.manager.barrier = threading.Barrier(2, timeout=5)
+        self.send_data()
+        self.wait_for_events(8)
+        self.assertTrue(all(on_worker for *_, on_worker
+                            in self.manager.events))
+        self.assertFalse(self.manager.barrier.broken)
+        self.assert_dependencies()
+        self.assertEqual(self.manager.blocking_nodes(), [])
+        self.assertEqual(self.manager.runtime_state(), SignalManager.Waiting)
+
+
+class TestSignalDeduplication(TestSignalManager):
+    manager_class = DeduplicatingSignalManager
+
+    def send(self, value):
+        source = self.branches[0][0]
+        self.manager.send(source, source.output_channel("Data"), value, None)
+
+    def test_unchanged_values_are_not_delivered(self):
+        self.send(42)
+        self.wait_for_events(4)
+        self.send(42)
+        self.process_events()
+        self.assertEqual(len(self.manager.events), 4)
+
+        self.send(43)
+        self.wait_for_events(8)
+
+        # a link that was disabled and enabled again gets the value again
+        _, discretize, _ = self.branches[0]
+        link = self.scheme.find_links(sink_node=discretize)[0]
+        link.enabled = False
+        link.enabled = True
+        self.wait_for_events(10)
+        self.assertEqual(self.manager.events[-1][:2], ("end", discretize))
@@ -0,0 +1,144 @@
+"""
+Tests for WidgetsScheme and WidgetsSignalManager
+"""
+import time
+from unittest.mock import Mock, patch
+
+from AnyQt.QtCore import QThread
+
+from Orange.data import Table
+
+from ...gui import test
+from ...registry import WidgetDescription
+from .. import SchemeLink
+from ..widgetsscheme import WidgetsScheme
+
+
+class TestWidgetsSignalManager(test.QAppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.scheme = WidgetsScheme()
+        self.manager = self.scheme.signal_manager
+        self.widget = Mock(deduplicate_outputs=False)
+        patcher = patch.object(self.scheme, "widget_for_node",
+                               return_value=self.widget)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        del self.manager
+        del self.scheme
+        super().tearDown()
+
+    def test_fingerprint(self):
+        data = Table("iris")
+        signal = Mock(value=data)
+        self.assertIsNone(self.manager.fingerprint(signal))
+
+        self.widget.deduplicate_outputs = True
+        fingerprint = self.manager.fingerprint(signal)
+        self.assertIsNotNone(fingerprint)
+        self.assertEqual(fingerprint, self.manager.fingerprint(signal))
+        data[0, 0] = 42
+        self.assertNotEqual(fingerprint, self.manager.fingerprint(signal))
+        self.assertIsNone(self.manager.fingerprint(Mock(value=42)))
+
+
+class TestDeduplicatedOutputs(test.QAppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.scheme = WidgetsScheme()
+        file_desc, distances_desc, clustering_desc = [
+            WidgetDescription.from_module("Orange.widgets." + module)
+            for module in ("data.owfile", "unsupervised.owdistances",
+                           "unsupervised.owhierarchicalclustering")]
+        self.source = self.scheme.new_node(file_desc)
+        self.distances = self.scheme.new_node(distances_desc)
+        self.clustering = self.scheme.new_node(clustering_desc)
+        self.scheme.add_link(
+            SchemeLink(self.source, "Data", self.distances, "Data"))
+        self.scheme.add_link(
+            SchemeLink(self.distances, "Distances", self.clustering,
+                       "Distances"))
+
+    def tearDown(self):
+        del self.scheme
+        super().tearDown()
+
+    def send(self, data):
+        manager = self.scheme.signal_manager
+        manager.send(self.scheme.widget_for_node(self.source), "Data",
+                     data, None)
+        self.wait()
+
+    def wait(self, until=lambda: True):
+        manager = self.scheme.signal_manager
+        end = time.perf_counter() + 10
+        while (not until() or manager.pending_nodes() or
+               manager.runtime_state() != manager.Waiting) \
+                and time.perf_counter() < end:
+            self.app.processEvents()
+
+    def test_distances_are_not_delivered_again(self):
+        distances = self.scheme.widget_for_node(self.distances)
+        clustering = self.scheme.widget_for_node(self.clustering)
+        self.assertTrue(distances.deduplicate_outputs)
+        data = Table("iris")[::5]
+        # The file widget loads its last file after it is created
+        self.wait(until=lambda: clustering.matrix is not None)
+        set_data = Mock(wraps=distances.set_data, __name__="set_data")
+        set_distances = Mock(wraps=clustering.set_distances,
+                             __name__="set_distances")
+        with patch.object(distances, "set_data", set_data), \
+                patch.object(clustering, "set_distances", set_distances):
+            self.send(data)
+            # Distances recomputes, but the same matrix is not delivered
+            self.send(data.copy())
+            self.assertEqual(set_data.call_count, 2)
+            self.assertEqual(set_distances.call_count, 1)
+
+            self.send(data[1:])
+            self.assertEqual(set_distances.call_count, 2)
+
+
+class TestAsynchronousWidgets(test.QAppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.scheme = WidgetsScheme()
+        file_desc, distances_desc = [
+            WidgetDescription.from_module("Orange.widgets." + module)
+            for module in ("data.owfile", "unsupervised.owdistances")]
+        self.source = self.scheme.new_node(file_desc)
+        self.sink = self.scheme.new_node(distances_desc)
+        self.scheme.add_link(SchemeLink(self.source, "Data", self.sink, "Data"))
+
+    def tearDown(self):
+        self.scheme.signal_manager.set_asynchronous(False)
+        del self.scheme
+        super().tearDown()
+
+    def test_thread_safe_inputs(self):
+        manager = self.scheme.signal_manager
+        manager.set_asynchronous(True)
+        widget = self.scheme.widget_for_node(self.sink)
+        self.assertTrue(widget.thread_safe_inputs)
+
+        calls = []
+        compute_distances = type(widget).compute_distances
+
+        def compute(widget, metric, data):
+            calls.append((QThread.currentThread() is self.app.thread(),
+                          widget.isEnabled()))
+            return compute_distances(widget, metric, data)
+
+        with patch.object(type(widget), "compute_distances", compute):
+            manager.send(self.scheme.widget_for_node(self.source), "Data",
+                         Table("iris"), None)
+            end = time.perf_counter() + 10
+            while (not calls or manager.runtime_state() != manager.Waiting) \
+                    and time.perf_counter() < end:
+                self.app.processEvents()
+                time.sleep(0.01)
+        # computed on a worker, while the widget's controls were disabled
+        self.assertEqual(calls, [(False, False)])
+        self.assertTrue(widget.isEnabled())
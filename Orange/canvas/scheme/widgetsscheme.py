@@ -28,7 +28,9 @@ import sip
 from AnyQt.QtWidgets import QWidget, QShortcut, QLabel, QSizePolicy, QAction
 from AnyQt.QtGui import QKeySequence, QWhatsThisClickedEvent
 
-from AnyQt.QtCore import Qt, QObject, QCoreApplication, QTimer, QEvent
+from AnyQt.QtCore import (
+    Qt, QObject, QCoreApplication, QTimer, QEvent, QThread
+)
 from AnyQt.QtCore import pyqtSignal as Signal
 
 from .signalmanager import SignalManager, compress_signals, can_enable_dynamic
@@ -192,7 +194,10 @@ class WidgetManager(QObject):
         self.__widget_processing_state = {}
 
         # Tracks the widget in the update loop by the SignalManager
-        self.__updating_widget = None
+        # Widgets whose inputs are being updated, by nodes
+        self.__updating_widgets = {}
+        # Widgets disabled while their inputs are updated on worker threads
+        self.__disabled_widgets = set()
 
     def set_scheme(self, scheme):
         """
@@ -656,16 +661,23 @@ class WidgetManager(QObject):
         widget = self.widget_for_node(node)
         # Remember the widget instance. The node and the node->widget mapping
         # can be removed between this and __on_processing_finished.
-        self.__updating_widget = widget
+        self.__updating_widgets[node] = widget
         self.__widget_processing_state[widget] |= self.InputUpdate
         self.__update_node_processing_state(node)
+        # Settings must not change while inputs are handled on a worker
+        if self.signal_manager().is_asynchronous(node) and widget.isEnabled():
+            self.__disabled_widgets.add(widget)
+            widget.setEnabled(False)
 
     def __on_processing_finished(self, node):
         """
         Signal manager exited the input update loop for the node.
         """
-        widget = self.__updating_widget
+        widget = self.__updating_widgets.pop(node)
         self.__widget_processing_state[widget] &= ~self.InputUpdate
+        if widget in self.__disabled_widgets:
+            self.__disabled_widgets.remove(widget)
+            widget.setEnabled(True)
 
         if widget in self.__node_for_widget:
             self.__update_node_processing_state(node)
@@ -674,8 +686,6 @@ class WidgetManager(QObject):
         else:
             raise ValueError("%r is not managed" % widget)
 
-        self.__updating_widget = None
-
     def __on_blocking_state_changed(self, state):
         """
         OWWidget blocking state has changed.
@@ -773,6 +783,18 @@ class WidgetsSignalManager(SignalManager):
                 WidgetManager.Initializing)
         return self.scheme().widget_manager.node_processing_state(node) & mask
 
+    def is_asynchronous(self, node):
+        """
+        Reimplemented from `SignalManager`.
+
+        Only inputs of widgets with thread-safe input handlers are delivered
+        on worker threads.
+        """
+        if not SignalManager.is_asynchronous(self, node):
+            return False
+        widget = self.scheme().widget_for_node(node)
+        return getattr(widget, "thread_safe_inputs", False)
+
     def send_to_node(self, node, signals):
         """
         Implementation of `SignalManager.send_to_node`.
@@ -789,6 +811,22 @@ class WidgetsSignalManager(SignalManager):
         """
         return compress_signals(signals)
 
+    def fingerprint(self, signal):
+        """
+        Reimplemented from :func:`SignalManager.fingerprint`.
+
+        Values sent by widgets with `deduplicate_outputs` are not delivered
+        again while their content does not change, if they have a
+        `fingerprint` method (see :func:`Orange.data.Table.fingerprint`);
+        other values are always delivered.
+        """
+        widget = self.scheme().widget_for_node(signal.link.source_node)
+        fingerprint = getattr(signal.value, "fingerprint", None)
+        if getattr(widget, "deduplicate_outputs", False) and \
+                callable(fingerprint):
+            return fingerprint()
+        return None
+
     def process_signals_for_widget(self, node, widget, signals):
         """
         Process new signals for the OWBaseWidget.
@@ -801,6 +839,25 @@ class WidgetsSignalManager(SignalManager):
             return
 
         app = QCoreApplication.instance()
+        # In asynchronous mode, this runs on a worker thread, which must not
+        # show the wait cursor or report errors in dialogs; the first error
+        # is reraised and reported when the processing finishes
+        in_gui_thread = QThread.currentThread() is app.thread()
+        errors = []
+
+        def set_wait_cursor():
+            if in_gui_thread:
+                app.setOverrideCursor(Qt.WaitCursor)
+
+        def restore_cursor():
+            if in_gui_thread:
+                app.restoreOverrideCursor()
+
+        def report_error():
+            if in_gui_thread:
+                sys.excepthook(*sys.exc_info())
+            else:
+                errors.append(sys.exc_info()[1])
 
         for signal in signals:
             link = signal.link
@@ -827,25 +884,28 @@ class WidgetsSignalManager(SignalManager):
             log.debug("Process signals: calling %s.%s (from %s with id:%s)",
                       type(widget).__name__, handler.__name__, link, signal.id)
 
-            app.setOverrideCursor(Qt.WaitCursor)
+            set_wait_cursor()
             try:
                 handler(*args)
             except Exception:
-                sys.excepthook(*sys.exc_info())
+                report_error()
                 log.exception("Error calling '%s' of '%s'",
                               handler.__name__, node.title)
             finally:
-                app.restoreOverrideCursor()
+                restore_cursor()
 
-        app.setOverrideCursor(Qt.WaitCursor)
+        set_wait_cursor()
         try:
             widget.handleNewSignals()
         except Exception:
-            sys.excepthook(*sys.exc_info())
+            report_error()
             log.exception("Error calling 'handleNewSignals()' of '%s'",
                           node.title)
         finally:
-            app.restoreOverrideCursor()
+            restore_cursor()
+
+        if errors:
+            raise errors[0]
 
     def eventFilter(self, receiver, event):
         if event.type() == QEvent.DeferredDelete and receiver is self.scheme():
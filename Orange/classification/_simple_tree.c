@@ -11,6 +11,7 @@
 
 #ifdef _MSC_VER
 #define isnan _isnan
+#define nextafter _nextafter
 #define log2f(x) (logf(x) / logf(2.0))
 #endif
 #define ASSERT(x) if(!(x)) exit(1)
@@ -28,6 +29,7 @@ struct Args {
 	float max_majority, skip_prob;
 
 	int type, *attr_split_so_far, num_attrs, cls_vals, *attr_vals, *domain;
+	unsigned int rand_state;
 };
 
 struct SimpleTreeNode {
@@ -79,6 +81,34 @@ enum { IntVar, FloatVar };
 #endif
 
 
+/*
+ * A xorshift generator whose state is kept in the arguments of a single
+ * build, so that trees can be built in parallel and each depends only on
+ * its seed.
+ */
+unsigned int
+next_random(unsigned int *state)
+{
+	unsigned int x = *state;
+
+	x ^= x << 13;
+	x ^= x >> 17;
+	x ^= x << 5;
+	return *state = x;
+}
+
+unsigned int
+init_random(int seed)
+{
+	unsigned int state = (unsigned int)seed * 2654435761u + 1;
+	int i;
+
+	/* decorrelate states from consecutive seeds */
+	for (i = 0; i < 8; i++)
+		next_random(&state);
+	return state;
+}
+
 /*
  * Examples with unknowns are larger so that, when sorted, they appear at the bottom.
  */
@@ -480,7 +510,7 @@ build_tree_(struct Example *examples, int size, int depth, struct SimpleTreeNode
 	for (i = 0; i < args->num_attrs; i++) {
 		if (!args->attr_split_so_far[i]) {
 			/* select random subset of attributes */
-			if ((double)rand() / (double)RAND_MAX < args->skip_prob)
+			if (next_random(&args->rand_state) / 4294967296.0 < args->skip_prob)
 				continue;
 
 			if (args->domain[i] == IntVar) {
@@ -622,13 +652,13 @@ build_tree(double *x, double *y, double *w, int size, int size_w, int min_instan
 	struct Args args;
 	int i, ind;
 
-	srand(seed);
+	args.rand_state = init_random(seed);
 
 	/* create a tabel with pointers to examples */
 	ASSERT(examples = (struct Example *)calloc(size, sizeof *examples));
 	for (i = 0; i < size; i++) {
 		if (bootstrap) {
-			ind = rand() % size;
+			ind = next_random(&args.rand_state) % size;
 		} else {
 			ind = i;
 		}
@@ -751,6 +781,62 @@ predict_regression(double *x, int size, struct SimpleTreeNode *node, int num_att
 	}
 }
 
+/*
+ * Forests are predicted in blocks of rows; all trees are applied to a block
+ * before proceeding to the next one, so that the block stays in the cache.
+ */
+#define FOREST_BLOCK_ROWS 256
+
+SIMPLE_TREE_EXPORT
+void
+predict_classification_forest(double *x, int size, struct SimpleTreeNode **trees, int n_trees, int num_attrs, int cls_vals, double *p)
+{
+	int i, j, t, start, end;
+	double *pp, *tree_p, sum;
+
+	ASSERT(tree_p = (double *)malloc(cls_vals * sizeof *tree_p));
+	for (start = 0; start < size; start = end) {
+		end = start + FOREST_BLOCK_ROWS < size ? start + FOREST_BLOCK_ROWS : size;
+		for (t = 0; t < n_trees; t++) {
+			for (i = start; i < end; i++) {
+				for (j = 0; j < cls_vals; j++)
+					tree_p[j] = 0;
+				predict_classification_(x + i * num_attrs, trees[t], cls_vals, tree_p);
+				sum = 0;
+				for (j = 0; j < cls_vals; j++)
+					sum += tree_p[j];
+				pp = p + i * cls_vals;
+				for (j = 0; j < cls_vals; j++)
+					pp[j] += tree_p[j] / sum;
+			}
+		}
+		for (i = start * cls_vals; i < end * cls_vals; i++)
+			p[i] /= n_trees;
+	}
+	free(tree_p);
+}
+
+SIMPLE_TREE_EXPORT
+void
+predict_regression_forest(double *x, int size, struct SimpleTreeNode **trees, int n_trees, int num_attrs, double *p)
+{
+	int i, t, start, end;
+	double sum, n;
+
+	for (start = 0; start < size; start = end) {
+		end = start + FOREST_BLOCK_ROWS < size ? start + FOREST_BLOCK_ROWS : size;
+		for (t = 0; t < n_trees; t++) {
+			for (i = start; i < end; i++) {
+				sum = n = 0;
+				predict_regression_(x + i * num_attrs, trees[t], &sum, &n);
+				p[i] += sum / n;
+			}
+		}
+		for (i = start; i < end; i++)
+			p[i] /= n_trees;
+	}
+}
+
 SIMPLE_TREE_EXPORT
 struct SimpleTreeNode *
 new_node(int children_size, int type, int cls_vals)
@@ -767,6 +853,136 @@ new_node(int children_size, int type, int cls_vals)
 	return node;
 }
 
+/*
+ * Conversion to and from the array-based format of compiled trees (see
+ * Orange.tree.CompiledTree). Codes of node types are indices into
+ * Orange.tree.TreeModel.NODE_TYPES.
+ */
+enum { CompiledLeaf = 0, CompiledDiscrete = 1, CompiledNumeric = 3 };
+
+struct CompiledTree {
+	int *code;
+	double *values, *thresholds;
+	int code_ptr, node_idx, type, cls_vals;
+};
+
+SIMPLE_TREE_EXPORT
+void
+tree_size(struct SimpleTreeNode *node, int *n_nodes, int *code_size)
+{
+	int i;
+
+	(*n_nodes)++;
+	*code_size += 2;
+	if (node->type != PredictorNode) {
+		*code_size += 1 + node->children_size;
+		for (i = 0; i < node->children_size; i++)
+			tree_size(node->children[i], n_nodes, code_size);
+	}
+}
+
+int
+compile_tree_(struct SimpleTreeNode *node, struct CompiledTree *t)
+{
+	int i, code_start, node_idx;
+
+	code_start = t->code_ptr;
+	node_idx = t->node_idx++;
+	t->code[code_start + 1] = node_idx;
+	t->code_ptr += 2;
+
+	if (t->type == Classification) {
+		for (i = 0; i < t->cls_vals; i++)
+			t->values[node_idx * t->cls_vals + i] = node->dist[i];
+	} else {
+		/* the mean (the prediction) and the weight; load_tree restores the
+		   sum as their product, which may differ from the original sum by
+		   rounding */
+		t->values[node_idx * 2] = node->n ? (double)node->sum / node->n : 0.0;
+		t->values[node_idx * 2 + 1] = node->n;
+	}
+	t->thresholds[node_idx] = 0.0;
+
+	if (node->type == PredictorNode) {
+		t->code[code_start] = CompiledLeaf;
+		return code_start;
+	}
+
+	if (node->type == DiscreteNode) {
+		t->code[code_start] = CompiledDiscrete;
+	} else {
+		assert(node->type == ContinuousNode);
+		t->code[code_start] = CompiledNumeric;
+		/* compiled trees go right if x > threshold; classification trees
+		   go right if x >= split */
+		t->thresholds[node_idx] = t->type == Classification ?
+			nextafter((double)node->split, -INFINITY) : node->split;
+	}
+	t->code[code_start + 2] = node->split_attr;
+	t->code_ptr += 1 + node->children_size;
+	for (i = 0; i < node->children_size; i++)
+		t->code[code_start + 3 + i] = compile_tree_(node->children[i], t);
+	return code_start;
+}
+
+SIMPLE_TREE_EXPORT
+void
+compile_tree(struct SimpleTreeNode *node, int type, int cls_vals, int *code, double *values, double *thresholds)
+{
+	struct CompiledTree t;
+
+	t.code = code;
+	t.values = values;
+	t.thresholds = thresholds;
+	t.code_ptr = t.node_idx = 0;
+	t.type = type;
+	t.cls_vals = cls_vals;
+	compile_tree_(node, &t);
+}
+
+SIMPLE_TREE_EXPORT
+struct SimpleTreeNode *
+load_tree(int *code, double *values, double *thresholds, int node_ptr, int type, int cls_vals, int *attr_vals)
+{
+	struct SimpleTreeNode *node;
+	int i, node_idx, children_size;
+
+	node_idx = code[node_ptr + 1];
+	if (code[node_ptr] == CompiledLeaf)
+		children_size = 0;
+	else if (code[node_ptr] == CompiledDiscrete)
+		children_size = attr_vals[code[node_ptr + 2]];
+	else
+		children_size = 2;
+
+	node = new_node(children_size, type, cls_vals);
+	node->split_attr = 0;
+	node->split = 0.0;
+	if (type == Classification) {
+		for (i = 0; i < cls_vals; i++)
+			node->dist[i] = values[node_idx * cls_vals + i];
+	} else {
+		node->n = values[node_idx * 2 + 1];
+		node->sum = values[node_idx * 2] * values[node_idx * 2 + 1];
+	}
+
+	if (code[node_ptr] == CompiledLeaf) {
+		node->type = PredictorNode;
+		return node;
+	}
+	if (code[node_ptr] == CompiledDiscrete) {
+		node->type = DiscreteNode;
+	} else {
+		node->type = ContinuousNode;
+		node->split = type == Classification ?
+			nextafter(thresholds[node_idx], INFINITY) : thresholds[node_idx];
+	}
+	node->split_attr = code[node_ptr + 2];
+	for (i = 0; i < children_size; i++)
+		node->children[i] = load_tree(code, values, thresholds, code[node_ptr + 3 + i], type, cls_vals, attr_vals);
+	return node;
+}
+
 
 // Empty python module definition
 #include "Python.h"
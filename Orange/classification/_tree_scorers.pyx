@@ -16,7 +16,17 @@ cdef extern from "numpy/npy_math.h":
 cpdef enum:
     NULL_BRANCH = -1
 
-def contingency(double[:] x, int nx, double[:] y, int ny):
+# Attribute and class values can be stored in float32 or float64,
+# independently of each other
+ctypedef fused x_t:
+    float
+    double
+
+ctypedef fused y_t:
+    float
+    double
+
+def contingency(x_t[:] x, int nx, y_t[:] y, int ny):
     cdef:
         np.ndarray[np.uint32_t, ndim=2] cont = np.zeros((ny, nx), dtype=np.uint32)
         int n = len(x), yi, xi
@@ -27,7 +37,39 @@ def contingency(double[:] x, int nx, double[:] y, int ny):
             cont[yi, xi] += 1
     return cont
 
-def find_threshold_entropy(double[:] x, double[:] y, np.intp_t[:] idx,
+def class_histograms(unsigned char[:, :] xb, np.intp_t[:] y, int[:] idx,
+                     int n_bins, int n_classes):
+    """
+    Compute class distributions for each bin of each (binned) attribute.
+
+    Bins are small integers that index the values of discrete attributes
+    and the intervals of binned numeric attributes.
+
+    Args:
+        xb: binned data; missing values are put into bin `n_bins`
+        y: class indices
+        idx: indices of instances to include
+        n_bins: the number of bins (excluding the bin for missing values)
+        n_classes: the number of classes
+
+    Returns:
+        array of shape (xb.shape[1], n_bins + 1, n_classes)
+    """
+    cdef:
+        np.ndarray[np.float64_t, ndim=3] hist = \
+            np.zeros((xb.shape[1], n_bins + 1, n_classes))
+        double[:, :, :] h = hist
+        Py_ssize_t i, a, row, cls
+
+    with nogil:
+        for i in range(idx.shape[0]):
+            row = idx[i]
+            cls = y[row]
+            for a in range(xb.shape[1]):
+                h[a, xb[row, a], cls] += 1
+    return hist
+
+def find_threshold_entropy(x_t[:] x, y_t[:] y, np.intp_t[:] idx,
                            int n_classes, int min_leaf):
     """
     Find the threshold for continuous attribute values that maximizes
@@ -88,6 +130,71 @@ def find_threshold_entropy(double[:] x, double[:] y, np.intp_t[:] idx,
     return (class_entro - best_entro) / N / log(2), x[idx[best_idx]]
 
 
+def find_bin_threshold_entropy(double[:, :] hist, int min_leaf):
+    """
+    Find the bin after which to split a binned numeric attribute to maximize
+    information gain.
+
+    This is a counterpart of :obj:`find_threshold_entropy` that works on
+    class distributions within bins (see :obj:`class_histograms`) instead of
+    sorted values. The last row of `hist` (missing values) is ignored.
+
+    Args:
+        hist: class distributions for bins, shape (n_bins + 1, n_classes)
+        min_leaf: the minimal number of instances on each side of the threshold
+
+    Returns:
+        (highest information gain, the last bin on the left side)
+    """
+    cdef:
+        Py_ssize_t n_bins = hist.shape[0] - 1, n_classes = hist.shape[1]
+        double[:] distr = np.zeros(2 * n_classes)
+        Py_ssize_t b, j
+        double entro, class_entro, best_entro, p, n_bin
+        double N = 0, n_left = 0
+        int best_bin = -1
+
+    for b in range(n_bins):
+        for j in range(n_classes):
+            distr[j] += hist[b, j]
+    for j in range(n_classes):
+        N += distr[j]
+    if N <= min_leaf:
+        return 0, 0
+
+    with nogil:
+        class_entro = N * log(N)
+        for j in range(n_classes):
+            p = distr[j]
+            if p:
+                class_entro -= p * log(p)
+        best_entro = class_entro
+
+        for b in range(n_bins - 1):
+            n_bin = 0
+            for j in range(n_classes):
+                n_bin += hist[b, j]
+                distr[j] -= hist[b, j]
+                distr[n_classes + j] += hist[b, j]
+            if n_bin == 0:
+                continue
+            n_left += n_bin
+            if n_left < min_leaf:
+                continue
+            if N - n_left < min_leaf:
+                break
+            entro = n_left * log(n_left) + (N - n_left) * log(N - n_left)
+            for j in range(2 * n_classes):
+                if distr[j]:
+                    entro -= distr[j] * log(distr[j])
+            if entro < best_entro:
+                best_entro = entro
+                best_bin = b
+    if best_bin == -1:
+        return 0, 0
+    return (class_entro - best_entro) / N / log(2), best_bin
+
+
 def find_binarization_entropy(double[:, :] cont, double[:] class_distr,
                               double[:] val_distr, int min_leaf):
     """
@@ -186,7 +293,7 @@ def find_binarization_entropy(double[:, :] cont, double[:] class_distr,
     return (class_entro - best_entro) / N / log(2), best_mapping
 
 
-def find_threshold_MSE(double[:] x, double[:] y, np.intp_t[:] idx, int min_leaf):
+def find_threshold_MSE(x_t[:] x, y_t[:] y, np.intp_t[:] idx, int min_leaf):
     """
     Find the threshold for continuous attribute values that minimizes MSE.
 
@@ -231,7 +338,7 @@ def find_threshold_MSE(double[:] x, double[:] y, np.intp_t[:] idx, int min_leaf)
     return (best_inter - (sum * sum) / N) / N, x[idx[best_idx]]
 
 
-def find_binarization_MSE(double[:] x, double[:] y, int n_values, int min_leaf):
+def find_binarization_MSE(x_t[:] x, y_t[:] y, int n_values, int min_leaf):
     """
     Find the split of discrete values into two groups that minimizes the MSE.
 
@@ -314,7 +421,7 @@ def find_binarization_MSE(double[:] x, double[:] y, int n_values, int min_leaf):
     return (best_inter - start_inter) / x.shape[0], best_mapping
 
 
-def compute_grouped_MSE(double[:] x, double[:] y, int n_values, int min_leaf):
+def compute_grouped_MSE(x_t[:] x, y_t[:] y, int n_values, int min_leaf):
     """
     Compute the MSE decrease of the given split into groups.
 
@@ -370,7 +477,7 @@ def compute_grouped_MSE(double[:] x, double[:] y, int n_values, int min_leaf):
     return (inter - sum * sum / n) / x.shape[0]
 
 
-def compute_predictions(double[:, :] X, int[:] code,
+def compute_predictions(x_t[:, :] X, int[:] code,
                         double[:, :] values, double[:] thresholds):
     """
     Return the values (distributions, means and variances) stored in the nodes
@@ -423,19 +530,20 @@ def compute_predictions_csr(X, int[:] code,
     """
     Same as compute_predictions except for sparse data
     """
+    return _compute_predictions_csr(X.data, X.indptr, X.indices, X.shape[0],
+                                     code, values, thresholds)
+
+
+def _compute_predictions_csr(x_t[:] data, np.int32_t[:] indptr,
+                             np.int32_t[:] indices, int n_rows, int[:] code,
+                             double[:, :] values, double[:] thresholds):
     cdef:
         unsigned int node_ptr, i, j, val_idx
         signed int next_node_ptr, node_idx
         np.float64_t val
         double[: ,:] predictions = np.empty(
-            (X.shape[0], values.shape[1]), dtype=np.float64)
-
-        double[:] data = X.data
-        np.int32_t[:] indptr = X.indptr
-        np.int32_t[:] indices = X.indices
-        int ind, attr, n_rows
-
-    n_rows = X.shape[0]
+            (n_rows, values.shape[1]), dtype=np.float64)
+        int ind, attr
 
     with nogil:
         for i in range(n_rows):
@@ -467,19 +575,20 @@ def compute_predictions_csc(X, int[:] code,
     """
     Same as compute_predictions except for sparse data
     """
+    return _compute_predictions_csc(X.data, X.indptr, X.indices, X.shape[0],
+                                     code, values, thresholds)
+
+
+def _compute_predictions_csc(x_t[:] data, np.int32_t[:] indptr,
+                             np.int32_t[:] indices, int n_rows, int[:] code,
+                             double[:, :] values, double[:] thresholds):
     cdef:
         unsigned int node_ptr, i, j, val_idx
         signed int next_node_ptr, node_idx
         np.float64_t val
         double[: ,:] predictions = np.empty(
-            (X.shape[0], values.shape[1]), dtype=np.float64)
-
-        double[:] data = X.data
-        np.int32_t[:] indptr = X.indptr
-        np.int32_t[:] indices = X.indices
-        int ind, attr, n_rows
-
-    n_rows = X.shape[0]
+            (n_rows, values.shape[1]), dtype=np.float64)
+        int ind, attr
 
     with nogil:
         for i in range(n_rows):
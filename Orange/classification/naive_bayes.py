@@ -22,22 +22,46 @@ class NaiveBayesLearner(Learner):
     preprocessors = [RemoveNaNColumns(), Discretize()]
     name = 'naive bayes'
 
-    def fit_storage(self, table):
+    @staticmethod
+    def _frequencies(table):
         if not isinstance(table, Storage):
             raise TypeError("Data is not a subclass of Orange.data.Storage.")
         if not all(var.is_discrete
                    for var in table.domain.variables):
             raise NotImplementedError("Only discrete variables are supported.")
 
-        cont = contingency.get_contingencies(table)
+        cont = [np.array(c) for c in contingency.get_contingencies(table)]
         class_freq = np.array(np.diag(
             contingency.get_contingency(table, table.domain.class_var)))
+        return cont, class_freq
+
+    @staticmethod
+    def _probabilities(cont, class_freq):
         class_prob = (class_freq + 1) / (np.sum(class_freq) + len(class_freq))
         log_cont_prob = [np.log(
-            (np.array(c) + 1) / (np.sum(np.array(c), axis=0)[None, :] +
-                                 c.shape[0]) / class_prob[:, None])
+            (c + 1) / (np.sum(c, axis=0)[None, :] + c.shape[0]) /
+            class_prob[:, None])
                          for c in cont]
-        return NaiveBayesModel(log_cont_prob, class_prob, table.domain)
+        return log_cont_prob, class_prob
+
+    def fit_storage(self, table):
+        cont, class_freq = self._frequencies(table)
+        model = NaiveBayesModel(*self._probabilities(cont, class_freq),
+                                table.domain)
+        # Frequencies are kept for updating the model with new data
+        model.cont_freq, model.class_freq = cont, class_freq
+        return model
+
+    def update_storage(self, model, data):
+        """Add frequencies from the data to those stored in the model"""
+        if model is None:
+            return self.fit_storage(data)
+        cont, class_freq = self._frequencies(data)
+        model.cont_freq = [c1 + c2 for c1, c2 in zip(model.cont_freq, cont)]
+        model.class_freq = model.class_freq + class_freq
+        model.log_cont_prob, model.class_prob = \
+            self._probabilities(model.cont_freq, model.class_freq)
+        return model
 
 
 class NaiveBayesModel(Model):
@@ -15,7 +15,10 @@ def configuration(parent_package='', top_path=None):
                          libraries=libraries,
                          export_symbols=[
                              "build_tree", "destroy_tree", "new_node",
-                             "predict_classification", "predict_regression"]
+                             "predict_classification", "predict_regression",
+                             "predict_classification_forest",
+                             "predict_regression_forest",
+                             "tree_size", "compile_tree", "load_tree"]
                          )
     config.add_extension('_tree_scorers',
                          sources=['_tree_scorers.c'],
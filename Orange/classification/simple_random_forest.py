@@ -1,7 +1,13 @@
+import ctypes as ct
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 from Orange.classification import Learner, Model
-from Orange.classification.simple_tree import SimpleTreeLearner
+from Orange.classification.simple_tree import \
+    SimpleTreeLearner, SIMPLE_TREE_NODE, _tree, c_double_p
+from Orange.tree import CompiledTreeModel
 
 __all__ = ['SimpleRandomForestLearner']
 
@@ -38,13 +44,18 @@ class SimpleRandomForestLearner(Learner):
         - if "log2", then `skip_prob = 1 - log2(n_features) / n_features`
 
     seed : int, optional (default = 42)
-        Random seed.
+        Random seed. The i-th tree is built with seed `seed + i`, so the
+        forest does not depend on the number of threads.
+
+    n_jobs : int, optional (default = -1)
+        Number of threads that build the trees; negative values are relative
+        to the number of processors (-1 uses all of them).
     """
 
     name = 'simple rf class'
 
     def __init__(self, n_estimators=10, min_instances=2, max_depth=1024,
-                 max_majority=1.0, skip_prob='sqrt', seed=42):
+                 max_majority=1.0, skip_prob='sqrt', seed=42, n_jobs=-1):
         super().__init__()
         self.n_estimators = n_estimators
         self.skip_prob = skip_prob
@@ -52,6 +63,7 @@ class SimpleRandomForestLearner(Learner):
         self.min_instances = min_instances
         self.max_majority = max_majority
         self.seed = seed
+        self.n_jobs = n_jobs
 
     def fit_storage(self, data):
         return SimpleRandomForestModel(self, data)
@@ -64,16 +76,44 @@ class SimpleRandomForestModel(Model):
         self.learn(learner, data)
 
     def learn(self, learner, data):
-        tree = SimpleTreeLearner(
-            learner.min_instances, learner.max_depth,
-            learner.max_majority, learner.skip_prob, True)
-        for i in range(learner.n_estimators):
-            tree.seed = learner.seed + i
-            self.estimators_.append(tree(data))
+        def build(seed):
+            tree = SimpleTreeLearner(
+                learner.min_instances, learner.max_depth,
+                learner.max_majority, learner.skip_prob, True, seed)
+            return tree(data)
+
+        # The tree builder releases the GIL, so trees are built in parallel
+        n_jobs = getattr(learner, "n_jobs", 1)
+        if n_jobs < 0:
+            n_jobs = max(1, os.cpu_count() + 1 + n_jobs)
+        n_jobs = max(1, min(n_jobs, learner.n_estimators))
+        seeds = [learner.seed + i for i in range(learner.n_estimators)]
+        with ThreadPoolExecutor(n_jobs) as executor:
+            self.estimators_.extend(executor.map(build, seeds))
+
+    def compiled(self):
+        """
+        Return the forest as a :obj:`Orange.tree.CompiledTreeModel`,
+        which can be saved into a memory-mappable file.
+        """
+        model = CompiledTreeModel(
+            self.domain, [tree.compiled() for tree in self.estimators_])
+        model.name = self.name
+        return model
+
+    def _forest(self):
+        trees = [tree.node for tree in self.estimators_]
+        return (ct.POINTER(SIMPLE_TREE_NODE) * len(trees))(*trees)
 
     def predict_storage(self, data):
-        p = np.zeros((data.X.shape[0], self.cls_vals))
-        for tree in self.estimators_:
-            p += tree(data, tree.Probs)
-        p /= len(self.estimators_)
+        X = np.ascontiguousarray(data.X, dtype=np.float64)
+        p = np.zeros((X.shape[0], self.cls_vals))
+        _tree.predict_classification_forest(
+            X.ctypes.data_as(c_double_p),
+            X.shape[0],
+            self._forest(),
+            len(self.estimators_),
+            X.shape[1],
+            self.cls_vals,
+            p.ctypes.data_as(c_double_p))
         return p.argmax(axis=1), p
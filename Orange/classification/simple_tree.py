@@ -2,6 +2,7 @@ import ctypes as ct
 
 import numpy as np
 from Orange.base import Learner, Model
+from Orange.tree import CompiledTree
 
 __all__ = ['SimpleTreeLearner']
 
@@ -37,6 +38,7 @@ SIMPLE_TREE_NODE._fields_ = [
 
 _tree.build_tree.restype = ct.POINTER(SIMPLE_TREE_NODE)
 _tree.new_node.restype = ct.POINTER(SIMPLE_TREE_NODE)
+_tree.load_tree.restype = ct.POINTER(SIMPLE_TREE_NODE)
 
 
 class SimpleTreeNode:
@@ -94,9 +96,9 @@ class SimpleTreeLearner(Learner):
 
 class SimpleTreeModel(Model):
     def __init__(self, learner, data):
-        X = np.ascontiguousarray(data.X)
-        Y = np.ascontiguousarray(data.Y)
-        W = np.ascontiguousarray(data.W)
+        X = np.ascontiguousarray(data.X, dtype=np.float64)
+        Y = np.ascontiguousarray(data.Y, dtype=np.float64)
+        W = np.ascontiguousarray(data.W, dtype=np.float64)
         self.num_attrs = X.shape[1]
         self.dom_attr = data.domain.attributes
         self.cls_vars = list(data.domain.class_vars)
@@ -124,19 +126,16 @@ class SimpleTreeModel(Model):
             raise ValueError(
                 "skip_prob not valid: {}".format(learner.skip_prob))
 
-        attr_vals = []
         domain = []
         for attr in data.domain.attributes:
             if attr.is_discrete:
-                attr_vals.append(len(attr.values))
                 domain.append(IntVar)
             elif attr.is_continuous:
-                attr_vals.append(0)
                 domain.append(FloatVar)
             else:
                 raise ValueError("Only Continuous and Discrete "
                                  "variables are supported")
-        attr_vals = np.array(attr_vals, dtype=np.int32)
+        attr_vals = self._attr_vals()
         domain = np.array(domain, dtype=np.int32)
 
         self.node = _tree.build_tree(
@@ -158,7 +157,7 @@ class SimpleTreeModel(Model):
             learner.seed)
 
     def predict_storage(self, data):
-        X = np.ascontiguousarray(data.X)
+        X = np.ascontiguousarray(data.X, dtype=np.float64)
         if self.type == Classification:
             p = np.zeros((X.shape[0], self.cls_vals))
             _tree.predict_classification(
@@ -185,35 +184,59 @@ class SimpleTreeModel(Model):
         if hasattr(self, "node"):
             _tree.destroy_tree(self.node, self.type)
 
+    def _attr_vals(self):
+        return np.array([len(attr.values) if attr.is_discrete else 0
+                         for attr in self.dom_attr], dtype=np.int32)
+
+    def compiled(self):
+        """
+        Return the tree in the array-based format of
+        :obj:`Orange.tree.CompiledTree`.
+
+        Values of nodes are class distributions for classification, and
+        means and weights for regression. When predicting from the compiled
+        tree, instances with missing values stop at the node instead of
+        being split between all its branches.
+        """
+        n_nodes, code_size = ct.c_int(0), ct.c_int(0)
+        _tree.tree_size(self.node, ct.byref(n_nodes), ct.byref(code_size))
+        n_values = self.cls_vals if self.type == Classification else 2
+        code = np.empty(code_size.value, dtype=np.int32)
+        values = np.empty((n_nodes.value, n_values))
+        thresholds = np.empty(n_nodes.value)
+        _tree.compile_tree(
+            self.node, self.type, self.cls_vals,
+            code.ctypes.data_as(c_int_p),
+            values.ctypes.data_as(c_double_p),
+            thresholds.ctypes.data_as(c_double_p))
+        return CompiledTree(code, values, thresholds)
+
+    def _load_compiled(self, tree):
+        code = np.ascontiguousarray(tree.code, dtype=np.int32)
+        values = np.ascontiguousarray(tree.values, dtype=np.float64)
+        thresholds = np.ascontiguousarray(tree.thresholds, dtype=np.float64)
+        attr_vals = self._attr_vals()
+        return _tree.load_tree(
+            code.ctypes.data_as(c_int_p),
+            values.ctypes.data_as(c_double_p),
+            thresholds.ctypes.data_as(c_double_p),
+            0, self.type, self.cls_vals,
+            attr_vals.ctypes.data_as(c_int_p))
+
     def __getstate__(self):
         dict = self.__dict__.copy()
         del dict['node']
-        py_node = self.__to_python(self.node)
-        return dict, py_node
+        return dict, self.compiled()
 
     def __setstate__(self, state):
-        dict, py_node = state
+        dict, tree = state
         self.__dict__.update(dict)
-        self.node = self.__from_python(py_node)
-
-    # for pickling a tree
-    def __to_python(self, node):
-        n = node.contents
-        py_node = SimpleTreeNode()
-        py_node.type = n.type
-        py_node.children_size = n.children_size
-        py_node.split_attr = n.split_attr
-        py_node.split = n.split
-        py_node.children = [
-            self.__to_python(n.children[i]) for i in range(n.children_size)]
-        if self.type == Classification:
-            py_node.dist = [n.dist[i] for i in range(self.cls_vals)]
+        if isinstance(tree, SimpleTreeNode):  # pickled by older versions
+            self.node = self.__from_python(tree)
         else:
-            py_node.n = n.n
-            py_node.sum = n.sum
-        return py_node
+            self.node = self._load_compiled(tree)
 
-    # for unpickling a tree
+    # for unpickling a tree pickled by older versions
     def __from_python(self, py_node):
         node = _tree.new_node(py_node.children_size, self.type, self.cls_vals)
         n = node.contents
@@ -8,7 +8,7 @@ from Orange.classification import SklLearner, SklModel, Learner
 from Orange.classification import _tree_scorers
 from Orange.statistics import distribution, contingency
 from Orange.tree import Node, DiscreteNode, MappedDiscreteNode, \
-    NumericNode, TreeModel
+    NumericNode, TreeModel, CompiledTree
 
 __all__ = ["SklTreeLearner", "TreeLearner"]
 
@@ -47,6 +47,15 @@ class TreeLearner(Learner):
             a majority at which the data is not split
             further
 
+        max_bins (int):
+            if given, values of numeric attributes are quantized into at
+            most this many bins (at most 255) of approximately equal
+            frequencies, and splits are searched for on class distributions
+            within bins. Data is binned only once and distributions in
+            nodes are computed from the parent's, which makes induction
+            on large data much faster. If `None` (default), all thresholds
+            are considered.
+
     Returns:
         instance of OrangeTreeModel
     """
@@ -58,7 +67,7 @@ class TreeLearner(Learner):
     def __init__(
             self, *args, binarize=False, max_depth=None,
             min_samples_leaf=1, min_samples_split=2, sufficient_majority=0.95,
-            preprocessors=None, **kwargs):
+            max_bins=None, preprocessors=None, **kwargs):
         super().__init__(preprocessors=preprocessors)
         self.params = {}
         self.binarize = self.params['binarize'] = binarize
@@ -66,6 +75,52 @@ class TreeLearner(Learner):
         self.min_samples_split = self.params['min_samples_split'] = min_samples_split
         self.sufficient_majority = self.params['sufficient_majority'] = sufficient_majority
         self.max_depth = self.params['max_depth'] = max_depth
+        self.max_bins = self.params['max_bins'] = max_bins
+
+    def _discrete_score(self, cont, n_instances):
+        """Return the information gain of a split by discrete attribute
+
+        The method computes the entropy itself, not by calling other
+        functions. This is to make sure that it uses the same
+        definition as the below classes that compute entropy themselves
+        for efficiency reasons.
+
+        Args:
+            cont (np.ndarray): contingency matrix (classes x values);
+                modified in place
+            n_instances (int): the number of instances, including those
+                with missing values of the attribute
+
+        Returns:
+            score, or 0 if the attribute should not be used
+        """
+        n_values = cont.shape[1]
+        attr_distr = np.sum(cont, axis=0)
+        null_nodes = attr_distr < self.min_samples_leaf
+        # This is just for speed. If there is only a single non-null-node,
+        # entropy wouldn't decrease anyway.
+        if sum(null_nodes) >= n_values - 1:
+            return 0
+        cont[:, null_nodes] = 0
+        attr_distr = np.sum(cont, axis=0)
+        cls_distr = np.sum(cont, axis=1)
+        n = np.sum(attr_distr)
+        # Avoid log(0); <= instead of == because we need an array
+        cls_distr[cls_distr <= 0] = 1
+        attr_distr[attr_distr <= 0] = 1
+        cont[cont <= 0] = 1
+        class_entr = n * np.log(n) - np.sum(cls_distr * np.log(cls_distr))
+        attr_entr = np.sum(attr_distr * np.log(attr_distr))
+        cont_entr = np.sum(cont * np.log(cont))
+        score = (class_entr - attr_entr + cont_entr) / n / np.log(2)
+        score *= n / n_instances  # punishment for missing values
+        return score
+
+    def _is_leaf(self, n_instances, distr, level):
+        """Tell whether a node with the given data is not split further"""
+        return n_instances < self.min_samples_split or \
+            max(distr) >= sum(distr) * self.sufficient_majority or \
+            self.max_depth is not None and level > self.max_depth
 
     def _select_attr(self, data):
         """Select the attribute for the next split.
@@ -81,41 +136,18 @@ class TreeLearner(Learner):
         REJECT_ATTRIBUTE = 0, None, None, 0
 
         def _score_disc():
-            """Scoring for discrete attributes, no binarization
-
-            The class computes the entropy itself, not by calling other
-            functions. This is to make sure that it uses the same
-            definition as the below classes that compute entropy themselves
-            for efficiency reasons."""
+            """Scoring for discrete attributes, no binarization"""
             n_values = len(attr.values)
             if n_values < 2:
                 return REJECT_ATTRIBUTE
 
             cont = _tree_scorers.contingency(col_x, len(data.domain.attributes[attr_no].values),
                                              data.Y, len(data.domain.class_var.values))
-            attr_distr = np.sum(cont, axis=0)
-            null_nodes = attr_distr < self.min_samples_leaf
-            # This is just for speed. If there is only a single non-null-node,
-            # entropy wouldn't decrease anyway.
-            if sum(null_nodes) >= n_values - 1:
+            score = self._discrete_score(cont, len(data))
+            if score == 0:
                 return REJECT_ATTRIBUTE
-            cont[:, null_nodes] = 0
-            attr_distr = np.sum(cont, axis=0)
-            cls_distr = np.sum(cont, axis=1)
-            n = np.sum(attr_distr)
-            # Avoid log(0); <= instead of == because we need an array
-            cls_distr[cls_distr <= 0] = 1
-            attr_distr[attr_distr <= 0] = 1
-            cont[cont <= 0] = 1
-            class_entr = n * np.log(n) - np.sum(cls_distr * np.log(cls_distr))
-            attr_entr = np.sum(attr_distr * np.log(attr_distr))
-            cont_entr = np.sum(cont * np.log(cont))
-            score = (class_entr - attr_entr + cont_entr) / n / np.log(2)
-            score *= n / len(data)  # punishment for missing values
             branches = col_x
             branches[np.isnan(branches)] = -1
-            if score == 0:
-                return REJECT_ATTRIBUTE
             node = DiscreteNode(attr, attr_no, None)
             return score, node, branches, n_values
 
@@ -185,9 +217,7 @@ class TreeLearner(Learner):
         distr = distribution.Discrete(node_insts, data.domain.class_var)
         if len(node_insts) < self.min_samples_leaf:
             return None
-        if len(node_insts) < self.min_samples_split or \
-                max(distr) >= sum(distr) * self.sufficient_majority or \
-                self.max_depth is not None and level > self.max_depth:
+        if self._is_leaf(len(node_insts), distr, level):
             node, branches, n_children = Node(None, None, distr), None, 0
         else:
             node, branches, n_children = self._select_attr(node_insts)
@@ -198,6 +228,171 @@ class TreeLearner(Learner):
                 for br in range(n_children)]
         return node
 
+    def _quantize(self, data):
+        """Replace attribute values with indices of bins
+
+        Values of discrete attributes are their own bins. Numeric attributes
+        with at most `max_bins` distinct values get a bin for each value;
+        otherwise the bins are bounded by quantiles.
+
+        Returns:
+            a tuple with binned data (np.ndarray of np.uint8), the number
+            of bins, which is also the index of the bin for missing values,
+            and a list of upper bounds of bins (or `None` for discrete
+            attributes)
+        """
+        if not 2 <= self.max_bins <= 255:
+            raise ValueError("max_bins must be between 2 and 255")
+        attributes = data.domain.attributes
+        n_bins = max([self.max_bins] + [len(attr.values)
+                                        for attr in attributes
+                                        if attr.is_discrete])
+        if n_bins > 255:
+            raise ValueError("Binned tree induction does not handle "
+                             "attributes with more than 255 values")
+        is_sparse = sp.issparse(data.X)
+        binned = np.empty((len(data), len(attributes)), dtype=np.uint8)
+        bounds = []
+        for attr_no, attr in enumerate(attributes):
+            col_x = data.X[:, attr_no]
+            if is_sparse:
+                col_x = col_x.toarray()
+                col_x = col_x.flatten()
+            nans = np.isnan(col_x)
+            if attr.is_discrete:
+                attr_bounds = None
+                col_b = col_x
+            else:
+                known = col_x[~nans]
+                attr_bounds = np.unique(known)[:-1]
+                if len(attr_bounds) >= self.max_bins:
+                    attr_bounds = np.unique(np.percentile(
+                        known, np.linspace(0, 100, self.max_bins + 1)[1:-1],
+                        interpolation="lower"))
+                col_b = np.searchsorted(attr_bounds, col_x)
+            binned[:, attr_no] = np.where(nans, n_bins, col_b)
+            bounds.append(attr_bounds)
+        return binned, n_bins, bounds
+
+    def _select_binned_attr(self, data, binned, n_bins, bounds, hist, inst):
+        """Select the attribute for the next split from class distributions
+        within bins.
+
+        Returns:
+            tuple with an instance of Node, a numpy array indicating
+            the branch index for each data instance, or -1 if data instance
+            is dropped, and the number of branches
+        """
+        best_score, best_res = 0, (Node(None, None, None), None, 0)
+        n_instances = len(inst)
+        for attr_no, attr in enumerate(data.domain.attributes):
+            attr_hist = hist[attr_no]
+            col_b = binned[inst, attr_no]
+            if attr.is_discrete:
+                n_values = len(attr.values)
+                if n_values < 2:
+                    continue
+                cont = np.ascontiguousarray(attr_hist[:n_values].T)
+                if not self.binarize or n_values == 2:
+                    score = self._discrete_score(cont, n_instances)
+                    if score > best_score:
+                        branches = col_b.astype(int)
+                        branches[col_b == n_bins] = -1
+                        node = DiscreteNode(attr, attr_no, None)
+                        best_score, best_res = \
+                            score, (node, branches, n_values)
+                    continue
+                attr_distr = np.sum(cont, axis=0)
+                if np.sum(attr_distr) == 0:  # all values are missing
+                    continue
+                score, best_mapping = \
+                    _tree_scorers.find_binarization_entropy(
+                        cont, np.sum(cont, axis=1), attr_distr,
+                        self.min_samples_leaf)
+                score *= 1 - np.sum(attr_hist[n_bins]) / n_instances
+                if score > best_score:
+                    col_x = col_b.astype(float)
+                    col_x[col_b == n_bins] = np.nan
+                    mapping, branches = MappedDiscreteNode.branches_from_mapping(
+                        col_x, best_mapping, n_values)
+                    node = MappedDiscreteNode(attr, attr_no, mapping, None)
+                    best_score, best_res = score, (node, branches, 2)
+            else:
+                score, cut = _tree_scorers.find_bin_threshold_entropy(
+                    attr_hist, self.min_samples_leaf)
+                score *= 1 - np.sum(attr_hist[n_bins]) / n_instances
+                if score > best_score:
+                    branches = (col_b > cut).astype(int)
+                    branches[col_b == n_bins] = -1
+                    node = NumericNode(attr, attr_no, bounds[attr_no][cut], None)
+                    best_score, best_res = score, (node, branches, 2)
+        return best_res
+
+    def build_binned_tree(self, data, active_inst):
+        """Induce a tree from data whose numeric attributes are binned
+
+        Data is binned once. Class distributions within bins are computed
+        for the root; in other nodes, the distributions for the largest
+        branch are obtained by subtracting those of the other branches
+        from the parent's.
+
+        Returns:
+            root node (Node)"""
+        binned, n_bins, bounds = self._quantize(data)
+        class_var = data.domain.class_var
+        n_classes = len(class_var.values)
+        y = np.zeros(len(data), dtype=np.intp)
+        y[active_inst] = data.Y[active_inst]
+        weights = data.W if data.has_weights() else None
+
+        def histograms(inst):
+            return _tree_scorers.class_histograms(
+                binned, y, inst, n_bins, n_classes)
+
+        def may_split(inst, level):
+            return len(inst) >= max(self.min_samples_split,
+                                    self.min_samples_leaf) and \
+                (self.max_depth is None or level <= self.max_depth)
+
+        def build(inst, hist, level):
+            if len(inst) < self.min_samples_leaf:
+                return None
+            distr = distribution.Discrete(
+                np.bincount(y[inst], minlength=n_classes,
+                            weights=None if weights is None else weights[inst]),
+                class_var)
+            if self._is_leaf(len(inst), distr, level):
+                node, branches, n_children = Node(None, None, distr), None, 0
+            else:
+                if hist is None:
+                    hist = histograms(inst)
+                node, branches, n_children = self._select_binned_attr(
+                    data, binned, n_bins, bounds, hist, inst)
+                node.value = distr
+            node.subset = inst
+            if branches is not None:
+                subsets = [inst[branches == br] for br in range(n_children)]
+                hists = [None] * n_children
+                split = [br for br in range(n_children)
+                         if may_split(subsets[br], level + 1)]
+                if split:
+                    largest = max(split, key=lambda br: len(subsets[br]))
+                    for br in split:
+                        if br != largest:
+                            hists[br] = histograms(subsets[br])
+                    if 2 * len(subsets[largest]) > len(inst):
+                        rest = np.in1d(branches, split, invert=True)
+                        hists[largest] = hist - histograms(inst[rest]) - sum(
+                            hists[br] for br in split if br != largest)
+                    else:
+                        hists[largest] = histograms(subsets[largest])
+                node.children = [
+                    build(subset, child_hist, level + 1)
+                    for subset, child_hist in zip(subsets, hists)]
+            return node
+
+        return build(active_inst, None, 1)
+
     def fit_storage(self, data):
         if self.binarize and any(
                 attr.is_discrete and len(attr.values) > self.MAX_BINARIZATION
@@ -209,7 +404,10 @@ class TreeLearner(Learner):
                              format(self.MAX_BINARIZATION))
 
         active_inst = np.nonzero(~np.isnan(data.Y))[0].astype(np.int32)
-        root = self.build_tree(data, active_inst)
+        if self.max_bins is None:
+            root = self.build_tree(data, active_inst)
+        else:
+            root = self.build_binned_tree(data, active_inst)
         if root is None:
             distr = distribution.Discrete(data, data.domain.class_var)
             if np.sum(distr) == 0:
@@ -227,6 +425,12 @@ class SklTreeClassifier(SklModel, TreeModelInterface):
         SklModel.__init__(self, *args, **kwargs)
         self._cached_sample_assignments = None
 
+    def compiled(self):
+        """Return the tree in the array-based format of :obj:`CompiledTree`"""
+        return CompiledTree.from_sklearn(
+            self.skl_model.tree_, len(self.domain.class_var.values),
+            self.skl_model.classes_)
+
 
 class SklTreeLearner(SklLearner):
     """Wrapper for SKL's tree inducer"""
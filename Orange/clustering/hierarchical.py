@@ -10,6 +10,7 @@ import scipy.cluster.hierarchy
 import scipy.spatial.distance
 
 from Orange.distance import Euclidean, PearsonR
+from Orange.misc import CondensedDistMatrix
 
 __all__ = ['HierarchicalClustering']
 
@@ -96,11 +97,15 @@ def dist_matrix_linkage(matrix, linkage=AVERAGE):
     """
     Return linkage using a precomputed distance matrix.
 
-    :param Orange.misc.DistMatrix matrix:
+    :param matrix:
+    :type matrix: Orange.misc.DistMatrix or Orange.misc.CondensedDistMatrix
     :param str linkage:
     """
-    # Extract compressed upper triangular distance matrix.
-    distances = condensedform(matrix)
+    if isinstance(matrix, CondensedDistMatrix):
+        distances = matrix.data
+    else:
+        # Extract compressed upper triangular distance matrix.
+        distances = condensedform(matrix)
     if linkage == WARD and not _HAS_WARD_LINKAGE_FROM_DIST:
         # Avoid `scipy.cluster.hierarchy.linkage` and dispatch to it's
         # cython implementation directly.
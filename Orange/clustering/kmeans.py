@@ -41,6 +41,47 @@ class KMeans(SklProjector):
         proj.inter_cluster = np.mean(cluster_dist[np.triu_indices_from(cluster_dist, 1)])
         return KMeansModel(proj, self.preprocessors)
 
+    def partial_fit(self, data, model=None):
+        """
+        Fit a model on the first batch of data or, if the `model` is given,
+        update it with a new batch, and return the model.
+
+        The model is fitted with mini-batch k-means (each batch is a single
+        mini-batch). Preprocessors are fit on the first batch; later batches
+        are transformed into the model's domain. Silhouette scores are not
+        computed.
+        """
+        if model is None:
+            data = self.preprocess(data)
+            proj = skl_cluster.MiniBatchKMeans(**self.params)
+            proj.partial_fit(data.X)
+            model = KMeansModel(proj, self.preprocessors)
+            model.pre_domain = data.domain
+            model.name = self.name
+        else:
+            if data.domain is not model.pre_domain:
+                data = data.transform(model.pre_domain)
+            model.proj.partial_fit(data.X)
+            model.centroids = model.proj.cluster_centers_
+        model.silhouette = np.nan
+        model.inertia = model.proj.inertia_ / data.X.shape[0]
+        cluster_dist = Euclidean(model.centroids)
+        model.inter_cluster = np.mean(
+            cluster_dist[np.triu_indices_from(cluster_dist, 1)])
+        return model
+
+    def fit_chunks(self, chunks):
+        """
+        Fit a model on data given in batches, which can be used to cluster
+        data that does not fit into memory. See :obj:`partial_fit`.
+        """
+        model = None
+        for chunk in chunks:
+            model = self.partial_fit(chunk, model)
+        if model is None:
+            raise ValueError("no data")
+        return model
+
 
 class KMeansModel(Projection):
     def __init__(self, proj, preprocessors=None):
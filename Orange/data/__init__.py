@@ -6,4 +6,9 @@ from .instance import *
 from .domain import *
 from .storage import *
 from .table import *
-from .io import *
+
+# Readers and writers, and optional back ends are imported on first use
+from Orange.misc.lazy_module import lazy_attributes
+lazy_attributes(__name__, {
+    "io": ".io", "Flags": ".io", "FileFormat": ".io",
+    "sql": ".sql", "pandas_compat": ".pandas_compat"})
@@ -3,12 +3,13 @@
 import numpy
 cimport numpy as np
 import cython
+from cython cimport floating
 
 cdef extern from "numpy/npy_math.h":
-    bint npy_isnan(double x)
+    bint npy_isnan(double x) nogil
 
 @cython.wraparound(False)
-def contingency_floatarray(np.ndarray[np.float64_t, ndim=1] col_data, np.ndarray[np.intp_t, ndim=1] classes, np.intp_t n_rows, np.ndarray[np.float64_t, ndim=1] W = None):
+def contingency_floatarray(np.ndarray[floating, ndim=1] col_data, np.ndarray[np.intp_t, ndim=1] classes, np.intp_t n_rows, double[:] W = None):
     """ 
     Given column values and class values, return
     - an array with the sorted list of values,
@@ -51,3 +52,80 @@ def contingency_floatarray(np.ndarray[np.float64_t, ndim=1] col_data, np.ndarray
     assert j == N-1
 
     return V,C,unknown
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def contingency_discrete(np.ndarray[floating, ndim=2] X,
+                         np.ndarray[np.intp_t, ndim=1] columns,
+                         np.ndarray[np.intp_t, ndim=1] classes,
+                         np.ndarray[np.float64_t, ndim=1] W,
+                         np.ndarray[np.float64_t, ndim=3] cont,
+                         np.ndarray[np.float64_t, ndim=2] unknown):
+    """
+    Add (weighted) counts of values in the given columns of X for each class
+    to `cont` and counts of missing values to `unknown`, in a single pass
+    over the rows.
+
+    Row i is counted for j-th column in `columns` into
+    `cont[j, classes[i], X[i, columns[j]]]`, or into
+    `unknown[j, classes[i]]` if the value is missing. Rows with negative
+    class indices (e.g. missing classes) are skipped, and so are values out
+    of the range of `cont`. X can be of type float64 or float32. The
+    function releases the GIL.
+    """
+    cdef Py_ssize_t i, j, n_cols = columns.shape[0]
+    cdef Py_ssize_t n_classes = cont.shape[1], n_values = cont.shape[2]
+    cdef np.intp_t tc, col
+    cdef np.float64_t v, w = 1.
+    cdef int weights = not W is None
+    with nogil:
+        for i in range(X.shape[0]):
+            tc = classes[i]
+            if tc < 0 or tc >= n_classes:
+                continue
+            if weights:
+                w = W[i]
+            for j in range(n_cols):
+                v = X[i, columns[j]]
+                if npy_isnan(v):
+                    unknown[j, tc] += w
+                elif 0 <= v < n_values:
+                    cont[j, tc, <Py_ssize_t>v] += w
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def contingency_discrete_csc(np.ndarray[floating, ndim=1] data,
+                             np.ndarray[np.intp_t, ndim=1] indices,
+                             np.ndarray[np.intp_t, ndim=1] indptr,
+                             np.ndarray[np.intp_t, ndim=1] columns,
+                             np.ndarray[np.intp_t, ndim=1] classes,
+                             np.ndarray[np.float64_t, ndim=1] W,
+                             np.ndarray[np.float64_t, ndim=3] cont,
+                             np.ndarray[np.float64_t, ndim=2] unknown):
+    """
+    A counterpart of :obj:`contingency_discrete` for a matrix in CSC format,
+    given by `data`, `indices` and `indptr`. Only stored values are
+    counted; implicit zeros must be added by the caller.
+    """
+    cdef Py_ssize_t j, k, n_cols = columns.shape[0]
+    cdef Py_ssize_t n_classes = cont.shape[1], n_values = cont.shape[2]
+    cdef np.intp_t tc, row, col
+    cdef np.float64_t v, w = 1.
+    cdef int weights = not W is None
+    with nogil:
+        for j in range(n_cols):
+            col = columns[j]
+            for k in range(indptr[col], indptr[col + 1]):
+                row = indices[k]
+                tc = classes[row]
+                if tc < 0 or tc >= n_classes:
+                    continue
+                if weights:
+                    w = W[row]
+                v = data[k]
+                if npy_isnan(v):
+                    unknown[j, tc] += w
+                elif 0 <= v < n_values:
+                    cont[j, tc, <Py_ssize_t>v] += w
@@ -3,6 +3,7 @@
 import numpy
 cimport numpy as np
 import cython
+from cython cimport floating
 
 cdef extern from "numpy/npy_math.h":
     bint npy_isnan(double x)
@@ -11,11 +12,13 @@ from numpy cimport NPY_FLOAT64 as NPY_float64
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def valuecount(np.ndarray[np.float64_t, ndim=2] a not None):
+def valuecount(np.ndarray[floating, ndim=2] a not None):
     """Count the occurrences of each value.
 
     It does so in-place, on a 2-d array of shape (2, N); the first row
     contains values and the second contains weights (1's, if unweighted).
+    The array can be of type float64 or float32; note that sums of float32
+    weights are exact only up to 2**24.
     The array should be sorted by the elements in the first row (e.g.
     a.sort(axis=0)). The function 'compresses' the array by merging
     consecutive columns with the same value in the first row, and adding
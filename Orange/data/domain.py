@@ -5,6 +5,7 @@ from math import log
 from collections import Iterable
 from itertools import chain
 from numbers import Integral
+from threading import Lock
 
 import numpy as np
 
@@ -15,6 +16,10 @@ from Orange.util import deprecated, OrangeDeprecationWarning
 
 __all__ = ["DomainConversion", "Domain"]
 
+# The number of conversions (from different source domains) kept by a domain
+CONVERSION_CACHE_SIZE = 32
+_conversion_lock = Lock()
+
 
 class DomainConversion:
     """
@@ -28,6 +33,9 @@ class DomainConversion:
 
         The source domain. The destination is not stored since destination
         domain is the one which contains the instance of DomainConversion.
+        The conversion keeps only a weak reference to the source, so that
+        domains can cache it; `source` is `None` after the source domain
+        is garbage collected.
 
     .. attribute:: attributes
 
@@ -63,7 +71,7 @@ class DomainConversion:
         """
         Compute the conversion indices from the given `source` to `destination`
         """
-        self.source = source
+        self._source = weakref.ref(source)
 
         self.attributes = [
             source.index(var) if var in source
@@ -91,6 +99,10 @@ class DomainConversion:
         self.sparse_Y = should_be_sparse(destination.class_vars)
         self.sparse_metas = should_be_sparse(destination.metas)
 
+    @property
+    def source(self):
+        return self._source()
+
 
 def filter_visible(feats):
     """
@@ -312,11 +324,13 @@ class Domain:
     def __getstate__(self):
         state = self.__dict__.copy()
         state.pop("_known_domains", None)
+        state.pop("_last_conversion", None)
         return state
 
     def __setstate__(self, state):
         self.__dict__.update(state)
         self._known_domains = weakref.WeakKeyDictionary()
+        self._last_conversion = None
 
     def index(self, var):
         """
@@ -377,7 +391,9 @@ class Domain:
         given source domain to this domain. Domain conversions are cached to
         speed-up the conversion in the common case in which the domain
         is based on another domain, for instance, when the domain contains
-        discretized variables from another domain.
+        discretized variables from another domain. The cache does not keep
+        the source domains alive and holds conversions from at most
+        `CONVERSION_CACHE_SIZE` domains; the oldest are discarded first.
 
         :param source: the source domain
         :type source: Orange.data.Domain
@@ -389,7 +405,15 @@ class Domain:
         c = self._known_domains.get(source, None)
         if not c:
             c = DomainConversion(source, self)
-            self._known_domains[source] = self._last_conversion = c
+            with _conversion_lock:
+                known = self._known_domains
+                while len(known) >= CONVERSION_CACHE_SIZE:
+                    oldest = next(iter(known), None)
+                    if oldest is None:
+                        break
+                    known.pop(oldest, None)
+                known[source] = c
+        self._last_conversion = c
         return c
 
     # noinspection PyProtectedMember
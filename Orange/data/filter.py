@@ -540,3 +540,393 @@ class FilterRegex(ValueFilter):
 
     def __call__(self, inst):
         return bool(self._re.search(inst or ''))
+
+
+def compile_filter(filter, domain):
+    """
+    Compile a :obj:`Values` filter (or a single :obj:`ValueFilter`) into a
+    function that takes a table with the given domain and returns a boolean
+    array indicating the matching rows.
+
+    Column indices, discrete values and regular expressions are resolved
+    once, at compilation. Numeric conditions of a conjunction (disjunction)
+    are combined in place, and the more expensive string conditions are
+    then evaluated only on rows that are still selected (not yet selected).
+    String conditions search a single buffer with all values of the column
+    instead of calling Python for each row; lists of values are matched
+    through a lookup table or a set. On tables with `use_column_indexes`,
+    numeric conditions are answered by binary search in sorted indexes of
+    columns (see :obj:`Orange.data.Table.column_index`).
+    """
+    return _compile(filter, domain)
+
+
+class _Plan:
+    #: 0 for numeric conditions, higher for conditions on strings
+    cost = 0
+
+    def __call__(self, table):
+        return self.evaluate(table, None)
+
+    def evaluate(self, table, rows):
+        """Return the indicator for the given rows (or all if `None`)"""
+        raise NotImplementedError
+
+
+class _ValuesPlan(_Plan):
+    def __init__(self, conditions, conjunction, negate):
+        self.conditions = sorted(conditions, key=lambda cond: cond.cost)
+        self.conjunction = conjunction
+        self.negate = negate
+        self.cost = max(cond.cost for cond in conditions)
+
+    def evaluate(self, table, rows):
+        n = len(table) if rows is None else len(rows)
+        sel = np.full(n, self.conjunction, dtype=bool)
+        for cond in self.conditions:
+            if cond.cost == 0:
+                if self.conjunction:
+                    sel &= cond.evaluate(table, rows)
+                else:
+                    sel |= cond.evaluate(table, rows)
+                continue
+            undecided = np.flatnonzero(sel == self.conjunction)
+            if not len(undecided):
+                break
+            if len(undecided) == n:
+                sel[:] = cond.evaluate(table, rows)
+            else:
+                sub_rows = undecided if rows is None else rows[undecided]
+                sel[undecided] = cond.evaluate(table, sub_rows)
+        if self.negate:
+            sel = ~sel
+        return sel
+
+
+class _ColumnPlan(_Plan):
+    """
+    A condition computed by a vectorized function of the column or, for
+    tables with `use_column_indexes`, by a query on the column's index
+    """
+    def __init__(self, index, func, query=None):
+        self.index = index
+        self.func = func
+        self.query = query
+
+    def evaluate(self, table, rows):
+        if self.query is not None and \
+                getattr(table, "use_column_indexes", False):
+            sel = self.query(table.column_index(self.index))
+            return sel if rows is None else sel[rows]
+        return self.func(_column(table, self.index, rows))
+
+
+class _StringsPlan(_ColumnPlan):
+    """A condition computed from the column's values converted to strings"""
+    cost = 1
+
+    def __init__(self, index, func, lower, to_string=str):
+        super().__init__(index, func)
+        self.lower = lower
+        self.to_string = to_string
+
+    def strings(self, table, rows):
+        strings = _column(table, self.index, rows).tolist()
+        if not set(map(type, strings)) <= {str}:
+            strings = list(map(self.to_string, strings))
+        if self.lower:
+            strings = list(map(str.lower, strings))
+        return strings
+
+    def evaluate(self, table, rows):
+        return self.func(self.strings(table, rows))
+
+
+class _SearchPlan(_StringsPlan):
+    """
+    Rows whose values contain a match of the regular expression.
+
+    The expression is searched for in a buffer with all values of the
+    column, each preceded and followed by the separator. If `literal` is
+    set, the expression matches a fixed string, which can not span over
+    more than one value; otherwise values covered by matches that span
+    over separators are checked separately.
+    """
+    def __init__(self, index, func, lower, regex, separator, literal,
+                 to_string=str):
+        super().__init__(index, func, lower, to_string)
+        self.regex = regex
+        self.separator = separator
+        self.literal = literal
+
+    def evaluate(self, table, rows):
+        lower = self.lower
+        strings = _column(table, self.index, rows).tolist()
+        sel = np.zeros(len(strings), dtype=bool)
+        if not strings:
+            return sel
+        sep = self.separator
+        try:
+            buffer = sep + sep.join(strings) + sep
+        except TypeError:
+            strings = list(map(self.to_string, strings))
+            buffer = sep + sep.join(strings) + sep
+        if lower:
+            buffer = buffer.lower()
+        # Positions in the buffer are positions of code points
+        codes = np.frombuffer(buffer.encode("utf-32-le", "surrogatepass"),
+                              dtype=np.uint32)
+        seps = np.flatnonzero(codes == ord(sep))
+        if len(seps) != len(strings) + 1:
+            # The separator appears in values; check them one by one
+            if lower:
+                strings = list(map(str.lower, strings))
+            return self.func(strings)
+
+        spans = np.array([m.span() for m in self.regex.finditer(buffer)],
+                         dtype=int).reshape(-1, 2)
+        if self.literal:
+            sel[np.searchsorted(seps, spans[:, 0], side="right") - 1] = True
+            return sel
+
+        empty = spans[:, 0] == spans[:, 1]
+        rows = np.searchsorted(seps, spans[empty, 0]) - 1
+        sel[rows[(rows >= 0) & (rows < len(strings))]] = True
+
+        spans = spans[~empty]
+        first = np.searchsorted(seps, spans[:, 0], side="right") - 1
+        inside = (seps[first] < spans[:, 0]) & \
+            (spans[:, 1] <= seps[np.minimum(first + 1, len(strings))])
+        sel[first[inside]] = True
+        if not inside.all():
+            # A match across values may hide matches in them (and does not
+            # itself tell anything); check them separately
+            first = first[~inside]
+            last = np.searchsorted(seps, spans[~inside, 1] - 1,
+                                   side="right") - 1
+            cover = np.zeros(len(strings) + 2, dtype=int)
+            np.add.at(cover, first, 1)
+            np.add.at(cover, last + 1, -1)
+            recheck = np.flatnonzero(
+                (np.cumsum(cover)[:len(strings)] > 0) & ~sel)
+            if lower:
+                strings = [strings[i].lower() for i in recheck]
+            else:
+                strings = [strings[i] for i in recheck]
+            sel[recheck] = self.func(strings)
+        return sel
+
+
+def _column(table, index, rows):
+    col = table.get_column_view(index)[0]
+    return col if rows is None else col[rows]
+
+
+def _is_defined(col):
+    return ~np.isnan(col.astype(float))
+
+
+def _query_defined(index):
+    sel = np.zeros(len(index), dtype=bool)
+    sel[index.defined_rows()] = True
+    return sel
+
+
+def _index_query(intervals, negate=False):
+    """
+    Return a function that selects rows with values in any of the intervals
+    (given as arguments of :obj:`Orange.data.util.ColumnIndex.rows`) from
+    the column's index, or `None` if bounds are not numbers
+    """
+    for interval in intervals:
+        if not all(bound is None or isinstance(bound, Real) and
+                   not isnan(bound) for bound in interval[:2]):
+            return None
+
+    def query(index):
+        sel = np.zeros(len(index), dtype=bool)
+        for interval in intervals:
+            sel[index.rows(*interval)] = True
+        return ~sel if negate else sel
+    return query
+
+
+def _range_query(filter, fmin, fmax):
+    """Return a query on the column's index for a continuous filter"""
+    intervals = {
+        filter.Equal: [(fmin, fmin)],
+        filter.NotEqual: [(fmin, fmin)],
+        filter.Less: [(None, fmin, True, False)],
+        filter.LessEqual: [(None, fmin)],
+        filter.Greater: [(fmin, None, False)],
+        filter.GreaterEqual: [(fmin, None)],
+        filter.Between: [(fmin, fmax)],
+        filter.Outside: [(None, fmin, True, False), (fmax, None, False)]}
+    if filter.oper not in intervals:
+        return None
+    return _index_query(intervals[filter.oper],
+                        negate=filter.oper == filter.NotEqual)
+
+
+def _comparison(filter, fmin, fmax):
+    """Return a function that compares a column to the filter's bounds"""
+    comparisons = {
+        filter.Equal: lambda col: col == fmin,
+        filter.NotEqual: lambda col: col != fmin,
+        filter.Less: lambda col: col < fmin,
+        filter.LessEqual: lambda col: col <= fmin,
+        filter.Greater: lambda col: col > fmin,
+        filter.GreaterEqual: lambda col: col >= fmin,
+        filter.Between: lambda col: (col >= fmin) * (col <= fmax),
+        filter.Outside: lambda col: (col < fmin) + (col > fmax)}
+    try:
+        return comparisons[filter.oper]
+    except KeyError:
+        raise TypeError("Invalid operator") from None
+
+
+def _compile(filter, domain):
+    if isinstance(filter, Values):
+        return _ValuesPlan([_compile(cond, domain)
+                            for cond in filter.conditions],
+                           filter.conjunction, filter.negate)
+    if isinstance(filter, FilterDiscrete):
+        return _compile_discrete(filter, domain)
+    if isinstance(filter, FilterContinuous):
+        return _compile_continuous(filter, domain)
+    if isinstance(filter, FilterString):
+        return _compile_string(filter, domain)
+    if isinstance(filter, FilterStringList):
+        return _compile_string_list(filter, domain)
+    if isinstance(filter, FilterRegex):
+        return _compile_regex(filter, domain)
+    raise TypeError("Invalid filter")
+
+
+def _compile_discrete(filter, domain):
+    index = domain.index(filter.column)
+    var = domain[filter.column]
+    indexed = var.is_primitive()
+    if filter.values is None:
+        return _ColumnPlan(index, _is_defined,
+                           _query_defined if indexed else None)
+
+    codes = [val if isinstance(val, Real) else var.to_val(val)
+             for val in filter.values]
+    query = _index_query([(code, code) for code in codes]) \
+        if indexed else None
+    if len(codes) <= 4:
+        # Comparisons are faster than a lookup for a few values
+        def compare(col):
+            sel = np.zeros(len(col), dtype=bool)
+            for code in codes:
+                sel |= col == code
+            return sel
+        return _ColumnPlan(index, compare, query)
+    n_values = len(var.values) if var.is_discrete else 0
+    if all(float(code).is_integer() and 0 <= code < n_values
+                     for code in codes):
+        # Index a table of accepted values; the last entry is for undefined
+        # and invalid values
+        lookup = np.zeros(n_values + 1, dtype=bool)
+        lookup[np.array(codes, dtype=int)] = True
+
+        def match(col):
+            col = col.astype(float, copy=False)
+            with np.errstate(invalid="ignore"):
+                valid = (col >= 0) & (col < n_values)
+            indices = np.where(valid, col, n_values).astype(int)
+            return lookup[indices] & (indices == col)
+        return _ColumnPlan(index, match, query)
+    codes = np.array(codes, dtype=float)
+    return _ColumnPlan(index, lambda col: np.in1d(col, codes), query)
+
+
+def _compile_continuous(filter, domain):
+    index = domain.index(filter.column)
+    indexed = domain[filter.column].is_primitive()
+    if filter.oper == filter.IsDefined:
+        return _ColumnPlan(index, _is_defined,
+                           _query_defined if indexed else None)
+    return _ColumnPlan(index, _comparison(filter, filter.min, filter.max),
+                       _range_query(filter, filter.min, filter.max)
+                       if indexed else None)
+
+
+def _compile_string(filter, domain):
+    index = domain.index(filter.column)
+    if filter.oper == filter.IsDefined:
+        return _ColumnPlan(index, lambda col: col.astype(bool))
+
+    lower = not filter.case_sensitive
+    fmin = filter.min or ""
+    fmax = filter.max or ""
+    if lower:
+        fmin, fmax = fmin.lower(), fmax.lower()
+
+    search = {filter.Contains: (str.__contains__, "{}"),
+              filter.StartsWith: (str.startswith, "\0{}"),
+              filter.EndsWith: (str.endswith, "{}\0")}
+    if filter.oper in search:
+        method, needle = search[filter.oper]
+
+        def func(strings):
+            return np.fromiter((method(s, fmin) for s in strings),
+                               dtype=bool, count=len(strings))
+        if not fmin or "\0" in fmin:
+            return _StringsPlan(index, func, lower)
+        regex = re.compile(re.escape(needle.format(fmin)))
+        return _SearchPlan(index, func, lower, regex, "\0", literal=True)
+
+    compare = _comparison(filter, fmin, fmax)
+
+    def func(strings):
+        col = np.empty(len(strings), dtype=object)
+        col[:] = strings
+        return compare(col).astype(bool)
+    return _StringsPlan(index, func, lower)
+
+
+def _compile_string_list(filter, domain):
+    index = domain.index(filter.column)
+    if filter.case_sensitive:
+        accepted = set(filter.values)
+        return _ColumnPlan(index, lambda col: np.fromiter(
+            map(accepted.__contains__, col), dtype=bool, count=len(col)))
+
+    accepted = set(filter.values_lower)
+
+    def func(strings):
+        return np.fromiter(map(accepted.__contains__, strings),
+                           dtype=bool, count=len(strings))
+    return _StringsPlan(index, func, True)
+
+
+# Constructs that look outside of the match, so searching in a buffer with
+# all values would give different results than searching in single values
+_LOOKAROUND = re.compile(r"\(\?<?[=!]|\\[AZ]")
+
+
+def _compile_regex(filter, domain):
+    index = domain.index(filter.column)
+    regex = filter._re  # pylint: disable=protected-access
+
+    def func(strings):
+        return np.fromiter((regex.search(s) is not None for s in strings),
+                           dtype=bool, count=len(strings))
+
+    def values(col):
+        return np.fromiter((filter(value) for value in col),
+                           dtype=bool, count=len(col))
+
+    if not isinstance(filter.pattern, str) \
+            or _LOOKAROUND.search(filter.pattern):
+        plan = _ColumnPlan(index, values)
+        plan.cost = 2
+        return plan
+    # With MULTILINE, ^ and $ match at boundaries of values separated by \n
+    buffer_regex = re.compile(filter.pattern, filter.flags | re.MULTILINE)
+    plan = _SearchPlan(index, func, False, buffer_regex, "\n",
+                       literal=False, to_string=lambda value: str(value or ""))
+    plan.cost = 2
+    return plan
@@ -11,7 +11,7 @@ from ast import literal_eval
 from collections import OrderedDict, Counter
 from functools import lru_cache
 from importlib import import_module
-from itertools import chain, repeat
+from itertools import chain, repeat, islice
 from math import isnan
 from numbers import Number
 from os import path, remove
@@ -23,12 +23,15 @@ from glob import glob
 
 import bottleneck as bn
 import numpy as np
+import scipy.sparse as sp
 from chardet.universaldetector import UniversalDetector
 
 from Orange.data import (
     _io, is_discrete_values, MISSING_VALUES, Table, Domain, Variable,
     DiscreteVariable, StringVariable, ContinuousVariable, TimeVariable,
+    dataset_dirs,
 )
+from Orange.data.util import EncodedColumns, intern_strings
 from Orange.util import Registry, flatten, namegen
 
 
@@ -40,6 +43,11 @@ __all__ = ["Flags", "FileFormat"]
 
 _IDENTITY = lambda i: i
 
+# Default number of rows in chunks read by FileFormat.iter_chunks and of the
+# sample from which the chunks' domain is inferred
+CHUNK_ROWS = 10000
+SAMPLE_ROWS = 10000
+
 
 class Compression:
     """Supported compression extensions"""
@@ -170,7 +178,10 @@ def sanitize_variable(valuemap, values, orig_values, coltype, coltype_kwargs,
         coltype_kwargs.update(values=valuemap)
 
     if coltype is StringVariable:
-        values = ['' if i is np.nan else i for i in orig_values]
+        # Equal strings share an object, which saves memory for columns
+        # with repeated values
+        values = intern_strings(
+            ['' if i is np.nan else i for i in orig_values])
 
     var = None
     if domain_vars is not None:
@@ -205,6 +216,52 @@ def sanitize_variable(valuemap, values, orig_values, coltype, coltype_kwargs,
     return values, var
 
 
+def _column_converter(var):
+    """
+    Return a function that converts a list of (stripped) strings into
+    an array of values of `var`; `None` stands for weights.
+
+    Like values of discrete variables that did not appear in the sample,
+    values of numeric columns that cannot be parsed become missing; they
+    are reported with a warning.
+    """
+    if var is None or type(var) is ContinuousVariable:
+        name = "weights" if var is None else var.name
+        return lambda values: _parse_numeric(values, float, name)
+    if var.is_time:
+        return lambda values: _parse_numeric(values, var.parse, var.name)
+    if var.is_discrete:
+        mapping = {value: float(i) for i, value in enumerate(var.values)}
+        return lambda values: np.array(
+            [mapping.get(i, np.nan) for i in values], dtype=float)
+    return lambda values: intern_strings(
+        ['' if i in MISSING_VALUES else i for i in values])
+
+
+def _parse_numeric(values, parse, name):
+    """
+    Return an array of `parse`d values; values that cannot be parsed are
+    reported with a warning and replaced by NaN
+    """
+    result = np.empty(len(values))
+    invalid = []
+    for i, value in enumerate(values):
+        if value in MISSING_VALUES:
+            result[i] = np.nan
+            continue
+        try:
+            result[i] = parse(value)
+        except ValueError:
+            result[i] = np.nan
+            invalid.append((i, value))
+    if invalid:
+        warnings.warn(
+            "Column '{}' has {} non-numeric value(s), e.g. '{}' in row {} of "
+            "the chunk; they are treated as missing".format(
+                name, len(invalid), invalid[0][1], invalid[0][0] + 1))
+    return result
+
+
 class Flags:
     """Parser for column flags (i.e. third header row)"""
     DELIMITER = ' '
@@ -407,6 +464,48 @@ class FileFormat(metaclass=FileFormatMeta):
 
         raise IOError('No readers for file "{}"'.format(filename))
 
+    @classmethod
+    def iter_chunks(cls, filename, chunk_rows=CHUNK_ROWS,
+                    sample_rows=SAMPLE_ROWS):
+        """Iterate over the data in `filename` in chunks of `chunk_rows` rows
+
+        All chunks are tables with the same domain. Formats that support
+        streaming infer the domain from the first `sample_rows` data rows;
+        values of discrete variables that do not appear in the sample are
+        read as unknown.
+
+        Parameters
+        ----------
+        filename : str
+        chunk_rows : int
+            maximal number of rows in a chunk
+        sample_rows : int
+            number of rows used for inferring the domain
+
+        Returns
+        -------
+        Iterator[Table]
+        """
+        filename = cls.locate(filename, dataset_dirs)
+        if cls is FileFormat:
+            reader = cls.get_reader(filename)
+        else:
+            reader = cls(filename)
+        return reader.read_chunks(chunk_rows, sample_rows)
+
+    def read_chunks(self, chunk_rows=CHUNK_ROWS, sample_rows=SAMPLE_ROWS):
+        """Return an iterator over chunks of data with at most `chunk_rows`
+        rows, see :obj:`iter_chunks`.
+
+        Formats that can read the data incrementally should override this
+        method; the default implementation reads the entire table and yields
+        its slices.
+        """
+        # pylint: disable=unused-argument
+        table = self.read()
+        for start in range(0, len(table), chunk_rows):
+            yield table[start:start + chunk_rows]
+
     @classmethod
     def write(cls, filename, data):
         return cls.write_file(filename, data)
@@ -559,6 +658,15 @@ class FileFormat(metaclass=FileFormatMeta):
         If `headers` is not provided, the header rows are extracted from `data`,
         assuming they precede it.
         """
+        return cls._data_table(data, headers)[0]
+
+    @classmethod
+    def _data_table(cls, data, headers=None):
+        """
+        Implementation of :obj:`data_table`; return a tuple with the table and
+        the indices of file columns that were put into `X`, `Y`, `metas` and
+        `W`, respectively.
+        """
         if not headers:
             headers, data = cls.parse_headers(data)
 
@@ -709,15 +817,65 @@ class FileFormat(metaclass=FileFormatMeta):
 
         domain = Domain(attrs, clses, metas)
 
+        layout = Xcols, Ycols, Mcols, Wcols
+
         if not data.size:
-            return Table.from_domain(domain, 0)
+            return Table.from_domain(domain, 0), layout
 
         table = Table.from_numpy(domain,
                                  data[:, Xcols].astype(float, order='C'),
                                  data[:, Ycols].astype(float, order='C'),
                                  data[:, Mcols].astype(object, order='C'),
                                  data[:, Wcols].astype(float, order='C'))
-        return table
+        return table, layout
+
+    @classmethod
+    def data_table_chunks(cls, data, chunk_rows=CHUNK_ROWS,
+                          sample_rows=SAMPLE_ROWS, headers=None):
+        """
+        Return an iterator over tables with at most `chunk_rows` rows, given
+        rows of `headers` and an iterable of rows of `data`, like
+        :obj:`data_table`.
+
+        The domain is determined from the first `sample_rows` rows of
+        data; `data` is then consumed lazily, so the memory use is bounded
+        by the sample and chunk size.
+        """
+        if not headers:
+            headers, data = cls.parse_headers(data)
+        data = iter(data)
+        sample = list(islice(data, sample_rows))
+        table, layout = cls._data_table(sample, headers)
+        domain = table.domain
+        Xcols, Ycols, Mcols, Wcols = layout
+        converters = [
+            [(col, _column_converter(var))
+             for col, var in zip(cols, variables)]
+            for cols, variables in ((Xcols, domain.attributes),
+                                    (Ycols, domain.class_vars),
+                                    (Mcols, domain.metas),
+                                    (Wcols, [None] * len(Wcols)))]
+        rowlen = max(chain(Xcols, Ycols, Mcols, Wcols), default=-1) + 1
+
+        def _equal_length(row):
+            row = list(row)[:rowlen]
+            row.extend([''] * (rowlen - len(row)))
+            return row
+
+        rows = (row for row in chain(sample, data) if any(row))
+        while True:
+            chunk = np.array([_equal_length(row)
+                              for row in islice(rows, chunk_rows)],
+                             dtype=object, ndmin=2)
+            if not chunk.size:
+                return
+            X, Y, metas, W = (
+                np.column_stack(
+                    [convert([i.strip() for i in chunk[:, col]])
+                     for col, convert in col_converters]
+                    or [np.empty((len(chunk), 0))])
+                for col_converters in converters)
+            yield Table.from_numpy(domain, X, Y, metas.astype(object), W)
 
     @staticmethod
     def header_names(data):
@@ -808,21 +966,11 @@ class CSVReader(FileFormat):
                 error = ''
             with self.open(self.filename, mode='rt', newline='',
                            encoding=encoding, errors=errors) as file:
-                # Sniff the CSV dialect (delimiter, quotes, ...)
                 try:
-                    dialect = csv.Sniffer().sniff(
-                        # Take first couple of *complete* lines as sample
-                        ''.join(file.readline() for _ in range(5)),
-                        self.DELIMITERS)
+                    dialect = self.sniff_dialect(file)
                 except UnicodeDecodeError as e:
                     error = e
                     continue
-                except csv.Error:
-                    dialect = csv.excel()
-                    dialect.delimiter = self.DELIMITERS[0]
-
-                file.seek(0)
-                dialect.skipinitialspace = True
 
                 try:
                     reader = csv.reader(file, dialect=dialect)
@@ -848,6 +996,35 @@ class CSVReader(FileFormat):
                     continue
         raise ValueError('Cannot parse dataset {}: {}'.format(self.filename, error)) from error
 
+    def sniff_dialect(self, file):
+        """Sniff the CSV dialect (delimiter, quotes, ...) and rewind `file`"""
+        try:
+            dialect = csv.Sniffer().sniff(
+                # Take first couple of *complete* lines as sample
+                ''.join(file.readline() for _ in range(5)),
+                self.DELIMITERS)
+        except csv.Error:
+            dialect = csv.excel()
+            dialect.delimiter = self.DELIMITERS[0]
+
+        file.seek(0)
+        dialect.skipinitialspace = True
+        return dialect
+
+    def read_chunks(self, chunk_rows=CHUNK_ROWS, sample_rows=SAMPLE_ROWS):
+        # Unlike read, which retries with different encodings, the file
+        # can only be read once, so the encoding is detected up front
+        encoding = detect_encoding(self.filename)
+        with self.open(self.filename, mode='rt', newline='',
+                       encoding=encoding) as file:
+            reader = csv.reader(file, dialect=self.sniff_dialect(file))
+            for table in self.data_table_chunks(reader, chunk_rows,
+                                                sample_rows):
+                if isinstance(self.filename, str):
+                    table.name = path.splitext(
+                        path.split(self.filename)[-1])[0]
+                yield table
+
     @classmethod
     def write_file(cls, filename, data):
         with cls.open(filename, mode='wt', newline='', encoding='utf-8') as file:
@@ -885,6 +1062,138 @@ class PickleReader(FileFormat):
             pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
 
 
+class BinaryReader(FileFormat):
+    """Reader for Orange's native memory-mapped binary format
+
+    The file starts with a magic string, the length of the header and
+    a pickled header with the domain and the layout of data blocks. Arrays
+    `X`, `Y`, `metas`, `W` and `ids` follow as raw, column-major blocks,
+    aligned to `ALIGNMENT` bytes. Sparse arrays are stored as the `data`,
+    `indices` and `indptr` blocks of their CSR form.
+
+    Reading maps the blocks into memory (copy-on-write) instead of copying
+    them, so opening is fast regardless of the file size and the pages are
+    shared between processes that open the same file. Arrays are writable,
+    as compiled code (e.g. in trees) requires, but changes are never written
+    back into the file; changed pages are copied into the process. Metas that include
+    non-primitive variables are pickled within the header, with columns of
+    strings dictionary-encoded, and are thus loaded into memory. They
+    unpickle into plain object arrays, so files that are written by this
+    version can also be read by older ones.
+    """
+    EXTENSIONS = ('.obin',)
+    DESCRIPTION = 'Orange binary table (memory-mapped)'
+    SUPPORT_SPARSE_DATA = True
+    PRIORITY = 30
+
+    MAGIC = b'ORANGEBT'
+    VERSION = 1
+    ALIGNMENT = 64
+    _HEADER_LEN = np.dtype('<u8')
+
+    def read(self):
+        with open(self.filename, 'rb') as f:
+            if f.read(len(self.MAGIC)) != self.MAGIC:
+                raise ValueError(
+                    "{} is not an Orange binary table".format(self.filename))
+            header_len = int(np.frombuffer(
+                f.read(self._HEADER_LEN.itemsize), self._HEADER_LEN)[0])
+            header = pickle.loads(f.read(header_len))
+        if header['version'] > self.VERSION:
+            raise ValueError("Unsupported version of binary table: {}"
+                             .format(header['version']))
+
+        blocks = header['blocks']
+
+        def block(name):
+            dtype, shape, offset = blocks[name]
+            if not np.prod(shape):
+                return np.zeros(shape, dtype=dtype)
+            return np.memmap(self.filename, dtype=dtype, mode='c',
+                             offset=offset, shape=shape, order='F')
+
+        def part(name):
+            if name in header['objects']:
+                return header['objects'][name]
+            if name in header['sparse']:
+                return sp.csr_matrix(
+                    (block(name + '.data'), block(name + '.indices'),
+                     block(name + '.indptr')),
+                    shape=header['sparse'][name], copy=False)
+            return block(name)
+
+        # Bypass Table.from_numpy: it would scan the arrays for infinite
+        # values and copy metas to object arrays
+        table = Table()
+        table.domain = header['domain']
+        table.X = part('X')
+        table.Y = part('Y')
+        table.metas = part('metas')
+        table.W = part('W')
+        table.ids = part('ids')
+        table.n_rows = table.X.shape[0]
+        table.attributes = {}
+        if isinstance(self.filename, str):
+            table.name = path.splitext(path.split(self.filename)[-1])[0]
+        self.set_table_metadata(self.filename, table)
+        return table
+
+    @classmethod
+    def write_file(cls, filename, data):
+        domain = data.domain
+        metas = data.metas
+        if not sp.issparse(metas) and metas.dtype == object and \
+                all(var.is_primitive() for var in domain.metas):
+            metas = metas.astype(float)
+        parts = [('X', data.X), ('Y', data._Y), ('metas', metas),
+                 ('W', data.W), ('ids', data.ids)]
+
+        arrays, objects, sparse = [], {}, {}
+        for name, array in parts:
+            if sp.issparse(array):
+                array = sp.csr_matrix(array)
+                sparse[name] = array.shape
+                arrays += [(name + '.data', array.data),
+                           (name + '.indices', array.indices),
+                           (name + '.indptr', array.indptr)]
+            elif array.dtype == object:
+                objects[name] = EncodedColumns(np.asarray(array))
+            else:
+                arrays.append((name, np.asarray(array)))
+
+        def header_bytes(offset):
+            blocks = OrderedDict()
+            for name, array in arrays:
+                offset = -(-offset // cls.ALIGNMENT) * cls.ALIGNMENT
+                blocks[name] = (array.dtype.str, array.shape, offset)
+                offset += array.nbytes
+            return pickle.dumps(
+                dict(version=cls.VERSION, domain=domain, blocks=blocks,
+                     sparse=sparse, objects=objects),
+                pickle.HIGHEST_PROTOCOL), blocks
+
+        # Offsets depend on header length, which (slightly) depends on the
+        # offsets; iterate until the layout is stable
+        prefix_len = len(cls.MAGIC) + cls._HEADER_LEN.itemsize
+        header, blocks = header_bytes(prefix_len)
+        while True:
+            new_header, blocks = header_bytes(prefix_len + len(header))
+            if len(new_header) == len(header):
+                header = new_header
+                break
+            header = new_header
+
+        with open(filename, 'wb') as f:
+            f.write(cls.MAGIC)
+            f.write(np.array([len(header)], dtype=cls._HEADER_LEN).tobytes())
+            f.write(header)
+            for name, array in arrays:
+                f.write(b'\0' * (blocks[name][2] - f.tell()))
+                # tofile writes in C order; transposition gives column-major
+                np.ascontiguousarray(array.T).tofile(f)
+        cls.write_table_metadata(filename, data)
+
+
 class BasketReader(FileFormat):
     """Reader for basket (sparse) files"""
     EXTENSIONS = ('.basket', '.bsk')
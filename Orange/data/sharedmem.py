@@ -0,0 +1,101 @@
+"""
+Sharing tables between processes without copying their data.
+
+A table is published by constructing a :obj:`SharedTable`. The handle is
+cheap to pickle -- it pickles to the name of the shared block -- so it can be
+passed to any number of worker processes, which get a table whose arrays are
+copy-on-write views into the shared memory: a worker that changes them gets
+private copies of the changed pages and other processes do not see changes.
+
+The block is a file in Orange's binary table format (see
+:obj:`Orange.data.io.BinaryReader`). It is placed into `/dev/shm` where
+available, so it lives in (POSIX) shared memory and is never written to
+disk; elsewhere it goes to the temporary directory and relies on the file
+system cache.
+"""
+import os
+import tempfile
+import weakref
+
+from Orange.data.io import BinaryReader
+
+__all__ = ["SharedTable"]
+
+
+def _shared_dir():
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        return shm
+    return None
+
+
+def _unlink(filename):
+    for name in (filename, filename + ".metadata"):
+        try:
+            os.remove(name)
+        except OSError:
+            # Already removed or (on Windows) still mapped by some process
+            pass
+
+
+class SharedTable:
+    """
+    A handle to a table whose arrays are published in shared memory.
+
+    The process that creates the handle owns the shared block; it is
+    released by :obj:`close`, at exit from the `with` block or when the
+    handle is garbage collected. Unpickled copies of the handle do not own
+    the block; tables obtained from them remain valid after it is released
+    on platforms that allow unlinking mapped files.
+
+    Dense and sparse `X`, `Y` and numeric metas are shared; metas that
+    include strings or other objects are pickled with the block's header
+    and are thus copied into each process.
+
+    Attributes:
+        name (str): the name of the shared block
+    """
+    def __init__(self, table):
+        fd, self.name = tempfile.mkstemp(
+            suffix=BinaryReader.EXTENSIONS[0], prefix="orange-",
+            dir=_shared_dir())
+        os.close(fd)
+        self._finalizer = weakref.finalize(self, _unlink, self.name)
+        try:
+            BinaryReader.write_file(self.name, table)
+        except BaseException:
+            self.close()
+            raise
+        self._table_name = table.name
+        self._table = None
+
+    @property
+    def table(self):
+        """A table whose arrays are copy-on-write views into shared memory"""
+        if self._table is None:
+            self._table = BinaryReader(self.name).read()
+            self._table.name = self._table_name
+        return self._table
+
+    def close(self):
+        """Release the shared block; a no-op for non-owners"""
+        if self._finalizer is not None:
+            self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __getstate__(self):
+        return {"name": self.name, "table_name": self._table_name}
+
+    def __setstate__(self, state):
+        self.name = state["name"]
+        self._table_name = state["table_name"]
+        self._finalizer = None
+        self._table = None
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, self.name)
@@ -220,6 +220,42 @@ class Backend(metaclass=Registry):
         """
         raise NotImplementedError
 
+    # aggregate related methods
+
+    def stddev(self, expression):
+        """Construct an aggregate expression for the standard deviation
+
+        Parameters
+        ----------
+        expression : str
+            numeric expression over the columns of the table
+
+        Returns
+        -------
+        sql expression computing the sample standard deviation
+        """
+        return "STDDEV_SAMP({})".format(expression)
+
+    def quantiles(self, expression, quantiles):
+        """Construct expressions for quantiles of the given expression
+
+        Expressions are used in a query without grouping that is limited
+        to a single row.
+
+        Parameters
+        ----------
+        expression : str
+            numeric expression over the columns of the table
+        quantiles : List[float]
+            quantiles, given as numbers between 0 and 1
+
+        Returns
+        -------
+        a list of sql expressions, one for each quantile
+        """
+        return ["PERCENTILE_CONT({}) WITHIN GROUP (ORDER BY {})".format(
+            q, expression) for q in quantiles]
+
 
 class TableDesc:
     def __init__(self, name, schema, sql):
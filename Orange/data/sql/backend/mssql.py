@@ -69,6 +69,14 @@ class PymssqlBackend(Backend):
 
         return " ".join(sql)
 
+    def stddev(self, expression):
+        return "STDEV({})".format(expression)
+
+    def quantiles(self, expression, quantiles):
+        # SQL Server implements PERCENTILE_CONT only as a window function
+        return [q + " OVER ()"
+                for q in super().quantiles(expression, quantiles)]
+
     @contextmanager
     def execute_sql_query(self, query, params=()):
         try:
@@ -12,7 +12,7 @@ from Orange.data.sql.backend.base import Backend, ToSql, BackendError
 
 log = logging.getLogger(__name__)
 
-EXTENSIONS = ('tsm_system_time', 'quantile')
+EXTENSIONS = ('tsm_system_time',)
 
 
 class Psycopg2Backend(Backend):
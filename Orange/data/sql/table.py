@@ -5,6 +5,7 @@ import functools
 import logging
 import threading
 import warnings
+from collections import OrderedDict
 from contextlib import contextmanager
 from itertools import islice
 from time import strftime
@@ -361,18 +362,22 @@ class SqlTable(Table):
         return self._get_stats(columns)
 
     def _get_stats(self, columns):
-        columns = [(c.to_sql(), c.is_continuous) for c in columns]
-        sql_fields = []
-        for field_name, continuous in columns:
-            stats = self.CONTINUOUS_STATS if continuous else self.DISCRETE_STATS
-            sql_fields.append(stats % dict(field_name=field_name))
-        query = self._sql_query(sql_fields)
+        fields = []
+        for col in columns:
+            field_name = col.to_sql()
+            if col.is_continuous:
+                value = self._value_field(col)
+                fields += ["MIN(%s)" % value, "MAX(%s)" % value,
+                           "AVG(%s)" % value, self.backend.stddev(value)]
+            fields += ["COUNT(*) - COUNT(%s)" % field_name,
+                       "COUNT(%s)" % field_name]
+        query = self._sql_query(fields)
         with self.backend.execute_sql_query(query) as cur:
-            results = cur.fetchone()
+            results = tuple(cur.fetchone())
         stats = []
         i = 0
-        for ci, (field_name, continuous) in enumerate(columns):
-            if continuous:
+        for col in columns:
+            if col.is_continuous:
                 stats.append(results[i:i+6])
                 i += 6
             else:
@@ -391,20 +396,20 @@ class SqlTable(Table):
         return self._get_distributions(columns)
 
     def _get_distributions(self, columns):
+        counts = self._grouped_counts(
+            [self._value_field(col) for col in columns])
         dists = []
-        for col in columns:
-            field_name = col.to_sql()
-            fields = field_name, "COUNT(%s)" % field_name
-            query = self._sql_query(fields,
-                                    filters=['%s IS NOT NULL' % field_name],
-                                    group_by=[field_name],
-                                    order_by=[field_name])
-            with self.backend.execute_sql_query(query) as cur:
-                dist = np.array(cur.fetchall())
+        for col, (values, freqs) in zip(columns, counts):
+            known = ~np.isnan(values)
+            unknowns = freqs[~known].sum()
+            values, freqs = values[known], freqs[known]
             if col.is_continuous:
-                dists.append((dist.T, []))
+                order = np.argsort(values)
+                dist = np.vstack((values[order], freqs[order]))
             else:
-                dists.append((dist[:, 1].T, []))
+                dist = np.zeros(len(col.values))
+                np.add.at(dist, values.astype(int), freqs)
+            dists.append((dist, unknowns))
         return dists
 
     def _compute_contingency(self, col_vars=None, row_var=None):
@@ -413,11 +418,10 @@ class SqlTable(Table):
 
         if col_vars is None:
             col_vars = range(len(self.domain.variables))
-        if len(col_vars) != 1:
-            raise NotImplementedError("Contingency for multiple columns "
-                                      "has not yet been implemented.")
         if row_var is None:
-            raise NotImplementedError("Defaults have not been implemented yet")
+            row_var = self.domain.class_var
+            if row_var is None:
+                raise ValueError("No row variable")
 
         row = self.domain[row_var]
         if not row.is_discrete:
@@ -430,50 +434,110 @@ class SqlTable(Table):
             raise ValueError("contingency can be computed only for discrete "
                              "and continuous values")
 
-        row_field = row.to_sql()
-
-        all_contingencies = [None] * len(columns)
-        for i, column in enumerate(columns):
-            column_field = column.to_sql()
-            fields = [row_field, column_field, "COUNT(%s)" % column_field]
-            group_by = [row_field, column_field]
-            order_by = [column_field]
-            filters = ['%s IS NOT NULL' % f
-                       for f in (row_field, column_field)]
-            query = self._sql_query(fields, filters=filters,
-                                    group_by=group_by, order_by=order_by)
-            with self.backend.execute_sql_query(query) as cur:
-                data = list(cur.fetchall())
-                if column.is_continuous:
-                    all_contingencies[i] = \
-                        (self._continuous_contingencies(data, row), [])
-                else:
-                    all_contingencies[i] =\
-                        (self._discrete_contingencies(data, row, column), [])
-        return all_contingencies, None
-
-    def _continuous_contingencies(self, data, row):
-        values = np.zeros(len(data))
-        counts = np.zeros((len(row.values), len(data)))
-        last = None
-        i = -1
-        for row_value, column_value, count in data:
-            if column_value == last:
-                counts[row.to_val(row_value), i] += count
+        counts = self._grouped_counts(
+            [self._value_field(col) for col in columns],
+            self._value_field(row))
+        n_rows = len(row.values)
+        unknown_rows = 0
+        all_contingencies = []
+        for column, (values, row_values, freqs) in zip(columns, counts):
+            known_rows = ~np.isnan(row_values)
+            # every grouping set partitions all rows of the table
+            unknown_rows = freqs[~known_rows].sum()
+            values, row_values, freqs = \
+                values[known_rows], row_values[known_rows].astype(int), \
+                freqs[known_rows]
+            known = ~np.isnan(values)
+            unknowns = np.bincount(row_values[~known], freqs[~known],
+                                   minlength=n_rows)
+            values, row_values, freqs = \
+                values[known], row_values[known], freqs[known]
+            if column.is_continuous:
+                values, inverse = np.unique(values, return_inverse=True)
+                conts = np.zeros((n_rows, len(values)))
+                np.add.at(conts, (row_values, inverse), freqs)
+                conts = [values, conts]
             else:
-                i += 1
-                last = column_value
-                values[i] = column_value
-                counts[row.to_val(row_value), i] += count
-        return (values, counts)
-
-    def _discrete_contingencies(self, data, row, column):
-        conts = np.zeros((len(row.values), len(column.values)))
-        for row_value, col_value, count in data:
-            row_index = row.to_val(row_value)
-            col_index = column.to_val(col_value)
-            conts[row_index, col_index] = count
-        return conts
+                conts = np.zeros((n_rows, len(column.values)))
+                np.add.at(conts, (row_values, values.astype(int)), freqs)
+            all_contingencies.append((conts, unknowns))
+        return all_contingencies, unknown_rows
+
+    def _compute_quantiles(self, columns, quantiles):
+        """
+        Compute quantiles of continuous columns in a single query.
+
+        Return an array of shape `(len(columns), len(quantiles))`; quantiles
+        of columns without defined values are `nan`.
+        """
+        if self.approx_len() > LARGE_TABLE:
+            self = self.sample_time(DEFAULT_SAMPLE_TIME)
+
+        columns = [self.domain[col] for col in columns]
+        fields = []
+        for col in columns:
+            fields += self.backend.quantiles(self._value_field(col),
+                                             quantiles)
+        if not fields:
+            return np.empty((len(columns), len(quantiles)))
+        query = self._sql_query(fields, limit=1)
+        with self.backend.execute_sql_query(query) as cur:
+            results = cur.fetchone() or (None,) * len(fields)
+        return np.array(results, dtype=float).reshape(len(columns), -1)
+
+    def _grouped_counts(self, fields, row_field=None):
+        """
+        Count the rows for each distinct value of each field (and, if given,
+        the row field) with a single query over grouping sets.
+
+        Return a list with an array for each field. The array's rows contain
+        values of the field, values of the row field (if given) and counts;
+        missing values are `nan`.
+        """
+        unique = list(OrderedDict.fromkeys(fields))
+        if not unique:
+            return []
+        extra = () if row_field is None else (row_field,)
+
+        # The row field is grouped in all sets, so it is checked last
+        order = sorted(range(len(unique)), key=lambda i: unique[i] in extra)
+
+        def which(expressions):
+            expressions = list(expressions)
+            return "CASE %s END" % " ".join(
+                "WHEN GROUPING(%s) = 0 THEN %s" % (unique[i], expressions[i])
+                for i in order)
+
+        sql_fields = [which(map(str, range(len(unique)))), which(unique)]
+        sql_fields += list(extra) + ["COUNT(*)"]
+        group_by = ["GROUPING SETS (%s)" % ", ".join(
+            "(%s)" % ", ".join((field,) + extra) for field in unique)]
+        query = self._sql_query(sql_fields, group_by=group_by)
+        with self.backend.execute_sql_query(query) as cur:
+            counts = np.array(cur.fetchall(), dtype=float)
+        counts = counts.reshape(-1, len(sql_fields))
+        counts = counts[np.argsort(counts[:, 0], kind="mergesort")]
+        splits = np.searchsorted(counts[:, 0], np.arange(1, len(unique)))
+        groups = [group[:, 1:].T for group in np.split(counts, splits)]
+        return [groups[unique.index(field)] for field in fields]
+
+    @staticmethod
+    def _value_field(var):
+        """
+        Return a numeric sql expression for values of the variable: the
+        value for continuous variables and its index for discrete ones.
+        Expressions of discrete variables whose `to_sql` has a true attribute
+        `returns_index` already give indices.
+        """
+        field = var.to_sql()
+        if var.is_discrete and not getattr(var.to_sql, "returns_index", False):
+            if var.values:
+                field = "CASE %s %s END" % (field, " ".join(
+                    "WHEN '%s' THEN %i" % (value.replace("'", "''"), i)
+                    for i, value in enumerate(var.values)))
+            else:
+                field = "NULL"
+        return "CAST(%s AS double precision)" % field
 
     def X_density(self):
         return self.DENSE
@@ -575,16 +639,6 @@ class SqlTable(Table):
             offset, limit, use_time_sample)
 
 
-    DISCRETE_STATS = "SUM(CASE TRUE WHEN %(field_name)s IS NULL THEN 1 " \
-                     "ELSE 0 END), " \
-                     "SUM(CASE TRUE WHEN %(field_name)s IS NULL THEN 0 " \
-                     "ELSE 1 END)"
-    CONTINUOUS_STATS = "MIN(%(field_name)s)::double precision, " \
-                       "MAX(%(field_name)s)::double precision, " \
-                       "AVG(%(field_name)s)::double precision, " \
-                       "STDDEV(%(field_name)s)::double precision, " \
-                       + DISCRETE_STATS
-
     def sample_percentage(self, percentage, no_cache=False):
         if percentage >= 100:
             return self
@@ -650,6 +704,10 @@ class SqlTable(Table):
     def checksum(self, include_metas=True):
         return np.nan
 
+    def fingerprint(self):
+        # Data in the database can change without notice
+        return None
+
 
 class SqlRowInstance(Instance):
     """
@@ -1,9 +1,12 @@
 import operator
 import os
+import weakref
 import zlib
-from collections import MutableSequence, Iterable, Sequence, Sized
+from collections import MutableSequence, Iterable, Sequence, Sized, \
+    OrderedDict
 from functools import reduce
-from itertools import chain
+from itertools import chain, count
+from math import isnan
 from numbers import Real, Integral
 from threading import Lock, RLock
 
@@ -17,15 +20,17 @@ from Orange.data import (
     Domain, Variable, Storage, StringVariable, Unknown, Value, Instance,
     ContinuousVariable, DiscreteVariable, MISSING_VALUES
 )
-from Orange.data.util import SharedComputeValue, vstack, hstack, \
-    assure_array_dense, assure_array_sparse, \
+from Orange.data.util import SharedComputeValue, LRUCache, ColumnIndex, \
+    EncodedColumns, vstack, hstack, assure_array_dense, assure_array_sparse, \
     assure_column_dense, assure_column_sparse
-from Orange.statistics.util import bincount, countnans, contingency, \
-    stats as fast_stats, sparse_has_implicit_zeros, sparse_count_implicit_zeros, \
+from Orange.statistics.util import bincount, countnans, \
+    contingencies as batch_contingencies, stats as fast_stats, \
+    sparse_has_implicit_zeros, sparse_count_implicit_zeros, \
     sparse_implicit_zero_weights
 from Orange.util import flatten
 
-__all__ = ["dataset_dirs", "get_sample_datasets_dir", "RowInstance", "Table"]
+__all__ = ["dataset_dirs", "get_sample_datasets_dir", "RowInstance", "Table",
+           "column_cache"]
 
 
 def get_sample_datasets_dir():
@@ -43,6 +48,80 @@ of Table."""
 _conversion_cache = None
 _conversion_cache_lock = RLock()
 
+"""Process-wide cache of columns computed by `compute_value` (and of data
+computed by `SharedComputeValue.compute_shared`) in Table.from_table, for
+source tables with `use_column_cache` set. Columns are stored for each source
+table and compute_value, so repeated conversions of the same table into the
+same domain do not recompute them. Limits can be changed with
+`column_cache.resize(maxsize, maxbytes)` (set `maxsize` to 0 to disable
+caching), and statistics are given by `column_cache.info()`.
+
+Entries for a table are removed when the table is changed through its
+methods or garbage collected. Code that changes the table's arrays in
+place must call `Table.invalidate_cache`."""
+column_cache = LRUCache(maxsize=1024, maxbytes=2 ** 28)
+_cache_tokens = weakref.WeakKeyDictionary()
+_next_cache_token = count()
+
+"""Indexes of columns of tables with `use_column_indexes` set, as
+{table: {column index: (identities of arrays, ColumnIndex)}}. Indexes are
+removed when the table is changed through its methods."""
+_column_indexes = weakref.WeakKeyDictionary()
+
+"""Types in which tables can store X and Y; see the `dtype` argument of
+Table.from_numpy, Table.from_table and Table.from_file."""
+STORAGE_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+
+def _column_cache_key(table, key):
+    """
+    Return the full key of data computed from the `table` in `column_cache`
+    and the group of table's entries; `None` if the data cannot be cached.
+    """
+    if not getattr(table, "use_column_cache", False):
+        return None, None
+    # Columns of tables that do not store data (like SqlTable) can change
+    try:
+        arrays = [id(vars(table)[name]) for name in ("X", "_Y", "metas")]
+        hash(key)
+    except (KeyError, TypeError):
+        return None, None
+    token = _cache_tokens.get(table)
+    if token is None:
+        token = _cache_tokens[table] = next(_next_cache_token)
+        weakref.finalize(table, column_cache.invalidate, token)
+    # Array identities catch replaced arrays, e.g. `table.X = X`
+    return (token, *arrays, key), token
+
+
+def _cached_column(table, key, compute, *args, **kwargs):
+    """
+    Return `compute(table, *args, **kwargs)`, cached in `column_cache` under
+    the given key (usually `compute` itself); `None` results are not cached
+    """
+    key, group = _column_cache_key(table, key)
+    if key is None:
+        return compute(table, *args, **kwargs)
+    column = column_cache.get(key)
+    if column is None:
+        column = compute(table, *args, **kwargs)
+        if column is not None:
+            column_cache.put(key, column, group)
+    return column
+
+
+def _array_checksum(a, cs=1):
+    """Update the adler32 checksum `cs` with the contents of a (sparse) array"""
+    if sp.issparse(a):
+        a = a.tocsr()
+        for part in (a.data, a.indices, a.indptr):
+            cs = zlib.adler32(np.ascontiguousarray(part), cs)
+        return cs
+    if a.dtype == object:
+        # The buffer of an object array holds pointers, not values
+        return zlib.adler32("\0".join(map(str, a.flat)).encode(), cs)
+    return zlib.adler32(np.ascontiguousarray(a), cs)
+
 
 class RowInstance(Instance):
     sparse_x = None
@@ -87,6 +166,7 @@ class RowInstance(Instance):
         self._check_single_class()
         if not isinstance(value, Real):
             value = self.table.domain.class_var.to_val(value)
+        self.table.invalidate_cache()
         self._y[0] = value
         if self.sparse_y:
             self.table._Y[self.row_index, 0] = value
@@ -97,6 +177,7 @@ class RowInstance(Instance):
         if isinstance(value, str):
             var = self._domain[key]
             value = var.to_val(value)
+        self.table.invalidate_cache()
         if key >= 0:
             if not isinstance(value, Real):
                 raise TypeError("Expected primitive value, got '%s'" %
@@ -169,6 +250,23 @@ class Table(MutableSequence, Storage):
     __file__ = None
     name = "untitled"
 
+    #: If set, filters on values of primitive variables use indexes of
+    #: columns (see :obj:`column_index`), which are built on first use and
+    #: kept until the table is changed. This pays off when the same table
+    #: is filtered many times, e.g. by interactive selections.
+    use_column_indexes = False
+
+    #: If set, columns computed from this table in domain conversions are
+    #: kept in :obj:`column_cache` until the table is changed through its
+    #: methods. Code that changes such a table's arrays in place must call
+    #: :obj:`invalidate_cache`.
+    use_column_cache = False
+
+    # The number of changes through the table's methods and the last
+    # computed fingerprint; see fingerprint
+    _modifications = 0
+    _fingerprint = None
+
     @property
     def columns(self):
         """
@@ -211,7 +309,7 @@ class Table(MutableSequence, Storage):
             if args[0].startswith('https://') or args[0].startswith('http://'):
                 return cls.from_url(args[0], **kwargs)
             else:
-                return cls.from_file(args[0])
+                return cls.from_file(args[0], **kwargs)
         elif isinstance(args[0], Table):
             return cls.from_table(args[0].domain, args[0])
         elif isinstance(args[0], Domain):
@@ -261,7 +359,7 @@ class Table(MutableSequence, Storage):
         return self
 
     @classmethod
-    def from_table(cls, domain, source, row_indices=...):
+    def from_table(cls, domain, source, row_indices=..., dtype=None):
         """
         Create a new table from selected columns and/or rows of an existing
         one. The columns are chosen using a domain. The domain may also include
@@ -269,6 +367,8 @@ class Table(MutableSequence, Storage):
         from source variables if possible.
 
         The resulting data may be a view or a copy of the existing data.
+        `X` and `Y` are stored in float32 if so is `X` of the source (or if
+        `dtype` is float32), and in float64 otherwise.
 
         :param domain: the domain for the new table
         :type domain: Orange.data.Domain
@@ -276,12 +376,28 @@ class Table(MutableSequence, Storage):
         :type source: Orange.data.Table
         :param row_indices: indices of the rows to include
         :type row_indices: a slice or a sequence
+        :param dtype: the type of values in `X` and `Y`; by default, the
+            type of the source
+        :type dtype: np.dtype
         :return: a new table
         :rtype: Orange.data.Table
         """
 
         global _conversion_cache
 
+        storage = _storage_dtype(source) if dtype is None \
+            else _check_dtype(dtype)
+
+        def as_storage(table):
+            # Arrays taken from the source keep their type unless it is
+            # explicitly changed
+            if dtype is not None:
+                for name in ("X", "_Y"):
+                    array = getattr(table, name)
+                    if array.dtype != storage:
+                        setattr(table, name, array.astype(storage))
+            return table
+
         def get_columns(row_indices, src_cols, n_rows, dtype=np.float64, is_sparse=False):
             if not len(src_cols):
                 if is_sparse:
@@ -307,45 +423,78 @@ class Table(MutableSequence, Storage):
                     source._Y, row_indices,
                     [x - n_src_attrs for x in src_cols]))
 
-            # initialize final array & set `match_density` for columns
+            # initialize final array (or a list of column blocks for sparse
+            # arrays, which are stacked at the end) & `assign` for columns
             if is_sparse:
-                a = sp.dok_matrix((n_rows, len(src_cols)), dtype=dtype)
-                match_density = assure_column_sparse
+                blocks, order = [], []
+
+                def assign(cols, values):
+                    if len(cols) == 1:
+                        values = assure_column_sparse(values)
+                    blocks.append(sp.csc_matrix(assure_array_sparse(values)))
+                    order.extend(cols)
             else:
                 a = np.empty((n_rows, len(src_cols)), dtype=dtype)
-                match_density = assure_column_dense
+
+                def assign(cols, values):
+                    if len(cols) == 1:
+                        a[:, cols[0]] = assure_column_dense(values)
+                    else:
+                        a[:, cols] = assure_array_dense(values)
+
+            # Compute values of the same type that can be computed together
+            # (e.g. Normalizers from continuization) are computed in batches
+            batches = OrderedDict()
+            for i, col in enumerate(src_cols):
+                if hasattr(type(col), "compute_batch"):
+                    batches.setdefault(type(col), []).append(i)
+            for batch_type, cols in batches.items():
+                if len(cols) == 1:
+                    continue
+                compute_values = tuple(src_cols[i] for i in cols)
+                columns = _cached_column(
+                    source, (batch_type, ) + compute_values,
+                    lambda data: batch_type.compute_batch(compute_values, data))
+                if columns is not None:
+                    if row_indices is not ...:
+                        columns = columns[row_indices]
+                    assign(cols, columns)
+                    src_cols = list(src_cols)
+                    for i in cols:
+                        src_cols[i] = ...
 
             shared_cache = _conversion_cache
             for i, col in enumerate(src_cols):
-                if col is None:
-                    a[:, i] = Unknown
+                if col is ...:  # computed in a batch
+                    continue
+                elif col is None:
+                    assign([i], np.full(n_rows, Unknown))
                 elif not isinstance(col, Integral):
                     if isinstance(col, SharedComputeValue):
                         if (id(col.compute_shared), id(source)) not in shared_cache:
                             shared_cache[id(col.compute_shared), id(source)] = \
-                                col.compute_shared(source)
+                                _cached_column(source, col.compute_shared,
+                                               col.compute_shared)
                         shared = shared_cache[id(col.compute_shared), id(source)]
-                        if row_indices is not ...:
-                            a[:, i] = match_density(
-                                col(source, shared_data=shared)[row_indices])
-                        else:
-                            a[:, i] = match_density(
-                                col(source, shared_data=shared))
+                        column = _cached_column(source, col, col,
+                                                shared_data=shared)
                     else:
-                        if row_indices is not ...:
-                            a[:, i] = match_density(col(source)[row_indices])
-                        else:
-                            a[:, i] = match_density(col(source))
+                        column = _cached_column(source, col, col)
+                    if row_indices is not ...:
+                        column = column[row_indices]
+                    assign([i], column)
                 elif col < 0:
-                    a[:, i] = match_density(source.metas[row_indices, -1 - col])
+                    assign([i], source.metas[row_indices, -1 - col])
                 elif col < n_src_attrs:
-                    a[:, i] = match_density(source.X[row_indices, col])
+                    assign([i], source.X[row_indices, col])
                 else:
-                    a[:, i] = match_density(
-                        source._Y[row_indices, col - n_src_attrs])
+                    assign([i], source._Y[row_indices, col - n_src_attrs])
 
             if is_sparse:
-                a = a.tocsr()
+                a = sp.hstack(blocks, format="csc")
+                if order != sorted(order):
+                    a = a[:, np.argsort(order)]
+                a = a.tocsr().astype(dtype)
 
             return a
 
@@ -355,7 +504,8 @@ class Table(MutableSequence, Storage):
                 if new_cache:
                     _conversion_cache = {}
                 else:
-                    cached = _conversion_cache.get((id(domain), id(source)))
+                    cached = _conversion_cache.get(
+                        (id(domain), id(source), storage))
                     if cached:
                         return cached
                 if domain == source.domain:
@@ -365,7 +515,7 @@ class Table(MutableSequence, Storage):
                     # since sparse flags are not considered when checking for
                     # domain equality, fix manually.
                     table = assure_domain_conversion_sparsity(table, source)
-                    return table
+                    return as_storage(table)
 
                 if isinstance(row_indices, slice):
                     start, stop, stride = row_indices.indices(source.X.shape[0])
@@ -381,12 +531,12 @@ class Table(MutableSequence, Storage):
                 self.domain = domain
                 conversion = domain.get_conversion(source.domain)
                 self.X = get_columns(row_indices, conversion.attributes, n_rows,
-                                     is_sparse=conversion.sparse_X)
+                                     storage, is_sparse=conversion.sparse_X)
                 if self.X.ndim == 1:
                     self.X = self.X.reshape(-1, len(self.domain.attributes))
 
                 self.Y = get_columns(row_indices, conversion.class_vars, n_rows,
-                                     is_sparse=conversion.sparse_Y)
+                                     storage, is_sparse=conversion.sparse_Y)
 
                 dtype = np.float64
                 if any(isinstance(var, StringVariable) for var in domain.metas):
@@ -406,13 +556,13 @@ class Table(MutableSequence, Storage):
                 else:
                     cls._init_ids(self)
                 self.attributes = getattr(source, 'attributes', {})
-                _conversion_cache[(id(domain), id(source))] = self
-                return self
+                _conversion_cache[(id(domain), id(source), storage)] = self
+                return as_storage(self)
             finally:
                 if new_cache:
                     _conversion_cache = None
 
-    def transform(self, domain):
+    def transform(self, domain, dtype=None):
         """
         Construct a table with a different domain.
 
@@ -431,11 +581,15 @@ class Table(MutableSequence, Storage):
 
         Args:
             domain (Domain): new domain
+            dtype (np.dtype): the type of values in `X` and `Y` (float64 or
+                float32); by default, the type of this table
 
         Returns:
             A new table
         """
-        return type(self).from_table(domain, self)
+        if dtype is None:
+            return type(self).from_table(domain, self)
+        return type(self).from_table(domain, self, dtype=dtype)
 
     @classmethod
     def from_table_rows(cls, source, row_indices):
@@ -465,13 +619,17 @@ class Table(MutableSequence, Storage):
         return self
 
     @classmethod
-    def from_numpy(cls, domain, X, Y=None, metas=None, W=None):
+    def from_numpy(cls, domain, X, Y=None, metas=None, W=None, dtype=None):
         """
         Construct a table from numpy arrays with the given domain. The number
         of variables in the domain must match the number of columns in the
         corresponding arrays. All arrays must have the same number of rows.
         Arrays may be of different numpy types, and may be dense or sparse.
 
+        Values of `X` and `Y` are stored as float64, unless `dtype` is set
+        to float32, which halves the memory at the cost of precision. Tables
+        derived from the table (see :obj:`from_table`) keep the type.
+
         :param domain: the domain for the new table
         :type domain: Orange.data.Domain
         :param X: array with attribute values
@@ -482,10 +640,18 @@ class Table(MutableSequence, Storage):
         :type metas: np.array
         :param W: array with weights
         :type W: np.array
+        :param dtype: the type of values in `X` and `Y` (float64 or float32)
+        :type dtype: np.dtype
         :return:
         """
-        X, Y, W = _check_arrays(X, Y, W, dtype='float64')
+        storage = np.dtype(np.float64) if dtype is None else _check_dtype(dtype)
+        X, Y = _check_arrays(X, Y, dtype=storage)
+        W, = _check_arrays(W, dtype='float64')
         metas, = _check_arrays(metas, dtype=object)
+        if dtype is not None:
+            X, Y = (a.astype(storage)
+                    if sp.issparse(a) and a.dtype != storage else a
+                    for a in (X, Y))
 
         if Y is not None and Y.ndim == 1:
             Y = Y.reshape(Y.shape[0], 1)
@@ -494,7 +660,7 @@ class Table(MutableSequence, Storage):
 
         if Y is None:
             if sp.issparse(X):
-                Y = np.empty((X.shape[0], 0), dtype=np.float64)
+                Y = np.empty((X.shape[0], 0), dtype=storage)
             else:
                 Y = X[:, len(domain.attributes):]
                 X = X[:, :len(domain.attributes)]
@@ -589,7 +755,7 @@ class Table(MutableSequence, Storage):
         writer.write_file(filename, self)
 
     @classmethod
-    def from_file(cls, filename, sheet=None):
+    def from_file(cls, filename, sheet=None, dtype=None):
         """
         Read a data table from a file. The path can be absolute or relative.
 
@@ -597,6 +763,9 @@ class Table(MutableSequence, Storage):
         :type filename: str
         :param sheet: Sheet in a file (optional)
         :type sheet: str
+        :param dtype: the type of values in `X` and `Y` (float64 or float32);
+            by default, the type in which the reader returns them
+        :type dtype: np.dtype
         :return: a new data table
         :rtype: Orange.data.Table
         """
@@ -611,6 +780,8 @@ class Table(MutableSequence, Storage):
         # (subclass) type
         if cls != data.__class__:
             data = cls(data)
+        if dtype is not None:
+            data = data.transform(data.domain, dtype)
 
         # no need to call _init_ids as fuctions from .io already
         # construct a table with .ids
@@ -745,6 +916,7 @@ class Table(MutableSequence, Storage):
         return self.from_table(domain, self, row_idx)
 
     def __setitem__(self, key, value):
+        self.invalidate_cache()
         if not isinstance(key, tuple):
             if isinstance(value, Real):
                 self.X[key, :] = value
@@ -826,6 +998,7 @@ class Table(MutableSequence, Storage):
     def __delitem__(self, key):
         if not self._check_all_dense():
             raise ValueError("Rows of sparse data cannot be deleted")
+        self.invalidate_cache()
         if key is ...:
             key = range(len(self))
         self.X = np.delete(self.X, key, axis=0)
@@ -878,6 +1051,7 @@ class Table(MutableSequence, Storage):
             row += len(self)
         if row < 0 or row > len(self):
             raise IndexError("Index out of range")
+        self.invalidate_cache()
         self.ensure_copy()  # ensure that numpy arrays are single-segment for resize
         self._resize_all(len(self) + 1)
         if row < len(self):
@@ -910,6 +1084,7 @@ class Table(MutableSequence, Storage):
         :param instances: additional instances
         :type instances: Orange.data.Table or a sequence of instances
         """
+        self.invalidate_cache()
         if isinstance(instances, Table) and instances.domain == self.domain:
             self.X = vstack((self.X, instances.X))
             self._Y = vstack((self._Y, instances._Y))
@@ -961,7 +1136,8 @@ class Table(MutableSequence, Storage):
                                      np.hstack(tuple(ndmin(t.X) for t in tables)),
                                      np.hstack(tuple(ndmin(t.Y) for t in tables)),
                                      np.hstack(tuple(ndmin(t.metas) for t in tables)),
-                                     np.hstack(tuple(ndmin(t.W) for t in tables)))
+                                     np.hstack(tuple(ndmin(t.W) for t in tables)),
+                                     dtype=_storage_dtype(*tables))
             return table
         raise ValueError('axis {} out of bounds [0, 2)'.format(axis))
 
@@ -1007,6 +1183,20 @@ class Table(MutableSequence, Storage):
         if is_view(self.W):
             self.W = self.W.copy()
 
+    def invalidate_cache(self):
+        """
+        Remove columns computed from this table from :obj:`column_cache`
+        and change the table's :obj:`fingerprint`.
+
+        Methods that change the table call this method; code that changes the
+        table's arrays in place must call it explicitly.
+        """
+        self._modifications += 1
+        token = _cache_tokens.get(self)
+        if token is not None:
+            column_cache.invalidate(token)
+        _column_indexes.pop(self, None)
+
     def copy(self):
         """
         Return a copy of the table
@@ -1015,6 +1205,22 @@ class Table(MutableSequence, Storage):
         t.ensure_copy()
         return t
 
+    def __copy__(self):
+        # Shallow copies share arrays; bypass encoding in __getstate__
+        table = self.__class__.__new__(self.__class__)
+        table.__dict__.update(self.__dict__)
+        return table
+
+    def __getstate__(self):
+        # Encoded metas unpickle into object arrays, so older versions of
+        # Orange can read the pickles
+        state = self.__dict__.copy()
+        state.pop("_fingerprint", None)
+        metas = state.get("metas")
+        if isinstance(metas, np.ndarray) and metas.dtype == object:
+            state["metas"] = EncodedColumns(metas)
+        return state
+
     @staticmethod
     def __determine_density(data):
         if data is None:
@@ -1043,6 +1249,7 @@ class Table(MutableSequence, Storage):
         """
         Set weights of data instances; create a vector of weights if necessary.
         """
+        self.invalidate_cache()
         if not self.W.shape[-1]:
             self.W = np.empty(len(self))
         self.W[:] = weight
@@ -1070,21 +1277,43 @@ class Table(MutableSequence, Storage):
         return bn.anynan(self._Y)
 
     def checksum(self, include_metas=True):
-        # TODO: zlib.adler32 does not work for numpy arrays with dtype object
-        # (after pickling and unpickling such arrays, checksum changes)
-        # Why, and should we fix it or remove it?
         """Return a checksum over X, Y, metas and W."""
-        cs = zlib.adler32(np.ascontiguousarray(self.X))
-        cs = zlib.adler32(np.ascontiguousarray(self._Y), cs)
+        cs = _array_checksum(self.X)
+        cs = _array_checksum(self._Y, cs)
         if include_metas:
-            cs = zlib.adler32(np.ascontiguousarray(self.metas), cs)
-        cs = zlib.adler32(np.ascontiguousarray(self.W), cs)
+            cs = _array_checksum(self.metas, cs)
+        cs = _array_checksum(self.W, cs)
         return cs
 
+    def fingerprint(self):
+        """
+        Return a value that is equal for tables with the same domain and
+        contents, including ids (see :obj:`checksum`).
+
+        The checksum is computed again only after the table is changed
+        through its methods or its arrays are replaced. Changes of arrays in
+        place are not reflected unless they are followed by a call of
+        :obj:`invalidate_cache`.
+        """
+        arrays = (self.X, self._Y, self.metas, self.W, self.ids)
+        cached = self._fingerprint
+        if cached is not None:
+            modifications, refs, fingerprint = cached
+            if modifications == self._modifications and \
+                    all(ref() is array for ref, array in zip(refs, arrays)):
+                return fingerprint
+        fingerprint = (self.domain, ) + \
+            tuple(array.shape for array in arrays) + \
+            (_array_checksum(self.ids, self.checksum()), )
+        self._fingerprint = (self._modifications,
+                             tuple(map(weakref.ref, arrays)), fingerprint)
+        return fingerprint
+
     def shuffle(self):
         """Randomly shuffle the rows of the table."""
         if not self._check_all_dense():
             raise ValueError("Rows of sparse data cannot be shuffled")
+        self.invalidate_cache()
         ind = np.arange(self.X.shape[0])
         np.random.shuffle(ind)
         self.X = self.X[ind]
@@ -1119,6 +1348,33 @@ class Table(MutableSequence, Storage):
         else:
             return rx(self.metas[:, -1 - index])
 
+    def column_index(self, column):
+        """
+        Return an index of sorted values of a column with a primitive
+        variable (:obj:`Orange.data.util.ColumnIndex`).
+
+        The index is built on the first call and kept until the table is
+        changed through its methods; code that changes the table's arrays
+        in place must call :obj:`invalidate_cache`.
+
+        :param column: the index of the column
+        :type column: int, str or Orange.data.Variable
+        :return: Orange.data.util.ColumnIndex
+        """
+        if not isinstance(column, Integral):
+            column = self.domain.index(column)
+        if not self.domain[column].is_primitive():
+            raise ValueError("only columns with primitive variables can be "
+                             "indexed")
+        arrays = tuple(id(vars(self).get(name))
+                       for name in ("X", "_Y", "metas"))
+        indexes = _column_indexes.setdefault(self, {})
+        cached = indexes.get(column)
+        if cached is None or cached[0] != arrays:
+            cached = indexes[column] = \
+                (arrays, ColumnIndex(self.get_column_view(column)[0]))
+        return cached[1]
+
     def _filter_is_defined(self, columns=None, negate=False):
         if columns is None:
             if sp.issparse(self.X):
@@ -1159,7 +1415,12 @@ class Table(MutableSequence, Storage):
     def _filter_same_value(self, column, value, negate=False):
         if not isinstance(value, Real):
             value = self.domain[column].to_val(value)
-        sel = self.get_column_view(column)[0] == value
+        if self.use_column_indexes and \
+                self.domain[column].is_primitive() and not isnan(value):
+            sel = np.zeros(len(self), dtype=bool)
+            sel[self.column_index(column).rows(value, value)] = True
+        else:
+            sel = self.get_column_view(column)[0] == value
         if negate:
             sel = np.logical_not(sel)
         return self.from_table_rows(self, sel)
@@ -1175,177 +1436,14 @@ class Table(MutableSequence, Storage):
 
         Parameters
         ----------
-        filter: Values object containing the conditions
+        filter: Values object containing the conditions (or a ValueFilter)
 
         Returns
         -------
         A 1d bool array. len(result) == len(self)
         """
-        from Orange.data.filter import Values
-
-        if isinstance(filter, Values):
-            conditions = filter.conditions
-            conjunction = filter.conjunction
-        else:
-            conditions = [filter]
-            conjunction = True
-        if conjunction:
-            sel = np.ones(len(self), dtype=bool)
-        else:
-            sel = np.zeros(len(self), dtype=bool)
-
-        for f in conditions:
-            selection = self._filter_to_indicator(f)
-
-            if conjunction:
-                sel *= selection
-            else:
-                sel += selection
-
-        if filter.negate:
-            sel = ~sel
-        return sel
-
-    def _filter_to_indicator(self, filter):
-        """Return selection of rows that match the condition.
-
-        Parameters
-        ----------
-        filter: ValueFilter describing the condition
-
-        Returns
-        -------
-        A 1d bool array. len(result) == len(self)
-        """
-        from Orange.data.filter import (
-            FilterContinuous, FilterDiscrete, FilterRegex, FilterString,
-            FilterStringList, Values
-        )
-        if isinstance(filter, Values):
-            return self._values_filter_to_indicator(filter)
-
-        col = self.get_column_view(filter.column)[0]
-
-        if isinstance(filter, FilterDiscrete):
-            return self._discrete_filter_to_indicator(filter, col)
-
-        if isinstance(filter, FilterContinuous):
-            return self._continuous_filter_to_indicator(filter, col)
-
-        if isinstance(filter, FilterString):
-            return self._string_filter_to_indicator(filter, col)
-
-        if isinstance(filter, FilterStringList):
-            if not filter.case_sensitive:
-                col = np.char.lower(np.array(col, dtype=str))
-                vals = [val.lower() for val in filter.values]
-            else:
-                vals = filter.values
-            return reduce(operator.add, (col == val for val in vals))
-
-        if isinstance(filter, FilterRegex):
-            return np.vectorize(filter)(col)
-
-        raise TypeError("Invalid filter")
-
-    def _discrete_filter_to_indicator(self, filter, col):
-        """Return selection of rows matched by the given discrete filter.
-
-        Parameters
-        ----------
-        filter: FilterDiscrete
-        col: np.ndarray
-
-        Returns
-        -------
-        A 1d bool array. len(result) == len(self)
-        """
-        if filter.values is None:  # <- is defined filter
-            col = col.astype(float)
-            return ~np.isnan(col)
-
-        sel = np.zeros(len(self), dtype=bool)
-        for val in filter.values:
-            if not isinstance(val, Real):
-                val = self.domain[filter.column].to_val(val)
-            sel += (col == val)
-        return sel
-
-    def _continuous_filter_to_indicator(self, filter, col):
-        """Return selection of rows matched by the given continuous filter.
-
-        Parameters
-        ----------
-        filter: FilterContinuous
-        col: np.ndarray
-
-        Returns
-        -------
-        A 1d bool array. len(result) == len(self)
-        """
-        if filter.oper == filter.IsDefined:
-            col = col.astype(float)
-            return ~np.isnan(col)
-
-        return self._range_filter_to_indicator(filter, col, filter.min, filter.max)
-
-    def _string_filter_to_indicator(self, filter, col):
-        """Return selection of rows matched by the given string filter.
-
-        Parameters
-        ----------
-        filter: FilterString
-        col: np.ndarray
-
-        Returns
-        -------
-        A 1d bool array. len(result) == len(self)
-        """
-        if filter.oper == filter.IsDefined:
-            return col.astype(bool)
-
-        col = col.astype(str)
-        fmin = filter.min or ""
-        fmax = filter.max or ""
-
-        if not filter.case_sensitive:
-            # convert all to lower case
-            col = np.char.lower(col)
-            fmin = fmin.lower()
-            fmax = fmax.lower()
-
-        if filter.oper == filter.Contains:
-            return np.fromiter((fmin in e for e in col),
-                               dtype=bool)
-        if filter.oper == filter.StartsWith:
-            return np.fromiter((e.startswith(fmin) for e in col),
-                               dtype=bool)
-        if filter.oper == filter.EndsWith:
-            return np.fromiter((e.endswith(fmin) for e in col),
-                               dtype=bool)
-
-        return self._range_filter_to_indicator(filter, col, fmin, fmax)
-
-    @staticmethod
-    def _range_filter_to_indicator(filter, col, fmin, fmax):
-        if filter.oper == filter.Equal:
-            return col == fmin
-        if filter.oper == filter.NotEqual:
-            return col != fmin
-        if filter.oper == filter.Less:
-            return col < fmin
-        if filter.oper == filter.LessEqual:
-            return col <= fmin
-        if filter.oper == filter.Greater:
-            return col > fmin
-        if filter.oper == filter.GreaterEqual:
-            return col >= fmin
-        if filter.oper == filter.Between:
-            return (col >= fmin) * (col <= fmax)
-        if filter.oper == filter.Outside:
-            return (col < fmin) + (col > fmax)
-
-        raise TypeError("Invalid operator")
+        from Orange.data.filter import compile_filter
+        return compile_filter(filter, self.domain)(self)
 
     def _compute_basic_stats(self, columns=None,
                              include_metas=False, compute_variance=False):
@@ -1367,14 +1465,26 @@ class Table(MutableSequence, Storage):
         else:
             columns = [self.domain.index(c) for c in columns]
             nattrs = len(self.domain.attributes)
-            Xs = any(0 <= c < nattrs for c in columns) and fast_stats(self.X, W)
-            Ys = any(c >= nattrs for c in columns) and fast_stats(self._Y, W)
-            ms = any(c < 0 for c in columns) and fast_stats(self.metas, W)
+            # Compute statistics only for the requested columns of each part
+            parts = [(self.X, [c for c in columns if 0 <= c < nattrs]),
+                     (self._Y, [c - nattrs for c in columns if c >= nattrs]),
+                     (self.metas, [-1 - c for c in columns if c < 0])]
+            part_stats = []
+            for arr, cols in parts:
+                if not cols:
+                    part_stats.append({})
+                    continue
+                if arr.ndim == 1:
+                    arr = arr[:, None]
+                uniq = sorted(set(cols))
+                part_stats.append(
+                    dict(zip(uniq, fast_stats(arr[:, uniq], W))))
+            Xs, Ys, ms = part_stats
             for column in columns:
                 if 0 <= column < nattrs:
-                    stats.append(Xs[column, :])
+                    stats.append(Xs[column])
                 elif column >= nattrs:
-                    stats.append(Ys[column - nattrs, :])
+                    stats.append(Ys[column - nattrs])
                 else:
                     stats.append(ms[-1 - column])
         return stats
@@ -1459,6 +1569,8 @@ class Table(MutableSequence, Storage):
         n_rows = len(row_desc.values)
         if 0 <= row_indi < n_atts:
             row_data = self.X[:, row_indi]
+            if sp.issparse(row_data):
+                row_data = row_data.toarray().ravel()
         elif row_indi < 0:
             row_data = self.metas[:, -1 - row_indi]
         else:
@@ -1500,21 +1612,13 @@ class Table(MutableSequence, Storage):
             vars = [(e, f_ind(col_indi[e]), col_desc[e]) for e in arr_indi]
             disc_vars = [v for v in vars if v[2].is_discrete]
             if disc_vars:
-                if sp.issparse(arr):
-                    max_vals = max(len(v[2].values) for v in disc_vars)
-                    disc_indi = {i for _, i, _ in disc_vars}
-                    mask = [i in disc_indi for i in range(arr.shape[1])]
-                    conts, nans = contingency(arr, row_data, max_vals - 1,
-                                              n_rows - 1, W, mask)
-                    for col_i, arr_i, var in disc_vars:
-                        n_vals = len(var.values)
-                        contingencies[col_i] = (conts[arr_i][:, :n_vals],
-                                                nans[arr_i])
-                else:
-                    for col_i, arr_i, var in disc_vars:
-                        contingencies[col_i] = contingency(
-                            arr[:, arr_i].astype(float),
-                            row_data, len(var.values) - 1, n_rows - 1, W)
+                conts, nans = batch_contingencies(
+                    arr, row_data,
+                    [len(var.values) for _, _, var in disc_vars],
+                    n_rows, W, [arr_i for _, arr_i, _ in disc_vars],
+                    n_jobs=-1)
+                for (col_i, _, var), cont, nan in zip(disc_vars, conts, nans):
+                    contingencies[col_i] = cont[:, :len(var.values)], nan
 
             cont_vars = [v for v in vars if v[2].is_continuous]
             if cont_vars:
@@ -1534,7 +1638,8 @@ class Table(MutableSequence, Storage):
                     else:
                         col_data, W_, classes_ = arr[:, arr_i], W, classes
 
-                    col_data = col_data.astype(dtype=np.float64)
+                    if col_data.dtype != np.float32:
+                        col_data = col_data.astype(np.float64, copy=False)
                     U, C, unknown = _contingency.contingency_floatarray(
                         col_data, classes_, n_rows, W_)
                     contingencies[col_i] = ([U, C], unknown)
@@ -1724,6 +1829,26 @@ def _check_arrays(*arrays, dtype=None):
     return checked
 
 
+def _check_dtype(dtype):
+    dtype = np.dtype(dtype)
+    if dtype not in STORAGE_DTYPES:
+        raise ValueError("X and Y can be stored as float64 or float32, not {}"
+                         .format(dtype))
+    return dtype
+
+
+def _storage_dtype(*tables):
+    """
+    Return the type of X and Y of a table derived from `tables`: float32 if
+    all tables store X in float32, and float64 otherwise.
+    """
+    # vars avoids downloading data of tables that do not store it (SqlTable)
+    if tables and all(getattr(vars(table).get("X"), "dtype", None) ==
+                      np.float32 for table in tables):
+        return np.dtype(np.float32)
+    return np.dtype(np.float64)
+
+
 def _check_inf(array):
     return array.dtype.char in np.typecodes['AllFloat'] and \
            np.isinf(array.data).any()
@@ -1,6 +1,11 @@
 """
 Data-manipulation utilities.
 """
+import operator
+import sys
+from collections import OrderedDict, deque, namedtuple
+from threading import Lock
+
 import numpy as np
 import bottleneck as bn
 from scipy import sparse as sp
@@ -65,6 +70,282 @@ class SharedComputeValue:
         raise NotImplementedError
 
 
+CacheInfo = namedtuple("CacheInfo",
+                       ["hits", "misses", "maxsize", "currsize",
+                        "maxbytes", "nbytes"])
+
+
+def nbytes(value):
+    """Return the (approximate) size of the value in bytes"""
+    if sp.issparse(value):
+        value = value.tocsr() if value.format not in ("csr", "csc") else value
+        return value.data.nbytes + value.indices.nbytes + value.indptr.nbytes
+    if isinstance(value, np.ndarray) or hasattr(value, "nbytes"):
+        return value.nbytes
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """
+    A thread-safe mapping that discards the least recently used items when
+    the number of items exceeds `maxsize` or their total size (as computed
+    by :obj:`nbytes`) exceeds `maxbytes`. Items larger than `maxbytes` are
+    not stored.
+
+    Items can be put into groups and then removed together by
+    :obj:`invalidate`. Invalidation does not block: if the cache is in use,
+    the group is removed before the next operation. This also allows
+    invalidation from finalizers (and thus at any point during garbage
+    collection).
+
+    Parameters
+    ----------
+    maxsize : int or None
+        The maximal number of items; `None` for no limit.
+    maxbytes : int or None
+        The maximal total size of items; `None` for no limit.
+    """
+    def __init__(self, maxsize=128, maxbytes=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = self.misses = 0
+        self._nbytes = 0
+        self._items = OrderedDict()  # key: (value, size, group)
+        self._groups = {}
+        self._invalid = deque()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        """Return the value for the key or `default`; count hits and misses"""
+        with self._lock:
+            self._remove_invalid()
+            try:
+                value = self._items[key][0]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, group=None):
+        """Store the value (into the given group) and evict old items"""
+        size = nbytes(value)
+        with self._lock:
+            self._remove_invalid()
+            self._remove(key)
+            if self.maxsize == 0 \
+                    or self.maxbytes is not None and size > self.maxbytes:
+                return
+            self._items[key] = (value, size, group)
+            self._nbytes += size
+            if group is not None:
+                self._groups.setdefault(group, set()).add(key)
+            while self.maxsize is not None and len(self._items) > self.maxsize \
+                    or self.maxbytes is not None and self._nbytes > self.maxbytes:
+                self._remove(next(iter(self._items)))
+
+    def _remove(self, key):
+        item = self._items.pop(key, None)
+        if item is None:
+            return
+        _, size, group = item
+        self._nbytes -= size
+        if group is not None:
+            keys = self._groups[group]
+            keys.discard(key)
+            if not keys:
+                del self._groups[group]
+
+    def _remove_invalid(self):
+        while self._invalid:
+            for key in list(self._groups.get(self._invalid.popleft(), ())):
+                self._remove(key)
+
+    def invalidate(self, group):
+        """Remove all items in the group"""
+        self._invalid.append(group)
+        if self._lock.acquire(blocking=False):
+            try:
+                self._remove_invalid()
+            finally:
+                self._lock.release()
+
+    def clear(self):
+        """Remove all items and reset statistics"""
+        with self._lock:
+            self._items.clear()
+            self._groups.clear()
+            self._invalid.clear()
+            self._nbytes = 0
+            self.hits = self.misses = 0
+
+    def resize(self, maxsize=128, maxbytes=None):
+        """Change the limits; evict items if necessary"""
+        with self._lock:
+            self._remove_invalid()
+            self.maxsize, self.maxbytes = maxsize, maxbytes
+            while self._items and (
+                    maxsize is not None and len(self._items) > maxsize
+                    or maxbytes is not None and self._nbytes > maxbytes):
+                self._remove(next(iter(self._items)))
+
+    def info(self):
+        """Return statistics as a named tuple `CacheInfo`"""
+        with self._lock:
+            self._remove_invalid()
+            return CacheInfo(self.hits, self.misses, self.maxsize,
+                             len(self._items), self.maxbytes, self._nbytes)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+
+class ColumnIndex:
+    """
+    An index of a numeric column: the permutation that sorts the column and
+    the sorted values, with undefined values at the end.
+
+    Rows with values in an interval are found by binary search, in
+    O(log n + k) for k rows; rows with a given value (e.g. of a discrete
+    variable) are a contiguous slice of the permutation.
+
+    Parameters
+    ----------
+    col : np.ndarray
+        A 1d array with values of the column.
+    """
+    def __init__(self, col):
+        col = np.asarray(col, dtype=float)
+        self.order = np.argsort(col, kind="mergesort")
+        self.n_defined = len(col) - int(np.isnan(col).sum())
+        self.values = col[self.order[:self.n_defined]]
+
+    def __len__(self):
+        return len(self.order)
+
+    def rows(self, low=None, high=None, include_low=True, include_high=True):
+        """
+        Return indices of rows with values between `low` and `high`.
+
+        A bound that is `None` is not checked. Indices are in the order of
+        values, not rows.
+        """
+        start, stop = 0, self.n_defined
+        if low is not None:
+            start = np.searchsorted(self.values, low,
+                                    side="left" if include_low else "right")
+        if high is not None:
+            stop = np.searchsorted(self.values, high,
+                                   side="right" if include_high else "left")
+        return self.order[start:max(start, stop)]
+
+    def defined_rows(self):
+        """Return indices of rows with defined values"""
+        return self.order[:self.n_defined]
+
+
+def dictionary_encode(values):
+    """
+    Return integer codes and an object array with unique values (the pool)
+    such that `pool[codes]` equals `values`.
+
+    Codes are numbered in the order of first appearance and stored in the
+    smallest unsigned integer type that fits them.
+    """
+    values = values.tolist() if isinstance(values, np.ndarray) else values
+    index = {value: i for i, value in enumerate(dict.fromkeys(values))}
+    codes = np.fromiter(map(index.__getitem__, values),
+                        dtype=np.min_scalar_type(max(len(index) - 1, 0)),
+                        count=len(values))
+    pool = np.empty(len(index), dtype=object)
+    pool[:] = list(index)
+    return codes, pool
+
+
+def dictionary_decode(codes, pool):
+    """
+    Return an object array with values of the dictionary-encoded column.
+
+    Equal values in the column refer to the same object from the pool.
+    """
+    return pool[codes]
+
+
+def intern_strings(values):
+    """
+    Return an object array with the given strings, in which equal strings
+    are the same object (the decoded form of a dictionary-encoded column).
+    """
+    return dictionary_decode(*dictionary_encode(values))
+
+
+class EncodedColumns:
+    """
+    A compact form of a 2d object array (e.g. metas) for pickling.
+
+    Columns of strings are dictionary-encoded, columns of numbers are stored
+    as float arrays and other columns are kept as they are. Pickles of
+    encoded arrays are smaller and much faster to write and read than
+    pickles of object arrays, which store each cell separately.
+
+    Encoded arrays unpickle into the original object arrays, which are
+    decoded by numpy functions alone, so pickles load also in Orange
+    versions without this class.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        A 2d array with dtype object.
+    """
+    def __init__(self, array):
+        self.shape = array.shape
+        self.columns = [self._encode(array[:, i])
+                        for i in range(array.shape[1])]
+
+    @staticmethod
+    def _encode(col):
+        # Only strings are encoded: keys of the pool would merge e.g. 1 and
+        # 1.0 or True and change their types; subclasses of str are kept
+        types = set(map(type, col))
+        if types <= {str}:
+            return dictionary_encode(col)
+        if types <= {float, np.float64}:
+            return col.astype(float)
+        return col
+
+    def decode(self):
+        """Return the original object array"""
+        array = np.empty(self.shape, dtype=object)
+        for i, col in enumerate(self.columns):
+            array[:, i] = dictionary_decode(*col) if isinstance(col, tuple) \
+                else col
+        return array
+
+    def __reduce__(self):
+        if not self.columns:
+            return np.empty, (self.shape, object)
+        return np.column_stack, ([_DecodedColumn(col)
+                                  for col in self.columns], )
+
+
+class _DecodedColumn:
+    """A column of EncodedColumns that pickles as a call that decodes it"""
+    def __init__(self, column):
+        self.column = column
+
+    def __reduce__(self):
+        col = self.column
+        if isinstance(col, tuple):
+            codes, pool = col
+            return operator.getitem, (pool, codes)
+        # Float columns are converted back to objects
+        return np.array, (col, object)
+
+
 def vstack(arrays):
     """vstack that supports sparse and dense arrays
 
@@ -101,7 +382,9 @@ def assure_array_sparse(a):
     if not sp.issparse(a):
         # since x can be a list, cast to np.array
         # since x can come from metas with string, cast to float
-        a = np.asarray(a).astype(np.float)
+        a = np.asarray(a)
+        if a.dtype != np.float32:
+            a = a.astype(np.float)
         return sp.csc_matrix(a)
     return a
 
@@ -2,5 +2,6 @@ from .distance import (Distance, DistanceModel,
                        Euclidean, Manhattan, Cosine, Jaccard,
                        SpearmanR, SpearmanRAbsolute, PearsonR, PearsonRAbsolute,
                        Mahalanobis, MahalanobisDistance)
+from .neighbors import NeighborIndex
 
 from .base import _preprocess, remove_discrete_features, impute
@@ -6,6 +6,7 @@
 
 import numpy as np
 cimport numpy as np
+from cython cimport floating
 
 cdef extern from "numpy/npy_math.h":
     bint npy_isnan(double x) nogil
@@ -23,8 +24,8 @@ cpdef void lower_to_symmetric(double [:, :] distances):
 
 
 def euclidean_rows_discrete(np.ndarray[np.float64_t, ndim=2] distances,
-                            np.ndarray[np.float64_t, ndim=2] x1,
-                            np.ndarray[np.float64_t, ndim=2] x2,
+                            np.ndarray[floating, ndim=2] x1,
+                            np.ndarray[floating, ndim=2] x2,
                             double[:, :] dist_missing,
                             np.ndarray[np.float64_t, ndim=1] dist_missing2,
                             char two_tables):
@@ -56,8 +57,8 @@ def euclidean_rows_discrete(np.ndarray[np.float64_t, ndim=2] distances,
 
 def fix_euclidean_rows(
     np.ndarray[np.float64_t, ndim=2] distances,
-    np.ndarray[np.float64_t, ndim=2] x1,
-    np.ndarray[np.float64_t, ndim=2] x2,
+    np.ndarray[floating, ndim=2] x1,
+    np.ndarray[floating, ndim=2] x2,
     np.ndarray[np.float64_t, ndim=1] means,
     np.ndarray[np.float64_t, ndim=1] vars,
     np.ndarray[np.float64_t, ndim=1] dist_missing2,
@@ -91,8 +92,8 @@ def fix_euclidean_rows(
 
 def fix_euclidean_rows_normalized(
     np.ndarray[np.float64_t, ndim=2] distances,
-    np.ndarray[np.float64_t, ndim=2] x1,
-    np.ndarray[np.float64_t, ndim=2] x2,
+    np.ndarray[floating, ndim=2] x1,
+    np.ndarray[floating, ndim=2] x2,
     np.ndarray[np.float64_t, ndim=1] means,
     np.ndarray[np.float64_t, ndim=1] vars,
     np.ndarray[np.float64_t, ndim=1] dist_missing2,
@@ -126,7 +127,7 @@ def fix_euclidean_rows_normalized(
 
 def fix_euclidean_cols(
     np.ndarray[np.float64_t, ndim=2] distances,
-    np.ndarray[np.float64_t, ndim=2] x,
+    np.ndarray[floating, ndim=2] x,
     double[:] means,
     double[:] vars):
     cdef:
@@ -156,7 +157,7 @@ def fix_euclidean_cols(
 
 def fix_euclidean_cols_normalized(
     np.ndarray[np.float64_t, ndim=2] distances,
-    np.ndarray[np.float64_t, ndim=2] x,
+    np.ndarray[floating, ndim=2] x,
     double[:] means,
     double[:] vars):
     cdef:
@@ -183,8 +184,8 @@ def fix_euclidean_cols_normalized(
                     distances[col1, col2] = distances[col2, col1] = d
 
 
-def manhattan_rows_cont(np.ndarray[np.float64_t, ndim=2] x1,
-                        np.ndarray[np.float64_t, ndim=2] x2,
+def manhattan_rows_cont(np.ndarray[floating, ndim=2] x1,
+                        np.ndarray[floating, ndim=2] x2,
                         char two_tables):
     cdef:
         int n_rows1, n_rows2, n_cols, row1, row2, col
@@ -204,8 +205,8 @@ def manhattan_rows_cont(np.ndarray[np.float64_t, ndim=2] x1,
     return distances
 
 def fix_manhattan_rows(np.ndarray[np.float64_t, ndim=2] distances,
-                       np.ndarray[np.float64_t, ndim=2] x1,
-                       np.ndarray[np.float64_t, ndim=2] x2,
+                       np.ndarray[floating, ndim=2] x1,
+                       np.ndarray[floating, ndim=2] x2,
                        np.ndarray[np.float64_t, ndim=1] medians,
                        np.ndarray[np.float64_t, ndim=1] mads,
                        np.ndarray[np.float64_t, ndim=1] dist_missing2_cont,
@@ -237,8 +238,8 @@ def fix_manhattan_rows(np.ndarray[np.float64_t, ndim=2] distances,
 
 
 def fix_manhattan_rows_normalized(np.ndarray[np.float64_t, ndim=2] distances,
-                                  np.ndarray[np.float64_t, ndim=2] x1,
-                                  np.ndarray[np.float64_t, ndim=2] x2,
+                                  np.ndarray[floating, ndim=2] x1,
+                                  np.ndarray[floating, ndim=2] x2,
                                   char two_tables):
     cdef:
         int n_rows1, n_rows2, n_cols, row1, row2, col
@@ -266,7 +267,7 @@ def fix_manhattan_rows_normalized(np.ndarray[np.float64_t, ndim=2] distances,
     return distances
 
 
-def manhattan_cols(np.ndarray[np.float64_t, ndim=2] x,
+def manhattan_cols(np.ndarray[floating, ndim=2] x,
                    np.ndarray[np.float64_t, ndim=1] medians,
                    np.ndarray[np.float64_t, ndim=1] mads,
                    char normalize):
@@ -307,7 +308,7 @@ def manhattan_cols(np.ndarray[np.float64_t, ndim=2] x,
     return distances
 
 
-def p_nonzero(np.ndarray[np.float64_t, ndim=1] x):
+def p_nonzero(np.ndarray[floating, ndim=1] x):
     cdef:
         int row, nonzeros, nonnans
         double val
@@ -321,7 +322,7 @@ def p_nonzero(np.ndarray[np.float64_t, ndim=1] x):
                 nonzeros += 1
     return float(nonzeros) / nonnans
 
-def any_nan_row(np.ndarray[np.float64_t, ndim=2] x):
+def any_nan_row(np.ndarray[floating, ndim=2] x):
     cdef:
         int row, n_cols, n_rows
         np.ndarray[np.int8_t, ndim=1] flags
@@ -339,8 +340,8 @@ def any_nan_row(np.ndarray[np.float64_t, ndim=2] x):
 
 def jaccard_rows(np.ndarray[np.int8_t, ndim=2] nonzeros1,
                  np.ndarray[np.int8_t, ndim=2] nonzeros2,
-                 np.ndarray[np.float64_t, ndim=2] x1,
-                 np.ndarray[np.float64_t, ndim=2] x2,
+                 np.ndarray[floating, ndim=2] x1,
+                 np.ndarray[floating, ndim=2] x2,
                  np.ndarray[np.int8_t, ndim=1] nans1,
                  np.ndarray[np.int8_t, ndim=1] nans2,
                  np.ndarray[np.float64_t, ndim=1] ps,
@@ -414,7 +415,7 @@ def jaccard_rows(np.ndarray[np.int8_t, ndim=2] nonzeros1,
 
 
 def jaccard_cols(np.ndarray[np.int8_t, ndim=2] nonzeros,
-                 np.ndarray[np.float64_t, ndim=2] x,
+                 np.ndarray[floating, ndim=2] x,
                  np.ndarray[np.int8_t, ndim=1] nans,
                  np.ndarray[np.float64_t, ndim=1] ps):
     cdef:
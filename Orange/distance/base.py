@@ -1,8 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import sklearn.metrics as skl_metrics
 
 from Orange.data import Table, Domain, Instance, RowInstance
-from Orange.misc import DistMatrix
+from Orange.misc import DistMatrix, CondensedDistMatrix
 from Orange.preprocess import SklImpute
 from Orange.statistics import util
 
@@ -10,6 +12,10 @@ from Orange.statistics import util
 # TODO: When we upgrade to numpy 1.13, change use argument copy=False in
 # nan_to_num instead of assignment
 
+# The default number of elements in a block of the distance matrix that is
+# computed at once in the blocked mode of `DistanceModel.__call__`
+BLOCK_SIZE = 2 ** 22
+
 # TODO this *private* function is called from several widgets to prepare
 # data for calling the below classes. After we (mostly) stopped relying
 # on sklearn.metrics, this is (mostly) unnecessary
@@ -204,7 +210,8 @@ class DistanceModel:
     def axis(self):
         return self._axis
 
-    def __call__(self, e1, e2=None):
+    def __call__(self, e1, e2=None, *, block_rows=None, n_jobs=1, out=None,
+                 condensed=False):
         """
         If e2 is omitted, calculate distances between all rows (axis=1) or
         columns (axis=2) of e1. If e2 is present, calculate distances between
@@ -214,14 +221,36 @@ class DistanceModel:
         `compute_data` and packs the result into `DistMatrix`. Subclasses are
         expected to define the `compute_data` and not the `__call__` method.
 
+        Distances between rows can also be computed in blocks of rows, which
+        bounds the size of temporary arrays; blocks are processed by
+        `n_jobs` threads. The result can be written into a given array,
+        e.g. a `numpy.memmap`, so the matrix does not need to fit into memory.
+        For distances between rows of a single table, only the blocks below
+        the diagonal are computed and then mirrored, and the diagonal is
+        set to zero.
+
+        With `condensed=True`, distances between rows or columns of a single
+        table are returned as `CondensedDistMatrix`, which stores only the
+        elements above the diagonal and thus takes half of the memory.
+        Distances between rows are computed in blocks, as above, and the
+        square matrix is never constructed.
+
         Args:
             e1 (Orange.data.Table or Orange.data.Instance or numpy.ndarray):
                 input data
             e2 (Orange.data.Table or Orange.data.Instance or numpy.ndarray):
                 secondary data
+            block_rows (int): the number of rows in a block; if omitted,
+                blocks have about `BLOCK_SIZE` elements
+            n_jobs (int): the number of threads used in the blocked mode
+            out (numpy.ndarray or str): an array into which the distances are
+                stored, or the name of a file for a new `numpy.memmap`;
+                for condensed matrices, the array must be flat
+            condensed (bool): if `True`, return a condensed matrix
 
         Returns:
-            A distance matrix (Orange.misc.distmatrix.DistMatrix)
+            A distance matrix (Orange.misc.distmatrix.DistMatrix or
+            Orange.misc.distmatrix.CondensedDistMatrix)
         """
         if self.axis == 0 and e2 is not None:
             # Backward compatibility fix
@@ -230,17 +259,139 @@ class DistanceModel:
             else:
                 raise ValueError("Two tables cannot be compared by columns")
 
+        if condensed and e2 is not None:
+            raise ValueError("Condensed matrices require a single table")
+
         x1 = _orange_to_numpy(e1)
         x2 = _orange_to_numpy(e2)
-        dist = self.compute_distances(x1, x2)
-        if self.impute and np.isnan(dist).any():
-            dist = np.nan_to_num(dist)
+        # Compiled functions expect both arrays to be of the same type
+        if x2 is not None and x1.dtype != x2.dtype:
+            dtype = np.result_type(x1.dtype, x2.dtype)
+            x1, x2 = (x if x.dtype == dtype else x.astype(dtype)
+                      for x in (x1, x2))
+        if condensed:
+            dist = self._compute_condensed(x1, block_rows, n_jobs, out)
+            n = x1.shape[self.axis == 0]
+            if isinstance(e1, (Table, RowInstance)):
+                return CondensedDistMatrix(dist, e1, None, self.axis, n=n)
+            return CondensedDistMatrix(dist, n=n)
+        if self.axis == 1 and (block_rows is not None or n_jobs != 1
+                               or out is not None):
+            dist = self._compute_blocks(x1, x2, block_rows, n_jobs, out)
+        else:
+            dist = self.compute_distances(x1, x2)
+            if self.impute and np.isnan(dist).any():
+                dist = np.nan_to_num(dist)
+            if out is not None:
+                out = self._output_array(out, dist.shape)
+                out[:] = dist
+                dist = out
         if isinstance(e1, (Table, RowInstance)):
             dist = DistMatrix(dist, e1, e2, self.axis)
         else:
             dist = DistMatrix(dist)
         return dist
 
+    @staticmethod
+    def _output_array(out, shape):
+        if isinstance(out, str):
+            return np.memmap(out, dtype=np.float64, mode="w+", shape=shape)
+        if out.shape != shape:
+            raise ValueError("output array must have shape {}".format(shape))
+        return out
+
+    def _compute_blocks(self, x1, x2, block_rows, n_jobs, out):
+        """
+        Compute distances between rows in blocks of `block_rows` rows, using
+        `n_jobs` threads, and store them into `out`.
+
+        Blocks use the two-table mode of `compute_distances`, so the method
+        relies on derived classes to compute the same distances in either
+        mode. Compiled functions that do the heavy lifting release the GIL,
+        so threads run in parallel.
+        """
+        n1 = x1.shape[0]
+        n2 = n1 if x2 is None else x2.shape[0]
+        out = self._output_array(
+            np.empty((n1, n2)) if out is None else out, (n1, n2))
+        if block_rows is None:
+            block_rows = max(1, BLOCK_SIZE // max(n2, 1))
+
+        def compute_block(start):
+            end = min(start + block_rows, n1)
+            # Some compiled functions return memory views
+            if x2 is not None:
+                block = np.asarray(self.compute_distances(x1[start:end], x2))
+            else:
+                block = np.asarray(
+                    self.compute_distances(x1[start:end], x1[:end]))
+                np.fill_diagonal(block[:, start:], 0)
+            if self.impute and np.isnan(block).any():
+                block = np.nan_to_num(block)
+            if x2 is not None:
+                out[start:end] = block
+            else:
+                # Blocks write into disjoint parts of the matrix: the rows
+                # start:end below the diagonal and the mirrored columns
+                diag = block[:, start:]
+                upper = np.triu_indices(end - start, 1)
+                diag[upper] = diag.T[upper]
+                out[start:end, :end] = block
+                out[:start, start:end] = block[:, :start].T
+
+        # In symmetric case, later blocks are larger; start them first
+        starts = range(0, n1, block_rows)[::1 if x2 is not None else -1]
+        if n_jobs == 1:
+            for start in starts:
+                compute_block(start)
+        else:
+            with ThreadPoolExecutor(n_jobs) as executor:
+                # list forces evaluation, so exceptions are raised
+                list(executor.map(compute_block, starts))
+        return out
+
+    def _compute_condensed(self, x1, block_rows, n_jobs, out):
+        """
+        Compute the elements above the diagonal of the matrix of distances
+        between rows (in blocks) or columns of `x1` and store them into
+        `out`, in the order of `scipy.spatial.distance.pdist`.
+        """
+        n = x1.shape[self.axis == 0]
+        size = n * (n - 1) // 2
+        out = self._output_array(
+            np.empty(size) if out is None else out, (size, ))
+        if self.axis == 0:
+            dist = np.asarray(self.compute_distances(x1, None))
+            if self.impute and np.isnan(dist).any():
+                dist = np.nan_to_num(dist)
+            out[:] = dist[np.triu_indices(n, 1)]
+            return out
+
+        if block_rows is None:
+            block_rows = max(1, BLOCK_SIZE // max(n, 1))
+
+        def compute_block(start):
+            end = min(start + block_rows, n)
+            block = np.asarray(
+                self.compute_distances(x1[start:end], x1[start:]))
+            if self.impute and np.isnan(block).any():
+                block = np.nan_to_num(block)
+            # Elements of each row right of the diagonal are contiguous
+            for i in range(start, end):
+                first = n * i - i * (i + 1) // 2
+                out[first:first + n - i - 1] = block[i - start, i - start + 1:]
+
+        # Blocks write into disjoint parts of the array; earlier blocks are
+        # larger, so they are started first
+        starts = range(0, n, block_rows)
+        if n_jobs == 1:
+            for start in starts:
+                compute_block(start)
+        else:
+            with ThreadPoolExecutor(n_jobs) as executor:
+                list(executor.map(compute_block, starts))
+        return out
+
     def compute_distances(self, x1, x2):
         """
         Abstract method for computation of distances between rows or colums of
@@ -262,11 +413,11 @@ class FittedDistanceModel(DistanceModel):
         super().__init__(axis, impute)
         self.attributes = attributes
 
-    def __call__(self, e1, e2=None):
+    def __call__(self, e1, e2=None, **kwargs):
         if e1.domain.attributes != self.attributes or \
                     e2 is not None and e2.domain.attributes != self.attributes:
             raise ValueError("mismatching domains")
-        return super().__call__(e1, e2)
+        return super().__call__(e1, e2, **kwargs)
 
     def continuous_columns(self, x1, x2, offset, scale):
         """
@@ -10,6 +10,10 @@ from .base import (Distance, DistanceModel, FittedDistance, FittedDistanceModel,
                    SklDistance, _orange_to_numpy)
 
 
+def _as_float64(x):
+    return x.astype(np.float64) if x.dtype == np.float32 else x
+
+
 class EuclideanRowsModel(FittedDistanceModel):
     """
     Model for computation of Euclidean distances between rows.
@@ -45,6 +49,9 @@ class EuclideanRowsModel(FittedDistanceModel):
         if self.continuous.any():
             data1, data2 = self.continuous_columns(
                 x1, x2, self.means, np.sqrt(2 * self.vars))
+            # In float32, rounding errors of norms would dominate distances
+            # between close rows
+            data1, data2 = _as_float64(data1), _as_float64(data2)
 
             # adapted from sklearn.metric.euclidean_distances
             xx = row_norms(data1, squared=True)[:, np.newaxis]
@@ -104,6 +111,7 @@ class EuclideanColumnsModel(FittedDistanceModel):
         if self.normalize:
             x1 = x1 - self.means
             x1 /= np.sqrt(2 * self.vars)
+        x1 = _as_float64(x1)
 
         # adapted from sklearn.metric.euclidean_distances
         xx = row_norms(x1.T, squared=True)[:, np.newaxis]
@@ -154,8 +162,8 @@ class Euclidean(FittedDistance):
         for normalization and imputation.
         """
         self.check_no_discrete(n_vals)
-        means = np.nanmean(x, axis=0)
-        vars = np.nanvar(x, axis=0)
+        means = np.nanmean(x, axis=0, dtype=float)
+        vars = np.nanvar(x, axis=0, dtype=float)
         if self.normalize and (np.isnan(vars).any() or not vars.all()):
             raise ValueError("some columns are constant or have no values")
         return EuclideanColumnsModel(
@@ -277,8 +285,8 @@ class Manhattan(FittedDistance):
         for normalization and imputation.
         """
         self.check_no_discrete(n_vals)
-        medians = np.nanmedian(x, axis=0)
-        mads = np.nanmedian(np.abs(x - medians), axis=0)
+        medians = np.nanmedian(x, axis=0).astype(float)
+        mads = np.nanmedian(np.abs(x - medians), axis=0).astype(float)
         if self.normalize and (np.isnan(mads).any() or not mads.all()):
             raise ValueError(
                 "some columns have zero absolute distance from median, "
@@ -331,6 +339,7 @@ class Cosine(FittedDistance):
             """
 
             def prepare_data(x):
+                x = _as_float64(x)
                 if self.discrete.any():
                     data = Cosine.discrete_to_indicators(x, self.discrete)
                 else:
@@ -600,11 +609,11 @@ class MahalanobisModel(DistanceModel):
         super().__init__(axis, impute)
         self.vi = vi
 
-    def __call__(self, e1, e2=None, impute=None):
+    def __call__(self, e1, e2=None, impute=None, **kwargs):
         # argument `impute` is here just for backward compatibility; don't use
         if impute is not None:
             self.impute = impute
-        return super().__call__(e1, e2)
+        return super().__call__(e1, e2, **kwargs)
 
     def compute_distances(self, x1, x2):
         if self.axis == 0:
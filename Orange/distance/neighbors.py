@@ -0,0 +1,422 @@
+"""
+Indexes for queries of nearest neighbours among rows of data.
+"""
+import hashlib
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.neighbors import BallTree, KDTree
+
+from Orange.data import Table
+from Orange.data.util import LRUCache
+from .base import BLOCK_SIZE, _orange_to_numpy
+from .distance import Euclidean, Manhattan
+
+__all__ = ["NeighborIndex", "index_cache"]
+
+
+"""Process-wide cache of neighbour indexes used by `NeighborIndex.cached`.
+Indexes are stored for the contents of the data, the distance and the
+parameters of the index, so an index built for one table is also used for
+any other table or array with the same data. Limits can be changed with
+`index_cache.resize(maxsize, maxbytes)`."""
+index_cache = LRUCache(maxsize=16, maxbytes=2 ** 28)
+
+ALGORITHMS = ("auto", "kd_tree", "ball_tree", "brute", "approximate")
+
+_TREE_METRICS = {Euclidean: "euclidean", Manhattan: "manhattan"}
+
+
+class NeighborIndex:
+    """
+    An index for queries of nearest neighbours among rows of data.
+
+    Distances are computed by an Orange distance (:obj:`Distance`) that is
+    fitted to the indexed data. The index is
+
+    - a kd-tree or a ball tree (from scikit-learn); trees require Euclidean
+      or Manhattan distance without normalization, and data with only
+      continuous attributes and no missing values;
+    - a brute-force search, which computes distances to all indexed rows in
+      blocks and works with any distance between rows;
+    - a graph of approximate nearest neighbours (`algorithm="approximate"`).
+      The graph is constructed from neighbours within leaves of a forest of
+      random projection trees, and then refined by comparing rows with
+      neighbours of their neighbours, as in NN-descent. A query starts with
+      the rows in the query's leaf of the first tree and proceeds with a
+      greedy search of the graph.
+
+    With `algorithm="auto"`, the index is a kd-tree if the distance and the
+    data allow it, and a brute-force search otherwise.
+
+    Indexes are costly to build; use :obj:`NeighborIndex.cached` to reuse
+    an index for the same data.
+
+    Args:
+        data (Orange.data.Table or np.ndarray): indexed data
+        distance (Orange.distance.Distance): distance or its type
+        algorithm (str): "auto", "kd_tree", "ball_tree", "brute" or
+            "approximate"
+        n_neighbors (int): the number of neighbours of each row in the
+            approximate graph
+        leaf_size (int): the maximal number of rows in leaves of trees
+        n_trees (int): the number of random projection trees
+        n_iter (int): the number of refinements of the approximate graph and
+            of steps of the greedy search
+        random_state (int): seed for random projections
+
+    Attributes:
+        data (Orange.data.Table): indexed data
+        distance (Orange.distance.Distance): distance
+        algorithm (str): "kd_tree", "ball_tree", "brute" or "approximate"
+        tree (sklearn.neighbors.KDTree or sklearn.neighbors.BallTree):
+            the tree; `None` for other algorithms
+        model (Orange.distance.DistanceModel): the distance fitted to data;
+            `None` for trees
+    """
+    def __init__(self, data, distance=Euclidean, algorithm="auto",
+                 n_neighbors=15, leaf_size=30, n_trees=8, n_iter=2,
+                 random_state=0):
+        if algorithm not in ALGORITHMS:
+            raise ValueError("unknown algorithm '{}'".format(algorithm))
+        if isinstance(distance, type):
+            distance = distance()
+        if distance.axis != 1:
+            raise ValueError("neighbours can only be found among rows")
+        if not isinstance(data, Table):
+            data = Table.from_numpy(None, np.atleast_2d(data))
+        if sp.issparse(data.X):
+            raise ValueError("sparse data is not supported")
+
+        self.data = data
+        self.distance = distance
+        self.x = data.X
+        self.n_neighbors = min(n_neighbors, len(data) - 1)
+        self.leaf_size = leaf_size
+        self.n_iter = n_iter
+        self.tree = self.model = None
+
+        metric = self._tree_metric()
+        if algorithm == "auto":
+            algorithm = "brute" if metric is None else "kd_tree"
+        self.algorithm = algorithm
+        if algorithm in ("kd_tree", "ball_tree"):
+            if metric is None:
+                raise ValueError(
+                    "trees require Euclidean or Manhattan distance without "
+                    "normalization on continuous data without missing values")
+            tree_type = KDTree if algorithm == "kd_tree" else BallTree
+            self.tree = tree_type(self.x, leaf_size, metric=metric)
+            return
+
+        self.model = distance.fit(data)
+        if algorithm == "approximate":
+            self._build_graph(n_trees, np.random.RandomState(random_state))
+
+    def _tree_metric(self):
+        metric = _TREE_METRICS.get(type(self.distance))
+        if metric is None or getattr(self.distance, "normalize", False) \
+                or not all(var.is_continuous
+                           for var in self.data.domain.attributes) \
+                or np.isnan(self.x).any():
+            return None
+        return metric
+
+    @classmethod
+    def cached(cls, data, distance=Euclidean, **kwargs):
+        """
+        Return an index for the data, reusing the index from `index_cache`
+        that was built with the same arguments for data with equal contents.
+        The returned index may thus refer to another table with the same data.
+
+        Arguments are the same as for the constructor. Indexes for sparse
+        data and for distances with unhashable parameters are not cached.
+        """
+        key = _cache_key(data, distance, kwargs)
+        if key is None:
+            return cls(data, distance, **kwargs)
+        index = index_cache.get(key)
+        if index is None:
+            index = cls(data, distance, **kwargs)
+            index_cache.put(key, index)
+        return index
+
+    @property
+    def nbytes(self):
+        """The (approximate) size of the index and the indexed data"""
+        size = self.x.nbytes
+        if self.tree is not None:
+            size += sum(np.asarray(a).nbytes for a in self.tree.get_arrays())
+        if self.algorithm == "approximate":
+            size += self._graph_dist.nbytes + self._graph_ind.nbytes \
+                    + len(self._trees) * self._graph_ind[:, 0].nbytes
+        return size
+
+    def query(self, data, k):
+        """
+        Return distances to the `k` nearest indexed rows and their indices
+        for each row of the data.
+
+        Args:
+            data (Orange.data.Table or Orange.data.Instance or np.ndarray):
+                data in the domain of the index (tables in other domains
+                are transformed)
+            k (int): the number of neighbours
+
+        Returns:
+            (np.ndarray, np.ndarray): arrays of shape `(len(data), k)` with
+            distances and indices of neighbours, ordered by distances
+        """
+        if isinstance(data, Table) and data.domain != self.data.domain:
+            data = data.transform(self.data.domain)
+        x = _orange_to_numpy(data)
+        if x.dtype != self.x.dtype:
+            x = x.astype(self.x.dtype)
+        self._check_k(k, len(self.x))
+        if self.tree is not None:
+            return self.tree.query(x, k)
+        if self.algorithm == "approximate":
+            return self._graph_query(x, k)
+        return self._brute_query(x, k)
+
+    def kneighbors(self, k):
+        """
+        Return distances to the `k` nearest neighbours and their indices for
+        each indexed row; rows are not considered neighbours of themselves.
+
+        Approximate indexes return (a part of) the graph, so `k` may not
+        exceed `n_neighbors`.
+
+        Returns:
+            (np.ndarray, np.ndarray): arrays of shape `(len(data), k)` with
+            distances and indices of neighbours, ordered by distances
+        """
+        n = len(self.x)
+        if self.algorithm == "approximate":
+            self._check_k(k, self.n_neighbors)
+            return self._graph_dist[:, :k].copy(), self._graph_ind[:, :k].copy()
+        self._check_k(k, n - 1)
+        dist, ind = self.query(self.x, k + 1)
+        # Remove the row itself or, if it is not found due to duplicates,
+        # the farthest neighbour
+        itself = ind == np.arange(n)[:, None]
+        itself[~itself.any(axis=1), -1] = True
+        return dist[~itself].reshape(n, k), ind[~itself].reshape(n, k)
+
+    def kneighbors_graph(self, k, mode="connectivity", include_self=False):
+        """
+        Return a sparse matrix with `k` nearest neighbours of indexed rows.
+
+        Args:
+            k (int): the number of neighbours
+            mode (str): "connectivity" for ones, or "distance" for distances
+            include_self (bool): if `True`, each row is counted as one of its
+                `k` nearest neighbours (as in :obj:`query`)
+
+        Returns:
+            (scipy.sparse.csr_matrix): a matrix in which row `i` contains
+            non-zero elements in columns of neighbours of row `i`
+        """
+        if mode not in ("connectivity", "distance"):
+            raise ValueError("unknown mode '{}'".format(mode))
+        n = len(self.x)
+        if not include_self:
+            dist, ind = self.kneighbors(k)
+        elif self.algorithm == "approximate":
+            self._check_k(k, self.n_neighbors + 1)
+            dist = np.hstack((np.zeros((n, 1)), self._graph_dist[:, :k - 1]))
+            ind = np.hstack((np.arange(n)[:, None], self._graph_ind[:, :k - 1]))
+        else:
+            dist, ind = self.query(self.x, k)
+        data = np.ones(n * k) if mode == "connectivity" else dist.ravel()
+        return sp.csr_matrix((data, ind.ravel(), np.arange(0, n * k + 1, k)),
+                             shape=(n, n))
+
+    @staticmethod
+    def _check_k(k, max_k):
+        if not 0 < k <= max_k:
+            raise ValueError("the number of neighbours must be between 1 "
+                             "and {}".format(max_k))
+
+    def _distances(self, x1, x2):
+        dist = np.array(self.model.compute_distances(x1, x2), dtype=float)
+        # Rows with undefined distances are never neighbours
+        dist[np.isnan(dist)] = np.inf
+        return dist
+
+    def _brute_query(self, x, k):
+        n_rows = len(x)
+        dist = np.empty((n_rows, k))
+        ind = np.empty((n_rows, k), dtype=np.intp)
+        block_rows = max(1, BLOCK_SIZE // len(self.x))
+        for start in range(0, n_rows, block_rows):
+            end = min(start + block_rows, n_rows)
+            block = self._distances(x[start:end], self.x)
+            nearest = _smallest(block, k)
+            dist[start:end] = block[np.arange(end - start)[:, None], nearest]
+            ind[start:end] = nearest
+        return dist, ind
+
+    def _projected(self, x):
+        """Impute missing values for random projections"""
+        if np.isnan(x).any():
+            x = np.where(np.isnan(x), self._means, x)
+        return x
+
+    def _build_graph(self, n_trees, rstate):
+        x, n, k = self.x, len(self.x), self.n_neighbors
+        self._graph_dist = np.full((n, k), np.inf)
+        self._graph_ind = np.full((n, k), -1, dtype=np.intp)
+        with np.errstate(invalid="ignore"):
+            self._means = np.nan_to_num(np.nanmean(x, axis=0))
+        # Leaves need at least k + 1 rows; halving leaves only above the size
+        self.leaf_size = max(self.leaf_size, 2 * k + 2)
+        projected = self._projected(x)
+        self._trees = [
+            _rp_tree(projected, np.arange(n), self.leaf_size, rstate)
+            for _ in range(n_trees)]
+        if k == 0:
+            return
+
+        for tree in self._trees:
+            for leaf in _leaves(tree):
+                dist = self._distances(x[leaf], x[leaf])
+                np.fill_diagonal(dist, np.inf)
+                self._update_graph(leaf, leaf, dist)
+
+        # Rows in the same leaf have common neighbours, so blocks of rows in
+        # the order of leaves are compared with a small number of candidates
+        order = np.hstack(list(_leaves(self._trees[0])))
+        for _ in range(self.n_iter):
+            for start in range(0, n, self.leaf_size):
+                rows = order[start:start + self.leaf_size]
+                candidates = self._expand(self._graph_ind[rows])
+                dist = self._distances(x[rows], x[candidates])
+                dist[rows[:, None] == candidates] = np.inf
+                self._update_graph(rows, candidates, dist)
+
+    def _update_graph(self, rows, candidates, dist):
+        self._graph_dist[rows], self._graph_ind[rows] = _merge(
+            self._graph_dist[rows], self._graph_ind[rows],
+            dist, candidates, self.n_neighbors)
+
+    def _expand(self, ind):
+        """Return the given rows and their neighbours in the graph"""
+        ind = ind[ind >= 0]
+        candidates = np.union1d(ind, self._graph_ind[ind].ravel())
+        return candidates[candidates >= 0]
+
+    def _graph_query(self, x, k):
+        n_rows = len(x)
+        dist = np.empty((n_rows, k))
+        ind = np.empty((n_rows, k), dtype=np.intp)
+        n_search = max(k, self.n_neighbors)
+        projected = self._projected(x)
+        for leaf, queries in _route(self._trees[0], projected,
+                                    np.arange(n_rows)):
+            for start in range(0, len(queries), self.leaf_size):
+                block = queries[start:start + self.leaf_size]
+                candidates = self._expand(leaf)
+                if len(candidates) < n_search:
+                    candidates = np.arange(len(self.x))
+                cand_dist = self._distances(x[block], self.x[candidates])
+                nearest = _smallest(cand_dist, n_search)
+                best_dist = cand_dist[np.arange(len(block))[:, None], nearest]
+                best_ind = candidates[nearest]
+                for _ in range(self.n_iter):
+                    candidates = self._expand(best_ind)
+                    best_dist, best_ind = _merge(
+                        best_dist, best_ind,
+                        self._distances(x[block], self.x[candidates]),
+                        candidates, n_search)
+                dist[block], ind[block] = best_dist[:, :k], best_ind[:, :k]
+        return dist, ind
+
+
+def _cache_key(data, distance, kwargs):
+    if isinstance(distance, type):
+        distance = distance()
+    if isinstance(data, Table):
+        x, attributes = data.X, tuple(data.domain.attributes)
+    else:
+        x, attributes = np.atleast_2d(data), None
+    if sp.issparse(x):
+        return None
+    try:
+        params = (type(distance), tuple(sorted(vars(distance).items())),
+                  tuple(sorted(kwargs.items())), attributes)
+        hash(params)
+    except TypeError:
+        return None
+    digest = hashlib.sha1(np.ascontiguousarray(x)).hexdigest()
+    return digest, x.shape, x.dtype.str, params
+
+
+def _smallest(dist, k):
+    """Return column indices of the `k` smallest elements in each row"""
+    if k < dist.shape[1]:
+        ind = np.argpartition(dist, k - 1, axis=1)[:, :k]
+    else:
+        ind = np.tile(np.arange(dist.shape[1]), (len(dist), 1))
+    rows = np.arange(len(dist))[:, None]
+    return ind[rows, np.argsort(dist[rows, ind], axis=1, kind="mergesort")]
+
+
+def _merge(dist, ind, new_dist, candidates, k):
+    """
+    Return distances and indices of the `k` nearest neighbours in each row
+    among neighbours `ind` and `candidates`, which may include the same rows.
+    Candidates are common to all rows and `new_dist` contains their distances.
+    """
+    rows = np.arange(len(ind))[:, None]
+    nearest = _smallest(new_dist, k)
+    dist = np.hstack((dist, new_dist[rows, nearest]))
+    ind = np.hstack((ind, candidates[nearest]))
+    order = np.argsort(ind, axis=1, kind="mergesort")
+    dist, ind = dist[rows, order], ind[rows, order]
+    dist[:, 1:][ind[:, 1:] == ind[:, :-1]] = np.inf
+    nearest = _smallest(dist, k)
+    return dist[rows, nearest], ind[rows, nearest]
+
+
+def _rp_tree(x, rows, leaf_size, rstate):
+    """
+    Return a random projection tree; leaves are arrays of row indices and
+    internal nodes are tuples (normal, offset, left subtree, right subtree).
+    Rows are split into halves by a hyperplane perpendicular to the line
+    between two random rows.
+    """
+    if len(rows) <= leaf_size:
+        return rows
+    first, second = rstate.choice(rows, 2, replace=False)
+    normal = x[first] - x[second]
+    if not normal.any():
+        normal = rstate.normal(size=x.shape[1])
+    projections = x[rows].dot(normal)
+    order = np.argsort(projections, kind="mergesort")
+    half = len(rows) // 2
+    offset = (projections[order[half - 1]] + projections[order[half]]) / 2
+    return (normal, offset,
+            _rp_tree(x, rows[order[:half]], leaf_size, rstate),
+            _rp_tree(x, rows[order[half:]], leaf_size, rstate))
+
+
+def _leaves(tree):
+    if isinstance(tree, np.ndarray):
+        yield tree
+    else:
+        yield from _leaves(tree[2])
+        yield from _leaves(tree[3])
+
+
+def _route(tree, x, queries):
+    """Yield leaves of the tree and the indices of rows of `x` in them"""
+    if not len(queries):
+        return
+    if isinstance(tree, np.ndarray):
+        yield tree, queries
+        return
+    normal, offset, left, right = tree
+    on_left = x[queries].dot(normal) < offset
+    yield from _route(left, x, queries[on_left])
+    yield from _route(right, x, queries[~on_left])
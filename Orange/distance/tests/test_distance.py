@@ -5,6 +5,7 @@ import numpy as np
 
 from Orange.data import ContinuousVariable, DiscreteVariable, Domain, Table
 from Orange import distance
+from Orange.tests import named_file
 
 
 class CommonTests:
@@ -37,6 +38,53 @@ class CommonFittedTests(CommonTests):
         self.assertRaises(ValueError, model, table1, new_table())
         self.assertRaises(ValueError, model, new_table(), table1)
 
+    def test_blocks(self):
+        """distances computed in blocks equal those computed at once"""
+        data = Table.from_numpy(
+            self.data.domain,
+            np.vstack([self.data.X] * 3))
+        data.X[1, 0] = data.X[4, 2] = np.nan
+        model = self.Distance().fit(data)
+        expected = model(data)
+        for block_rows in (1, 2, 4, 100):
+            np.testing.assert_almost_equal(
+                model(data, block_rows=block_rows, n_jobs=2), expected)
+        expected = model(data, data[:4])
+        np.testing.assert_almost_equal(
+            model(data, data[:4], block_rows=2, n_jobs=2), expected)
+
+        out = np.full((len(data), 4), 42.)
+        dist = model(data, data[:4], block_rows=5, out=out)
+        np.testing.assert_almost_equal(out, expected)
+        self.assertTrue(np.shares_memory(dist, out))
+        self.assertIs(dist.row_items, data)
+        self.assertRaises(ValueError, model, data, out=out)
+
+        with named_file("", suffix=".dst") as fn:
+            dist = model(data, data[:4], out=fn)
+            np.testing.assert_almost_equal(
+                np.memmap(fn, dtype=float, shape=(len(data), 4)), expected)
+            del dist
+
+    def test_condensed(self):
+        """condensed matrices contain the upper triangle of the matrix"""
+        data = Table.from_numpy(
+            self.data.domain,
+            np.vstack([self.data.X] * 3))
+        data.X[1, 0] = data.X[4, 2] = np.nan
+        model = self.Distance().fit(data)
+        expected = model(data)
+        expected = expected[np.triu_indices(len(expected), 1)]
+        for block_rows in (None, 1, 4, 100):
+            np.testing.assert_almost_equal(
+                model(data, condensed=True, block_rows=block_rows,
+                      n_jobs=2).data,
+                expected)
+        out = np.full(len(expected), 42.)
+        dist = model(data, condensed=True, block_rows=5, out=out)
+        self.assertIs(dist.data, out)
+        np.testing.assert_almost_equal(out, expected)
+
 
 class CommonNormalizedTests(CommonFittedTests):
     """Tests applicable to distances the have normalization"""
@@ -0,0 +1,140 @@
+# Test methods with long descriptive names can omit docstrings
+# pylint: disable=missing-docstring
+import pickle
+import unittest
+
+import numpy as np
+import scipy.sparse as sp
+
+from Orange.data import Table
+from Orange.distance import Euclidean, Manhattan, Cosine, NeighborIndex
+from Orange.distance.neighbors import index_cache
+
+
+def recall(ind, exact):
+    return np.mean([len(set(a) & set(b)) / len(b) for a, b in zip(ind, exact)])
+
+
+class TestNeighborIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.iris = Table("iris")
+        cls.heart = Table("heart_disease")
+        cls.x = np.random.RandomState(0).rand(1000, 5)
+
+    def test_algorithms(self):
+        self.assertEqual(NeighborIndex(self.iris).algorithm, "kd_tree")
+        self.assertEqual(NeighborIndex(self.iris, Manhattan).algorithm,
+                         "kd_tree")
+        self.assertEqual(NeighborIndex(self.iris, Cosine).algorithm, "brute")
+        self.assertEqual(
+            NeighborIndex(self.iris, Euclidean(normalize=True)).algorithm,
+            "brute")
+        # discrete attributes and missing values
+        self.assertEqual(NeighborIndex(self.heart).algorithm, "brute")
+        self.assertRaises(ValueError, NeighborIndex, self.heart,
+                          algorithm="ball_tree")
+        self.assertRaises(ValueError, NeighborIndex, self.iris,
+                          algorithm="annoy")
+        self.assertRaises(ValueError, NeighborIndex, self.iris,
+                          Euclidean(axis=0))
+        self.assertRaises(ValueError, NeighborIndex,
+                          sp.csr_matrix(self.iris.X))
+
+    def test_exact(self):
+        x = self.x
+        dist = np.array(Euclidean(x))
+        np.fill_diagonal(dist, np.inf)
+        expected = np.sort(dist, axis=1)[:, :5]
+        for algorithm in ("kd_tree", "ball_tree", "brute"):
+            index = NeighborIndex(x, algorithm=algorithm)
+            neigh_dist, neigh_ind = index.kneighbors(5)
+            np.testing.assert_almost_equal(neigh_dist, expected)
+            np.testing.assert_almost_equal(
+                dist[np.arange(len(x))[:, None], neigh_ind], expected)
+
+            neigh_dist, neigh_ind = index.query(x[:10], 3)
+            np.testing.assert_equal(neigh_ind[:, 0], np.arange(10))
+            np.testing.assert_almost_equal(neigh_dist[:, 1:], expected[:10, :2])
+
+    def test_brute_uses_distance(self):
+        index = NeighborIndex(self.heart, Manhattan(normalize=True))
+        dist = Manhattan(self.heart, normalize=True)
+        neigh_dist, neigh_ind = index.query(self.heart[:20], 4)
+        np.testing.assert_almost_equal(
+            neigh_dist, np.sort(dist[:20], axis=1)[:, :4])
+        np.testing.assert_almost_equal(
+            dist[np.arange(20)[:, None], neigh_ind], neigh_dist)
+
+    def test_approximate(self):
+        x = self.x
+        exact = NeighborIndex(x)
+        index = NeighborIndex(x, algorithm="approximate", n_neighbors=10,
+                              n_trees=4)
+        self.assertEqual(index.algorithm, "approximate")
+        neigh_dist, neigh_ind = index.kneighbors(10)
+        self.assertEqual(neigh_ind.shape, (1000, 10))
+        self.assertFalse((neigh_ind == np.arange(1000)[:, None]).any())
+        self.assertTrue((np.diff(neigh_dist, axis=1) >= 0).all())
+        np.testing.assert_almost_equal(
+            neigh_dist,
+            np.linalg.norm(x[neigh_ind] - x[:, None], axis=2))
+        self.assertGreater(recall(neigh_ind, exact.kneighbors(10)[1]), 0.9)
+
+        queries = np.random.RandomState(1).rand(100, 5)
+        neigh_dist, neigh_ind = index.query(queries, 5)
+        self.assertGreater(recall(neigh_ind, exact.query(queries, 5)[1]), 0.9)
+        self.assertRaises(ValueError, index.kneighbors, 11)
+
+    def test_approximate_small(self):
+        index = NeighborIndex(self.iris[:10], algorithm="approximate")
+        self.assertEqual(index.n_neighbors, 9)
+        np.testing.assert_equal(np.sort(index.kneighbors(9)[1], axis=1),
+                                [np.delete(np.arange(10), i)
+                                 for i in range(10)])
+
+    def test_approximate_missing(self):
+        exact = NeighborIndex(self.heart)
+        index = NeighborIndex(self.heart, algorithm="approximate")
+        self.assertGreater(
+            recall(index.kneighbors(5)[1], exact.kneighbors(5)[1]), 0.9)
+
+    def test_kneighbors_graph(self):
+        x = self.x
+        for algorithm in ("kd_tree", "approximate"):
+            index = NeighborIndex(x, algorithm=algorithm)
+            graph = index.kneighbors_graph(4)
+            self.assertIsInstance(graph, sp.csr_matrix)
+            self.assertEqual(graph.shape, (1000, 1000))
+            np.testing.assert_equal(graph.sum(axis=1), 4)
+            self.assertEqual(graph.diagonal().sum(), 0)
+
+            graph = index.kneighbors_graph(4, include_self=True)
+            np.testing.assert_equal(graph.diagonal(), 1)
+
+            graph = index.kneighbors_graph(4, mode="distance")
+            np.testing.assert_almost_equal(
+                graph.max(axis=1).toarray().ravel(), index.kneighbors(4)[0][:, -1])
+            self.assertRaises(ValueError, index.kneighbors_graph, 4, "weight")
+
+    def test_cached(self):
+        index_cache.clear()
+        index = NeighborIndex.cached(self.iris)
+        self.assertIs(NeighborIndex.cached(self.iris), index)
+        self.assertIs(NeighborIndex.cached(self.iris.copy()), index)
+        self.assertIsNot(NeighborIndex.cached(self.iris, Manhattan), index)
+        self.assertIsNot(NeighborIndex.cached(self.iris, algorithm="brute"),
+                         index)
+        self.assertIsNot(NeighborIndex.cached(self.iris[1:]), index)
+        self.assertEqual(index_cache.info().currsize, 4)
+        self.assertGreater(index_cache.info().nbytes, 4 * self.iris.X.nbytes)
+
+    def test_pickle(self):
+        index = NeighborIndex(self.iris, algorithm="approximate")
+        index2 = pickle.loads(pickle.dumps(index))
+        np.testing.assert_equal(index2.query(self.iris[:5], 3)[1],
+                                index.query(self.iris[:5], 3)[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,5 @@
+import multiprocessing as mp
+import os
 from collections import namedtuple
 
 import numpy as np
@@ -35,6 +37,32 @@ def _mp_worker(fold_i, train_data, test_data, learner_i, learner,
                       failed, len(test_data), predicted, probs)
 
 
+# State of a worker process; data is sent to each process only once, when
+# the pool is created, and tasks then refer to it by indices
+_mp_state = {}
+
+
+def _mp_init(train_data, test_data, learners, preprocessor, store_models):
+    _mp_state.clear()
+    _mp_state.update(train_data=train_data, test_data=test_data,
+                     learners=learners, preprocessor=preprocessor,
+                     store_models=store_models, fold=(None, None))
+
+
+def _mp_indices_worker(args):
+    fold_i, train_i, test_i, learner_i = args
+    state = _mp_state
+    # Tasks are issued by folds, so consecutive tasks usually share the fold;
+    # keep the last preprocessed training data to avoid recomputing it
+    cached_fold_i, train_data = state['fold']
+    if cached_fold_i != fold_i:
+        train_data = state['preprocessor'](state['train_data'][train_i])
+        state['fold'] = fold_i, train_data
+    return _mp_worker(fold_i, train_data, state['test_data'][test_i],
+                      learner_i, state['learners'][learner_i],
+                      state['store_models'])
+
+
 class Results:
     """
     Class for storing predictions in model testing.
@@ -112,14 +140,16 @@ class Results:
         :param callback: Function for reporting back the progress as a value
             between 0 and 1
         :type callback: callable
-        :param n_jobs:
-            Ignored.
+        :param n_jobs: The number of processes for fitting and testing
+            models; negative values are counted from the number of CPUs
+            (-1 uses all). Learners and preprocessor must be picklable
+            when `n_jobs` is not 1.
         :type n_jobs: int
         """
         self.store_data = store_data
         self.store_models = store_models
         self.dtype = np.float32
-        self.n_jobs = 1
+        self.n_jobs = n_jobs
 
         self.models = None
         self.folds = None
@@ -312,21 +342,41 @@ class Results:
         self._prepare_arrays(test_data)
 
         n_callbacks = len(self.learners) * len(self.indices)
-
-        data_splits = (
-            (fold_i, self.preprocessor(train_data[train_i]), test_data[test_i])
-            for fold_i, (train_i, test_i) in enumerate(self.indices))
-        args_iter = (
-            (fold_i, train_data, test_data, learner_i, learner,
-             self.store_models)
-            for (fold_i, train_data, test_data) in data_splits
-            for (learner_i, learner) in enumerate(self.learners))
+        n_jobs = self.n_jobs
+        if n_jobs < 0:
+            n_jobs = max(1, os.cpu_count() + 1 + n_jobs)
+        n_jobs = min(n_jobs, n_callbacks)
 
         results = []
         parts = np.linspace(.0, .99, n_callbacks + 1)[1:]
-        for progress, part in zip(parts, args_iter):
-            results.append(_mp_worker(*(part + ())))
-            self._callback(progress)
+        if n_jobs > 1:
+            args_iter = (
+                (fold_i, train_i, test_i, learner_i)
+                for fold_i, (train_i, test_i) in enumerate(self.indices)
+                for learner_i in range(len(self.learners)))
+            chunksize = max(1, n_callbacks // (4 * n_jobs))
+            initargs = (train_data, test_data, self.learners,
+                        self.preprocessor, self.store_models)
+            with mp.Pool(n_jobs, _mp_init, initargs) as pool:
+                for progress, result in zip(
+                        parts, pool.imap_unordered(_mp_indices_worker,
+                                                   args_iter, chunksize)):
+                    results.append(result)
+                    self._callback(progress)
+        else:
+            data_splits = (
+                (fold_i, self.preprocessor(train_data[train_i]),
+                 test_data[test_i])
+                for fold_i, (train_i, test_i) in enumerate(self.indices))
+            args_iter = (
+                (fold_i, train_data, test_data, learner_i, learner,
+                 self.store_models)
+                for (fold_i, train_data, test_data) in data_splits
+                for (learner_i, learner) in enumerate(self.learners))
+
+            for progress, part in zip(parts, args_iter):
+                results.append(_mp_worker(*(part + ())))
+                self._callback(progress)
 
         results = sorted(results)
 
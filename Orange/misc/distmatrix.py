@@ -1,10 +1,30 @@
+import zlib
+
 import numpy as np
 
 from Orange.data import Table, StringVariable, Domain
-from Orange.data.io import detect_encoding
 from Orange.util import deprecated
 
 
+def _fingerprint(matrix, data):
+    """
+    Return a value that is equal for matrices with the same contents, items
+    and axis, or `None` if items are neither tables nor sequences.
+    """
+    items = []
+    for item in (matrix.row_items, matrix.col_items):
+        if isinstance(item, Table):
+            item = item.fingerprint()
+        elif isinstance(item, (list, tuple)):
+            item = tuple(item)
+        elif item is not None:
+            return None
+        items.append(item)
+    data = np.ascontiguousarray(data)
+    return (type(matrix), data.shape, data.dtype, matrix.axis,
+            zlib.adler32(data)) + tuple(items)
+
+
 class DistMatrix(np.ndarray):
     """
     Distance matrix. Extends ``numpy.ndarray``.
@@ -69,6 +89,13 @@ class DistMatrix(np.ndarray):
         self.axis = state[-1]
         super().__setstate__(state[0:-3])
 
+    def fingerprint(self):
+        """
+        Return a value that is equal for matrices with the same contents,
+        items and axis, or `None` if items are neither tables nor sequences.
+        """
+        return _fingerprint(self, self.view(np.ndarray))
+
     @property
     @deprecated
     def dim(self):
@@ -140,75 +167,17 @@ class DistMatrix(np.ndarray):
         Args:
             filename: file name
         """
+        from Orange.data.io import detect_encoding
         with open(filename, encoding=detect_encoding(filename)) as fle:
-            line = fle.readline()
-            if not line:
-                raise ValueError("empty file")
-            data = line.strip().split()
-            if not data[0].strip().isdigit():
-                raise ValueError("distance file must begin with dimension")
-            n = int(data.pop(0))
-            symmetric = True
-            axis = 1
-            col_labels = row_labels = None
-            for flag in data:
-                if flag in ("labelled", "labeled", "row_labels"):
-                    row_labels = []
-                elif flag == "col_labels":
-                    col_labels = []
-                elif flag == "symmetric":
-                    symmetric = True
-                elif flag == "asymmetric":
-                    symmetric = False
-                else:
-                    flag_data = flag.split("=")
-                    if len(flag_data) == 2:
-                        name, value = map(str.strip, flag_data)
-                    else:
-                        name, value = "", None
-                    if name == "axis" and value.isdigit():
-                        axis = int(value)
-                    else:
-                        raise ValueError("invalid flag '{}'".format(
-                            flag, filename))
-            if col_labels is not None:
-                col_labels = [x.strip()
-                              for x in fle.readline().strip().split("\t")]
-                if len(col_labels) != n:
-                    raise ValueError("mismatching number of column labels")
-
+            n, symmetric, axis, row_labels, col_labels = _read_header(fle)
             matrix = np.zeros((n, n))
-            for i, line in enumerate(fle):
-                if i >= n:
-                    raise ValueError("too many rows".format(filename))
-                line = line.strip().split("\t")
-                if row_labels is not None:
-                    row_labels.append(line.pop(0).strip())
-                if len(line) > n:
-                    raise ValueError("too many columns in matrix row {}".
-                                     format("'{}'".format(row_labels[i])
-                                            if row_labels else i + 1))
-                for j, e in enumerate(line[:i + 1 if symmetric else n]):
-                    try:
-                        matrix[i, j] = float(e)
-                    except ValueError as exc:
-                        raise ValueError(
-                            "invalid element at row {}, column {}".format(
-                                "'{}'".format(row_labels[i])
-                                if row_labels else i + 1,
-                                "'{}'".format(col_labels[j])
-                                if col_labels else j + 1)) from exc
-                    if symmetric:
-                        matrix[j, i] = matrix[i, j]
-        if col_labels:
-            col_labels = Table.from_list(
-                Domain([], metas=[StringVariable("label")]),
-                [[item] for item in col_labels])
-        if row_labels:
-            row_labels = Table.from_list(
-                Domain([], metas=[StringVariable("label")]),
-                [[item] for item in row_labels])
-        return cls(matrix, row_labels, col_labels, axis)
+            for i, values in _read_rows(fle, n, symmetric,
+                                        row_labels, col_labels):
+                matrix[i, :len(values)] = values
+                if symmetric:
+                    matrix[:len(values), i] = values
+        return cls(matrix, _labels_table(row_labels),
+                   _labels_table(col_labels), axis)
 
     @staticmethod
     def _trivial_labels(items):
@@ -246,26 +215,304 @@ class DistMatrix(np.ndarray):
         Args:
             filename: file name
         """
-        n = len(self)
-        data = "{}\taxis={}".format(n, self.axis)
-        row_labels = col_labels = None
-        if self.has_col_labels():
-            data += "\tcol_labels"
-            col_labels = self.col_items
-        if self.has_row_labels():
-            data += "\trow_labels"
-            row_labels = self.row_items
         symmetric = np.allclose(self, self.T)
-        if not symmetric:
-            data += "\tasymmetric"
-        with open(filename, "wt") as fle:
-            fle.write(data + "\n")
-            if col_labels is not None:
-                fle.write("\t".join(str(e.metas[0]) for e in col_labels) + "\n")
-            for i, row in enumerate(self):
-                if row_labels is not None:
-                    fle.write(str(row_labels[i].metas[0]) + "\t")
-                if symmetric:
-                    fle.write("\t".join(map(str, row[:i + 1])) + "\n")
-                else:
-                    fle.write("\t".join(map(str, row)) + "\n")
+        _write(filename, self, symmetric,
+               (row[:i + 1] if symmetric else row
+                for i, row in enumerate(self)))
+
+
+class CondensedDistMatrix:
+    """
+    Symmetric distance matrix with a zero diagonal, which stores only the
+    elements above the diagonal.
+
+    Elements are stored in a flat array in the same order as in
+    `scipy.spatial.distance.pdist`, so the matrix can be passed to
+    `scipy.cluster.hierarchy.linkage` without conversions. The matrix
+    supports indexing like `DistMatrix`; elements are gathered from the
+    condensed array, so indexing with slices and lists returns (square)
+    arrays, while the whole square matrix is constructed only by
+    :obj:`to_square` or when the matrix is converted to a numpy array.
+
+    .. attribute:: data
+
+        A flat array with elements above the diagonal.
+
+    .. attribute:: row_items
+
+        Items corresponding to matrix rows.
+
+    .. attribute:: col_items
+
+        Items corresponding to matrix columns.
+
+    .. attribute:: axis
+
+        If axis=1 we calculate distances between rows,
+        if axis=0 we calculate distances between columns.
+
+    The dimension `n` of the matrix can be given explicitly; otherwise it
+    is computed from the length of `data`, which is ambiguous for empty
+    data (n=0 or n=1) and then gives n=1.
+    """
+    def __init__(self, data, row_items=None, col_items=None, axis=1, n=None):
+        data = np.asarray(data)
+        if n is None:
+            n = int(round((1 + np.sqrt(1 + 8 * len(data))) / 2))
+        if n * (n - 1) // 2 != len(data):
+            raise ValueError("invalid length of condensed distance matrix")
+        self.data = data
+        self.n = n
+        self.row_items = row_items
+        self.col_items = col_items
+        self.axis = axis
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        """Construct a condensed matrix from a (symmetric) `DistMatrix`"""
+        return cls(np.asarray(matrix)[np.triu_indices(len(matrix), 1)],
+                   getattr(matrix, "row_items", None),
+                   getattr(matrix, "col_items", None),
+                   getattr(matrix, "axis", 1), n=len(matrix))
+
+    def fingerprint(self):
+        """See :obj:`DistMatrix.fingerprint`"""
+        return _fingerprint(self, self.data)
+
+    def to_square(self):
+        """Return the matrix as `DistMatrix`"""
+        return DistMatrix(self[:, :], self.row_items, self.col_items,
+                          self.axis)
+
+    @property
+    def shape(self):
+        return self.n, self.n
+
+    @property
+    def dtype(self):
+        return self.data.dtype
+
+    def __len__(self):
+        return self.n
+
+    def __array__(self, dtype=None):
+        matrix = self[:, :]
+        return matrix if dtype is None else matrix.astype(dtype)
+
+    @property
+    def flat(self):
+        return self.data
+
+    def condensed_index(self, i, j):
+        """Return the index of element (i, j), where i < j, in `data`"""
+        return self.n * i - i * (i + 1) // 2 + j - i - 1
+
+    def _elements(self, rows, cols):
+        rows, cols = np.broadcast_arrays(rows, cols)
+        i, j = np.minimum(rows, cols), np.maximum(rows, cols)
+        off_diagonal = i != j
+        values = np.zeros(i.shape, dtype=self.data.dtype)
+        values[off_diagonal] = self.data[
+            self.condensed_index(i[off_diagonal], j[off_diagonal])]
+        return values
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key, slice(None))
+        if len(key) != 2:
+            raise IndexError("too many indices")
+        rows, cols = key
+        indices = np.arange(self.n)
+        row_ind, col_ind = indices[rows], indices[cols]
+        if isinstance(rows, slice) or isinstance(cols, slice):
+            # numpy semantics: slices give an outer product
+            shape = np.shape(row_ind) + np.shape(col_ind)
+            values = self._elements(*np.ix_(np.atleast_1d(row_ind),
+                                            np.atleast_1d(col_ind)))
+            values = values.reshape(shape)
+        else:
+            values = self._elements(row_ind, col_ind)
+        return values[()] if values.ndim == 0 else values
+
+    def submatrix(self, row_items, col_items=None):
+        """
+        Return a submatrix; the submatrix is condensed if it is symmetric,
+        that is, if `col_items` are not given.
+
+        Args:
+            row_items: indices of rows
+            col_items: incides of columns
+        """
+        if col_items:
+            matrix = DistMatrix(self[np.ix_(row_items, col_items)],
+                                axis=self.axis)
+            if self.row_items is not None:
+                matrix.row_items = self.row_items[row_items]
+            if self.col_items is not None:
+                matrix.col_items = self.col_items[col_items]
+            return matrix
+        row_items = np.asarray(row_items)
+        i, j = np.triu_indices(len(row_items), 1)
+        obj = CondensedDistMatrix(
+            self._elements(row_items[i], row_items[j]), axis=self.axis,
+            n=len(row_items))
+        if self.row_items is not None:
+            obj.row_items = self.row_items[row_items]
+        if self.col_items is not None:
+            if self.col_items is self.row_items:
+                obj.col_items = obj.row_items
+            else:
+                obj.col_items = self.col_items[row_items]
+        return obj
+
+    @classmethod
+    def from_file(cls, filename):
+        """
+        Load a symmetric distance matrix with zero diagonal from a file in
+        the format described at
+        :obj:`~Orange.misc.distmatrix.DistMatrix.from_file`.
+
+        Args:
+            filename: file name
+        """
+        from Orange.data.io import detect_encoding
+        with open(filename, encoding=detect_encoding(filename)) as fle:
+            n, symmetric, axis, row_labels, col_labels = _read_header(fle)
+            if not symmetric:
+                raise ValueError("condensed matrix must be symmetric")
+            self = cls(np.zeros(n * (n - 1) // 2), axis=axis, n=n)
+            for i, values in _read_rows(fle, n, True, row_labels, col_labels):
+                if len(values) > i and values[i] != 0:
+                    raise ValueError("condensed matrix must have zero "
+                                     "diagonal")
+                js = np.arange(min(i, len(values)))
+                self.data[self.condensed_index(js, i)] = values[:len(js)]
+        self.row_items = _labels_table(row_labels)
+        self.col_items = _labels_table(col_labels)
+        return self
+
+    def has_row_labels(self):
+        """See :obj:`DistMatrix.has_row_labels`"""
+        return DistMatrix._trivial_labels(self.row_items)
+
+    def has_col_labels(self):
+        """See :obj:`DistMatrix.has_col_labels`"""
+        return DistMatrix._trivial_labels(self.col_items)
+
+    def save(self, filename):
+        """
+        Save the distance matrix to a file in the file format described at
+        :obj:`~Orange.misc.distmatrix.DistMatrix.from_file`.
+
+        Args:
+            filename: file name
+        """
+        _write(filename, self, True,
+               (self[i, :i + 1] for i in range(self.n)))
+
+
+def _read_header(fle):
+    """
+    Read the header of a distance file and return the dimension, symmetry,
+    axis and lists for row labels and column labels (or `None`);
+    the latter are already read.
+    """
+    line = fle.readline()
+    if not line:
+        raise ValueError("empty file")
+    data = line.strip().split()
+    if not data[0].strip().isdigit():
+        raise ValueError("distance file must begin with dimension")
+    n = int(data.pop(0))
+    symmetric = True
+    axis = 1
+    col_labels = row_labels = None
+    for flag in data:
+        if flag in ("labelled", "labeled", "row_labels"):
+            row_labels = []
+        elif flag == "col_labels":
+            col_labels = []
+        elif flag == "symmetric":
+            symmetric = True
+        elif flag == "asymmetric":
+            symmetric = False
+        else:
+            flag_data = flag.split("=")
+            if len(flag_data) == 2:
+                name, value = map(str.strip, flag_data)
+            else:
+                name, value = "", None
+            if name == "axis" and value.isdigit():
+                axis = int(value)
+            else:
+                raise ValueError("invalid flag '{}'".format(flag))
+    if col_labels is not None:
+        col_labels = [x.strip()
+                      for x in fle.readline().strip().split("\t")]
+        if len(col_labels) != n:
+            raise ValueError("mismatching number of column labels")
+    return n, symmetric, axis, row_labels, col_labels
+
+
+def _read_rows(fle, n, symmetric, row_labels, col_labels):
+    """
+    Iterate over the rows of a distance file, yielding row indices and
+    arrays of values; elements above the diagonal of symmetric matrices
+    are skipped. Row labels are appended to `row_labels`, if given.
+    """
+    for i, line in enumerate(fle):
+        if i >= n:
+            raise ValueError("too many rows")
+        line = line.strip().split("\t")
+        if row_labels is not None:
+            row_labels.append(line.pop(0).strip())
+        if len(line) > n:
+            raise ValueError("too many columns in matrix row {}".
+                             format("'{}'".format(row_labels[i])
+                                    if row_labels else i + 1))
+        line = line[:i + 1 if symmetric else n]
+        values = np.zeros(len(line))
+        for j, e in enumerate(line):
+            try:
+                values[j] = float(e)
+            except ValueError as exc:
+                raise ValueError(
+                    "invalid element at row {}, column {}".format(
+                        "'{}'".format(row_labels[i])
+                        if row_labels else i + 1,
+                        "'{}'".format(col_labels[j])
+                        if col_labels else j + 1)) from exc
+        yield i, values
+
+
+def _labels_table(labels):
+    if not labels:
+        return labels
+    return Table.from_list(
+        Domain([], metas=[StringVariable("label")]),
+        [[item] for item in labels])
+
+
+def _write(filename, matrix, symmetric, rows):
+    """
+    Write the header with flags and labels of `matrix`, and then `rows`
+    (elements up to the diagonal for symmetric matrices) to a file.
+    """
+    data = "{}\taxis={}".format(len(matrix), matrix.axis)
+    row_labels = col_labels = None
+    if matrix.has_col_labels():
+        data += "\tcol_labels"
+        col_labels = matrix.col_items
+    if matrix.has_row_labels():
+        data += "\trow_labels"
+        row_labels = matrix.row_items
+    if not symmetric:
+        data += "\tasymmetric"
+    with open(filename, "wt") as fle:
+        fle.write(data + "\n")
+        if col_labels is not None:
+            fle.write("\t".join(str(e.metas[0]) for e in col_labels) + "\n")
+        for i, row in enumerate(rows):
+            if row_labels is not None:
+                fle.write(str(row_labels[i].metas[0]) + "\t")
+            fle.write("\t".join(map(str, row)) + "\n")
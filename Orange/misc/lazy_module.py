@@ -1,12 +1,31 @@
+"""
+Deferred imports that keep `import Orange` cheap.
+
+- :obj:`_LazyModule` is a placeholder for a submodule that is imported when
+  any of its attributes is accessed,
+- :obj:`lazy_attributes` makes attributes of a module (submodules or names
+  from submodules) import on first access, and
+- :obj:`call_before_import` runs a function just before the first import of
+  any of the given modules, e.g. to set up Qt only when widgets are used.
+"""
+import sys
+from importlib import import_module
+import importlib.abc
+import importlib.util
+from types import ModuleType
+
+__all__ = ["lazy_attributes", "call_before_import"]
+
+
 class _LazyModule:
     def __init__(self, name):
         self.__name = name
 
     def _do_import(self):
-        import Orange
-        from importlib import import_module
-        mod = import_module('Orange.' + self.__name, package='Orange')
-        setattr(Orange, self.__name, mod)
+        full_name = 'Orange.' + self.__name
+        mod = import_module(full_name)
+        parent, _, name = full_name.rpartition('.')
+        setattr(sys.modules[parent], name, mod)
         return mod
 
     def __getattr__(self, key):
@@ -15,3 +34,74 @@ class _LazyModule:
     def __dir__(self):
         return list(self._do_import().__dict__)
 
+
+class _LazyAttributesModule(ModuleType):
+    """Module type whose missing attributes are looked up in `__lazy__`"""
+    def __getattr__(self, name):
+        try:
+            module_name = self.__dict__["__lazy__"][name]
+        except KeyError:
+            raise AttributeError("module '{}' has no attribute '{}'"
+                                 .format(self.__name__, name)) from None
+        module = import_module(module_name, self.__name__)
+        if module.__name__.rpartition('.')[2] == name:
+            value = module
+        else:
+            value = getattr(module, name)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self.__lazy__))
+
+
+def lazy_attributes(module_name, attributes):
+    """
+    Make attributes of a module import on first access.
+
+    Args:
+        module_name (str): the name of an already imported module, usually
+            `__name__`
+        attributes (dict): a mapping from attribute names to names of modules,
+            which may be relative to `module_name`; if the last component of
+            the module's name equals the attribute name, the attribute is
+            the module itself, otherwise it is taken from the module
+    """
+    module = sys.modules[module_name]
+    if not isinstance(module, _LazyAttributesModule):
+        module.__class__ = _LazyAttributesModule
+        module.__lazy__ = {}
+    module.__lazy__.update(attributes)
+
+
+class _ImportTrigger(importlib.abc.MetaPathFinder):
+    def __init__(self, names, callback):
+        self.names = frozenset(names)
+        self.callback = callback
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname not in self.names:
+            return None
+        # Remove the trigger first, so the callback can import anything
+        sys.meta_path.remove(self)
+        self.callback()
+        # The callback may have changed sys.meta_path, which is being
+        # iterated over by the caller, so look for the module again
+        return importlib.util.find_spec(fullname)
+
+
+def call_before_import(names, callback):
+    """
+    Call `callback` once, just before the first of modules `names` is imported.
+
+    If any of the modules is already imported, the callback is called
+    immediately.
+
+    Args:
+        names (list of str): full names of modules
+        callback (callable): a function without arguments
+    """
+    if any(name in sys.modules for name in names):
+        callback()
+    else:
+        sys.meta_path.insert(0, _ImportTrigger(names, callback))
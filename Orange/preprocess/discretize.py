@@ -5,7 +5,6 @@ from Orange.data import DiscreteVariable, Domain
 from Orange.data.sql.table import SqlTable
 from Orange.preprocess.util import _RefuseDataInConstructor
 from Orange.statistics import distribution, contingency
-from Orange.statistics.basic_stats import BasicStats
 from Orange.util import Reprable
 from .transformation import Transformation
 from . import _discretize
@@ -81,6 +80,8 @@ class Discretizer(Transformation):
 
 
 class BinSql:
+    returns_index = True
+
     def __init__(self, var, points):
         self.var = var
         self.points = points
@@ -124,22 +125,21 @@ class EqualFreq(Discretization):
     def __init__(self, n=4):
         self.n = n
 
-    # noinspection PyProtectedMember
     def __call__(self, data, attribute):
-        if type(data) == SqlTable:
-            att = attribute.to_sql()
-            quantiles = [(i + 1) / self.n for i in range(self.n - 1)]
-            query = data._sql_query(
-                ['quantile(%s, ARRAY%s)' % (att, str(quantiles))],
-                use_time_sample=1000)
-            with data._execute_sql_query(query) as cur:
-                points = sorted(set(cur.fetchone()[0]))
+        if isinstance(data, SqlTable):
+            points = self._sql_points(data, [attribute])[0]
         else:
             d = distribution.get_distribution(data, attribute)
             points = _discretize.split_eq_freq(d, self.n)
         return Discretizer.create_discretized_var(
             data.domain[attribute], points)
 
+    # noinspection PyProtectedMember
+    def _sql_points(self, data, attributes):
+        quantiles = [(i + 1) / self.n for i in range(self.n - 1)]
+        return [sorted(set(q[~np.isnan(q)].tolist()))
+                for q in data._compute_quantiles(attributes, quantiles)]
+
 class EqualWidth(Discretization):
     """Discretization into a fixed number of bins with equal widths.
 
@@ -156,9 +156,8 @@ class EqualWidth(Discretization):
             min, max = fixed[attribute.name]
             points = self._split_eq_width(min, max)
         else:
-            if type(data) == SqlTable:
-                stats = BasicStats(data, attribute)
-                points = self._split_eq_width(stats.min, stats.max)
+            if isinstance(data, SqlTable):
+                points = self._sql_points(data, [attribute])[0]
             else:
                 values = data[:, attribute]
                 values = values.X if values.X.size else values.Y
@@ -167,8 +166,14 @@ class EqualWidth(Discretization):
         return Discretizer.create_discretized_var(
             data.domain[attribute], points)
 
+    # noinspection PyProtectedMember
+    def _sql_points(self, data, attributes):
+        return [self._split_eq_width(*stats[:2])
+                for stats in data._compute_basic_stats(attributes)]
+
     def _split_eq_width(self, min, max):
-        if np.isnan(min) or np.isnan(max) or min == max:
+        if min is None or max is None \
+                or np.isnan(min) or np.isnan(max) or min == max:
             return []
         dif = (max - min) / self.n
         return [min + (i + 1) * dif for i in range(self.n - 1)]
@@ -418,6 +423,9 @@ class DomainDiscretizer(_RefuseDataInConstructor, Reprable):
                 if var.is_continuous:
                     if fixed and var.name in fixed.keys():
                         nv = method(data, var, fixed)
+                    elif var in sql_points:
+                        nv = Discretizer.create_discretized_var(
+                            var, sql_points[var])
                     else:
                         nv = method(data, var)
                     if not self.clean or len(nv.values) > 1:
@@ -430,7 +438,20 @@ class DomainDiscretizer(_RefuseDataInConstructor, Reprable):
         else:
             method = self.method
         domain = data.domain
-        new_attrs = transform_list(domain.attributes, fixed or self.fixed)
+        fixed = fixed or self.fixed
+        sql_points = {}
+        if isinstance(data, SqlTable) and hasattr(method, "_sql_points"):
+            # Compute cut points of all variables with a single query
+            variables = [var for var in domain.attributes
+                         if not (fixed and var.name in fixed)]
+            if self.discretize_class:
+                variables += domain.class_vars
+            variables = [var for var in variables if var.is_continuous]
+            if variables:
+                # pylint: disable=protected-access
+                sql_points = dict(zip(variables,
+                                      method._sql_points(data, variables)))
+        new_attrs = transform_list(domain.attributes, fixed)
         if self.discretize_class:
             new_classes = transform_list(domain.class_vars)
         else:
@@ -32,6 +32,13 @@ class ReplaceUnknowns(Transformation):
         else:
             return np.where(np.isnan(c), self.value, c)
 
+    @classmethod
+    def transform_batch(cls, transformations, columns):
+        if sp.issparse(columns):
+            return None
+        return np.where(np.isnan(columns),
+                        [t.value for t in transformations], columns)
+
 
 class BaseImputeMethod(Reprable):
     name = ""
@@ -1,4 +1,5 @@
 from Orange.data import ContinuousVariable, Domain
+from Orange.data.sql.table import SqlTable
 from Orange.statistics import distribution
 from Orange.util import Reprable
 from .preprocess import Normalize
@@ -17,8 +18,12 @@ class Normalizer(Reprable):
         self.transform_class = transform_class
 
     def __call__(self, data):
-
-        dists = distribution.get_distributions(data)
+        if isinstance(data, SqlTable):
+            # pylint: disable=protected-access
+            dists = [_AggregatedStats(*stats)
+                     for stats in data._compute_basic_stats()]
+        else:
+            dists = distribution.get_distributions(data)
         new_attrs = [self.normalize(dists[i], var) for
                      (i, var) in enumerate(data.domain.attributes)]
         new_class_vars = data.domain.class_vars
@@ -58,3 +63,28 @@ class Normalizer(Reprable):
                 var.name,
                 compute_value=Norm(var, (dma + dmi) / 2, 2 / diff),
                 sparse=var.sparse)
+
+
+class _AggregatedStats:
+    """
+    Statistics of a continuous variable computed by the database, with the
+    interface of :obj:`Orange.statistics.distribution.Continuous` used by
+    the normalizer.
+    """
+    def __init__(self, min, max, mean, sd, nans, non_nans):
+        self._min, self._max = min, max
+        # the deviation is undefined (NULL) for a single defined value
+        self._mean, self._sd = mean, sd or 0
+        self.size = non_nans
+
+    def min(self):
+        return self._min
+
+    def max(self):
+        return self._max
+
+    def mean(self):
+        return self._mean
+
+    def standard_deviation(self):
+        return self._sd
@@ -208,16 +208,34 @@ class ClassificationScorer(Scorer):
     def score_data(self, data, feature):
         instances_with_class = \
             np.sum(distribution.Discrete(data, data.domain.class_var))
-
-        def score_from_contingency(f):
-            cont = contingency.Discrete(data, f)
-            return self.from_contingency(
-                cont, 1. - np.sum(cont.unknowns)/instances_with_class)
-
-        scores = [score_from_contingency(f) for f in data.domain.attributes]
+        conts, unknowns = contingency.get_discrete_contingencies(data)
+        scores = self.from_contingencies(
+            conts, 1. - np.sum(unknowns, axis=1) / instances_with_class)
         if feature is not None:
             return scores[0]
-        return scores
+        return list(scores)
+
+    def from_contingency(self, cont, nan_adjustment):
+        """Return the score for the contingency matrix (classes x values)"""
+        return self.from_contingencies(
+            np.asarray(cont, dtype=float)[np.newaxis],
+            np.array([nan_adjustment]))[0]
+
+    def from_contingencies(self, conts, nan_adjustments):
+        """
+        Return scores for a stack of contingency matrices (classes x values),
+        which are padded with zeros to the same number of values.
+
+        Derived classes need to define either this method or (slower)
+        :obj:`from_contingency`, which is called for each matrix, with
+        columns for values that do not appear removed.
+        """
+        if type(self).from_contingency is \
+                ClassificationScorer.from_contingency:
+            raise NotImplementedError
+        return np.array([
+            self.from_contingency(cont[:, np.sum(cont, axis=0) > 0], adj)
+            for cont, adj in zip(conts, nan_adjustments)])
 
 
 def _entropy(D):
@@ -227,18 +245,32 @@ def _entropy(D):
     return np.sum(np.sum(- P * np.log2(PC), axis=0) * np.sum(D, axis=0) / np.sum(D))
 
 
-def _gini(D):
-    """Gini index of class-distribution matrix"""
-    P = np.asarray(D / np.sum(D, axis=0))
-    return np.sum((1 - np.sum(P ** 2, axis=0)) *
-                  np.sum(D, axis=0) / np.sum(D))
+def _entropies(D):
+    """Entropies of class distributions in a stack of class-distribution
+    matrices, weighted by column sums; columns without data are ignored"""
+    col_sums = np.sum(D, axis=1, keepdims=True)
+    P = D / np.where(col_sums > 0, col_sums, 1)
+    PC = np.clip(P, 1e-15, 1)
+    with np.errstate(invalid="ignore"):
+        return np.sum(- P * np.log2(PC) * col_sums, axis=(1, 2)) / \
+            np.sum(col_sums, axis=(1, 2))
+
+
+def _ginis(D):
+    """Gini indices of a stack of class-distribution matrices; columns
+    without data are ignored"""
+    col_sums = np.sum(D, axis=1, keepdims=True)
+    P = D / np.where(col_sums > 0, col_sums, 1)
+    with np.errstate(invalid="ignore"):
+        return np.sum((1 - np.sum(P ** 2, axis=1, keepdims=True)) * col_sums,
+                      axis=(1, 2)) / np.sum(col_sums, axis=(1, 2))
 
 
-def _symmetrical_uncertainty(data, attr1, attr2):
-    """Symmetrical uncertainty, Press et al., 1988."""
-    cont = np.asarray(contingency.Discrete(data, attr1, attr2), dtype=float)
-    ig = InfoGain().from_contingency(cont, 1)
-    return 2 * ig / (_entropy(cont) + _entropy(cont.T))
+def _symmetrical_uncertainties(conts):
+    """Symmetrical uncertainty, Press et al., 1988, for a stack of
+    contingency matrices"""
+    ig = InfoGain().from_contingencies(conts, 1)
+    return 2 * ig / (_entropies(conts) + _entropies(conts.transpose(0, 2, 1)))
 
 
 class FCBF(ClassificationScorer):
@@ -251,25 +283,25 @@ class FCBF(ClassificationScorer):
     """
     def score_data(self, data, feature=None):
         attributes = data.domain.attributes
-        S = []
-        for i, attr in enumerate(attributes):
-            S.append((_symmetrical_uncertainty(data, attr, data.domain.class_var), i))
-        S.sort()
+        conts, _ = contingency.get_discrete_contingencies(data)
+        S = sorted(zip(_symmetrical_uncertainties(conts),
+                       range(len(attributes))))
         worst = []
 
         p = 1
-        while True:
-            try: SUpc, Fp = S[-p]
-            except IndexError: break
-            q = p + 1
-            while True:
-                try: SUqc, Fq = S[-q]
-                except IndexError: break
-                if _symmetrical_uncertainty(data, attributes[Fp], attributes[Fq]) >= SUqc:
-                    del S[-q]
-                    worst.append((1e-4*SUqc, Fq))
-                else:
-                    q += 1
+        while p <= len(S):
+            Fp = S[-p][1]
+            # Features whose uncertainty with the class is lower than Fp's
+            candidates = S[:-p]
+            if candidates:
+                conts, _ = contingency.get_discrete_contingencies(
+                    data, [Fq for _, Fq in candidates], attributes[Fp])
+                redundant = _symmetrical_uncertainties(conts) >= \
+                    np.array([SUqc for SUqc, _ in candidates])
+                worst += [(1e-4 * SUqc, Fq) for (SUqc, Fq), red
+                          in zip(candidates, redundant) if red]
+                S = [c for c, red in zip(candidates, redundant)
+                     if not red] + S[-p:]
             p += 1
         best = S
         scores = [i[0] for i in sorted(chain(best, worst), key=lambda i: i[1])]
@@ -281,10 +313,10 @@ class InfoGain(ClassificationScorer):
     Information gain is the expected decrease of entropy. See `Wikipedia entry on information gain
     <http://en.wikipedia.org/wiki/Information_gain_ratio>`_.
     """
-    def from_contingency(self, cont, nan_adjustment):
-        h_class = _entropy(np.sum(cont, axis=1))
-        h_residual = _entropy(np.compress(np.sum(cont, axis=0), cont, axis=1))
-        return nan_adjustment * (h_class - h_residual)
+    def from_contingencies(self, conts, nan_adjustments):
+        h_class = _entropies(np.sum(conts, axis=2, keepdims=True))
+        h_residual = _entropies(conts)
+        return nan_adjustments * (h_class - h_residual)
 
 
 class GainRatio(ClassificationScorer):
@@ -297,13 +329,12 @@ class GainRatio(ClassificationScorer):
 
     .. [Quinlan1986] J R Quinlan: Induction of Decision Trees, Machine Learning, 1986.
     """
-    def from_contingency(self, cont, nan_adjustment):
-        h_class = _entropy(np.sum(cont, axis=1))
-        h_residual = _entropy(np.compress(np.sum(cont, axis=0), cont, axis=1))
-        h_attribute = _entropy(np.sum(cont, axis=0))
-        if h_attribute == 0:
-            h_attribute = 1
-        return nan_adjustment * (h_class - h_residual) / h_attribute
+    def from_contingencies(self, conts, nan_adjustments):
+        h_class = _entropies(np.sum(conts, axis=2, keepdims=True))
+        h_residual = _entropies(conts)
+        h_attribute = _entropies(np.sum(conts, axis=1)[:, :, np.newaxis])
+        h_attribute[h_attribute == 0] = 1
+        return nan_adjustments * (h_class - h_residual) / h_attribute
 
 
 class Gini(ClassificationScorer):
@@ -312,8 +343,9 @@ class Gini(ClassificationScorer):
     classes. See `Wikipedia entry on Gini impurity
     <https://en.wikipedia.org/wiki/Decision_tree_learning#Gini_impurity>`_.
     """
-    def from_contingency(self, cont, nan_adjustment):
-        return (_gini(np.sum(cont, axis=1)) - _gini(cont)) * nan_adjustment
+    def from_contingencies(self, conts, nan_adjustments):
+        return (_ginis(np.sum(conts, axis=2, keepdims=True)) - _ginis(conts)) \
+            * nan_adjustments
 
 
 class ReliefF(Scorer):
@@ -1,10 +1,16 @@
+from collections import OrderedDict
+
 import numpy as np
 import scipy.sparse as sp
 
-from Orange.data import Instance, Table, Domain
+from Orange.data import Instance, Table, Domain, Variable
 from Orange.util import Reprable
 
 
+def _defined_in(cls, name):
+    return next(base for base in cls.__mro__ if name in vars(base))
+
+
 class Transformation(Reprable):
     """
     Base class for simple transformations of individual variables. Derived
@@ -48,6 +54,48 @@ class Transformation(Reprable):
         raise NotImplementedError(
             "ColumnTransformations must implement method 'transform'.")
 
+    @classmethod
+    def compute_batch(cls, transformations, data):
+        """
+        Return a matrix whose i-th column is the column computed by
+        `transformations[i]` (instances of `cls`) from `data`, or `None` if
+        transformations must be called individually.
+
+        Columns of all variables are extracted from the data in a single
+        conversion and passed to `transform_batch`. `Table.from_table` calls
+        this method for groups of compute values of the same type.
+        """
+        if cls.__call__ is not Transformation.__call__ or not all(
+                isinstance(t.variable, Variable) and t.variable.is_primitive()
+                for t in transformations):
+            return None
+        variables = list(OrderedDict.fromkeys(t.variable
+                                              for t in transformations))
+        indices = {var: i for i, var in enumerate(variables)}
+        columns = Table.from_table(Domain(variables), data).X
+        columns = columns[:, [indices[t.variable] for t in transformations]]
+        # A derived class may override `transform`, but not `transform_batch`
+        if issubclass(_defined_in(cls, "transform_batch"),
+                      _defined_in(cls, "transform")):
+            return cls.transform_batch(transformations, columns)
+        return Transformation.transform_batch.__func__(
+            cls, transformations, columns)
+
+    @classmethod
+    def transform_batch(cls, transformations, columns):
+        """
+        Return transformed `columns`, where the i-th column is transformed
+        by `transformations[i]`, or `None` if this is not supported for the
+        given (e.g. sparse) data.
+
+        The default implementation calls `transform` for each column of
+        dense data. Derived classes can provide vectorized implementations.
+        """
+        if sp.issparse(columns):
+            return None
+        return np.column_stack([t.transform(col)
+                                for t, col in zip(transformations, columns.T)])
+
 
 class Identity(Transformation):
     """Return an untransformed value of `c`.
@@ -55,6 +103,10 @@ class Identity(Transformation):
     def transform(self, c):
         return c
 
+    @classmethod
+    def transform_batch(cls, transformations, columns):
+        return columns
+
 
 class Indicator(Transformation):
     """
@@ -75,6 +127,12 @@ class Indicator(Transformation):
     def transform(self, c):
         return c == self.value
 
+    @classmethod
+    def transform_batch(cls, transformations, columns):
+        if sp.issparse(columns):
+            return None
+        return columns == [t.value for t in transformations]
+
 
 class Indicator1(Transformation):
     """
@@ -95,6 +153,12 @@ class Indicator1(Transformation):
     def transform(self, c):
         return (c == self.value) * 2 - 1
 
+    @classmethod
+    def transform_batch(cls, transformations, columns):
+        if sp.issparse(columns):
+            return None
+        return (columns == [t.value for t in transformations]) * 2 - 1
+
 
 class Normalizer(Transformation):
     """
@@ -124,6 +188,18 @@ class Normalizer(Transformation):
         else:
             return (c - self.offset) * self.factor
 
+    @classmethod
+    def transform_batch(cls, transformations, columns):
+        offsets = np.array([t.offset for t in transformations], dtype=float)
+        factors = np.array([t.factor for t in transformations], dtype=float)
+        if sp.issparse(columns):
+            if np.any(offsets != 0):
+                raise ValueError('Non-zero offset in normalization '
+                                 'of sparse data')
+            return sp.csc_matrix(columns).dot(sp.diags(factors))
+        else:
+            return (columns - offsets) * factors
+
 
 class Lookup(Transformation):
     """
@@ -7,7 +7,8 @@ from scipy.linalg import eigh as lapack_eigh
 
 import sklearn.manifold as skl_manifold
 
-from Orange.distance import Distance, DistanceModel, Euclidean
+from Orange.distance import Distance, DistanceModel, Euclidean, \
+    NeighborIndex
 from Orange.projection import SklProjector
 
 __all__ = ["MDS", "Isomap", "LocallyLinearEmbedding", "SpectralEmbedding",
@@ -173,9 +174,33 @@ class SpectralEmbedding(SklProjector):
 
     def __init__(self, n_components=2, affinity='nearest_neighbors', gamma=None,
                  random_state=None, eigen_solver=None, n_neighbors=None, n_jobs=1,
-                 preprocessors=None):
+                 neighbors_algorithm='auto', preprocessors=None):
         super().__init__(preprocessors=preprocessors)
         self.params = vars()
+        self.neighbors_algorithm = neighbors_algorithm
+
+    def fit(self, X, Y=None):
+        """
+        Fit the embedding; the graph of nearest neighbours is taken from a
+        (cached) `NeighborIndex` with the given `neighbors_algorithm`, which
+        can also be 'approximate'.
+        """
+        params = self.params.copy()
+        if params["affinity"] != "nearest_neighbors":
+            return super().fit(X, Y)
+        n_neighbors = params["n_neighbors"] or max(int(X.shape[0] / 10), 1)
+        index = NeighborIndex.cached(X, Euclidean,
+                                     algorithm=self.neighbors_algorithm)
+
+        def affinity(_):
+            graph = index.kneighbors_graph(n_neighbors, include_self=True)
+            return 0.5 * (graph + graph.T)
+
+        params["affinity"] = affinity
+        proj = self.__wraps__(**params).fit(X)
+        proj.affinity = "nearest_neighbors"
+        proj.n_neighbors_ = n_neighbors
+        return proj
 
 
 class TSNE(SklProjector):
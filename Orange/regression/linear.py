@@ -162,3 +162,4 @@ class PolynomialModel(Model):
 
 
 PolynomialLearner.__returns__ = PolynomialModel
+LinearRegressionLearner.__returns__ = LinearModel
@@ -27,6 +27,22 @@ class MeanLearner(Learner):
         dist = distribution.get_distribution(data, data.domain.class_var)
         return MeanModel(dist)
 
+    def update_storage(self, model, data):
+        """
+        Update the model's distribution and mean with the data.
+        """
+        if model is None:
+            return self.fit_storage(data)
+        dist = distribution.get_distribution(data, data.domain.class_var)
+        merged = numpy.hstack((model.dist, dist))
+        values, indices = numpy.unique(merged[0], return_inverse=True)
+        counts = numpy.bincount(indices, weights=merged[1])
+        model.dist = distribution.Continuous(
+            numpy.vstack((values, counts)), model.dist.variable,
+            model.dist.unknowns + dist.unknowns)
+        model.mean = model.dist.mean() if model.dist.any() else 0.0
+        return model
+
 
 # noinspection PyMissingConstructor
 class MeanModel(Model):
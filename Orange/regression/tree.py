@@ -6,7 +6,7 @@ import sklearn.tree as skl_tree
 
 from Orange.base import TreeModel as TreeModelInterface
 from Orange.tree import Node, DiscreteNode, MappedDiscreteNode, \
-    NumericNode, TreeModel
+    NumericNode, TreeModel, CompiledTree
 from Orange.regression import SklLearner, SklModel, Learner
 from Orange.classification import _tree_scorers
 
@@ -177,7 +177,9 @@ class TreeLearner(Learner):
 
 
 class SklTreeRegressor(SklModel, TreeModelInterface):
-    pass
+    def compiled(self):
+        """Return the tree in the array-based format of :obj:`CompiledTree`"""
+        return CompiledTree.from_sklearn(self.skl_model.tree_)
 
 
 class SklTreeRegressionLearner(SklLearner):
@@ -278,3 +278,42 @@ def get_contingencies(dat, skip_discrete=False, skip_continuous=False):
             columns = range(len(vars))
         contigs = [get_contingency(dat, i) for i in columns]
     return contigs
+
+
+def get_discrete_contingencies(dat, columns=None, row_variable=None):
+    """
+    Return contingencies of discrete attributes with the class (or another
+    discrete variable) in a single array, in which matrices are padded with
+    zeros to the largest number of values.
+
+    Args:
+        dat (Orange.data.Storage): data
+        columns (list of int): indices of attributes (default: all)
+        row_variable (Orange.data.DiscreteVariable):
+            row variable (default: class variable)
+
+    Returns:
+        tuple with an array of shape (n_columns, n_rows, max_values) and
+        an array with unknown values of shape (n_columns, n_rows)
+    """
+    attributes = dat.domain.attributes
+    row_var = dat.domain.class_var if row_variable is None \
+        else _get_variable(row_variable, dat, "row_variable")
+    if row_var is None:
+        raise ValueError("data has no target variable")
+    if columns is None:
+        columns = range(len(attributes))
+    col_vars = [attributes[col] for col in columns]
+    try:
+        conts, _ = dat._compute_contingency(col_vars, row_var)
+    except NotImplementedError:
+        conts = [(cont, cont.unknowns)
+                 for cont in (Discrete(dat, var, row_var)
+                              for var in col_vars)]
+    n_values = max((len(var.values) for var in col_vars), default=0)
+    array = np.zeros((len(conts), len(row_var.values), n_values))
+    unknowns = np.zeros((len(conts), len(row_var.values)))
+    for i, (cont, unks) in enumerate(conts):
+        array[i, :, :cont.shape[1]] = cont
+        unknowns[i] = unks
+    return array, unknowns
@@ -239,6 +239,9 @@ class Continuous(Distribution):
         except NotImplementedError:
             col = data[:, variable]
             dtype = col.dtype
+            if dtype == np.float32:
+                # Weights are summed in place; float32 is exact only to 2**24
+                dtype = np.dtype(np.float64)
             if data.has_weights():
                 if not "float" in dtype.name and "float" in col.dtype.name:
                     dtype = col.dtype.name
@@ -4,6 +4,7 @@ and once used from the bottlechest package (fork of bottleneck).
 
 It also patches bottleneck to contain these functions.
 """
+import os
 from warnings import warn
 
 import bottleneck as bn
@@ -13,22 +14,19 @@ from scipy import sparse as sp
 
 def _count_nans_per_row_sparse(X, weights, dtype=None):
     """ Count the number of nans (undefined) values per row. """
-    if weights is not None:
-        X = X.tocoo(copy=False)
-        nonzero_mask = np.isnan(X.data)
-        nan_rows, nan_cols = X.row[nonzero_mask], X.col[nonzero_mask]
-
-        if weights.ndim == 1:
-            data_weights = weights[nan_rows]
-        else:
-            data_weights = weights[nan_rows, nan_cols]
-
-        w = sp.coo_matrix((data_weights, (nan_rows, nan_cols)), shape=X.shape)
-        w = w.tocsr()
-
-        return np.fromiter((np.sum(row.data) for row in w), dtype=dtype)
+    X = X.tocoo(copy=False)
+    nonzero_mask = np.isnan(X.data)
+    nan_rows, nan_cols = X.row[nonzero_mask], X.col[nonzero_mask]
+
+    if weights is None:
+        data_weights = None
+    elif weights.ndim == 1:
+        data_weights = weights[nan_rows]
+    else:
+        data_weights = weights[nan_rows, nan_cols]
 
-    return np.fromiter((np.isnan(row.data).sum() for row in X), dtype=dtype)
+    counts = np.bincount(nan_rows, weights=data_weights, minlength=X.shape[0])
+    return counts.astype(dtype or np.float64)
 
 
 def sparse_count_implicit_zeros(x):
@@ -275,6 +273,104 @@ def contingency(X, y, max_X=None, max_y=None, weights=None, mask=None):
     return np.array(contingencies), np.array(nans)
 
 
+# Minimal number of values (rows x columns) computed by a thread
+_MIN_BLOCK_SIZE = 2 ** 20
+
+
+def contingencies(X, y, n_values, n_y, weights=None, columns=None, n_jobs=1):
+    """
+    Compute the contingency matrices for discrete columns of an array
+    versus the vector `y` in a single pass over the data.
+
+    Unlike :obj:`contingency`, which computes matrices column by column, this
+    function counts the values of all columns in one pass over rows of `X`,
+    with the columns split into blocks that are processed by `n_jobs`
+    threads. The result is a single array that is padded with zeros to the
+    largest number of values.
+
+    Parameters
+    ----------
+    X : np.ndarray or scipy.sparse matrix
+        With (discrete) values in columns.
+    y : 1d array
+        Vector of values of the row variable; rows where it is missing are
+        skipped.
+    n_values : int or sequence of int
+        The number of values of each (selected) column
+    n_y : int
+        The number of values of `y`
+    weights : array_like
+        Row weights. When not None, contingencies contain weighted counts
+    columns : sequence of int
+        Indices of columns to include (default: all)
+    n_jobs : int
+        The number of threads; negative values are relative to the number
+        of CPUs
+
+    Returns
+    -------
+    contingencies: (m × n_y × max(n_values)) array
+        for each selected column of X, with rows corresponding to values
+        of `y`
+    nans : (m × n_y) array
+        Number of nans in each column of X for each value of `y`.
+    """
+    from Orange.data._contingency import \
+        contingency_discrete, contingency_discrete_csc
+
+    if columns is None:
+        columns = np.arange(X.shape[1])
+    columns = np.asarray(columns, dtype=np.intp)
+    n_values = np.broadcast_to(n_values, columns.shape)
+    if sp.issparse(X):
+        X = sp.csc_matrix(
+            X, dtype=np.float32 if X.dtype == np.float32 else np.float64)
+        indices = X.indices.astype(np.intp)
+        indptr = X.indptr.astype(np.intp)
+    elif X.dtype not in (np.float64, np.float32):
+        # Convert only the selected columns; others may also contain strings
+        X = X[:, columns].astype(np.float64)
+        columns = np.arange(len(columns))
+    classes = np.array(y, dtype=float)
+    unknown_y = np.isnan(classes)
+    classes[unknown_y] = -1
+    classes = classes.astype(np.intp)
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np.float64)
+
+    conts = np.zeros((len(columns), n_y, max(n_values, default=0)))
+    nans = np.zeros((len(columns), n_y))
+    if n_jobs < 0:
+        n_jobs = max(1, os.cpu_count() + 1 + n_jobs)
+    n_jobs = max(1, min(n_jobs, len(columns),
+                        len(columns) * X.shape[0] // _MIN_BLOCK_SIZE))
+    blocks = np.array_split(np.arange(len(columns)), n_jobs)
+
+    def compute_block(block):
+        if len(block):
+            sl = slice(block[0], block[-1] + 1)
+            if sp.issparse(X):
+                contingency_discrete_csc(X.data, indices, indptr, columns[sl],
+                                         classes, weights, conts[sl], nans[sl])
+            else:
+                contingency_discrete(X, columns[sl], classes, weights,
+                                     conts[sl], nans[sl])
+
+    if n_jobs == 1:
+        compute_block(blocks[0])
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(n_jobs) as executor:
+            list(executor.map(compute_block, blocks))
+    if sp.issparse(X) and conts.shape[2]:
+        # Add implicit zeros: rows of each class that are not stored
+        class_totals = np.bincount(
+            classes[~unknown_y], minlength=n_y,
+            weights=None if weights is None else weights[~unknown_y])
+        conts[:, :, 0] += class_totals - np.sum(conts, axis=2) - nans
+    return conts, nans
+
+
 def stats(X, weights=None, compute_variance=False):
     """
     Compute min, max, #nans, mean and variance.
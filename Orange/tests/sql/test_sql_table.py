@@ -4,16 +4,20 @@
 import pickle
 import unittest
 import unittest.mock
+from contextlib import contextmanager
 
 import numpy as np
-from Orange.data.sql.backend.base import BackendError
+from Orange.data.sql.backend.base import Backend, BackendError, ToSql
 
 from numpy.testing import assert_almost_equal
 
 from Orange.data import filter, ContinuousVariable, DiscreteVariable, \
     StringVariable, TimeVariable, Table, Domain
 from Orange.data.sql.table import SqlTable
-from Orange.preprocess.discretize import EqualWidth
+from Orange.preprocess import Normalize
+from Orange.preprocess.discretize import EqualWidth, EqualFreq, \
+    Discretizer, DomainDiscretizer as Discretize
+from Orange.preprocess.normalize import Normalizer
 from Orange.statistics.basic_stats import BasicStats, DomainBasicStats
 from Orange.statistics.contingency import Continuous, Discrete, get_contingencies
 from Orange.statistics.distribution import get_distributions
@@ -594,6 +598,31 @@ class TestSqlTable(PostgresTest):
         self.assertIsInstance(conts[1], Continuous)
         self.assertIsInstance(conts[2], Discrete)
 
+    def test_contingencies_match_table(self):
+        iris = SqlTable(self.conn, self.iris, inspect_values=True)
+        iris.domain = Domain(iris.domain.attributes, iris.domain['iris'])
+        table = Table("iris")
+        for sql_cont, cont in zip(get_contingencies(iris),
+                                  get_contingencies(table)):
+            np.testing.assert_almost_equal(sql_cont.values, cont.values)
+            np.testing.assert_almost_equal(sql_cont.counts, cont.counts)
+
+    def test_discretization_and_normalization(self):
+        iris = SqlTable(self.conn, self.iris, inspect_values=True)
+        domain = Discretize(method=EqualWidth(n=3))(iris)
+        self.assertEqual(len(domain.attributes), 4)
+        np.testing.assert_almost_equal(domain[0].compute_value.points,
+                                       [5.5, 6.7])
+
+        domain = Discretize(method=EqualFreq(n=2))(iris)
+        np.testing.assert_almost_equal(domain[0].compute_value.points,
+                                       [5.8])
+
+        norm = Normalizer(norm_type=Normalize.NormalizeBySpan)(iris)
+        norm = norm.domain[0].compute_value
+        self.assertAlmostEqual(norm.offset, 4.3)
+        self.assertAlmostEqual(norm.factor, 1 / 3.6)
+
     def test_pickling_restores_connection_pool(self):
         iris = SqlTable(self.conn, self.iris, inspect_values=True)
         iris2 = pickle.loads(pickle.dumps(iris))
@@ -624,3 +653,122 @@ class TestSqlTable(PostgresTest):
         self.assertGreater(len(table.domain.metas), 0)
         attr = table.domain[-1]
         self.assertIsInstance(attr, variable_type)
+
+
+class MockBackend:
+    """Backend that records queries and returns prepared results"""
+    stddev = Backend.stddev
+    quantiles = Backend.quantiles
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.queries = []
+
+    @staticmethod
+    def create_sql_query(table_name, fields, filters=(), group_by=None,
+                         *_):
+        return dict(table_name=table_name, fields=fields, filters=filters,
+                    group_by=group_by)
+
+    @contextmanager
+    def execute_sql_query(self, query, params=None):
+        self.queries.append(query)
+        result = self.results.pop(0)
+        cur = unittest.mock.Mock()
+        cur.fetchall.return_value = result
+        cur.fetchone.return_value = result[0] if result else None
+        yield cur
+
+
+class TestSqlTableAggregates(unittest.TestCase):
+    def setUp(self):
+        self.x = ContinuousVariable("x")
+        self.x.to_sql = ToSql('"x"')
+        self.d = DiscreteVariable("d", values=["a", "b", "c'"])
+        self.d.to_sql = ToSql('"d"')
+        self.y = DiscreteVariable("y", values=["n", "p"])
+        self.y.to_sql = ToSql('"y"')
+
+    def table(self, *results):
+        table = SqlTable.__new__(SqlTable)
+        table.backend = MockBackend(*results)
+        table.domain = Domain([self.x, self.d], self.y)
+        table.table_name = "t"
+        table._cached__len__ = 10
+        return table
+
+    def test_value_field(self):
+        self.assertEqual(SqlTable._value_field(self.x),
+                         'CAST("x" AS double precision)')
+        self.assertEqual(
+            SqlTable._value_field(self.d),
+            "CAST(CASE \"d\" WHEN 'a' THEN 0 WHEN 'b' THEN 1 "
+            "WHEN 'c''' THEN 2 END AS double precision)")
+        # discretized variables compute indices of bins in the database
+        binned = Discretizer.create_discretized_var(self.x, [1, 2])
+        self.assertEqual(SqlTable._value_field(binned),
+                         "CAST(%s AS double precision)" % binned.to_sql())
+
+    def test_distributions(self):
+        table = self.table([(0, 1.5, 2), (1, 0, 4), (0, 0.5, 1),
+                            (0, None, 3), (1, 2, 1), (1, None, 1),
+                            (2, 1, 10)])
+        (dx, ux), (dd, ud), (dy, uy) = table._compute_distributions()
+        np.testing.assert_equal(dx, [[0.5, 1.5], [1, 2]])
+        self.assertEqual(ux, 3)
+        np.testing.assert_equal(dd, [4, 0, 1])
+        self.assertEqual(ud, 1)
+        np.testing.assert_equal(dy, [0, 10])
+        self.assertEqual(uy, 0)
+
+        query, = table.backend.queries
+        self.assertEqual(len(query["group_by"]), 1)
+        self.assertTrue(query["group_by"][0].startswith("GROUPING SETS"))
+
+    def test_contingencies(self):
+        table = self.table([
+            (0, 1.5, 0, 2), (0, 0.5, 1, 1), (0, 1.5, 1, 3), (0, None, 1, 4),
+            (0, 0.5, None, 5),
+            (1, 2, 0, 1), (1, 0, 1, 2), (1, 0, None, 3), (1, None, 0, 6),
+            (1, None, None, 2),
+            (2, 0, 0, 9), (2, 1, 1, 8), (2, None, None, 5)])
+        conts, unknown_rows = table._compute_contingency()
+        self.assertEqual(unknown_rows, 5)
+        (cx, ux), (cd, ud), (cy, uy) = conts
+        values, counts = cx
+        np.testing.assert_equal(values, [0.5, 1.5])
+        np.testing.assert_equal(counts, [[0, 2], [1, 3]])
+        np.testing.assert_equal(ux, [0, 4])
+        np.testing.assert_equal(cd, [[0, 0, 1], [2, 0, 0]])
+        np.testing.assert_equal(ud, [6, 0])
+        np.testing.assert_equal(cy, [[9, 0], [0, 8]])
+
+        query, = table.backend.queries
+        fields = query["fields"]
+        # the class is grouped in all sets and must be identified last
+        self.assertTrue(
+            fields[0].endswith("WHEN GROUPING(%s) = 0 THEN 2 END"
+                               % SqlTable._value_field(self.y)))
+
+    def test_discretization(self):
+        table = self.table([(1, 2, 2)])
+        discretized = Discretize(method=EqualFreq(n=4))(table)
+        self.assertEqual(discretized["x"].compute_value.points, [1, 2])
+        self.assertEqual(len(table.backend.queries), 1)
+
+        table = self.table([(0, 3, 1, 1, 0, 10, 0, 10)])
+        discretized = Discretize(method=EqualWidth(n=3))(table)
+        self.assertEqual(discretized["x"].compute_value.points, [1, 2])
+        self.assertEqual(len(table.backend.queries), 1)
+
+    def test_normalization(self):
+        table = self.table([(1, 5, 2, 4, 0, 10, 0, 10, 0, 10)],
+                           [(1, 5, 2, 4, 0, 10, 0, 10, 0, 10)])
+        normalizer = Normalizer(norm_type=Normalize.NormalizeBySD)
+        norm = normalizer(table).domain["x"].compute_value
+        self.assertEqual((norm.offset, norm.factor), (2, 0.25))
+
+        normalizer = Normalizer(norm_type=Normalize.NormalizeBySpan)
+        norm = normalizer(table).domain["x"].compute_value
+        self.assertEqual((norm.offset, norm.factor), (1, 0.25))
+        self.assertEqual(len(table.backend.queries), 2)
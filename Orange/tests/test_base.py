@@ -4,7 +4,7 @@ import pickle
 import unittest
 
 from Orange.base import SklLearner, Learner, Model
-from Orange.data import Domain
+from Orange.data import Domain, Table
 from Orange.preprocess import Discretize, Randomize
 from Orange.regression import LinearRegressionLearner
 
@@ -72,6 +72,14 @@ class TestLearner(unittest.TestCase):
             'as well as an iterable object')
 
 
+    def test_partial_fit_not_supported(self):
+        learner = DummyLearner()
+        self.assertFalse(learner.supports_partial_fit)
+        self.assertRaises(NotImplementedError,
+                          learner.partial_fit, Table("iris"))
+        self.assertFalse(LinearRegressionLearner().supports_partial_fit)
+
+
 class TestSklLearner(unittest.TestCase):
     def test_sklearn_supports_weights(self):
         """Check that the SklLearner correctly infers whether or not the
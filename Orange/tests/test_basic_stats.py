@@ -33,3 +33,14 @@ class TestDomainBasicStats(TestCase):
             self.assertAlmostEqual(stat1.var, stat2.var)
             self.assertAlmostEqual(stat1.nans, stat2.nans)
             self.assertAlmostEqual(stat1.non_nans, stat2.non_nans)
+
+    def test_compute_selected_columns(self):
+        domain = self.zoo.domain
+        all_stats = self.zoo._compute_basic_stats(include_metas=True)
+        columns = [domain.metas[0], domain.attributes[3], domain.class_var,
+                   domain.attributes[0], domain.attributes[3]]
+        stats = self.zoo._compute_basic_stats(columns)
+        self.assertEqual(len(stats), 5)
+        n_attrs = len(domain.attributes)
+        for i, index in enumerate((n_attrs + 1, 3, n_attrs, 0, 3)):
+            self.assertEqual(list(stats[i]), list(all_stats[index]))
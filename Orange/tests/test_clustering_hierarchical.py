@@ -96,6 +96,13 @@ class TestHierarchical(unittest.TestCase):
         numpy.testing.assert_equal(
             hierarchical.squareform(dist, mode="upper"), m)
 
+    def test_condensed_matrix(self):
+        condensed = Orange.misc.CondensedDistMatrix.from_matrix(self.matrix)
+        for linkage in ("single", "average", "ward"):
+            numpy.testing.assert_almost_equal(
+                hierarchical.dist_matrix_linkage(condensed, linkage),
+                hierarchical.dist_matrix_linkage(self.matrix, linkage))
+
     def test_pre_post_order(self):
         tree = hierarchical.Tree
         root = tree("A", (tree("B"), tree("C")))
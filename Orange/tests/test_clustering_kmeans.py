@@ -3,6 +3,8 @@
 
 import unittest
 
+import numpy as np
+
 import Orange
 from Orange.clustering.kmeans import KMeans
 
@@ -47,3 +49,13 @@ class TestKMeans(unittest.TestCase):
         X = self.iris.X[::20]
         p = c(X)
 
+    def test_partial_fit(self):
+        kmeans = KMeans(n_clusters=3, random_state=42)
+        data = self.iris[np.random.RandomState(0).permutation(150)]
+        model = kmeans.fit_chunks(data[i:i + 50] for i in range(0, 150, 50))
+        self.assertEqual(model.centroids.shape, (3, 4))
+        self.assertGreater(model.inertia, 0)
+        clusters = model(self.iris).X.ravel()
+        # Setosa is separated from the other two species
+        self.assertEqual(len(set(clusters[:50])), 1)
+        self.assertNotIn(clusters[0], clusters[50:])
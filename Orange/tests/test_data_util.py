@@ -3,8 +3,13 @@ from unittest.mock import Mock
 
 import numpy as np
 
-from Orange.data.util import scale, one_hot, SharedComputeValue
+import scipy.sparse as sp
+
+from Orange.data.util import scale, one_hot, SharedComputeValue, LRUCache, \
+    dictionary_encode, dictionary_decode, intern_strings, EncodedColumns
 import Orange
+from Orange.data import table as table_module
+
 
 class TestDataUtil(unittest.TestCase):
     def test_scale(self):
@@ -21,6 +26,42 @@ class TestDataUtil(unittest.TestCase):
                                          [0, 1, 0]])
         np.testing.assert_equal(one_hot([], int), np.zeros((0, 0), dtype=int))
 
+    def test_dictionary_encode(self):
+        values = ["b", "a", "b", "", "a"]
+        codes, pool = dictionary_encode(np.array(values, dtype=object))
+        np.testing.assert_equal(codes, [0, 1, 0, 2, 1])
+        self.assertEqual(codes.dtype, np.uint8)
+        np.testing.assert_equal(pool, ["b", "a", ""])
+        decoded = dictionary_decode(codes, pool)
+        self.assertEqual(decoded.dtype, object)
+        self.assertEqual(decoded.tolist(), values)
+
+        codes, pool = dictionary_encode([])
+        self.assertEqual(len(codes), 0)
+        self.assertEqual(len(pool), 0)
+
+        interned = intern_strings(["a" + str(i % 2) for i in range(4)])
+        self.assertIs(interned[0], interned[2])
+        self.assertEqual(interned.tolist(), ["a0", "a1", "a0", "a1"])
+
+    def test_encoded_columns(self):
+        array = np.array([["a", 1.5, 1, ""],
+                          ["b", np.nan, True, None],
+                          ["a", 2.0, 1.0, "c"]], dtype=object)
+        encoded = EncodedColumns(array)
+        self.assertIsInstance(encoded.columns[0], tuple)
+        self.assertEqual(encoded.columns[1].dtype, float)
+        decoded = encoded.decode()
+        self.assertEqual(decoded.dtype, object)
+        self.assertEqual(decoded.shape, array.shape)
+        np.testing.assert_equal(decoded.tolist(), array.tolist())
+        # values that compare equal keep their types
+        self.assertEqual([type(x) for x in decoded[:, 2]], [int, bool, float])
+
+        empty = EncodedColumns(np.empty((0, 2), dtype=object)).decode()
+        self.assertEqual(empty.shape, (0, 2))
+
+
 
 class DummyPlus(SharedComputeValue):
 
@@ -71,3 +112,97 @@ class TestSharedComputeValue(unittest.TestCase):
         #test with descendants of table
         DummyTable.from_table(c.domain, data)
         self.assertEqual(obj.compute_shared.call_count, 4)
+
+        # tables do not cache columns unless asked to
+        data.X[0, 0] = 41
+        mdata = Orange.data.Table.from_table(domain, data)
+        self.assertEqual(obj.compute_shared.call_count, 5)
+        self.assertEqual(mdata.X[0, 0], 42)
+
+    def test_cached_call(self):
+        obj = DummyPlus(Mock(return_value=1))
+        data = Orange.data.Table("iris")
+        data.use_column_cache = True
+        domain = Orange.data.Domain([at.copy(compute_value=obj)
+                                     for at in data.domain.attributes],
+                                    data.domain.class_vars)
+
+        ndata = Orange.data.Table.from_table(domain, data)
+        self.assertEqual(obj.compute_shared.call_count, 1)
+        # shared data and columns are computed once per table
+        Orange.data.Table.from_table(domain, data)
+        DummyTable.from_table(domain, data, range(10))
+        self.assertEqual(obj.compute_shared.call_count, 1)
+        Orange.data.Table.from_table(domain, data.copy())
+        self.assertEqual(obj.compute_shared.call_count, 2)
+
+        # changing the table invalidates the cache
+        data[0, 0] = 42
+        mdata = Orange.data.Table.from_table(domain, data)
+        self.assertEqual(obj.compute_shared.call_count, 3)
+        self.assertEqual(mdata.X[0, 0], 43)
+        np.testing.assert_equal(mdata.X[1:], ndata.X[1:])
+
+        data.X[0, 0] = 41
+        data.invalidate_cache()
+        mdata = Orange.data.Table.from_table(domain, data)
+        self.assertEqual(obj.compute_shared.call_count, 4)
+        self.assertEqual(mdata.X[0, 0], 42)
+
+    def test_cached_none(self):
+        # pylint: disable=protected-access
+        data = Orange.data.Table("iris")
+        data.use_column_cache = True
+        compute = Mock(return_value=None)
+        self.assertIsNone(table_module._cached_column(data, compute, compute))
+        key, _ = table_module._column_cache_key(data, compute)
+        self.assertNotIn(key, table_module.column_cache)
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_size(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.info()[:4], (3, 1, 2, 2))
+
+        cache.resize(maxsize=1)
+        self.assertEqual(len(cache), 1)
+        self.assertIn("c", cache)
+        cache.clear()
+        self.assertEqual(cache.info()[:4], (0, 0, 1, 0))
+
+    def test_bytes(self):
+        cache = LRUCache(maxsize=None, maxbytes=2000)
+        cache.put("a", np.zeros(100))
+        cache.put("b", sp.csr_matrix(np.eye(10)))
+        self.assertEqual(cache.info().nbytes, 800 + 80 + 40 + 44)
+        cache.put("c", np.zeros(120))
+        self.assertEqual(cache.info().nbytes, 800 + 164 + 960)
+        cache.put("d", np.zeros(50))
+        self.assertEqual(cache.info().nbytes, 164 + 960 + 400)
+        self.assertNotIn("a", cache)
+        cache.put("e", np.zeros(300))
+        self.assertNotIn("e", cache)
+        self.assertEqual(len(cache), 3)
+
+    def test_invalidate(self):
+        cache = LRUCache()
+        cache.put("a", 1, group=1)
+        cache.put("b", 2, group=1)
+        cache.put("c", 3, group=2)
+        cache.invalidate(1)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get("c"), 3)
+        cache.invalidate(3)
+
+        # invalidation within a locked cache is deferred
+        with cache._lock:
+            cache.invalidate(2)
+            self.assertEqual(len(cache), 1)
+        self.assertIsNone(cache.get("c"))
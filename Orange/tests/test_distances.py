@@ -16,7 +16,7 @@ from Orange.distance import (Euclidean, SpearmanR, SpearmanRAbsolute,
                              PearsonR, PearsonRAbsolute, Manhattan, Cosine,
                              Jaccard, _preprocess, MahalanobisDistance)
 from Orange.distance.distance import _spearmanr2, _corrcoef2
-from Orange.misc import DistMatrix
+from Orange.misc import DistMatrix, CondensedDistMatrix
 from Orange.tests import named_file, test_filename
 from Orange.util import OrangeDeprecationWarning
 
@@ -187,6 +187,114 @@ class TestDistMatrix(TestCase):
             self.assertEqual(m.axis, 0)
 
 
+class TestCondensedDistMatrix(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.iris = Table('iris')
+        cls.dist = Euclidean(cls.iris)
+        cls.cond = CondensedDistMatrix.from_matrix(cls.dist)
+
+    # pylint: disable=unsubscriptable-object
+    def test_condensed(self):
+        cond = self.cond
+        np.testing.assert_almost_equal(
+            cond.data, scipy.spatial.distance.pdist(self.iris.X))
+        self.assertEqual(cond.shape, (150, 150))
+        self.assertEqual(len(cond), 150)
+        self.assertIs(cond.row_items, self.iris)
+        np.testing.assert_almost_equal(np.asarray(cond), self.dist)
+        np.testing.assert_almost_equal(cond.to_square(), self.dist)
+        self.assertIsInstance(cond.to_square(), DistMatrix)
+        np.testing.assert_equal(cond.flat, self.dist.flat)
+        self.assertRaises(ValueError, CondensedDistMatrix, np.zeros(4))
+
+    def test_small(self):
+        for n in (0, 1, 2):
+            cond = CondensedDistMatrix.from_matrix(DistMatrix(np.zeros((n, n))))
+            self.assertEqual(cond.shape, (n, n))
+            self.assertEqual(np.asarray(cond).shape, (n, n))
+        self.assertEqual(CondensedDistMatrix(np.zeros(0)).shape, (1, 1))
+        self.assertEqual(CondensedDistMatrix(np.zeros(0), n=0).shape, (0, 0))
+        self.assertEqual(CondensedDistMatrix(np.zeros(3)).shape, (3, 3))
+        self.assertRaises(ValueError, CondensedDistMatrix, np.zeros(3), n=4)
+        model = Euclidean().fit(self.iris)
+        self.assertEqual(model(self.iris[:1], condensed=True).shape, (1, 1))
+        self.assertEqual(model(self.iris[:0], condensed=True).shape, (0, 0))
+
+    def test_getitem(self):
+        cond, dist = self.cond, self.dist
+        self.assertEqual(cond[3, 3], 0)
+        self.assertEqual(cond[3, 5], dist[3, 5])
+        self.assertEqual(cond[5, 3], dist[3, 5])
+        np.testing.assert_equal(cond[5], dist[5])
+        np.testing.assert_equal(cond[:, 7], dist[:, 7])
+        np.testing.assert_equal(cond[2:5, 3:8], dist[2:5, 3:8])
+        np.testing.assert_equal(cond[[1, 4, 2], [4, 4, 0]],
+                                dist[[1, 4, 2], [4, 4, 0]])
+        np.testing.assert_equal(cond[-1, ::-3], dist[-1, ::-3])
+
+    def test_submatrix(self):
+        sub = self.cond.submatrix([2, 7, 4])
+        self.assertIsInstance(sub, CondensedDistMatrix)
+        np.testing.assert_equal(np.asarray(sub),
+                                self.dist.submatrix([2, 7, 4]))
+        self.assertTrue(tables_equal(sub.row_items,
+                                     self.dist.row_items[[2, 7, 4]]))
+
+        sub = self.cond.submatrix([2, 3], [4, 5, 6])
+        self.assertIsInstance(sub, DistMatrix)
+        np.testing.assert_equal(sub, self.dist[2:4, 4:7])
+
+    def test_pickling(self):
+        unpickled = pickle.loads(pickle.dumps(self.cond))
+        np.testing.assert_equal(unpickled.data, self.cond.data)
+        self.assertTrue(tables_equal(unpickled.row_items,
+                                     self.cond.row_items))
+
+    def test_from_file(self):
+        with named_file(
+            """3 axis=0 row_labels
+                danny	0
+                eve 	1.23	0
+                frank	4.56	7.89	0""") as name:
+            m = CondensedDistMatrix.from_file(name)
+            np.testing.assert_almost_equal(m.data, [1.23, 4.56, 7.89])
+            np.testing.assert_almost_equal(np.asarray(m),
+                                           DistMatrix.from_file(name))
+            self.assertEqual([e.metas[0] for e in m.row_items],
+                             ["danny", "eve", "frank"])
+            self.assertIsNone(m.col_items)
+            self.assertEqual(m.axis, 0)
+
+            m.save(name)
+            m = CondensedDistMatrix.from_file(name)
+            np.testing.assert_almost_equal(m.data, [1.23, 4.56, 7.89])
+            self.assertEqual([e.metas[0] for e in m.row_items],
+                             ["danny", "eve", "frank"])
+
+        with named_file("2 asymmetric\n0\t1\n2\t0") as name:
+            self.assertRaises(ValueError, CondensedDistMatrix.from_file, name)
+        with named_file("2\n0.12\n1\t0") as name:
+            self.assertRaises(ValueError, CondensedDistMatrix.from_file, name)
+        with named_file("2\n0\n1\tx") as name:
+            self.assertRaisesRegex(ValueError, "row 2, column 2",
+                                   CondensedDistMatrix.from_file, name)
+
+    def test_distance(self):
+        cond = Euclidean().fit(self.iris)(self.iris, condensed=True)
+        self.assertIsInstance(cond, CondensedDistMatrix)
+        np.testing.assert_almost_equal(cond.data, self.cond.data)
+        self.assertIs(cond.row_items, self.iris)
+
+        cond = Euclidean(axis=0).fit(self.iris)(self.iris, condensed=True)
+        np.testing.assert_almost_equal(
+            cond.data, scipy.spatial.distance.pdist(self.iris.X.T))
+        self.assertEqual(cond.axis, 0)
+
+        self.assertRaises(ValueError, Euclidean().fit(self.iris),
+                          self.iris, self.iris[:5], condensed=True)
+
+
 # noinspection PyTypeChecker
 class TestEuclidean(TestCase):
     @classmethod
@@ -963,6 +1071,18 @@ class TestDistances(TestCase):
         new_table = _preprocess(self.test5)
         self.assertFalse(np.isnan(new_table.X).any())
 
+    def test_float32(self):
+        iris = Table('iris')
+        iris32 = Table('iris', dtype=np.float32)
+        for distance in (Euclidean, Manhattan, Cosine, Jaccard):
+            for kwargs in ({}, {"axis": 0}):
+                dist = distance(iris32, **kwargs)
+                self.assertEqual(dist.dtype, np.float64)
+                np.testing.assert_allclose(dist, distance(iris, **kwargs),
+                                           rtol=1e-5, atol=1e-5)
+        np.testing.assert_allclose(Euclidean(iris32[:5], iris[:10]),
+                                   Euclidean(iris[:5], iris[:10]), rtol=1e-5, atol=1e-5)
+
     def test_distance_to_instance(self):
         iris = Table('iris')
         inst = Instance(iris.domain, np.concatenate((iris[1].x, iris[1].y)))
@@ -1,6 +1,8 @@
 # Test methods with long descriptive names can omit docstrings
 # pylint: disable=missing-docstring
+import gc
 import warnings
+import weakref
 from time import time
 from numbers import Real
 from itertools import starmap, chain
@@ -13,7 +15,7 @@ from numpy.testing import assert_array_equal
 from Orange.data import (
     ContinuousVariable, DiscreteVariable, StringVariable, TimeVariable,
     Variable, Domain, Table, DomainConversion)
-from Orange.data.domain import filter_visible
+from Orange.data.domain import filter_visible, CONVERSION_CACHE_SIZE
 from Orange.preprocess import Continuize, Impute
 from Orange.tests.base import create_pickling_tests
 from Orange.util import OrangeDeprecationWarning
@@ -448,6 +450,30 @@ class TestDomainInit(unittest.TestCase):
         unpickled_domain = pickle.loads(pickle.dumps(domain))
         self.assertTrue(hasattr(unpickled_domain, '_known_domains'))
 
+    def test_conversion_cache_is_bounded(self):
+        domain = Domain([ContinuousVariable("x")])
+        sources = [Domain([ContinuousVariable("x"),
+                           ContinuousVariable("y{}".format(i))])
+                   for i in range(CONVERSION_CACHE_SIZE + 5)]
+        conversions = [domain.get_conversion(source) for source in sources]
+        self.assertEqual(len(domain._known_domains), CONVERSION_CACHE_SIZE)
+        self.assertIs(domain.get_conversion(sources[-2]), conversions[-2])
+        # the oldest conversion was discarded
+        self.assertIsNot(domain.get_conversion(sources[0]), conversions[0])
+
+    def test_conversion_cache_does_not_keep_sources(self):
+        domain = Domain([ContinuousVariable("x")])
+        source = Domain([ContinuousVariable("x"), ContinuousVariable("y")])
+        conversion = domain.get_conversion(source)
+        self.assertIs(conversion.source, source)
+        ref = weakref.ref(source)
+        del source
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertIsNone(conversion.source)
+        self.assertEqual(len(domain._known_domains), 0)
+        pickle.loads(pickle.dumps(domain))
+
     def test_different_domains_with_same_attributes_are_equal(self):
         domain1 = Domain([])
         domain2 = Domain([])
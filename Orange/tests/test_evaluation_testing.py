@@ -36,6 +36,11 @@ class _ParameterTuningLearner(MajorityLearner):
         return learner(data)
 
 
+class _FailingLearner(MajorityLearner):
+    def __call__(self, data):
+        raise SystemError("failing learner")
+
+
 # noinspection PyUnresolvedReferences
 class TestSampling(unittest.TestCase):
     @classmethod
@@ -84,6 +89,29 @@ class TestSampling(unittest.TestCase):
                preprocessor=preprocessor)
         self.assertEqual(data_sizes, expected_sizes)
 
+    def run_test_n_jobs(self, method, *args, **kwargs):
+        learners = [NaiveBayesLearner(), _FailingLearner(), MajorityLearner()]
+        progress = []
+        serial = method(*args, learners=learners, store_models=True,
+                        **kwargs)
+        parallel = method(*args, learners=learners, store_models=True,
+                          callback=progress.append, n_jobs=2, **kwargs)
+        np.testing.assert_equal(parallel.row_indices, serial.row_indices)
+        np.testing.assert_equal(parallel.actual, serial.actual)
+        np.testing.assert_equal(parallel.predicted[[0, 2]],
+                                serial.predicted[[0, 2]])
+        np.testing.assert_almost_equal(parallel.probabilities[[0, 2]],
+                                       serial.probabilities[[0, 2]])
+        self.assertFalse(parallel.failed[0])
+        self.assertIsInstance(parallel.failed[1], SystemError)
+        self.assertFalse(parallel.failed[2])
+        self.assertEqual(parallel.models.shape, serial.models.shape)
+        for models in parallel.models:
+            self.assertIsInstance(models[0], learners[0].__returns__)
+            self.assertIsInstance(models[2], learners[2].__returns__)
+        self.assertEqual(len(progress), 3 * len(parallel.models) + 1)
+        self.assertEqual(progress, sorted(progress))
+
     def check_folds(self, result, folds_count, rows):
         self.assertEqual(len(result.folds), folds_count)
         fold_size = rows / folds_count
@@ -210,6 +238,9 @@ class TestCrossValidation(TestSampling):
     def test_preprocessor(self):
         self.run_test_preprocessor(CrossValidation, [135] * 10)
 
+    def test_n_jobs(self):
+        self.run_test_n_jobs(CrossValidation, self.iris, k=5)
+
     def test_augmented_data_classification(self):
         data = Table("iris")
         n_classes = len(data.domain.class_var.values)
@@ -373,6 +404,9 @@ class TestLeaveOneOut(TestSampling):
     def test_preprocessor(self):
         self.run_test_preprocessor(LeaveOneOut, [149] * 150)
 
+    def test_n_jobs(self):
+        self.run_test_n_jobs(LeaveOneOut, self.random_table[:30])
+
 
 class TestTestOnTrainingData(TestSampling):
     def test_results(self):
@@ -563,6 +597,9 @@ class TestTestOnTestData(TestSampling):
                        preprocessor=preprocessor)
         self.assertEqual(data_sizes, [30])
 
+    def test_n_jobs(self):
+        self.run_test_n_jobs(TestOnTestData, self.iris[::2], self.iris[1::2])
+
 
 class TestTrainTestSplit(unittest.TestCase):
     def test_fixed_training_size(self):
@@ -623,3 +660,7 @@ class TestShuffleSplit(TestSampling):
             strata_samples.append(np.count_nonzero(train < 2 * n) == n)
 
         self.assertTrue(not all(strata_samples))
+
+    def test_n_jobs(self):
+        self.run_test_n_jobs(ShuffleSplit, self.iris, n_resamples=4,
+                             test_size=.2)
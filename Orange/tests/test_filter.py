@@ -11,7 +11,8 @@ from Orange.data import Table, Domain, ContinuousVariable, DiscreteVariable, \
     StringVariable
 from Orange.data.filter import \
     FilterContinuous, FilterDiscrete, FilterString, Values, HasClass, \
-    IsDefined, SameValue, Random, ValueFilter, FilterStringList, FilterRegex
+    IsDefined, SameValue, Random, ValueFilter, FilterStringList, \
+    FilterRegex, compile_filter
 
 NIMOCK = MagicMock(side_effect=NotImplementedError())
 
@@ -364,6 +365,101 @@ class TestFilterString(unittest.TestCase):
         self.assertFalse(flt(self.inst))
 
 
+class TestCompileFilter(unittest.TestCase):
+    def setUp(self):
+        self.domain = Domain([DiscreteVariable("d", values="abcdef"),
+                              ContinuousVariable("c")],
+                             metas=[StringVariable("s")])
+        strings = ["abc", "", "Abc\nd", "x\0bc", "bca", "cab", "b c"]
+        self.data = Table.from_numpy(
+            self.domain, np.array([[0, 1], [1, 2], [2, 3], [3, 4], [4, 5],
+                                   [5, 6], [np.nan, 7]]),
+            metas=np.array(strings, dtype=object)[:, None])
+        self.strings = strings
+
+    def assert_selects(self, filter, expected):
+        np.testing.assert_equal(
+            compile_filter(filter, self.domain)(self.data), expected)
+
+    def test_discrete(self):
+        self.assert_selects(FilterDiscrete("d", ["b", 3]),
+                            [0, 1, 0, 1, 0, 0, 0])
+        self.assert_selects(FilterDiscrete("d", [0, 1, 2, 3, "f"]),
+                            [1, 1, 1, 1, 0, 1, 0])
+        self.assert_selects(FilterDiscrete("d", None),
+                            [1, 1, 1, 1, 1, 1, 0])
+        self.assertRaises(ValueError, compile_filter,
+                          FilterDiscrete("d", ["z"]), self.domain)
+
+    def test_string_search(self):
+        fs = FilterString
+        for oper, method in ((fs.Contains, str.__contains__),
+                             (fs.StartsWith, str.startswith),
+                             (fs.EndsWith, str.endswith)):
+            for ref in ("bc", "b", "c", "", "a", "x\0", "\nd"):
+                for case_sensitive in (True, False):
+                    f = fs("s", oper, ref, case_sensitive=case_sensitive)
+                    strings = self.strings if case_sensitive else \
+                        [s.lower() for s in self.strings]
+                    self.assert_selects(
+                        f, [method(s, ref) for s in strings])
+
+    def test_regex(self):
+        for pattern in ("^b", "c$", "b.", "\\s", "(?s)c.*b", "^$",
+                        "(?<=a)b", "\\Ab"):
+            self.assert_selects(
+                FilterRegex("s", pattern),
+                [FilterRegex("s", pattern)(s) for s in self.strings])
+
+    def test_string_list(self):
+        self.assert_selects(FilterStringList("s", ["abc", "Bca"]),
+                            [1, 0, 0, 0, 0, 0, 0])
+        self.assert_selects(
+            FilterStringList("s", ["abc", "Bca"], case_sensitive=False),
+            [1, 0, 0, 0, 1, 0, 0])
+
+    def test_values(self):
+        f = Values([FilterContinuous("c", FilterContinuous.Greater, 2),
+                    Values([FilterString("s", FilterString.Contains, "b"),
+                            FilterDiscrete("d", None)], conjunction=False,
+                           negate=True)])
+        self.assert_selects(f, [0, 0, 0, 0, 0, 0, 0])
+        f.conditions[1].negate = False
+        self.assert_selects(f, [0, 0, 1, 1, 1, 1, 1])
+        f.conjunction = False
+        self.assert_selects(f, [1, 1, 1, 1, 1, 1, 1])
+        f.negate = True
+        self.assert_selects(f, [0, 0, 0, 0, 0, 0, 0])
+
+    def test_column_indexes(self):
+        fc = FilterContinuous
+        filters = [fc("c", oper, ref, 5)
+                   for oper in (fc.Equal, fc.NotEqual, fc.Less, fc.LessEqual,
+                                fc.Greater, fc.GreaterEqual, fc.Between,
+                                fc.Outside, fc.IsDefined)
+                   for ref in (2, 2.5, 6, np.nan)]
+        filters += [fc("d", fc.Less, 2), fc("d", fc.NotEqual, 1),
+                    FilterDiscrete("d", ["b", 3]), FilterDiscrete("d", None),
+                    FilterDiscrete("d", list(range(6))),
+                    Values([fc("c", fc.Greater, 2),
+                            FilterDiscrete("d", [1, 4])], conjunction=False)]
+        indexed = self.data.copy()
+        indexed.use_column_indexes = True
+        for f in filters:
+            expected = compile_filter(f, self.domain)(self.data)
+            np.testing.assert_equal(
+                compile_filter(f, self.domain)(indexed), expected)
+            np.testing.assert_equal(
+                compile_filter(f, self.domain).evaluate(indexed, [2, 0, 6]),
+                expected[[2, 0, 6]])
+
+    def test_invalid(self):
+        self.assertRaises(TypeError, compile_filter,
+                          ValueFilter("s"), self.domain)
+        self.assertRaises(TypeError, compile_filter,
+                          FilterContinuous("c", None, 1), self.domain)
+
+
 class TestSameValueFilter(unittest.TestCase):
     def setUp(self):
         self.table = Table('zoo')
@@ -5,9 +5,17 @@ import unittest
 import os
 import tempfile
 import shutil
+import warnings
 
-from Orange.data.io import FileFormat, TabReader, CSVReader, PickleReader
+import numpy as np
+import scipy.sparse as sp
+
+from Orange.classification import TreeLearner
+from Orange.data import Table, Domain, DiscreteVariable
+from Orange.data.io import FileFormat, TabReader, CSVReader, PickleReader, \
+    BinaryReader
 from Orange.data.table import get_sample_datasets_dir
+from Orange.tests import named_file, assert_array_nanequal
 
 
 class WildcardReader(FileFormat):
@@ -100,3 +108,169 @@ class TestReader(unittest.TestCase):
         reader = PickleReader("")
         with unittest.mock.patch("pickle.load", return_value=None):
             self.assertRaises(TypeError, reader.read, "foo")
+
+
+class TestBinaryReader(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tempdir, "data.obin")
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_get_reader(self):
+        self.assertIsInstance(FileFormat.get_reader("t.obin"), BinaryReader)
+
+    def test_write_read_dense(self):
+        data = Table("zoo")
+        data.attributes = {"description": "zoo"}
+        data.save(self.filename)
+        new = Table.from_file(self.filename)
+        self.assertEqual(new.domain, data.domain)
+        np.testing.assert_equal(new.X, data.X)
+        np.testing.assert_equal(new.Y, data.Y)
+        np.testing.assert_equal(new.metas, data.metas)
+        np.testing.assert_equal(new.ids, data.ids)
+        self.assertEqual(new.attributes, data.attributes)
+        self.assertEqual(new.name, "data")
+
+    def test_arrays_are_mapped(self):
+        data = Table("iris")
+        data.set_weights(np.arange(len(data)))
+        data.save(self.filename)
+        new = Table.from_file(self.filename)
+        self.assertIsInstance(new.X, np.memmap)
+        self.assertIsInstance(new.W, np.memmap)
+        self.assertTrue(new.X.flags.f_contiguous)
+        np.testing.assert_equal(new.W, data.W)
+        # changes are not written into the file
+        new.X[0, 0] = 42
+        self.assertEqual(Table.from_file(self.filename).X[0, 0],
+                         data.X[0, 0])
+
+    def test_tree_on_mapped_data(self):
+        # compiled code requires writable buffers
+        for name in ("iris", "heart_disease"):
+            data = Table(name)
+            data.save(self.filename)
+            new = Table.from_file(self.filename)
+            model = TreeLearner()(new)
+            np.testing.assert_equal(model(new), TreeLearner()(data)(data))
+
+    def test_encoded_metas(self):
+        data = Table("zoo")
+        data.save(self.filename)
+        with open(self.filename, "rb") as f:
+            content = f.read()
+        # Files must not refer to classes that older versions do not have
+        self.assertNotIn(b"EncodedColumns", content)
+        new = Table.from_file(self.filename)
+        self.assertEqual(new.metas.dtype, object)
+        np.testing.assert_equal(new.metas, data.metas)
+
+    def test_numeric_metas(self):
+        data = Table("iris")
+        domain = Domain(data.domain.attributes[:2], data.domain.class_var,
+                        data.domain.attributes[2:])
+        data = data.transform(domain)
+        data.save(self.filename)
+        new = Table.from_file(self.filename)
+        self.assertEqual(new.metas.dtype, np.float64)
+        np.testing.assert_equal(new.metas, data.metas)
+
+    def test_sparse(self):
+        data = Table("iris").to_sparse()
+        data.save(self.filename)
+        new = Table.from_file(self.filename)
+        self.assertTrue(sp.isspmatrix_csr(new.X))
+        np.testing.assert_equal(new.X.toarray(), data.X.toarray())
+        np.testing.assert_equal(new.Y, data.Y)
+
+    def test_empty(self):
+        data = Table("iris")[:0]
+        data.save(self.filename)
+        new = Table.from_file(self.filename)
+        self.assertEqual(len(new), 0)
+        self.assertEqual(new.domain, data.domain)
+
+    def test_invalid_file(self):
+        with open(self.filename, "wb") as f:
+            f.write(b"not a table")
+        self.assertRaises(ValueError, BinaryReader(self.filename).read)
+
+
+class TestIterChunks(unittest.TestCase):
+
+    def test_chunks_match_table(self):
+        data = Table("heart_disease")
+        chunks = list(FileFormat.iter_chunks("heart_disease.tab",
+                                             chunk_rows=100, sample_rows=50))
+        self.assertEqual([len(chunk) for chunk in chunks], [100, 100, 100, 3])
+        for chunk in chunks:
+            self.assertEqual(chunk.domain, data.domain)
+            self.assertEqual(chunk.name, "heart_disease")
+        assert_array_nanequal(np.vstack([chunk.X for chunk in chunks]),
+                              data.X)
+        np.testing.assert_equal(np.hstack([chunk.Y for chunk in chunks]),
+                                data.Y)
+
+    def test_all_types(self):
+        content = "\n".join(["a\tb\tc\td\tw",
+                             "d\tc\tstring\ttime\tc",
+                             "class\t\tmeta\t\tweight",
+                             "x\t1.5\tfoo\t2017-01-01\t1",
+                             "y\t?\t\t2017-01-02\t2",
+                             "",
+                             "z\t3\tbar\t?\t3"])
+        with named_file(content, suffix=".tab") as fn:
+            data = Table(fn)
+            chunks = list(FileFormat.iter_chunks(fn, chunk_rows=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+        self.assertEqual(chunks[0].domain, data.domain)
+        assert_array_nanequal(np.vstack([chunk.X for chunk in chunks]),
+                              data.X)
+        np.testing.assert_equal(np.hstack([chunk.W for chunk in chunks]),
+                                data.W)
+        np.testing.assert_equal(np.vstack([chunk.metas for chunk in chunks]),
+                                data.metas)
+        np.testing.assert_equal(np.hstack([chunk.Y for chunk in chunks]),
+                                data.Y)
+
+    def test_values_outside_sample(self):
+        DiscreteVariable._clear_cache()
+        content = "\n".join(["chunk_class", "x", "y", "z", "x"])
+        with named_file(content, suffix=".tab") as fn:
+            chunks = list(FileFormat.iter_chunks(fn, chunk_rows=3,
+                                                 sample_rows=2))
+        self.assertEqual(chunks[0].domain["chunk_class"].values, ["x", "y"])
+        np.testing.assert_equal(chunks[0].X[:, 0], [0, 1, np.nan])
+        np.testing.assert_equal(chunks[1].X[:, 0], [0])
+
+    def test_invalid_values_outside_sample(self):
+        content = "\n".join(["chunk_x\tchunk_t", "c\ttime", "",
+                             "1\t2017-01-01", "2\t2017-01-02",
+                             "foo\t2017-01-03", "4\tbar"])
+        with named_file(content, suffix=".tab") as fn, \
+                warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            chunks = list(FileFormat.iter_chunks(fn, chunk_rows=3,
+                                                 sample_rows=2))
+        self.assertTrue(chunks[0].domain["chunk_t"].is_time)
+        np.testing.assert_equal(chunks[0].X[:, 0], [1, 2, np.nan])
+        np.testing.assert_equal(chunks[1].X[:, 0], [4])
+        self.assertTrue(np.isnan(chunks[1].X[0, 1]))
+        messages = [str(warning.message) for warning in w]
+        self.assertTrue(any("'chunk_x'" in msg and "'foo'" in msg
+                            for msg in messages))
+        self.assertTrue(any("'chunk_t'" in msg and "'bar'" in msg
+                            for msg in messages))
+
+    def test_non_streaming_format(self):
+        data = Table("iris")
+        with named_file("", suffix=".obin") as fn:
+            data.save(fn)
+            chunks = list(BinaryReader.iter_chunks(fn, chunk_rows=60))
+        self.assertEqual([len(chunk) for chunk in chunks], [60, 60, 30])
+        np.testing.assert_equal(np.vstack([chunk.X for chunk in chunks]),
+                                data.X)
@@ -1,6 +1,7 @@
 # Test methods with long descriptive names can omit docstrings
 # pylint: disable=missing-docstring
 
+import pickle
 import unittest
 
 import numpy as np
@@ -8,6 +9,7 @@ import numpy as np
 from Orange.data import Table, Domain, ContinuousVariable, DiscreteVariable
 from Orange.classification import KNNLearner
 from Orange.regression import KNNRegressionLearner
+from Orange.distance.neighbors import index_cache
 from Orange.evaluation import CA, CrossValidation, MSE
 
 
@@ -58,6 +60,24 @@ class TestKNNLearner(unittest.TestCase):
         ca = CA(results)
         self.assertGreater(ca, 0.8)
 
+    def test_KNN_reuses_tree(self):
+        index_cache.clear()
+        models = [KNNLearner(n_neighbors=k)(self.iris) for k in (3, 5)]
+        self.assertEqual(index_cache.info().hits, 1)
+        self.assertEqual(index_cache.info().currsize, 1)
+        # pickled models do not depend on the cache
+        model = pickle.loads(pickle.dumps(models[1]))
+        np.testing.assert_equal(model(self.iris), models[1](self.iris))
+
+        KNNLearner(metric="manhattan")(self.iris)
+        KNNLearner(algorithm="brute")(self.iris)
+        KNNLearner(metric="mahalanobis")(self.iris)
+        self.assertEqual(index_cache.info().currsize, 2)
+
+        model = KNNLearner(leaf_size=10)(self.iris)
+        self.assertEqual(index_cache.info().currsize, 3)
+        self.assertEqual(model.skl_model._tree.get_arrays()[2].shape, (15, ))
+
     def test_KNN_regression(self):
         learners = [KNNRegressionLearner(),
                     KNNRegressionLearner(metric="mahalanobis")]
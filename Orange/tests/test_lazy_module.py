@@ -0,0 +1,80 @@
+# Test methods with long descriptive names can omit docstrings
+# pylint: disable=missing-docstring
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from types import ModuleType
+from unittest.mock import Mock
+
+from Orange.misc.lazy_module import lazy_attributes, call_before_import
+
+
+class TestLazyAttributes(unittest.TestCase):
+    def setUp(self):
+        self.module = ModuleType("lazy_test_module")
+        sys.modules[self.module.__name__] = self.module
+
+    def tearDown(self):
+        del sys.modules[self.module.__name__]
+
+    def test_lazy_attributes(self):
+        import json
+        lazy_attributes(self.module.__name__,
+                        {"json": "json", "dumps": "json"})
+        self.assertNotIn("json", self.module.__dict__)
+        self.assertIn("json", dir(self.module))
+        self.assertIs(self.module.json, json)
+        self.assertIs(self.module.dumps, json.dumps)
+        self.assertIs(self.module.__dict__["dumps"], json.dumps)
+        self.assertRaises(AttributeError, getattr, self.module, "loads")
+        self.assertFalse(hasattr(self.module, "loads"))
+
+        lazy_attributes(self.module.__name__, {"loads": "json"})
+        self.assertIs(self.module.loads, json.loads)
+
+    def test_existing_attributes_take_precedence(self):
+        self.module.dumps = 42
+        lazy_attributes(self.module.__name__, {"dumps": "json"})
+        self.assertEqual(self.module.dumps, 42)
+
+
+class TestCallBeforeImport(unittest.TestCase):
+    def test_call_before_import(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "lazy_test_trigger.py"), "w") as f:
+                f.write("import lazy_test_callback\nVALUE = 42\n")
+            sys.path.insert(0, tmp)
+            try:
+                callback = Mock(side_effect=lambda: sys.modules.setdefault(
+                    "lazy_test_callback", ModuleType("lazy_test_callback")))
+                call_before_import(["lazy_test_trigger"], callback)
+                callback.assert_not_called()
+
+                import lazy_test_trigger
+                callback.assert_called_once_with()
+                self.assertEqual(lazy_test_trigger.VALUE, 42)
+
+                call_before_import(["lazy_test_trigger"], callback)
+                self.assertEqual(callback.call_count, 2)
+            finally:
+                sys.path.remove(tmp)
+                sys.modules.pop("lazy_test_trigger", None)
+                sys.modules.pop("lazy_test_callback", None)
+
+
+class TestStartup(unittest.TestCase):
+    def test_import_data_is_lazy(self):
+        heavy = ["Orange.data.io", "Orange.data.sql", "Orange.data.pandas_compat",
+                 "Orange.widgets", "AnyQt", "PyQt4", "PyQt5", "pyqtgraph"]
+        code = "import sys, Orange.data; " \
+               "print([m for m in {!r} if m in sys.modules]); " \
+               "print(Orange.data.FileFormat.__module__)".format(heavy)
+        output = subprocess.check_output([sys.executable, "-c", code],
+                                         universal_newlines=True)
+        self.assertEqual(output.split(), ["[]", "Orange.data.io"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@
 
 import unittest
 import numpy as np
+import sklearn.manifold as skl_manifold
 
 from Orange.projection import (MDS, Isomap, LocallyLinearEmbedding,
                                SpectralEmbedding, TSNE)
@@ -117,6 +118,18 @@ class TestManifold(unittest.TestCase):
         se = se(data)
         self.assertEqual((data.X.shape[0], n_com), se.embedding_.shape)
 
+    def test_se_neighbors(self):
+        data = self.ionosphere
+        se = SpectralEmbedding(n_neighbors=5, random_state=0)(data)
+        skl_se = skl_manifold.SpectralEmbedding(n_neighbors=5, random_state=0)
+        np.testing.assert_almost_equal(
+            np.abs(se.embedding_), np.abs(skl_se.fit(data.X).embedding_))
+        self.assertEqual(se.affinity, "nearest_neighbors")
+
+        se = SpectralEmbedding(n_neighbors=5, random_state=0,
+                               neighbors_algorithm="approximate")(data)
+        self.assertEqual((len(data), 2), se.embedding_.shape)
+
     def test_tsne(self):
         data = self.ionosphere[:50]
         for i in range(1, 4):
@@ -50,3 +50,15 @@ class TestMeanLearner(unittest.TestCase):
     def test_discrete(self):
         iris = Table('iris')
         self.assertRaises(ValueError, self.learn, iris)
+
+    def test_partial_fit(self):
+        x = np.random.randint(1, 4, (100, 3))
+        y = np.random.randint(0, 5, (100, 1)) / 3.0
+        w = np.random.random((100, 1))
+        t = Table(x, y, W=w)
+        clf = self.learn.partial_fit(t[:30])
+        clf = self.learn.partial_fit(t[30:80], clf)
+        clf = self.learn.partial_fit(t[80:], clf)
+        self.assertAlmostEqual(clf.mean, np.average(y.ravel(), weights=w.ravel()))
+        self.assertAlmostEqual(clf.dist[1].sum(), w.sum())
+        np.testing.assert_almost_equal(clf.dist, self.learn(t).dist)
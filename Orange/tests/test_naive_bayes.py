@@ -3,9 +3,13 @@
 
 import unittest
 
+import numpy as np
+
 from Orange.classification import NaiveBayesLearner
 from Orange.data import Table, Domain, DiscreteVariable, ContinuousVariable
+from Orange.data.io import FileFormat
 from Orange.evaluation import CrossValidation, CA
+from Orange.tests import named_file
 
 
 class TestNaiveBayesLearner(unittest.TestCase):
@@ -53,3 +57,24 @@ class TestNaiveBayesLearner(unittest.TestCase):
         data = Table('voting')
         results = CrossValidation(data, [self.learner])
         self.assertFalse(any(results.failed))
+
+    def test_partial_fit(self):
+        data = Table('titanic')
+        data.shuffle()
+        model = self.learner(data)
+        chunks = (data[i:i + 500] for i in range(0, len(data), 500))
+        chunked = self.learner.fit_chunks(chunks)
+        np.testing.assert_almost_equal(chunked.class_prob, model.class_prob)
+        for prob1, prob2 in zip(chunked.log_cont_prob, model.log_cont_prob):
+            np.testing.assert_almost_equal(prob1, prob2)
+        np.testing.assert_equal(chunked(data), model(data))
+
+    def test_partial_fit_from_file(self):
+        data = Table('titanic')
+        with named_file("", suffix=".tab") as fn:
+            data.save(fn)
+            model = self.learner.fit_chunks(
+                FileFormat.iter_chunks(fn, chunk_rows=300))
+        np.testing.assert_almost_equal(model.class_prob,
+                                       self.model.class_prob)
+        self.assertTrue(self.learner.supports_partial_fit)
@@ -9,6 +9,8 @@ import scipy.sparse as sp
 from Orange.data import Table, Domain, DiscreteVariable, ContinuousVariable
 from Orange.classification.tree import \
     TreeModel, Node, DiscreteNode, MappedDiscreteNode, NumericNode
+from Orange.tests import named_file
+from Orange.tree import CompiledTreeModel
 
 
 class TestTree:
@@ -63,6 +65,16 @@ class TestTree:
             tree = self.TreeLearner(max_depth=i)(self.data)
             self.assertEqual(tree.depth(), i)
 
+    def test_float32(self):
+        data = self.data.transform(self.data.domain, np.float32)
+        model = self.TreeLearner()(data)
+        model64 = self.TreeLearner()(self.data)
+        self.assertEqual(model.node_count(), model64.node_count())
+        np.testing.assert_allclose(model(data), model64(self.data),
+                                   rtol=1e-5)
+        np.testing.assert_allclose(model(data.to_sparse()), model(data),
+                                   rtol=1e-5)
+
     def test_refuse_binarize_too_many_values(self):
         clf = self.TreeLearner(binarize=True)
         lim = clf.MAX_BINARIZATION
@@ -217,6 +229,82 @@ class TestClassifier(TestTree, unittest.TestCase):
         cls.prediction_on_0_1 = np.array([[0.5, 0.5, 0]])
 
 
+class TestBinnedClassifier(TestClassifier):
+    @staticmethod
+    def TreeLearner(**kwargs):
+        from Orange.classification import TreeLearner
+        return TreeLearner(max_bins=255, **kwargs)
+
+    def test_same_as_exact(self):
+        # With fewer distinct values than bins, the same thresholds are
+        # considered as in exact search
+        from Orange.classification import TreeLearner
+        def describe(tree):
+            return [(type(node), node.attr_idx,
+                     getattr(node, "threshold", None), list(node.subset))
+                    for node in self.all_nodes(tree.root)]
+
+        for data in (self.data, Table("titanic")):
+            for binarize in (False, True):
+                exact = TreeLearner(binarize=binarize)(data)
+                binned = self.TreeLearner(binarize=binarize)(data)
+                self.assertEqual(describe(exact), describe(binned))
+                np.testing.assert_equal(exact._values, binned._values)
+                np.testing.assert_equal(exact(data), binned(data))
+
+    def test_quantized(self):
+        from Orange.classification import TreeLearner
+        domain = Domain([ContinuousVariable("x"),
+                         DiscreteVariable("r1", values="abcd"),
+                         ContinuousVariable("r2")],
+                        self.class_var)
+        n = 1000
+        x = np.random.random((n, 4))
+        x[:, 1] = np.random.randint(0, 4, n)
+        x[:, 3] = (x[:, 0] + x[:, 2] > 1).astype(float)
+        x[::7, 0] = np.nan
+        x[::11, 1] = np.nan
+        data = Table(domain, x)
+
+        learner = TreeLearner(max_bins=16, min_samples_leaf=5)
+        tree = learner(data)
+        binned, n_bins, bounds = learner._quantize(data)
+        self.assertEqual(n_bins, 16)
+        self.assertLessEqual(np.max(binned[:, 0][~np.isnan(x[:, 0])]), 15)
+        np.testing.assert_equal(binned[::7, 0], n_bins)
+        np.testing.assert_equal(binned[::11, 1], n_bins)
+        self.assertIsNone(bounds[1])
+        self.assertEqual(len(bounds[0]), 15)
+
+        for node in self.all_nodes(tree.root):
+            # distributions must match the data, although they were computed
+            # from the parent's histograms
+            np.testing.assert_equal(
+                node.value, np.bincount(data.Y[node.subset].astype(int),
+                                        minlength=3))
+            self.assertGreaterEqual(len(node.subset), 5)
+            if isinstance(node, NumericNode):
+                self.assertIn(node.threshold, bounds[node.attr_idx])
+                col = data.X[node.subset, node.attr_idx]
+                for br, child in enumerate(node.children):
+                    if child is not None:
+                        np.testing.assert_equal(
+                            child.subset,
+                            node.subset[~np.isnan(col) &
+                                        ((col > node.threshold) == br)])
+        self.assertGreater(np.mean(tree(data) == data.Y), 0.9)
+
+    def test_invalid_max_bins(self):
+        from Orange.classification import TreeLearner
+        self.assertRaises(ValueError, TreeLearner(max_bins=1), self.data)
+        self.assertRaises(ValueError, TreeLearner(max_bins=256), self.data)
+        domain = Domain(
+            [DiscreteVariable("x", ["v{}".format(i) for i in range(300)])],
+            self.class_var)
+        data = Table(domain, np.zeros((10, 2)))
+        self.assertRaises(ValueError, TreeLearner(max_bins=16), data)
+
+
 class TestRegressor(TestTree, unittest.TestCase):
     from Orange.regression import TreeLearner
 
@@ -403,6 +491,30 @@ class TestTreeModel(unittest.TestCase):
              [ 7 42]     v3 d or e
 """)
 
+    def test_compiled_model(self):
+        model = TreeModel(self.data, self.root)
+        compiled = CompiledTreeModel(self.domain, [model.compiled()] * 2)
+        nan = float("nan")
+        x = np.array([[nan, 0, 0], [13, 1, 0], [14, 2, 2]])
+        np.testing.assert_equal(compiled.predict(x), [0, 3, 6])
+        np.testing.assert_equal(compiled.predict(sp.csc_matrix(x)), [0, 3, 6])
+
+        with named_file("", suffix=".oct") as fn:
+            compiled.save(fn)
+            loaded = CompiledTreeModel.load(fn)
+            self.assertEqual(len(loaded.trees), 2)
+            self.assertEqual([var.name for var in loaded.domain.variables],
+                             [var.name for var in self.domain.variables])
+            for tree in loaded.trees:
+                np.testing.assert_equal(tree.code, model._code)
+                np.testing.assert_equal(tree.values, model._values)
+            np.testing.assert_equal(loaded.predict(x), [0, 3, 6])
+            del loaded, tree
+
+            with open(fn, "wb") as f:
+                f.write(b"not a tree")
+            self.assertRaises(ValueError, CompiledTreeModel.load, fn)
+
     def test_compile_and_run_cont_sparse(self):
         # pylint: disable=protected-access
         model = TreeModel(self.data, self.root)
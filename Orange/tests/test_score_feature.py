@@ -38,6 +38,46 @@ class FeatureScoringTest(unittest.TestCase):
         np.testing.assert_almost_equal([scorer(self.zoo, a) for a in range(5)],
                                        correct, decimal=5)
 
+    def test_score_all_features(self):
+        for scorer in (InfoGain(), GainRatio(), Gini()):
+            scores = scorer(self.adult)
+            self.assertEqual(len(scores), len(self.adult.domain.attributes))
+            self.assertFalse(np.any(np.isnan(scores)))
+            np.testing.assert_almost_equal(
+                scores[:5], [scorer(self.adult, a) for a in range(5)])
+            np.testing.assert_almost_equal(
+                scorer(self.zoo)[:5], [scorer(self.zoo, a) for a in range(5)])
+
+    def test_score_sparse(self):
+        data = Table("heart_disease")
+        data = preprocess.Continuize()(preprocess.Impute()(data))
+        sparse = data.to_sparse()
+        for scorer in (InfoGain(), GainRatio(), Gini(), FCBF(), Chi2(),
+                       ANOVA()):
+            np.testing.assert_almost_equal(scorer(sparse), scorer(data))
+
+    def test_from_contingency(self):
+        cont = np.array([[3, 0, 2], [1, 0, 4]])
+        np.testing.assert_almost_equal(
+            InfoGain().from_contingency(cont, 1), 0.124511, decimal=5)
+        # Values that do not appear are ignored
+        np.testing.assert_almost_equal(
+            Gini().from_contingency(cont, 0.5),
+            Gini().from_contingency(cont[:, [0, 2]], 0.5))
+
+        class Majority(preprocess.score.ClassificationScorer):
+            def from_contingency(self, cont, nan_adjustment):
+                self.shapes.append(cont.shape)
+                return np.max(np.sum(cont, axis=1)) / np.sum(cont)
+
+        scorer = Majority()
+        scorer.shapes = []
+        scores = scorer(self.zoo)
+        self.assertEqual(len(scores), len(self.zoo.domain.attributes))
+        # Padding is removed before calling from_contingency
+        self.assertEqual(scorer.shapes[0], (7, 2))
+        self.assertAlmostEqual(scores[0], 41 / 101)
+
     def test_classless(self):
         classless = Table(Domain(self.zoo.domain.attributes),
                           self.zoo[:, 0:-1])
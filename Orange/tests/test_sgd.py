@@ -26,6 +26,20 @@ class TestSGDRegressionLearner(unittest.TestCase):
         mod = lrn(Table("housing"))
         self.assertEqual(len(mod.coefficients), len(mod.domain.attributes))
 
+    def test_partial_fit(self):
+        nrows, ncols = 500, 5
+        rs = np.random.RandomState(0)
+        X = rs.rand(nrows, ncols)
+        y = X.dot(rs.rand(ncols))
+        data = Table(X, y)
+        sgd = SGDRegressionLearner(random_state=0)
+        self.assertTrue(sgd.supports_partial_fit)
+        model = sgd.fit_chunks(data[i:i + 50]
+                               for _ in range(5) for i in range(0, 500, 50))
+        self.assertEqual(len(model.coefficients), ncols)
+        self.assertLess(np.mean((model(data) - y) ** 2), np.var(y) / 4)
+
+
 
 class TestSGDClassificationLearner(unittest.TestCase):
     @classmethod
@@ -41,3 +55,14 @@ class TestSGDClassificationLearner(unittest.TestCase):
         lrn = SGDClassificationLearner()
         mod = lrn(self.iris)
         self.assertEqual(len(mod.coefficients[0]), len(mod.domain.attributes))
+
+    def test_partial_fit(self):
+        lrn = SGDClassificationLearner(random_state=0)
+        # the first chunk contains a single class
+        model = lrn.partial_fit(self.iris[:50])
+        for _ in range(5):
+            for i in range(50, 150, 50):
+                model = lrn.partial_fit(self.iris[i:i + 50], model)
+        self.assertEqual(len(model.coefficients), 3)
+        np.testing.assert_equal(model.used_vals[0], [0, 1, 2])
+        self.assertGreater(np.mean(model(self.iris) == self.iris.Y), 0.6)
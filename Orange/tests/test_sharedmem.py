@@ -0,0 +1,70 @@
+# Test methods with long descriptive names can omit docstrings
+# pylint: disable=missing-docstring
+import multiprocessing as mp
+import os
+import pickle
+import unittest
+
+import numpy as np
+import scipy.sparse as sp
+
+from Orange.classification import TreeLearner
+from Orange.data import Table
+from Orange.data.sharedmem import SharedTable
+
+
+def _fit_tree(handle):
+    data = handle.table
+    model = TreeLearner()(data)
+    return isinstance(data.X, np.memmap), list(model(data))
+
+
+class TestSharedTable(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = Table("zoo")
+
+    def test_pickle(self):
+        with SharedTable(self.data) as handle:
+            pickled = pickle.dumps(handle)
+            self.assertLess(len(pickled), 300)
+            table = pickle.loads(pickled).table
+            self.assertEqual(table.domain, self.data.domain)
+            self.assertEqual(table.name, self.data.name)
+            self.assertIsInstance(table.X, np.memmap)
+            np.testing.assert_equal(table.X, self.data.X)
+            np.testing.assert_equal(table.Y, self.data.Y)
+            np.testing.assert_equal(table.metas, self.data.metas)
+            np.testing.assert_equal(table.ids, self.data.ids)
+
+    def test_sparse(self):
+        data = Table("iris").to_sparse()
+        with SharedTable(data) as handle:
+            table = pickle.loads(pickle.dumps(handle)).table
+        self.assertTrue(sp.isspmatrix_csr(table.X))
+        np.testing.assert_equal(table.X.toarray(), data.X.toarray())
+
+    def test_close(self):
+        handle = SharedTable(self.data)
+        copy = pickle.loads(pickle.dumps(handle))
+        copy.close()
+        self.assertTrue(os.path.exists(handle.name))
+        handle.close()
+        self.assertFalse(os.path.exists(handle.name))
+        handle.close()
+
+    def test_garbage_collected(self):
+        handle = SharedTable(self.data)
+        name = handle.name
+        del handle
+        self.assertFalse(os.path.exists(name))
+
+    def test_worker_processes(self):
+        expected = list(TreeLearner()(self.data)(self.data))
+        with SharedTable(self.data) as handle, mp.Pool(2) as pool:
+            results = pool.map(_fit_tree, [handle] * 4)
+        self.assertEqual(results, [(True, expected)] * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
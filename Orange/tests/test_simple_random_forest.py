@@ -26,6 +26,45 @@ class TestSimpleRandomForestLearner(unittest.TestCase):
         p = clf(data)
         self.assertEqual(p.shape, (len(data),))
 
+    def test_SimpleRandomForest_threads_are_deterministic(self):
+        data = Orange.data.Table('iris')
+        forests = [SimpRandForestCls(n_jobs=n_jobs)(data)
+                   for n_jobs in (1, 4)]
+        for tree1, tree2 in zip(*(forest.estimators_ for forest in forests)):
+            self.assertEqual(tree1.dumps_tree(tree1.node),
+                             tree2.dumps_tree(tree2.node))
+        np.testing.assert_equal(forests[0](data, forests[0].Probs),
+                                forests[1](data, forests[1].Probs))
+
+    def test_SimpleRandomForest_seeds(self):
+        data = Orange.data.Table('iris')
+        forest = SimpRandForestCls(n_estimators=3, seed=1)(data)
+        trees = [tree.dumps_tree(tree.node) for tree in forest.estimators_]
+        self.assertEqual(len(set(trees)), 3)
+        tree = SimpRandForestCls(n_estimators=1, seed=2)(data).estimators_[0]
+        self.assertEqual(tree.dumps_tree(tree.node), trees[1])
+
+    def test_SimpleRandomForest_predicts_average_of_trees(self):
+        data = Orange.data.Table('iris')
+        clf = SimpRandForestCls(n_estimators=5)(data)
+        expected = np.mean([tree(data, tree.Probs)
+                            for tree in clf.estimators_], axis=0)
+        np.testing.assert_almost_equal(clf(data, clf.Probs), expected)
+
+        data = Orange.data.Table('housing')
+        reg = SimpRandForestReg(n_estimators=5)(data)
+        expected = np.mean([tree(data) for tree in reg.estimators_], axis=0)
+        np.testing.assert_almost_equal(reg(data), expected)
+
+
+    def test_SimpleRandomForest_float32(self):
+        for data, learner in ((Orange.data.Table('iris'), SimpRandForestCls),
+                              (Orange.data.Table('housing'), SimpRandForestReg)):
+            data32 = data.transform(data.domain, dtype=np.float32)
+            data64 = data32.transform(data.domain, dtype=np.float64)
+            model = learner(n_estimators=5, seed=1)(data32)
+            expected = learner(n_estimators=5, seed=1)(data64)
+            np.testing.assert_almost_equal(model(data32), expected(data64))
 
 if __name__ == '__main__':
     unittest.main()
@@ -59,6 +59,29 @@ class TestSimpleTreeLearner(unittest.TestCase):
         p_ = clf_(self.data_cls, clf.Probs)
         np.testing.assert_almost_equal(p, p_)
 
+    def test_SimpleTree_compiled(self):
+        for data, learner in ((self.data_cls, SimpleTreeCls()),
+                              (self.data_reg, SimpleTreeReg())):
+            model = learner(data)
+            tree = model.compiled()
+            self.assertEqual(len(tree.values), len(tree.thresholds))
+            # pickling goes through the compiled tree; sums in regression
+            # trees are restored from means, so they are only approximate
+            tree_ = pickle.loads(pickle.dumps(model)).compiled()
+            np.testing.assert_equal(tree_.code, tree.code)
+            np.testing.assert_equal(tree_.thresholds, tree.thresholds)
+            np.testing.assert_allclose(tree_.values, tree.values, rtol=1e-6)
+
+            known = ~np.isnan(data.X).any(axis=1)
+            values = tree.get_values(data.X[known])
+            if data.domain.has_discrete_class:
+                values /= values.sum(axis=1)[:, None]
+                expected = model(data[known], model.Probs)
+            else:
+                values = values[:, 0]
+                expected = model(data[known])
+            np.testing.assert_almost_equal(values, expected)
+
     def test_SimpleTree_classification_tree(self):
         lrn = SimpleTreeCls(min_instances=6, max_majority=0.7)
         clf = lrn(self.data_cls)
@@ -92,6 +115,17 @@ class TestSimpleTreeLearner(unittest.TestCase):
             '{ 2 3.71094 0.27028 } { 2 5.18490 3.70920 } } { 2 5.77083 5.93398 '
             '} } } }')
 
+    def test_SimpleTree_float32(self):
+        for data, learner in ((self.data_cls, SimpleTreeCls),
+                              (self.data_reg, SimpleTreeReg)):
+            data32 = data.transform(data.domain, dtype=np.float32)
+            data64 = data32.transform(data.domain, dtype=np.float64)
+            model = learner(min_instances=5)(data32)
+            expected = learner(min_instances=5)(data64)
+            self.assertEqual(model.dumps_tree(model.node),
+                             expected.dumps_tree(expected.node))
+            np.testing.assert_almost_equal(model(data32), expected(data64))
+
     def test_SimpleTree_single_instance(self):
         data = Orange.data.Table('iris')
         lrn = SimpleTreeCls()
@@ -1,12 +1,15 @@
 import unittest
 from itertools import chain
 from functools import partial, wraps
+from unittest.mock import patch
 
 import numpy as np
 from scipy.sparse import csr_matrix, issparse, lil_matrix, csc_matrix
 
-from Orange.statistics.util import bincount, countnans, contingency, stats, \
-    nanmin, nanmax, unique, nanunique, mean, nanmean, digitize, var, nansum, nanmedian
+from Orange.statistics import util
+from Orange.statistics.util import bincount, countnans, contingency, \
+    contingencies, stats, nanmin, nanmax, unique, nanunique, mean, nanmean, \
+    digitize, var, nansum, nanmedian
 
 
 def dense_sparse(test_case):
@@ -66,6 +69,57 @@ class TestUtil(unittest.TestCase):
                                              [0, 0, 0]])
         np.testing.assert_equal(nans, [1, 0, 0])
 
+    def test_contingencies(self):
+        x = np.array([[0, 1, 2, 0],
+                      [1, 1, np.nan, 1],
+                      [0, 2, 2, 2],
+                      [2, 0, 0, 3],
+                      [np.nan, 0, 1, 0]])
+        y = np.array([0, 0, 1, np.nan, 0])
+        conts, nans = contingencies(x, y, [3, 3, 3, 4], 2)
+        np.testing.assert_equal(conts, [[[1, 1, 0, 0], [1, 0, 0, 0]],
+                                        [[1, 2, 0, 0], [0, 0, 1, 0]],
+                                        [[0, 1, 1, 0], [0, 0, 1, 0]],
+                                        [[2, 1, 0, 0], [0, 0, 1, 0]]])
+        np.testing.assert_equal(nans, [[1, 0], [0, 0], [1, 0], [0, 0]])
+
+        w = np.array([1, 2, 2, 3, 4])
+        conts, nans = contingencies(x, y, 3, 2, weights=w, columns=[2, 0])
+        np.testing.assert_equal(conts, [[[0, 4, 1], [0, 0, 2]],
+                                        [[1, 2, 0], [2, 0, 0]]])
+        np.testing.assert_equal(nans, [[2, 0], [4, 0]])
+
+    def test_contingencies_sparse(self):
+        rng = np.random.RandomState(0)
+        x = rng.randint(0, 4, (100, 10)).astype(float)
+        x[rng.rand(100, 10) < 0.5] = 0
+        x[rng.rand(100, 10) < 0.1] = np.nan
+        y = rng.randint(0, 3, 100).astype(float)
+        y[:5] = np.nan
+        w = rng.rand(100)
+        sparse = csc_matrix(x)
+        sparse[0, 0] = 0  # explicit zero
+        for weights in (None, w):
+            dense = contingencies(x, y, 4, 3, weights, [1, 3, 4])
+            for array in (sparse, csr_matrix(x)):
+                conts, nans = contingencies(array, y, 4, 3, weights, [1, 3, 4])
+                np.testing.assert_almost_equal(conts, dense[0])
+                np.testing.assert_almost_equal(nans, dense[1])
+
+    def test_contingencies_threads(self):
+        rng = np.random.RandomState(0)
+        x = rng.randint(0, 4, (100, 10)).astype(float)
+        x[rng.rand(100, 10) < 0.1] = np.nan
+        y = rng.randint(0, 3, 100).astype(float)
+        single = contingencies(x, y, 4, 3)
+        with patch.object(util, "_MIN_BLOCK_SIZE", 100):
+            for n_jobs in (2, 3, -1):
+                threaded = contingencies(x, y, 4, 3, n_jobs=n_jobs)
+                np.testing.assert_equal(threaded[0], single[0])
+                np.testing.assert_equal(threaded[1], single[1])
+        np.testing.assert_equal(np.sum(single[0], axis=(1, 2)) +
+                                np.sum(single[1], axis=1), 100)
+
     def test_stats(self):
         X = np.arange(4).reshape(2, 2).astype(float)
         X[1, 1] = np.nan
@@ -121,6 +121,21 @@ class TestTabReader(unittest.TestCase):
         self.assertTrue(table.domain[0].is_continuous)
         self.assertEqual(table.domain[0].name, 'Feature 1')
 
+    def test_read_repeated_strings(self):
+        samplefile = """\
+        x\tname
+        c\ts
+        \tm
+        1\tfoo
+        2\tbar
+        3\tfoo
+        """
+        file = io.StringIO(samplefile)
+        table = read_tab_file(file)
+
+        self.assertEqual(table.metas[:, 0].tolist(), ["foo", "bar", "foo"])
+        self.assertIs(table.metas[0, 0], table.metas[2, 0])
+
     def test_reuse_variables(self):
         file1 = io.StringIO("\n".join("xd dbac"))
         t1 = read_tab_file(file1)
@@ -3,6 +3,7 @@
 
 import copy
 import os
+import pickle
 import random
 import unittest
 from itertools import chain
@@ -491,6 +492,96 @@ class TableTestCase(unittest.TestCase):
         self.assertNotEqual(crc1, crc5)
         self.assertEqual(crc1, crc6)
 
+    def test_checksum_sparse(self):
+        d = data.Table("iris").to_sparse()
+        crc1 = d.checksum()
+        d.X = d.X.copy()
+        d.X[0, 0] = 42
+        self.assertNotEqual(crc1, d.checksum())
+
+    def test_fingerprint(self):
+        d = data.Table("zoo")
+        fp = d.fingerprint()
+        self.assertEqual(fp, d.fingerprint())
+        # fingerprints depend on the contents
+        self.assertEqual(fp, d.copy().fingerprint())
+        self.assertEqual(fp, pickle.loads(pickle.dumps(d)).fingerprint())
+        self.assertNotEqual(fp, d[1:].fingerprint())
+
+        d.ids = d.ids + 1
+        self.assertNotEqual(fp, d.fingerprint())
+
+        fp = d.fingerprint()
+        d[0, 0] = 1 - d[0, 0]
+        self.assertNotEqual(fp, d.fingerprint())
+
+        fp = d.fingerprint()
+        d.set_weights(2)
+        self.assertNotEqual(fp, d.fingerprint())
+
+        fp = d.fingerprint()
+        d.X[0, 0] = 1 - d.X[0, 0]
+        self.assertEqual(fp, d.fingerprint())
+        d.invalidate_cache()
+        self.assertNotEqual(fp, d.fingerprint())
+
+    def test_transform_after_inplace_change(self):
+        d = data.Table("iris")
+        attr = d.domain[0]
+        double = data.ContinuousVariable(
+            "double", compute_value=lambda table: 2 * table.get_column_view(0)[0])
+        domain = data.Domain([double])
+        self.assertEqual(d.transform(domain).X[0, 0], 2 * d.X[0, 0])
+        d.X[0, 0] = 100
+        self.assertEqual(d.transform(domain).X[0, 0], 200)
+
+        d.use_column_cache = True
+        d.X[0, 0] = 50
+        self.assertEqual(d.transform(domain).X[0, 0], 100)
+        d.X[0, 0] = 60
+        self.assertEqual(d.transform(domain).X[0, 0], 100)
+        d.invalidate_cache()
+        self.assertEqual(d.transform(domain).X[0, 0], 120)
+        d[0, attr] = 70
+        self.assertEqual(d.transform(domain).X[0, 0], 140)
+
+    def test_column_index(self):
+        d = data.Table("iris")
+        index = d.column_index("sepal length")
+        self.assertIs(index, d.column_index(0))
+        col = d.X[:, 0]
+        np.testing.assert_equal(sorted(index.rows(5, 5.5)),
+                                np.flatnonzero((col >= 5) & (col <= 5.5)))
+        np.testing.assert_equal(
+            sorted(index.rows(5, 5.5, include_low=False, include_high=False)),
+            np.flatnonzero((col > 5) & (col < 5.5)))
+        self.assertEqual(len(index.rows(low=8)), 0)
+        self.assertRaises(ValueError, data.Table("zoo").column_index, "name")
+
+        d[0, 0] = 10
+        index = d.column_index(0)
+        np.testing.assert_equal(index.rows(low=10), [0])
+        d.extend(d[:1])
+        np.testing.assert_equal(sorted(d.column_index(0).rows(low=10)),
+                                [0, 150])
+        d.X = d.X.copy()
+        d.X[0, 0] = np.nan
+        self.assertIsNot(d.column_index(0), index)
+        index = d.column_index(0)
+        np.testing.assert_equal(index.rows(low=10), [150])
+        self.assertEqual(len(index.defined_rows()), 150)
+
+    def test_same_value_with_column_indexes(self):
+        d = data.Table("zoo")
+        for var, value in (("legs", 4), ("type", "mammal"), ("type", 1)):
+            for negate in (False, True):
+                filter_ = filter.SameValue(d.domain[var], value,
+                                           negate=negate)
+                d.use_column_indexes = True
+                indexed = filter_(d)
+                d.use_column_indexes = False
+                np.testing.assert_equal(indexed.ids, filter_(d).ids)
+
     def test_total_weight(self):
         d = data.Table("zoo")
         self.assertEqual(d.total_weight(), len(d))
@@ -723,6 +814,25 @@ class TableTestCase(unittest.TestCase):
         self.assertEqual(d.checksum(include_metas=False),
                          d2.checksum(include_metas=False))
 
+    def test_pickle_encodes_metas(self):
+        d = data.Table("zoo")
+        domain = d.domain
+        d = d.transform(data.Domain(domain.attributes[1:], domain.class_var,
+                                    domain.metas + domain.attributes[:1]))
+        state = d.__getstate__()
+        self.assertIsNot(state["metas"], d.metas)
+        # Pickles of metas can be loaded without Orange
+        self.assertNotIn(b"Orange", pickle.dumps(state["metas"]))
+        d2 = pickle.loads(pickle.dumps(d))
+        self.assertEqual(d2.metas.dtype, object)
+        np.testing.assert_equal(d2.metas, d.metas)
+        self.assertEqual(d2.domain, d.domain)
+        self.assertEqual(d2[3], d[3])
+
+        shallow = copy.copy(d)
+        self.assertIs(shallow.metas, d.metas)
+        self.assertIs(shallow.X, d.X)
+
     def test_translate_through_slice(self):
         d = data.Table("iris")
         dom = data.Domain(["petal length", "sepal length", "iris"],
@@ -2805,6 +2915,60 @@ class TestTableSparseDense(unittest.TestCase):
         d = self.iris.transform(domain)
         self.assertFalse(sp.issparse(d.metas))
 
+
+class TestTableFloat32(unittest.TestCase):
+    def setUp(self):
+        self.iris = Table("iris", dtype=np.float32)
+
+    def assert_float32(self, table):
+        self.assertEqual(table.X.dtype, np.float32)
+        self.assertEqual(table.Y.dtype, np.float32)
+
+    def test_from_numpy(self):
+        iris = self.iris
+        table = Table.from_numpy(iris.domain, iris.X.astype(float), iris.Y,
+                                 dtype=np.float32)
+        self.assert_float32(table)
+        self.assertEqual(table.W.dtype, np.float64)
+        self.assertEqual(Table.from_numpy(iris.domain, iris.X, iris.Y).X.dtype,
+                         np.float64)
+        table = Table.from_numpy(iris.domain, sp.csr_matrix(iris.X), iris.Y,
+                                 dtype=np.float32)
+        self.assertEqual(table.X.dtype, np.float32)
+        self.assertRaises(ValueError, Table.from_numpy, iris.domain, iris.X,
+                          iris.Y, dtype=int)
+
+    def test_from_file(self):
+        self.assert_float32(self.iris)
+        np.testing.assert_equal(self.iris.X, Table("iris").X.astype(np.float32))
+
+    def test_preserved(self):
+        iris = self.iris
+        self.assert_float32(iris.copy())
+        self.assert_float32(iris[::2])
+        self.assert_float32(iris.to_sparse())
+        self.assert_float32(pickle.loads(pickle.dumps(iris)))
+        attributes = iris.domain.attributes
+        self.assert_float32(Table.concatenate([
+            iris.transform(Domain(attributes[:2])),
+            iris.transform(Domain(attributes[2:], iris.domain.class_var))]))
+        domain = Domain([ContinuousVariable("x", compute_value=lambda data:
+                                            data.X[:, 0] * 2)],
+                        iris.domain.class_var)
+        transformed = iris.transform(domain)
+        self.assert_float32(transformed)
+        np.testing.assert_equal(transformed.X[:, 0], iris.X[:, 0] * 2)
+
+    def test_transform_dtype(self):
+        iris = self.iris.transform(self.iris.domain, np.float64)
+        self.assertEqual(iris.X.dtype, np.float64)
+        self.assertEqual(iris.Y.dtype, np.float64)
+        self.assert_float32(iris.transform(iris.domain, np.float32))
+        self.assert_float32(iris[:5].transform(
+            Domain(iris.domain.attributes[:2], iris.domain.class_var),
+            np.float32))
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -1,11 +1,15 @@
 import unittest
+from unittest.mock import patch
 
 import numpy as np
 import scipy.sparse as sp
 
 from Orange.data import Table, Domain, DiscreteVariable, ContinuousVariable, \
     StringVariable
-from Orange.preprocess.transformation import Identity, Transformation, Lookup
+from Orange.preprocess.transformation import Identity, Transformation, Lookup, \
+    Indicator, Indicator1, Normalizer
+from Orange.preprocess.discretize import Discretizer
+from Orange.preprocess.impute import ReplaceUnknowns
 
 
 class TestTransformation(unittest.TestCase):
@@ -71,3 +75,93 @@ class LookupTest(unittest.TestCase):
             np.testing.assert_array_equal(
                 lookup.transform(col),
                 np.array([2, 0, 2, 1, np.nan, 1], dtype=np.float64))
+
+
+class TestTransformBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = Table("heart_disease")
+
+    def convert(self, data, compute_values):
+        domain = Domain([ContinuousVariable("c{}".format(i), compute_value=cv)
+                         for i, cv in enumerate(compute_values)])
+        return Table.from_table(domain, data)
+
+    def assert_batch_equal(self, data, compute_values):
+        expected = np.column_stack([cv(data) for cv in compute_values])
+        np.testing.assert_almost_equal(
+            self.convert(data, compute_values).X, expected)
+        np.testing.assert_almost_equal(
+            type(compute_values[0]).compute_batch(compute_values, data),
+            expected)
+
+    def test_batch(self):
+        data = self.data
+        attrs = data.domain.attributes
+        cont = [attr for attr in attrs if attr.is_continuous]
+        disc = [attr for attr in attrs if attr.is_discrete]
+        self.assert_batch_equal(
+            data, [Normalizer(attr, i, 1 / (i + 1))
+                   for i, attr in enumerate(cont)])
+        self.assert_batch_equal(
+            data, [ReplaceUnknowns(attr, i) for i, attr in enumerate(cont)])
+        self.assert_batch_equal(
+            data, [Discretizer(attr, [i, 50 + i])
+                   for i, attr in enumerate(cont)])
+        for cls in (Indicator, Indicator1):
+            self.assert_batch_equal(
+                data, [cls(attr, i) for attr in disc
+                       for i in range(len(attr.values))])
+        self.assert_batch_equal(
+            data, [Identity(attr) for attr in attrs] + [Identity(attrs[0])])
+        self.assert_batch_equal(data[5:10],
+                                [Identity(attr) for attr in cont])
+
+    def test_batch_is_used(self):
+        cont = [attr for attr in self.data.domain.attributes
+                if attr.is_continuous]
+        with patch.object(Normalizer, "transform", side_effect=ValueError):
+            self.convert(self.data, [Normalizer(attr, 0, 1) for attr in cont])
+
+    def test_overridden_transform(self):
+        class Double(Normalizer):
+            def transform(self, c):
+                return 2 * c
+
+        cont = [attr for attr in self.data.domain.attributes
+                if attr.is_continuous]
+        self.assert_batch_equal(
+            self.data, [Double(attr, 1, 1) for attr in cont])
+
+    def test_mixed_order(self):
+        data = self.data
+        cont = [attr for attr in data.domain.attributes if attr.is_continuous]
+        compute_values = [Normalizer(cont[0], 1, 2), Identity(cont[1]),
+                          Normalizer(cont[2], 0, 3), Identity(cont[3])]
+        np.testing.assert_almost_equal(
+            self.convert(data, compute_values).X,
+            np.column_stack([cv(data) for cv in compute_values]))
+
+    def test_sparse(self):
+        domain = Domain([ContinuousVariable("c{}".format(i), sparse=True)
+                         for i in range(4)])
+        data = Table.from_numpy(
+            domain, sp.csr_matrix(np.array([[0, 1, 0, 2],
+                                            [3, 0, 0, 0],
+                                            [0, 0, 4, 5.]])))
+        compute_values = [Normalizer(domain[i], 0, i + 1) for i in (3, 0, 2)]
+        target = Domain([ContinuousVariable("n{}".format(i), sparse=True,
+                                            compute_value=cv)
+                         for i, cv in enumerate(compute_values)] +
+                        [ContinuousVariable("d", sparse=True,
+                                            compute_value=Indicator(domain[1],
+                                                                    1))])
+        converted = Table.from_table(target, data)
+        self.assertTrue(sp.isspmatrix_csr(converted.X))
+        np.testing.assert_almost_equal(
+            converted.X.toarray(),
+            [[8, 0, 0, 1], [0, 3, 0, 0], [20, 0, 12, 0]])
+
+        self.assertRaises(
+            ValueError, Normalizer.compute_batch,
+            [Normalizer(domain[0], 1, 1), Normalizer(domain[1], 0, 1)], data)
@@ -11,6 +11,7 @@ from sklearn.tree._tree import TREE_LEAF
 from Orange.data import Table
 from Orange.classification import SklTreeLearner, TreeLearner
 from Orange.regression import SklTreeRegressionLearner
+from Orange.tree import CompiledTreeModel
 
 
 class TestSklTreeLearner(unittest.TestCase):
@@ -28,6 +29,19 @@ class TestSklTreeLearner(unittest.TestCase):
         pred = model(table)
         self.assertTrue(np.all(table.Y.flatten() == pred))
 
+    def test_compiled(self):
+        # the tree sees only two of the three classes
+        table = Table('iris')[:100]
+        clf = SklTreeLearner(max_depth=3)(table)
+        model = CompiledTreeModel(clf.domain, [clf.compiled()])
+        np.testing.assert_almost_equal(model(table, model.Probs),
+                                       clf(table, clf.Probs))
+
+        table = Table('housing')
+        reg = SklTreeRegressionLearner()(table)
+        model = CompiledTreeModel(reg.domain, [reg.compiled()])
+        np.testing.assert_almost_equal(model(table), reg(table))
+
 
 class TestTreeLearner(unittest.TestCase):
     def test_uses_preprocessors(self):
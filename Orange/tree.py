@@ -1,5 +1,6 @@
 """Tree model used by Orange inducers, and Tree interface"""
 
+import pickle
 from collections import OrderedDict
 
 import numpy as np
@@ -146,7 +147,9 @@ class TreeModel(TreeModelInterface):
 
     def _prepare_predictions(self, n):
         rootval = self.root.value
-        return np.empty((n,) + rootval.shape, dtype=rootval.dtype)
+        # Values computed from float32 data are stored as float64, too
+        dtype = np.float64 if rootval.dtype == np.float32 else rootval.dtype
+        return np.empty((n,) + rootval.shape, dtype=dtype)
 
     def get_values_by_nodes(self, X):
         """Prediction that does not use compiled trees; for demo only"""
@@ -191,15 +194,11 @@ class TreeModel(TreeModelInterface):
         return y
 
     def get_values(self, X):
-        from Orange.classification import _tree_scorers
-        if sp.isspmatrix_csc(X):
-            func = _tree_scorers.compute_predictions_csc
-        elif sp.issparse(X):
-            func = _tree_scorers.compute_predictions_csr
-            X = X.tocsr()
-        else:
-            func = _tree_scorers.compute_predictions
-        return func(X, self._code, self._values, self._thresholds)
+        return self.compiled().get_values(X)
+
+    def compiled(self):
+        """Return the tree in the array-based format of :obj:`CompiledTree`"""
+        return CompiledTree(self._code, self._values, self._thresholds)
 
     def predict(self, X):
         predictions = self.get_values(X)
@@ -376,3 +375,187 @@ class TreeModel(TreeModelInterface):
         conditions = OrderedDict()
         self.root.parent = None
         _compute_subtree(self.root)
+
+
+class CompiledTree:
+    """
+    A tree stored in flat arrays, the common format to which Orange's
+    trees, simple trees and scikit-learn's trees are exported.
+
+    The format is described in :obj:`TreeModel._compile`. Predictions are
+    computed by walking the arrays in native code, without Python objects
+    for nodes, and pickling copies the arrays.
+
+    Attributes:
+        code (np.ndarray): encoded tree (np.int32)
+        values (np.ndarray): values (e.g. distributions) of nodes, one row
+            per node
+        thresholds (np.ndarray): thresholds of numeric nodes
+    """
+    def __init__(self, code, values, thresholds):
+        self.code = code
+        self.values = values
+        self.thresholds = thresholds
+
+    @property
+    def node_count(self):
+        return len(self.values)
+
+    def get_values(self, X):
+        """
+        Return values of nodes into which the rows of `X` fall.
+
+        A row stops at the node whose attribute value is missing.
+
+        Args:
+            X (np.ndarray or sp.spmatrix): dense, CSR or CSC data
+
+        Returns:
+            (np.ndarray): a matrix with a row of values for each row of `X`
+        """
+        from Orange.classification import _tree_scorers
+        if sp.isspmatrix_csc(X):
+            func = _tree_scorers.compute_predictions_csc
+        elif sp.issparse(X):
+            func = _tree_scorers.compute_predictions_csr
+            X = X.tocsr()
+        else:
+            func = _tree_scorers.compute_predictions
+            if X.dtype != np.float32:
+                X = np.asarray(X, dtype=np.float64)
+        return func(X, self.code, self.values, self.thresholds)
+
+    @classmethod
+    def from_sklearn(cls, tree, n_classes=None, classes=None):
+        """
+        Convert a fitted scikit-learn tree.
+
+        Args:
+            tree (sklearn.tree._tree.Tree): the tree (`tree_` of the estimator)
+            n_classes (int): the number of class values for classification;
+                `None` for regression
+            classes (np.ndarray): indices of class values that correspond to
+                columns of the tree's values (`classes_` of the estimator)
+        """
+        left, right = tree.children_left, tree.children_right
+        inner = left != -1
+        starts = np.zeros(tree.node_count, dtype=np.int32)
+        sizes = np.where(inner, 5, 2)
+        starts[1:] = np.cumsum(sizes)[:-1]
+        code = np.empty(sizes.sum(), dtype=np.int32)
+        code[starts] = np.where(
+            inner, TreeModel.NODE_TYPES.index(NumericNode), 0)
+        code[starts + 1] = np.arange(tree.node_count)
+        inner_starts = starts[inner]
+        code[inner_starts + 2] = tree.feature[inner]
+        code[inner_starts + 3] = starts[left[inner]]
+        code[inner_starts + 4] = starts[right[inner]]
+
+        values = tree.value[:, 0, :]
+        if n_classes is not None:
+            class_values = np.zeros((tree.node_count, n_classes))
+            if classes is None:
+                classes = np.arange(values.shape[1])
+            class_values[:, np.asarray(classes, dtype=int)] = values
+            values = class_values
+        return cls(code, np.ascontiguousarray(values, dtype=np.float64),
+                   np.ascontiguousarray(tree.threshold, dtype=np.float64))
+
+
+class CompiledTreeModel(Model):
+    """
+    A model that predicts with one or more compiled trees. Forests predict
+    the average of predictions of their trees; for classification, each
+    tree's distributions are normalized first.
+
+    Models can be saved into files from which the arrays of trees are
+    memory-mapped instead of read, so large forests load in constant time
+    and their pages are shared between processes.
+
+    Attributes:
+        trees (list of CompiledTree): trees of the model
+    """
+    MAGIC = b'ORANGECT'
+    VERSION = 1
+    ALIGNMENT = 64
+    _HEADER_LEN = np.dtype('<u8')
+
+    def __init__(self, domain, trees):
+        super().__init__(domain)
+        self.trees = list(trees)
+
+    def predict(self, X):
+        predictions = np.zeros((X.shape[0], self.trees[0].values.shape[1]))
+        for tree in self.trees:
+            values = tree.get_values(X)
+            if self.domain.class_var.is_discrete:
+                sums = values.sum(axis=1)
+                sums[sums == 0] = 1
+                values /= sums[:, np.newaxis]
+            predictions += values
+        predictions /= len(self.trees)
+        if self.domain.class_var.is_continuous:
+            return predictions[:, 0]
+        return predictions
+
+    def save(self, filename):
+        """Save the model into a file that can be memory-mapped by `load`"""
+        blocks, offset = [], 0
+        for tree in self.trees:
+            tree_blocks = []
+            for arr in (tree.code, tree.values, tree.thresholds):
+                offset = -(-offset // self.ALIGNMENT) * self.ALIGNMENT
+                tree_blocks.append((arr.dtype.str, arr.shape, offset))
+                offset += arr.nbytes
+            blocks.append(tree_blocks)
+        header = pickle.dumps(
+            dict(version=self.VERSION, domain=self.domain,
+                 name=getattr(self, "name", None), blocks=blocks),
+            protocol=pickle.HIGHEST_PROTOCOL)
+        start = len(self.MAGIC) + self._HEADER_LEN.itemsize + len(header)
+        start = -(-start // self.ALIGNMENT) * self.ALIGNMENT
+        with open(filename, "wb") as f:
+            f.write(self.MAGIC)
+            f.write(np.array(len(header), dtype=self._HEADER_LEN).tobytes())
+            f.write(header)
+            for tree, tree_blocks in zip(self.trees, blocks):
+                for arr, (_, _, block_offset) in zip(
+                        (tree.code, tree.values, tree.thresholds),
+                        tree_blocks):
+                    f.seek(start + block_offset)
+                    f.write(np.ascontiguousarray(arr).tobytes())
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Load a model saved by `save`.
+
+        The file is mapped copy-on-write, so the arrays can not be changed
+        on the disk.
+        """
+        with open(filename, "rb") as f:
+            if f.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError(
+                    "{} is not a file with compiled trees".format(filename))
+            header_len = int(np.frombuffer(
+                f.read(cls._HEADER_LEN.itemsize), cls._HEADER_LEN)[0])
+            header = pickle.loads(f.read(header_len))
+            start = f.tell()
+        if header["version"] > cls.VERSION:
+            raise ValueError("Unsupported version of compiled trees: {}"
+                             .format(header["version"]))
+        start = -(-start // cls.ALIGNMENT) * cls.ALIGNMENT
+        buffer = np.memmap(filename, dtype=np.uint8, mode="c")
+
+        def block(dtype, shape, offset):
+            dtype = np.dtype(dtype)
+            offset += start
+            size = int(np.prod(shape)) * dtype.itemsize
+            return buffer[offset:offset + size].view(dtype).reshape(shape)
+
+        trees = [CompiledTree(*(block(*desc) for desc in tree_blocks))
+                 for tree_blocks in header["blocks"]]
+        model = cls(header["domain"], trees)
+        if header["name"] is not None:
+            model.name = header["name"]
+        return model
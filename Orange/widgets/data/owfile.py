@@ -337,25 +337,78 @@ class OWFile(widget.OWWidget, RecentPathsWComboMixin):
         FileFormat
         """
         if self.source == self.LOCAL_FILE:
-            path = self.last_path()
-            if self.recent_paths and self.recent_paths[0].file_format:
-                qname = self.recent_paths[0].file_format
-                reader_class = class_from_qualified_name(qname)
-                reader = reader_class(path)
-            else:
-                reader = FileFormat.get_reader(path)
-            if self.recent_paths and self.recent_paths[0].sheet:
-                reader.select_sheet(self.recent_paths[0].sheet)
-            return reader
+            recent = self.recent_paths[0] if self.recent_paths else None
+            return self._file_reader(self.last_path(), recent)
         elif self.source == self.URL:
             url = self.url_combo.currentText().strip()
             if url:
                 return UrlReader(url)
 
+    @staticmethod
+    def _file_reader(path, recent):
+        if recent is not None and recent.file_format:
+            reader_class = class_from_qualified_name(recent.file_format)
+            reader = reader_class(path)
+        else:
+            reader = FileFormat.get_reader(path)
+        if recent is not None and recent.sheet:
+            reader.select_sheet(recent.sheet)
+        return reader
+
+    @staticmethod
+    def _check_sheet(reader):
+        # Read the first sheet if the selected one does not exist
+        if len(reader.sheets) < 2 or \
+                reader.sheet and reader.sheet not in reader.sheets:
+            reader.select_sheet(None)
+
+    @classmethod
+    def data_from_settings(cls, settings, basedir=None):
+        """
+        Return the data that the widget outputs with the given settings.
+
+        The widget is not constructed, so this can be used to run workflows
+        without GUI. Edits of the domain are not applied.
+
+        Parameters
+        ----------
+        settings : dict
+            Settings as saved in a workflow
+        basedir : str, optional
+            The directory of the workflow, for files with relative paths
+
+        Returns
+        -------
+        data : Table or None
+        """
+        params = cls.settingsHandler.settings_namespace(settings)
+        if params.source == cls.URL:
+            path = params.recent_urls[0].strip() if params.recent_urls else ""
+            if not path:
+                return None
+            reader = UrlReader(path)
+        else:
+            if not params.recent_paths:
+                return None
+            recent = params.recent_paths[0]
+            search_paths = cls.SEARCH_PATHS
+            if basedir is not None:
+                search_paths = search_paths + [("basedir", basedir)]
+            resolved = recent.resolve(search_paths)
+            path = recent.search(search_paths) if resolved is None \
+                else resolved.abspath
+            if path is None:
+                raise FileNotFoundError(cls.Error.file_not_found)
+            reader = cls._file_reader(path, recent)
+            cls._check_sheet(reader)
+        data = reader.read()
+        add_origin(data, path)
+        return data
+
     def _update_sheet_combo(self):
+        self._check_sheet(self.reader)
         if len(self.reader.sheets) < 2:
             self.sheet_box.hide()
-            self.reader.select_sheet(None)
             return
 
         self.sheet_combo.clear()
@@ -173,6 +173,19 @@ class TestOWFile(WidgetTest):
         self.open_dataset("iris")
         self.assertFalse(self.widget.Error.file_not_found.is_shown())
 
+    def test_data_from_settings(self):
+        self.open_dataset("iris")
+        settings = self.widget.settingsHandler.pack_data(self.widget)
+        data = OWFile.data_from_settings(settings)
+        self.assertEqual(data.domain,
+                         self.get_output(self.widget.Outputs.data).domain)
+        self.assertEqual(len(data), 150)
+
+        self.assertIsNone(OWFile.data_from_settings({"recent_paths": []}))
+        settings = {"recent_paths": [RecentPath("no-such-file.tab", None, None)]}
+        self.assertRaises(FileNotFoundError,
+                          OWFile.data_from_settings, settings)
+
     def test_check_column_noname(self):
         """
         Column name cannot be changed to an empty string or a string with whitespaces.
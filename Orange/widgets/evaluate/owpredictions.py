@@ -473,40 +473,96 @@ class OWPredictions(OWWidget):
         if not slots:
             self.Outputs.predictions.send(None)
             return
+        self.Outputs.predictions.send(
+            self._predictions_table(self, self.data, self.class_var, slots))
 
-        if self.class_var and self.class_var.is_discrete:
-            newmetas, newcolumns = self._classification_output_columns()
+    @classmethod
+    def predictions_from_settings(cls, settings, data, predictors):
+        """
+        Return the predictions that the widget outputs with given settings.
+
+        The widget is not constructed, so this can be used to run workflows
+        without GUI. Like in the widget, predictors that fail are omitted.
+
+        Parameters
+        ----------
+        settings : dict
+            Settings as saved in a workflow
+        data : Orange.data.Table
+            Input data or None
+        predictors : list of Model
+            Input predictors
+
+        Returns
+        -------
+        predictions : Orange.data.Table or None
+
+        Raises
+        ------
+        ValueError
+            With the widget's error message if predictors and data do not
+            have the same target
+        """
+        if data is None or not len(data) or not predictors:
+            return None
+        pred_classes = set(p.domain.class_var for p in predictors)
+        if len(pred_classes) > 1:
+            raise ValueError(cls.Error.predictors_target_mismatch)
+        class_var = pred_classes.pop()
+        if data.domain.class_var is not None and \
+                class_var != data.domain.class_var:
+            raise ValueError(cls.Error.data_target_mismatch)
+        if class_var is None:
+            return None
+
+        slots = []
+        for predictor in predictors:
+            try:
+                results = cls.predict(predictor, data)
+            except ValueError:
+                continue
+            slots.append(PredictorSlot(predictor, predictor.name, results))
+        if not slots:
+            return None
+        params = cls.settingsHandler.settings_namespace(settings)
+        return cls._predictions_table(params, data, class_var, slots)
+
+    @classmethod
+    def _predictions_table(cls, params, data, class_var, slots):
+        if class_var.is_discrete:
+            newmetas, newcolumns = \
+                cls._classification_output_columns(params, class_var, slots)
         else:
-            newmetas, newcolumns = self._regression_output_columns()
+            newmetas, newcolumns = cls._regression_output_columns(slots)
 
-        attrs = list(self.data.domain.attributes) if self.output_attrs else []
-        metas = list(self.data.domain.metas) + newmetas
-        domain = \
-            Orange.data.Domain(attrs, self.data.domain.class_var, metas=metas)
-        predictions = self.data.transform(domain)
+        attrs = list(data.domain.attributes) if params.output_attrs else []
+        metas = list(data.domain.metas) + newmetas
+        domain = Orange.data.Domain(attrs, data.domain.class_var, metas=metas)
+        predictions = data.transform(domain)
         if newcolumns:
             newcolumns = numpy.hstack(
                 [numpy.atleast_2d(cols) for cols in newcolumns])
             predictions.metas[:, -newcolumns.shape[1]:] = newcolumns
-        self.Outputs.predictions.send(predictions)
+        return predictions
 
-    def _classification_output_columns(self):
+    @staticmethod
+    def _classification_output_columns(params, class_var, slots):
         newmetas = []
         newcolumns = []
-        slots = self._valid_predictors()
-        if self.output_predictions:
-            newmetas += [DiscreteVariable(name=p.name, values=self.class_values)
+        class_values = list(class_var.values)
+        if params.output_predictions:
+            newmetas += [DiscreteVariable(name=p.name, values=class_values)
                          for p in slots]
             newcolumns += [p.results[0].reshape((-1, 1)) for p in slots]
 
-        if self.output_probabilities:
+        if params.output_probabilities:
             newmetas += [ContinuousVariable(name="%s (%s)" % (p.name, value))
-                         for p in slots for value in self.class_values]
+                         for p in slots for value in class_values]
             newcolumns += [p.results[1] for p in slots]
         return newmetas, newcolumns
 
-    def _regression_output_columns(self):
-        slots = self._valid_predictors()
+    @staticmethod
+    def _regression_output_columns(slots):
         newmetas = [ContinuousVariable(name=p.name) for p in slots]
         newcolumns = [p.results[0].reshape((-1, 1)) for p in slots]
         return newmetas, newcolumns
@@ -160,6 +160,10 @@ class OWTestLearners(OWWidget):
 
     settingsHandler = settings.PerfectDomainContextHandler()
 
+    # Input handlers check (and download) data and leave updates of models,
+    # views and contexts to call_in_gui_thread
+    thread_safe_inputs = True
+
     #: Resampling/testing types
     KFold, FeatureFold, ShuffleSplit, LeaveOneOut, TestOnTrain, TestOnTest \
         = 0, 1, 2, 3, 4, 5
@@ -336,6 +340,9 @@ class OWTestLearners(OWWidget):
         learner : Optional[Orange.base.Learner]
         key : Any
         """
+        self.call_in_gui_thread(self._set_learner, learner, key)
+
+    def _set_learner(self, learner, key):
         if key in self.learners and learner is None:
             # Removed
             self._invalidate([key])
@@ -395,6 +402,9 @@ class OWTestLearners(OWWidget):
         else:
             self.Warning.missing_data.clear()
 
+        self.call_in_gui_thread(self._set_train_data, data)
+
+    def _set_train_data(self, data):
         self.data = data
         self.closeContext()
         self._update_scorers()
@@ -445,6 +455,9 @@ class OWTestLearners(OWWidget):
         else:
             self.Warning.missing_data.clear()
 
+        self.call_in_gui_thread(self._set_test_data, data)
+
+    def _set_test_data(self, data):
         self.test_data = data
         if self.resampling == OWTestLearners.TestOnTest:
             self._invalidate()
@@ -478,11 +491,17 @@ class OWTestLearners(OWWidget):
         """
         Set the input preprocessor to apply on the training data.
         """
+        self.call_in_gui_thread(self._set_preprocessor, preproc)
+
+    def _set_preprocessor(self, preproc):
         self.preprocessor = preproc
         self._invalidate()
 
     def handleNewSignals(self):
         """Reimplemented from OWWidget.handleNewSignals."""
+        self.call_in_gui_thread(self._handle_new_signals)
+
+    def _handle_new_signals(self):
         self._update_class_selection()
         self._update_header()
         self._update_stats_model()
@@ -48,6 +48,27 @@ class TestOWPredictions(WidgetTest):
         evres = self.get_output(self.widget.Outputs.evaluation_results)
         self.assertEqual(len(evres.data), 0)
 
+    def test_predictions_from_settings(self):
+        model = ConstantLearner()(self.iris)
+        model.name = "Constant"
+        self.widget.output_probabilities = False
+        self.send_signal(self.widget.Inputs.data, self.iris)
+        self.send_signal(self.widget.Inputs.predictors, model, 1)
+        output = self.get_output(self.widget.Outputs.predictions)
+
+        settings = self.widget.settingsHandler.pack_data(self.widget)
+        pred = OWPredictions.predictions_from_settings(
+            settings, self.iris, [model])
+        self.assertEqual([var.name for var in pred.domain.metas],
+                         [var.name for var in output.domain.metas])
+        np.testing.assert_equal(pred.metas, output.metas)
+
+        self.assertIsNone(
+            OWPredictions.predictions_from_settings({}, self.iris, []))
+        majority_titanic = ConstantLearner()(Table("titanic"))
+        self.assertRaises(ValueError, OWPredictions.predictions_from_settings,
+                          {}, self.iris, [model, majority_titanic])
+
     def test_mismatching_targets(self):
         error = self.widget.Error
 
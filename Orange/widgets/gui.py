@@ -14,7 +14,8 @@ from collections import defaultdict, Sequence
 import pkg_resources
 
 from AnyQt import QtWidgets, QtCore, QtGui
-from AnyQt.QtCore import Qt, QSize, QItemSelection, pyqtSignal as Signal
+from AnyQt.QtCore import Qt, QSize, QItemSelection, QThread, \
+    pyqtSignal as Signal
 from AnyQt.QtGui import QCursor, QColor
 from AnyQt.QtWidgets import (
     QApplication, QStyle, QSizePolicy, QWidget, QLabel, QGroupBox, QSlider,
@@ -2007,12 +2008,17 @@ def auto_commit(widget, master, value, label, auto_label=None, box=True,
 
     def do_commit():
         nonlocal dirty
-        QApplication.setOverrideCursor(QCursor(Qt.WaitCursor))
+        # Widgets with thread-safe inputs commit from worker threads, which
+        # must not change the cursor
+        in_gui_thread = QThread.currentThread() is QApplication.instance().thread()
+        if in_gui_thread:
+            QApplication.setOverrideCursor(QCursor(Qt.WaitCursor))
         try:
             commit()
             dirty = False
         finally:
-            QApplication.restoreOverrideCursor()
+            if in_gui_thread:
+                QApplication.restoreOverrideCursor()
 
     dirty = False
     commit = commit or getattr(master, 'commit')
@@ -42,12 +42,13 @@ class OWKNNLearner(OWBaseLearner):
             label="Weight:", items=[i.capitalize() for i in self.weights],
             callback=self.settings_changed)
 
-    def create_learner(self):
-        return self.LEARNER(
-            n_neighbors=self.n_neighbors,
-            metric=self.metrics[self.metric_index],
-            weights=self.weights[self.weight_index],
-            preprocessors=self.preprocessors)
+    @classmethod
+    def _create_learner(cls, params, preprocessors):
+        return cls.LEARNER(
+            n_neighbors=params.n_neighbors,
+            metric=cls.metrics[params.metric_index],
+            weights=cls.weights[params.weight_index],
+            preprocessors=preprocessors)
 
     def get_learner_parameters(self):
         return (("Number of neighbours", self.n_neighbors),
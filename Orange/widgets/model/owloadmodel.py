@@ -100,8 +100,7 @@ class OWLoadModel(widget.OWWidget):
     def load(self, filename):
         """Load the object from filename and send it to output."""
         try:
-            with open(filename, "rb") as f:
-                model = pickle.load(f)
+            model = self._read_model(filename)
         except (pickle.UnpicklingError, OSError, EOFError):
             self.Error.load_error(os.path.split(filename)[-1])
         else:
@@ -109,6 +108,35 @@ class OWLoadModel(widget.OWWidget):
             self._remember(filename)
             self.Outputs.model.send(model)
 
+    @staticmethod
+    def _read_model(filename):
+        with open(filename, "rb") as f:
+            return pickle.load(f)
+
+    @classmethod
+    def model_from_settings(cls, settings):
+        """
+        Return the model that the widget outputs with the given settings.
+
+        The widget is not constructed, so this can be used to run workflows
+        without GUI. Like the widget, this loads the current file only if it
+        is among the existing recent files.
+
+        Raises
+        ------
+        ValueError
+            With the widget's error message if the file can not be read
+        """
+        params = cls.settingsHandler.settings_namespace(settings)
+        filename = params.filename
+        if filename not in list(filter(os.path.isfile, params.history))[:20]:
+            return None
+        try:
+            return cls._read_model(filename)
+        except (pickle.UnpicklingError, OSError, EOFError):
+            raise ValueError(
+                cls.Error.load_error.format(os.path.split(filename)[-1]))
+
     def _remember(self, filename):
         """
         Remember `filename` was accessed.
@@ -67,16 +67,17 @@ class OWLogisticRegression(OWBaseLearner):
         fmt = "C={}" if self.strength_C >= 1 else "C={:.3f}"
         self.c_label.setText(fmt.format(self.strength_C))
 
-    def create_learner(self):
-        penalty = self.penalty_types_short[self.penalty_type]
-        return self.LEARNER(
+    @classmethod
+    def _create_learner(cls, params, preprocessors):
+        penalty = cls.penalty_types_short[params.penalty_type]
+        return cls.LEARNER(
             penalty=penalty,
-            dual=self.dual,
-            tol=self.tol,
-            C=self.strength_C,
-            fit_intercept=self.fit_intercept,
-            intercept_scaling=self.intercept_scaling,
-            preprocessors=self.preprocessors
+            dual=cls.dual,
+            tol=cls.tol,
+            C=cls.C_s[params.C_index],
+            fit_intercept=cls.fit_intercept,
+            intercept_scaling=cls.intercept_scaling,
+            preprocessors=preprocessors
         )
 
     def update_model(self):
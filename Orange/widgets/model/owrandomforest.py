@@ -62,27 +62,32 @@ class OWRandomForest(OWBaseLearner):
             callback=self.settings_changed, checked="use_min_samples_split",
             checkCallback=self.settings_changed, alignment=Qt.AlignRight)
 
-    def create_learner(self):
-        common_args = {"n_estimators": self.n_estimators}
-        if self.use_max_features:
-            common_args["max_features"] = self.max_features
-        if self.use_random_state:
-            common_args["random_state"] = self.random_state
-        if self.use_max_depth:
-            common_args["max_depth"] = self.max_depth
-        if self.use_min_samples_split:
-            common_args["min_samples_split"] = self.min_samples_split
-
-        return self.LEARNER(preprocessors=self.preprocessors, **common_args)
+    @classmethod
+    def _create_learner(cls, params, preprocessors):
+        common_args = {"n_estimators": params.n_estimators}
+        if params.use_max_features:
+            common_args["max_features"] = params.max_features
+        if params.use_random_state:
+            common_args["random_state"] = params.random_state
+        if params.use_max_depth:
+            common_args["max_depth"] = params.max_depth
+        if params.use_min_samples_split:
+            common_args["min_samples_split"] = params.min_samples_split
+
+        return cls.LEARNER(preprocessors=preprocessors, **common_args)
 
     def check_data(self):
         self.Error.not_enough_features.clear()
-        if super().check_data():
-            n_features = len(self.data.domain.attributes)
-            if self.use_max_features and self.max_features > n_features:
-                self.Error.not_enough_features(n_features)
-                self.valid_data = False
-        return self.valid_data
+        return super().check_data()
+
+    @classmethod
+    def _data_error(cls, params, learner, data):
+        error = super()._data_error(params, learner, data)
+        if error is None:
+            n_features = len(data.domain.attributes)
+            if params.use_max_features and params.max_features > n_features:
+                error = "not_enough_features", (n_features, )
+        return error
 
     def get_learner_parameters(self):
         """Called by send report to list the parameters of the learner."""
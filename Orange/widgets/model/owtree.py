@@ -68,21 +68,18 @@ class OWTreeLearner(OWBaseLearner):
                      callback=self.settings_changed, controlWidth=80,
                      checkCallback=self.settings_changed)
 
-    def learner_kwargs(self):
-        # Pylint doesn't get our Settings
-        # pylint: disable=invalid-sequence-index
-        return dict(
-            max_depth=(None, self.max_depth)[self.limit_depth],
-            min_samples_split=(2, self.min_internal)[self.limit_min_internal],
-            min_samples_leaf=(1, self.min_leaf)[self.limit_min_leaf],
-            binarize=self.binary_trees,
-            preprocessors=self.preprocessors,
-            sufficient_majority=(1, self.sufficient_majority / 100)[
-                self.limit_majority])
-
-    def create_learner(self):
+    @classmethod
+    def _create_learner(cls, params, preprocessors):
         # pylint: disable=not-callable
-        return self.LEARNER(**self.learner_kwargs())
+        return cls.LEARNER(
+            max_depth=params.max_depth if params.limit_depth else None,
+            min_samples_split=params.min_internal
+            if params.limit_min_internal else 2,
+            min_samples_leaf=params.min_leaf if params.limit_min_leaf else 1,
+            binarize=params.binary_trees,
+            preprocessors=preprocessors,
+            sufficient_majority=params.sufficient_majority / 100
+            if params.limit_majority else 1)
 
     def get_learner_parameters(self):
         from Orange.canvas.report import plural_w
@@ -33,3 +33,22 @@ class TestOWLoadModel(WidgetTest):
         finally:
             os.remove(fname)
 
+    def test_model_from_settings(self):
+        clsf = ConstantModel([1, 1, 1])
+        fd, fname = mkstemp(suffix='.pkcls')
+        os.close(fd)
+        try:
+            with open(fname, 'wb') as f:
+                pickle.dump(clsf, f)
+            self.widget.load(fname)
+            settings = self.widget.settingsHandler.pack_data(self.widget)
+            model = OWLoadModel.model_from_settings(settings)
+            self.assertIsInstance(model, ConstantModel)
+
+            with open(fname, "w") as f:
+                f.write("X")
+            self.assertRaises(ValueError,
+                              OWLoadModel.model_from_settings, settings)
+        finally:
+            os.remove(fname)
+        self.assertIsNone(OWLoadModel.model_from_settings(settings))
@@ -46,3 +46,13 @@ class TestOWRandomForest(WidgetTest, WidgetLearnerTestMixin):
             DefaultParameterMapping("max_depth", None),
             DefaultParameterMapping("min_samples_split", 2)])
         self.test_parameters()
+
+    def test_model_from_settings_checks_max_features(self):
+        settings = {"use_max_features": True, "max_features": 100}
+        learner = OWRandomForest.learner_from_settings(settings)
+        with self.assertRaisesRegex(ValueError, "Insufficient number"):
+            OWRandomForest.model_from_settings(settings, learner, self.data)
+        settings["max_features"] = 2
+        learner = OWRandomForest.learner_from_settings(settings)
+        self.assertIsNotNone(
+            OWRandomForest.model_from_settings(settings, learner, self.data))
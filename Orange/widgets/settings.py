@@ -38,6 +38,7 @@ import pprint
 import time
 import warnings
 from operator import itemgetter
+from types import SimpleNamespace
 
 from Orange.data import Domain, Variable
 from Orange.misc.environ import widget_settings_dir
@@ -458,6 +459,27 @@ class SettingsHandler:
 
         provider.initialize(instance, data)
 
+    def settings_namespace(self, data=None):
+        """Return an object with widget's settings as attributes.
+
+        Settings are migrated and initialized as in :obj:`initialize`, but
+        without constructing the widget. Class methods that compute widget's
+        outputs from settings use this when running workflows without GUI.
+
+        Parameters
+        ----------
+        data : dict or bytes that unpickle into a dict
+            values used to override the defaults
+        """
+        if isinstance(data, bytes):
+            data = pickle.loads(data)
+        else:
+            data = copy.deepcopy(data)
+        self._migrate_settings(data)
+        namespace = SimpleNamespace()
+        self.provider.initialize(namespace, self._add_defaults(data))
+        return namespace
+
     def _migrate_settings(self, settings):
         """Ask widget to migrate settings to the latest version."""
         if settings:
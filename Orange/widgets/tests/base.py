@@ -695,6 +695,37 @@ class WidgetLearnerTestMixin:
                 parameter.set_value(new_value)
                 self.widget.apply.assert_called_once_with()
 
+    def test_learner_from_settings(self):
+        """Check that learners and models computed from settings match"""
+        try:
+            self.widget.learner_from_settings({})
+        except NotImplementedError:
+            self.skipTest("The widget does not create learners from settings")
+        for dataset in self.valid_datasets:
+            self.send_signal("Data", dataset)
+            for parameter in self.parameters:
+                if self._should_check_parameter(parameter, dataset):
+                    parameter.set_value(parameter.values[-1])
+            self.widget.apply_button.button.click()
+
+            settings = self.widget.settingsHandler.pack_data(self.widget)
+            learner = self.widget.learner_from_settings(settings)
+            self.assertIsInstance(learner, self.widget.LEARNER)
+            self.assertEqual(learner.name, self.widget.learner.name)
+            for parameter in self.parameters:
+                if self._should_check_parameter(parameter, dataset):
+                    self.assertEqual(
+                        self._get_param_value(learner, parameter),
+                        self._get_param_value(self.widget.learner, parameter))
+            if self.get_output(self.widget.Outputs.model) is None:
+                self.assertRaises(ValueError, self.widget.model_from_settings,
+                                  settings, learner, dataset)
+            else:
+                model = self.widget.model_from_settings(
+                    settings, learner, dataset)
+                self.assertIsInstance(model, self.model_class)
+                self.assertEqual(model.name, learner.name)
+
     @staticmethod
     def _should_check_parameter(parameter, data):
         """Should the param be passed into the learner given the data"""
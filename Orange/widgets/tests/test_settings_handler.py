@@ -299,6 +299,24 @@ class SettingHandlerTestCase(unittest.TestCase):
             handler.initialize(widget, settings_with_version)
             migrate_settings.assert_called_with(settings, 1)
 
+    def test_settings_namespace(self):
+        handler = SettingsHandler()
+        handler.bind(SimpleWidget)
+
+        migrate_settings = Mock()
+        with patch.object(SimpleWidget, "migrate_settings", migrate_settings):
+            settings = {"setting": 5, VERSION_KEY: 1}
+            namespace = handler.settings_namespace(settings)
+            migrate_settings.assert_called_with({"setting": 5}, 1)
+        # the given settings are not changed
+        self.assertEqual(settings, {"setting": 5, VERSION_KEY: 1})
+        self.assertEqual(namespace.setting, 5)
+        self.assertEqual(namespace.list_setting, [])
+        self.assertFalse(hasattr(namespace, "non_setting"))
+
+        namespace = handler.settings_namespace(pickle.dumps({}))
+        self.assertEqual(namespace.setting, 42)
+
     def test_pack_settings_stores_version(self):
         handler = SettingsHandler()
         handler.bind(SimpleWidget)
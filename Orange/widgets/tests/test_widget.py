@@ -1,8 +1,10 @@
 # Test methods with long descriptive names can omit docstrings
 # pylint: disable=missing-docstring
 
+import threading
 from unittest.mock import patch, MagicMock
 
+from AnyQt.QtCore import QThread
 from AnyQt.QtGui import QShowEvent
 from AnyQt.QtWidgets import QAction
 
@@ -87,6 +89,24 @@ class WidgetTestCase(WidgetTest):
         w = TestWidget2()
         w.showEvent(QShowEvent())
 
+    def test_call_in_gui_thread(self):
+        widget = self.create_widget(MyWidget)
+        calls = []
+
+        def record(value):
+            calls.append((value, QThread.currentThread() is widget.thread()))
+
+        widget.call_in_gui_thread(record, 1)
+        self.assertEqual(calls, [(1, True)])
+
+        thread = threading.Thread(
+            target=lambda: widget.call_in_gui_thread(record, 2))
+        thread.start()
+        thread.join()
+        self.assertEqual(len(calls), 1)
+        self.process_events(lambda: len(calls) == 2)
+        self.assertEqual(calls[1], (2, True))
+
 
 class WidgetMsgTestCase(WidgetTest):
 
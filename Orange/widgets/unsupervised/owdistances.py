@@ -47,6 +47,8 @@ class OWDistances(OWWidget):
 
     want_main_area = False
     buttons_area_orientation = Qt.Vertical
+    thread_safe_inputs = True
+    deduplicate_outputs = True
 
     class Error(OWWidget.Error):
         no_continuous_features = Msg("No numeric features")
@@ -88,7 +90,7 @@ class OWDistances(OWWidget):
     @check_sql_input
     def set_data(self, data):
         self.data = data
-        self.refresh_metrics()
+        self.call_in_gui_thread(self.refresh_metrics)
         self.unconditional_commit()
 
     def refresh_metrics(self):
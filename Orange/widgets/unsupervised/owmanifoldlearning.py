@@ -194,6 +194,7 @@ class OWManifoldLearning(OWWidget):
 
     resizing_enabled = False
     want_main_area = False
+    thread_safe_inputs = True
 
     manifold_method_index = Setting(0)
     n_components = Setting(2)
@@ -256,8 +257,9 @@ class OWManifoldLearning(OWWidget):
     @Inputs.data
     def set_data(self, data):
         self.data = data
-        self.n_components_spin.setMaximum(len(self.data.domain.attributes)
-                                          if self.data else 10)
+        self.call_in_gui_thread(
+            self.n_components_spin.setMaximum,
+            len(data.domain.attributes) if data else 10)
         self.apply()
 
     def apply(self):
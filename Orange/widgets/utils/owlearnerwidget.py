@@ -61,7 +61,10 @@ class OWBaseLearner(OWWidget, metaclass=OWBaseLearnerMeta):
     LEARNER should have __returns__ attribute.
 
     Overwrite `create_learner`, `add_main_layout` and `get_learner_parameters`
-    in case LEARNER has extra parameters.
+    in case LEARNER has extra parameters. Widgets that overwrite
+    `_create_learner` instead of `create_learner` also support computing
+    their outputs without GUI, with `learner_from_settings` and
+    `model_from_settings`.
 
     """
     LEARNER = None
@@ -112,7 +115,87 @@ class OWBaseLearner(OWWidget, metaclass=OWBaseLearnerMeta):
         Returns:
             Learner: an instance of Orange.base.learner subclass.
         """
-        return self.LEARNER(preprocessors=self.preprocessors)
+        return self._create_learner(self, self.preprocessors)
+
+    @classmethod
+    def _create_learner(cls, params, preprocessors):
+        """Creates a learner for the given settings.
+
+        Args:
+            params: an object with settings as attributes; either the widget
+                or a namespace with settings from a workflow
+            preprocessors (Preprocess): preprocessors or None
+
+        Returns:
+            Learner: an instance of Orange.base.learner subclass.
+        """
+        # pylint: disable=unused-argument
+        return cls.LEARNER(preprocessors=preprocessors)
+
+    @classmethod
+    def _prepare_learner(cls, learner, name):
+        if learner is not None:
+            if issubclass(cls.LEARNER, Fitter):
+                learner.use_default_preprocessors = True
+            learner.name = name
+        return learner
+
+    @staticmethod
+    def _fit_model(learner, data, name):
+        model = learner(data)
+        model.name = name
+        model.instances = data
+        return model
+
+    @classmethod
+    def learner_from_settings(cls, settings, preprocessors=None):
+        """Return the learner that the widget outputs with the given settings.
+
+        The widget is not constructed, so this can be used to run workflows
+        without GUI.
+
+        Args:
+            settings (dict): settings as saved in a workflow; missing
+                settings have default values
+            preprocessors (Preprocess): preprocessors or None
+
+        Returns:
+            Learner: an instance of Orange.base.learner subclass.
+
+        Raises:
+            NotImplementedError: if the widget overrides `create_learner`
+        """
+        if cls.create_learner is not OWBaseLearner.create_learner:
+            raise NotImplementedError(
+                "{} does not create learners from settings".format(cls.__name__))
+        params = cls.settingsHandler.settings_namespace(settings)
+        return cls._prepare_learner(cls._create_learner(params, preprocessors),
+                                    params.learner_name or cls.name)
+
+    @classmethod
+    def model_from_settings(cls, settings, learner, data):
+        """Return the model that the widget outputs with the given settings.
+
+        Args:
+            settings (dict): settings as saved in a workflow
+            learner (Learner): a learner from `learner_from_settings`
+            data (Table): training data or None
+
+        Returns:
+            Model: the model or None if there is no data
+
+        Raises:
+            ValueError: with the widget's error message if the learner can
+                not be fit to the data
+        """
+        if data is None:
+            return None
+        params = cls.settingsHandler.settings_namespace(settings)
+        error = cls._data_error(params, learner, data)
+        if error is not None:
+            name, args = error
+            raise ValueError(getattr(cls.Error, name).format(*args))
+        return cls._fit_model(learner, data, learner.name)
 
     def get_learner_parameters(self):
         """Creates an `OrderedDict` or a sequence of pairs with current model
@@ -146,11 +229,8 @@ class OWBaseLearner(OWWidget, metaclass=OWBaseLearnerMeta):
         self.update_model()
 
     def update_learner(self):
-        self.learner = self.create_learner()
-        if self.learner and issubclass(self.LEARNER, Fitter):
-            self.learner.use_default_preprocessors = True
-        if self.learner is not None:
-            self.learner.name = self.learner_name
+        self.learner = self._prepare_learner(self.create_learner(),
+                                             self.learner_name)
         self.Outputs.learner.send(self.learner)
         self.outdated_settings = False
         self.Warning.outdated_learner.clear()
@@ -165,12 +245,10 @@ class OWBaseLearner(OWWidget, metaclass=OWBaseLearnerMeta):
         self.model = None
         if self.check_data():
             try:
-                self.model = self.learner(self.data)
+                self.model = self._fit_model(self.learner, self.data,
+                                             self.learner_name)
             except BaseException as exc:
                 self.show_fitting_failed(exc)
-            else:
-                self.model.name = self.learner_name
-                self.model.instances = self.data
         self.Outputs.model.send(self.model)
 
     def check_data(self):
@@ -178,20 +256,37 @@ class OWBaseLearner(OWWidget, metaclass=OWBaseLearnerMeta):
         self.Error.sparse_not_supported.clear()
         if self.data is not None and self.learner is not None:
             self.Error.data_error.clear()
-            if not self.learner.check_learner_adequacy(self.data.domain):
-                self.Error.data_error(self.learner.learner_adequacy_err_msg)
-            elif not len(self.data):
-                self.Error.data_error("Dataset is empty.")
-            elif len(np.unique(self.data.Y)) < 2:
-                self.Error.data_error("Data contains a single target value.")
-            elif self.data.X.size == 0:
-                self.Error.data_error("Data has no features to learn from.")
-            elif self.data.is_sparse() and not self.supports_sparse:
-                self.Error.sparse_not_supported()
-            else:
+            error = self._data_error(self, self.learner, self.data)
+            if error is None:
                 self.valid_data = True
+            else:
+                name, args = error
+                getattr(self.Error, name)(*args)
         return self.valid_data
 
+    @classmethod
+    def _data_error(cls, params, learner, data):
+        """Return the error that prevents fitting the learner to the data.
+
+        Returns:
+            None or a tuple with the name of a message in `Error` and the
+            arguments for its formatting
+        """
+        # pylint: disable=unused-argument
+        if data.domain.class_var is None:
+            return "data_error", ("Data has no target variable.", )
+        if not learner.check_learner_adequacy(data.domain):
+            return "data_error", (learner.learner_adequacy_err_msg, )
+        if not len(data):
+            return "data_error", ("Dataset is empty.", )
+        if len(np.unique(data.Y)) < 2:
+            return "data_error", ("Data contains a single target value.", )
+        if data.X.size == 0:
+            return "data_error", ("Data has no features to learn from.", )
+        if data.is_sparse() and not cls.supports_sparse:
+            return "sparse_not_supported", ()
+        return None
+
     def settings_changed(self, *args, **kwargs):
         self.outdated_settings = True
         self.Warning.outdated_learner(shown=not self.auto_apply)
@@ -4,6 +4,7 @@
 import sys
 import os
 import types
+from functools import partial
 from operator import attrgetter
 
 from AnyQt.QtWidgets import (
@@ -12,7 +13,7 @@ from AnyQt.QtWidgets import (
     QProgressBar, QAction
 )
 from AnyQt.QtCore import (
-    Qt, QByteArray, QSettings, QUrl, pyqtSignal as Signal
+    Qt, QByteArray, QSettings, QUrl, QThread, pyqtSignal as Signal
 )
 from AnyQt.QtGui import QIcon, QKeySequence, QDesktopServices
 
@@ -137,6 +138,19 @@ class OWWidget(QDialog, OWComponent, Report, ProgressBarMixin,
     #: static size contents.
     resizing_enabled = True
 
+    #: If true, input handlers and `handleNewSignals` do not touch the GUI
+    #: and may be called on a worker thread when the workflow's signal
+    #: manager runs in asynchronous mode
+    #: (:obj:`~Orange.canvas.scheme.signalmanager.SignalManager.set_asynchronous`).
+    #: Such handlers pass GUI updates to :obj:`call_in_gui_thread`.
+    thread_safe_inputs = False
+
+    #: If true, outputs with a `fingerprint` method (tables and distance
+    #: matrices) are not delivered to connected widgets again if they have
+    #: the same content as the value delivered before. Widgets that change
+    #: their outputs in place (e.g. the variables' colors) must not set it.
+    deduplicate_outputs = False
+
     blockingStateChanged = Signal(bool)
     processingStateChanged = Signal(int)
 
@@ -145,6 +159,8 @@ class OWWidget(QDialog, OWComponent, Report, ProgressBarMixin,
     progressBarValueChanged = Signal(float)
     messageActivated = Signal(Msg)
     messageDeactivated = Signal(Msg)
+    # Requests for calls from call_in_gui_thread
+    _guiCallRequested = Signal(object)
 
     settingsHandler = None
     """:type: SettingsHandler"""
@@ -230,6 +246,8 @@ class OWWidget(QDialog, OWComponent, Report, ProgressBarMixin,
         sc = QShortcut(QKeySequence.Copy, self)
         sc.activated.connect(self.copy_to_clipboard)
 
+        self._guiCallRequested.connect(self.__gui_call, Qt.QueuedConnection)
+
         if self.controlArea is not None:
             # Otherwise, the first control has focus
             self.controlArea.setFocus(Qt.ActiveWindowFocusReason)
@@ -745,6 +763,23 @@ class OWWidget(QDialog, OWComponent, Report, ProgressBarMixin,
         """Is this widget blocking signal processing."""
         return self.__blocking
 
+    def call_in_gui_thread(self, func, *args):
+        """
+        Call `func(*args)` in the widget's (GUI) thread: immediately when
+        called from it, and from its event loop otherwise.
+
+        Input handlers of widgets with :obj:`thread_safe_inputs` use this
+        for the code that updates the GUI.
+        """
+        if QThread.currentThread() is self.thread():
+            func(*args)
+        else:
+            self._guiCallRequested.emit(partial(func, *args))
+
+    def __gui_call(self, func):  # pylint: disable=no-self-use
+        # A method (and not a function) so that the call runs in self's thread
+        func()
+
     def resetSettings(self):
         """Reset the widget settings to default"""
         self.settingsHandler.reset_settings(self)
@@ -0,0 +1,61 @@
+import numpy as np
+
+from Orange.data import Table, Domain, ContinuousVariable, DiscreteVariable, \
+    StringVariable
+from Orange.data.filter import FilterContinuous, FilterDiscrete, \
+    FilterString, FilterStringList, FilterRegex, Values
+
+from .base import Benchmark, benchmark
+
+
+# noinspection PyStatementEffect
+class BenchFilter(Benchmark):
+    def setUp(self):
+        n = 1000000
+        rng = np.random.RandomState(0)
+        words = np.array(["".join(word) for word in
+                          rng.choice(list("abcdefghij"), (10000, 8))],
+                         dtype=object)
+        self.domain = Domain(
+            [DiscreteVariable("d", values=list("abcdefghij")),
+             ContinuousVariable("c")],
+            metas=[StringVariable("s")])
+        self.words = words
+        self.table = Table.from_numpy(
+            self.domain, np.c_[rng.randint(0, 10, n), rng.rand(n)],
+            metas=words[rng.randint(0, len(words), n)][:, None])
+
+    @benchmark(number=3, warmup=1)
+    def bench_discrete_values(self):
+        Values([FilterDiscrete("d", [1, 3, 5, 7, 8, 9])])(self.table)
+
+    @benchmark(number=3, warmup=1)
+    def bench_string_contains(self):
+        Values([FilterString("s", FilterString.Contains, "ABC",
+                             case_sensitive=False)])(self.table)
+
+    @benchmark(number=3, warmup=1)
+    def bench_string_starts_with(self):
+        Values([FilterString("s", FilterString.StartsWith, "ab")])(self.table)
+
+    @benchmark(number=3, warmup=1)
+    def bench_string_list(self):
+        Values([FilterStringList("s", list(self.words[:20]))])(self.table)
+
+    @benchmark(number=3, warmup=1)
+    def bench_regex(self):
+        Values([FilterRegex("s", "^a.c")])(self.table)
+
+    @benchmark(number=3, warmup=1)
+    def bench_numeric_and_string(self):
+        Values([FilterString("s", FilterString.Contains, "ab"),
+                FilterContinuous("c", FilterContinuous.Less, 0.1)])(self.table)
+
+    @benchmark(number=3, warmup=1)
+    def bench_indexed_range(self):
+        self.table.use_column_indexes = True
+        try:
+            Values([FilterContinuous("c", FilterContinuous.Between,
+                                     0.2, 0.21)])(self.table)
+        finally:
+            self.table.use_column_indexes = False
@@ -0,0 +1,27 @@
+import numpy as np
+
+from Orange.distance import NeighborIndex
+
+from .base import Benchmark, benchmark
+
+
+# noinspection PyStatementEffect
+class BenchNeighbors(Benchmark):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.x = rng.rand(20000, 10)
+        self.queries = rng.rand(2000, 10)
+        self.brute = NeighborIndex(self.x, algorithm="brute")
+        self.approximate = NeighborIndex(self.x, algorithm="approximate")
+
+    @benchmark(number=3, warmup=1)
+    def bench_build_approximate(self):
+        NeighborIndex(self.x, algorithm="approximate")
+
+    @benchmark(number=3, warmup=1)
+    def bench_query_brute(self):
+        self.brute.query(self.queries, 10)
+
+    @benchmark(number=3, warmup=1)
+    def bench_query_approximate(self):
+        self.approximate.query(self.queries, 10)
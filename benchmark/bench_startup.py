@@ -0,0 +1,146 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+from .base import Benchmark, _timeitlike_time_format
+
+
+# Runs in a fresh interpreter: imports a module, measuring the time spent in
+# each newly imported module without its own imports, and prints the total
+# time followed by per-module times.
+_MEASURE_IMPORT = """
+import builtins, sys, time
+_import = builtins.__import__
+own_times, stack = {{}}, []
+
+def timed_import(name, *args, **kwargs):
+    new = name not in sys.modules
+    stack.append(0.)
+    start = time.perf_counter()
+    try:
+        return _import(name, *args, **kwargs)
+    finally:
+        elapsed = time.perf_counter() - start
+        nested = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        if new and name in sys.modules:
+            own_times[name] = elapsed - nested
+
+builtins.__import__ = timed_import
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+for name, elapsed in own_times.items():
+    print(name, elapsed)
+"""
+
+
+def _measure_import(module):
+    output = subprocess.check_output(
+        [sys.executable, "-c", _MEASURE_IMPORT.format(module=module)],
+        universal_newlines=True)
+    lines = output.splitlines()
+    own_times = {}
+    for line in lines[1:]:
+        name, elapsed = line.split()
+        own_times[name] = float(elapsed)
+    return float(lines[0]), own_times
+
+
+# Runs widget discovery in a fresh interpreter with the registry cache in the
+# given file and prints the time and the number of modules imported meanwhile.
+_RUN_DISCOVERY = """
+import os, pickle, sys, time
+from Orange.canvas import config
+from Orange.canvas.registry import WidgetRegistry
+from Orange.canvas.registry.discovery import WidgetDiscovery
+filename = {filename!r}
+cached = {{}}
+if os.path.exists(filename):
+    with open(filename, "rb") as f:
+        cached = pickle.load(f)
+start, n_modules = time.perf_counter(), len(sys.modules)
+discovery = WidgetDiscovery(WidgetRegistry(), cached)
+discovery.run(config.widgets_entry_points())
+print(time.perf_counter() - start, len(sys.modules) - n_modules)
+with open(filename, "wb") as f:
+    pickle.dump(discovery.cached_descriptions, f)
+"""
+
+
+def _run_discovery(filename):
+    output = subprocess.check_output(
+        [sys.executable, "-c", _RUN_DISCOVERY.format(filename=filename)],
+        universal_newlines=True)
+    elapsed, n_modules = output.split()
+    return float(elapsed), int(n_modules)
+
+
+def _module_available(module):
+    return subprocess.call([sys.executable, "-c", "import " + module],
+                           stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL) == 0
+
+
+def bench_import(module, repeat=5, top=10):
+    """Benchmark the import of `module` in a fresh interpreter.
+
+    Besides the total time, the report lists the modules on which most of
+    the time is spent (without their own imports), so it is apparent which
+    import caused a regression.
+
+    Parameters
+    ----------
+    module : str
+        The name of the module.
+    repeat : int
+        The number of interpreters started.
+    top : int
+        The number of most expensive modules to report.
+    """
+    def wrapper(self):
+        if not _module_available(module):
+            raise unittest.SkipTest("{} can not be imported".format(module))
+        measurements = [_measure_import(module) for _ in range(repeat)]
+        totals = np.array([total for total, _ in measurements])
+        own_times = {}
+        for _, times in measurements:
+            for name, elapsed in times.items():
+                own_times[name] = min(own_times.get(name, elapsed), elapsed)
+
+        print("[import {}] in {} fresh interpreters:".format(module, repeat))
+        print("\tmin {:4s}".format(_timeitlike_time_format(totals.min())))
+        print("\tavg {:4s}".format(_timeitlike_time_format(totals.mean())))
+        print("\t{} modules imported, most expensive:".format(len(own_times)))
+        for name, elapsed in sorted(own_times.items(),
+                                    key=lambda x: -x[1])[:top]:
+            print("\t\t{:40s} {}".format(
+                name, _timeitlike_time_format(elapsed)))
+    return wrapper
+
+
+class BenchStartup(Benchmark):
+    bench_import_orange = bench_import("Orange")
+    bench_import_data = bench_import("Orange.data")
+    bench_import_data_io = bench_import("Orange.data.io")
+    bench_import_classification = bench_import("Orange.classification")
+    bench_import_preprocess = bench_import("Orange.preprocess")
+    bench_import_evaluation = bench_import("Orange.evaluation")
+    bench_import_widget = bench_import("Orange.widgets.widget")
+
+    def bench_discovery(self):
+        """Widget discovery with an empty (cold) and a filled (warm) cache"""
+        if not _module_available("Orange.canvas.registry.discovery"):
+            raise unittest.SkipTest("canvas can not be imported")
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "registry-cache.pck")
+            for run in ("cold", "warm"):
+                elapsed, n_modules = _run_discovery(filename)
+                print("[widget discovery, {} cache]".format(run))
+                print("\t{:4s}, {} modules imported".format(
+                    _timeitlike_time_format(elapsed), n_modules))